@@ -1,4 +1,5 @@
 from swarms.structs.agent import Agent
+from swarms.structs.agent_collection import AgentCollection
 from swarms.structs.agents_available import showcase_available_agents
 from swarms.structs.auto_swarm import AutoSwarm, AutoSwarmRouter
 from swarms.structs.base_structure import BaseStructure
@@ -32,6 +33,11 @@ from swarms.structs.multi_agent_exec import (
     run_agents_with_tasks_concurrently,
     run_single_agent,
 )
+from swarms.structs.pipeline_executor import (
+    PipelineExecutor,
+    PipelineStage,
+    StageStats,
+)
 from swarms.structs.queue_swarm import TaskQueueSwarm
 from swarms.structs.rearrange import AgentRearrange, rearrange
 from swarms.structs.round_robin import RoundRobinSwarm
@@ -44,6 +50,7 @@ from swarms.structs.swarm_router import (
     swarm_router,
 )
 from swarms.structs.swarming_architectures import (
+    TopologyRuntime,
     broadcast,
     circular_swarm,
     exponential_swarm,
@@ -64,6 +71,13 @@ from swarms.structs.swarming_architectures import (
     star_swarm,
 )
 from swarms.structs.task import Task
+from swarms.structs.task_scheduler import TaskScheduler
+from swarms.structs.tiered_memory import TieredMemory
+from swarms.structs.vector_index import (
+    HashingEmbedding,
+    NumpyVectorIndex,
+    VectorIndex,
+)
 from swarms.structs.utils import (
     detect_markdown,
     distribute_tasks,
@@ -96,6 +110,7 @@ __all__ = [
     "RoundRobinSwarm",
     "SequentialWorkflow",
     "Task",
+    "TaskScheduler",
     "detect_markdown",
     "distribute_tasks",
     "extract_key_from_json",
@@ -144,4 +159,13 @@ __all__ = [
     "run_agents_with_tasks_concurrently",
     "showcase_available_agents",
     "GroupChatState",
+    "PipelineExecutor",
+    "PipelineStage",
+    "StageStats",
+    "TopologyRuntime",
+    "HashingEmbedding",
+    "NumpyVectorIndex",
+    "VectorIndex",
+    "AgentCollection",
+    "TieredMemory",
 ]
@@ -44,12 +44,23 @@ from swarms.structs.safe_loading import (
     SafeLoaderUtils,
     SafeStateManager,
 )
+from swarms.structs.tiered_memory import TieredMemory
 from swarms.tools.base_tool import BaseTool
-from swarms.tools.tool_parse_exec import parse_and_execute_json
+from swarms.tools.tool_parse_exec import (
+    ToolDispatcher,
+    parse_and_execute_json,
+)
 from swarms.utils.data_to_text import data_to_text
 from swarms.utils.file_processing import create_file_in_folder
 from swarms.utils.formatter import formatter
+from swarms.utils.llm_cache import (
+    CacheMissError,
+    LLMCache,
+    get_default_llm_cache,
+    llm_call_payload,
+)
 from swarms.utils.pdf_to_text import pdf_to_text
+from swarms.utils.rate_limiter import RateLimiter, get_rate_limiter
 from swarms.utils.wrapper_clusterop import (
     exec_callable_with_clusterops,
 )
@@ -123,6 +134,15 @@ class Agent:
         list_of_pdf (str): The list of pdf
         tokenizer (Any): The tokenizer
         long_term_memory (BaseVectorDatabase): The long term memory
+        tiered_memory (TieredMemory): Keeps short_memory to a recent
+            window, summarizing and archiving older messages, and
+            builds prompts from all tiers within context_length
+        llm_cache (LLMCache): Serves repeated LLM calls from a cache,
+            or records and replays them. Defaults to the process-wide
+            cache set with set_default_llm_cache, if any
+        rate_limiter (RateLimiter): Request, token and adaptive
+            concurrency limits for the LLM calls. Defaults to the
+            process-wide limiter for model_name
         preset_stopping_token (bool): Enable preset stopping token
         traceback (Any): The traceback
         traceback_handlers (Any): The traceback handlers
@@ -337,6 +357,9 @@ class Agent:
         model_name: str = None,
         llm_args: dict = None,
         load_state_path: str = None,
+        tiered_memory: Optional[TieredMemory] = None,
+        llm_cache: Optional[LLMCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
         *args,
         **kwargs,
     ):
@@ -453,6 +476,13 @@ class Agent:
         self.model_name = model_name
         self.llm_args = llm_args
         self.load_state_path = load_state_path
+        self.tiered_memory = tiered_memory
+        self.llm_cache = (
+            get_default_llm_cache()
+            if llm_cache is None
+            else llm_cache
+        )
+        self.rate_limiter = rate_limiter
 
         # Initialize the short term memory
         self.short_memory = Conversation(
@@ -538,6 +568,9 @@ class Agent:
                 tool.__name__: tool for tool in tools
             }
 
+        # Built lazily and reused for every tool call in every loop
+        self.tool_dispatcher: Optional[ToolDispatcher] = None
+
         # If the tool schema exists or a list of base models exists then convert the tool schema into an openai schema
         if exists(tool_schema) or exists(list_base_models):
             threading.Thread(
@@ -825,9 +858,15 @@ class Agent:
                     self.dynamic_temperature()
 
                 # Task prompt
-                task_prompt = (
-                    self.short_memory.return_history_as_string()
-                )
+                if self.tiered_memory is not None:
+                    self.tiered_memory.compact(self.short_memory)
+                    task_prompt = self.tiered_memory.build_prompt(
+                        self.short_memory, task, self.context_length
+                    )
+                else:
+                    task_prompt = (
+                        self.short_memory.return_history_as_string()
+                    )
 
                 # Parameters
                 attempt = 0
@@ -921,6 +960,10 @@ class Agent:
 
                         success = True  # Mark as successful to exit the retry loop
 
+                    except CacheMissError:
+                        # Retrying cannot fill a replay cache
+                        raise
+
                     except Exception as e:
 
                         self.log_agent_data()
@@ -1004,6 +1047,9 @@ class Agent:
             if self.agent_ops_on is True and is_last is True:
                 self.check_end_session_agentops()
 
+            if self.tiered_memory is not None:
+                self.tiered_memory.compact(self.short_memory)
+
             # Merge all responses
             all_responses = [
                 response
@@ -1200,13 +1246,31 @@ class Agent:
 
         return output.getvalue()
 
+    def get_tool_dispatcher(self) -> ToolDispatcher:
+        """
+        Return the dispatcher for the agent's tools.
+
+        The dispatcher is rebuilt only when the tools list changes, so
+        the name index and argument validators are computed once.
+
+        Returns:
+            ToolDispatcher: The dispatcher bound to ``self.tools``.
+        """
+        if self.tool_dispatcher is None or not (
+            self.tool_dispatcher.matches(self.tools)
+        ):
+            if self.tool_dispatcher is not None:
+                self.tool_dispatcher.shutdown()
+            self.tool_dispatcher = ToolDispatcher(self.tools)
+        return self.tool_dispatcher
+
     def parse_and_execute_tools(self, response: str, *args, **kwargs):
         try:
             logger.info("Executing tool...")
 
             # try to Execute the tool and return a string
             out = parse_and_execute_json(
-                functions=self.tools,
+                functions=self.get_tool_dispatcher(),
                 json_string=response,
                 parse_md=True,
                 *args,
@@ -2064,7 +2128,9 @@ class Agent:
         try:
             if self.tools is not None:
                 tool_call_output = parse_and_execute_json(
-                    self.tools, response, parse_md=True
+                    self.get_tool_dispatcher(),
+                    response,
+                    parse_md=True,
                 )
 
                 if tool_call_output is not str:
@@ -2429,7 +2495,29 @@ class Agent:
             if hasattr(self.llm, method_name):
                 try:
                     method = getattr(self.llm, method_name)
-                    return method(task, *args, **kwargs)
+                    # An llm with its own cache (LiteLLM) already
+                    # serves repeats; caching again would store and
+                    # look up every response twice
+                    if (
+                        self.llm_cache is None
+                        or getattr(self.llm, "cache", None)
+                        is not None
+                    ):
+                        return self._rate_limited_call(
+                            method, task, *args, **kwargs
+                        )
+
+                    payload = llm_call_payload(
+                        self.llm, task, args, kwargs
+                    )
+                    return self.llm_cache.call(
+                        payload,
+                        lambda: self._rate_limited_call(
+                            method, task, *args, **kwargs
+                        ),
+                    )
+                except CacheMissError:
+                    raise
                 except Exception as e:
                     raise RuntimeError(
                         f"Error calling {method_name}: {str(e)}"
@@ -2439,6 +2527,41 @@ class Agent:
             f"No suitable method found in the llm object. Expected one of: {method_names}"
         )
 
+    def _rate_limited_call(
+        self, method: Callable, task: str, *args, **kwargs
+    ) -> Any:
+        """
+        Call the llm inside a slot of the model's rate limiter, which
+        every agent and LiteLLM instance on the same model shares.
+        """
+        limiter = self.rate_limiter
+        if limiter is None:
+            limiter = get_rate_limiter(
+                self.model_name
+                or getattr(self.llm, "model_name", None)
+            )
+
+        def count(text: str) -> int:
+            if self.tokenizer is None:
+                return len(text) // 4
+            return self.tokenizer.count_tokens(text)
+
+        # Token budgets need an estimate up front, settled afterwards
+        prompt_tokens = estimate = 0
+        if limiter.token_bucket is not None:
+            prompt_tokens = count(task)
+            estimate = prompt_tokens + (self.max_tokens or 0)
+
+        with limiter.slot(estimate) as slot:
+            response = method(task, *args, **kwargs)
+            if (
+                estimate
+                and slot.tokens == estimate
+                and isinstance(response, str)
+            ):
+                slot.used_tokens(prompt_tokens + count(response))
+            return response
+
     def handle_sop_ops(self):
         # If the user inputs a list of strings for the sop then join them and set the sop
         if exists(self.sop_list):
@@ -0,0 +1,317 @@
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+DEFAULT_INDEXES = ("model_name", "status")
+
+
+def agent_name(agent: Any) -> Optional[str]:
+    """Name of an agent, accepting both ``agent_name`` and ``name``."""
+    return getattr(agent, "agent_name", None) or getattr(
+        agent, "name", None
+    )
+
+
+def _append(mapping: Dict, key: Hashable, agent: Any):
+    bucket = mapping.get(key)
+    if bucket is None:
+        mapping[key] = [agent]
+    else:
+        bucket.append(agent)
+
+
+def _discard(mapping: Dict, key: Hashable, agent: Any):
+    # Rebind rather than shrink in place, so a reader holding the old
+    # bucket never sees it lose an item mid-iteration
+    remaining = [a for a in mapping.get(key, ()) if a is not agent]
+    if remaining:
+        mapping[key] = remaining
+    else:
+        mapping.pop(key, None)
+
+
+class AgentCollection:
+    """
+    Indexed, thread-safe collection of agents shared by swarms and
+    registries.
+
+    Agents are indexed by name, id, tag and a configurable set of
+    attributes, so lookups are dictionary hits instead of scans. Writes
+    take a lock and update the indexes in place: adding appends to a
+    bucket, so one add costs the same however many agents are held,
+    while removing rebinds the buckets it touches. Reads take no lock;
+    each is a single dictionary or list operation, which the GIL keeps
+    atomic, and anything a read iterates over is copied first. Agents
+    are indexed before they are listed and unlisted before they are
+    unindexed, so every agent in :meth:`snapshot` can be looked up.
+
+    Attribute indexes are computed when an agent is added. Call
+    :meth:`reindex` after changing an indexed attribute in place.
+
+    Args:
+        agents (Optional[Iterable[Any]]): Initial agents.
+        unique_names (bool): Reject agents whose name is already taken.
+        indexes (Sequence[str]): Attributes to build secondary indexes
+            for. Agents where the attribute is missing or None are left
+            out of that index.
+        name_fn (Callable[[Any], str]): Returns the name to index an
+            agent under.
+
+    Examples:
+    >>> agents = AgentCollection([researcher, writer])
+    >>> agents.get("researcher")
+    >>> agents.where(model_name="gpt-4o")
+    """
+
+    def __init__(
+        self,
+        agents: Optional[Iterable[Any]] = None,
+        unique_names: bool = False,
+        indexes: Sequence[str] = DEFAULT_INDEXES,
+        name_fn: Callable[[Any], str] = agent_name,
+    ):
+        self.unique_names = unique_names
+        self.index_fields = tuple(indexes)
+        self.name_fn = name_fn
+        self._lock = threading.Lock()
+        self._reset()
+        if agents:
+            self.add_many(agents)
+
+    # Writes
+
+    def _reset(self):
+        self._agents: List[Any] = []
+        self._by_name: Dict[str, List[Any]] = {}
+        self._by_id: Dict[Any, Any] = {}
+        self._by_tag: Dict[str, List[Any]] = {}
+        self._indexes: Dict[str, Dict[Hashable, List[Any]]] = {
+            field: {} for field in self.index_fields
+        }
+
+    def _insert(self, agent: Any):
+        _append(self._by_name, self.name_fn(agent), agent)
+        agent_id = getattr(agent, "id", None)
+        if agent_id is not None:
+            self._by_id.setdefault(agent_id, agent)
+        for tag in getattr(agent, "tags", None) or ():
+            _append(self._by_tag, tag, agent)
+        for field in self.index_fields:
+            value = getattr(agent, field, None)
+            if value is not None:
+                _append(self._indexes[field], value, agent)
+
+    def _drop(self, agent: Any):
+        _discard(self._by_name, self.name_fn(agent), agent)
+        agent_id = getattr(agent, "id", None)
+        if self._by_id.get(agent_id) is agent:
+            # Fall back to another agent sharing the id, if any
+            for other in self._agents:
+                if other is not agent and (
+                    getattr(other, "id", None) == agent_id
+                ):
+                    self._by_id[agent_id] = other
+                    break
+            else:
+                del self._by_id[agent_id]
+        for tag in getattr(agent, "tags", None) or ():
+            _discard(self._by_tag, tag, agent)
+        for index in self._indexes.values():
+            # Scan by identity: the attribute may have changed since
+            for key in [
+                k
+                for k, v in index.items()
+                if any(a is agent for a in v)
+            ]:
+                _discard(index, key, agent)
+
+    def add(self, agent: Any) -> None:
+        """
+        Add an agent.
+
+        Raises:
+            ValueError: If ``unique_names`` is set and the name is taken.
+        """
+        self.add_many([agent])
+
+    def add_many(self, agents: Iterable[Any]) -> None:
+        """
+        Add several agents.
+
+        Raises:
+            ValueError: If ``unique_names`` is set and a name is taken.
+                No agents are added in that case.
+        """
+        agents = list(agents)
+        with self._lock:
+            if self.unique_names:
+                seen = set()
+                for agent in agents:
+                    name = self.name_fn(agent)
+                    if name in self._by_name or name in seen:
+                        raise ValueError(
+                            f"Agent with name {name} already exists."
+                        )
+                    seen.add(name)
+            for agent in agents:
+                # Index first, so an agent listed is always found
+                self._insert(agent)
+                self._agents.append(agent)
+
+    def remove(self, agent: Any) -> Any:
+        """
+        Remove an agent, given the agent itself or its name.
+
+        Returns:
+            Any: The removed agent.
+
+        Raises:
+            KeyError: If the agent is not in the collection.
+        """
+        with self._lock:
+            if isinstance(agent, str):
+                matches = self._by_name.get(agent)
+                if not matches:
+                    raise KeyError(agent)
+                agent = matches[0]
+            elif agent not in self:
+                raise KeyError(self.name_fn(agent))
+
+            self._agents = [a for a in self._agents if a is not agent]
+            self._drop(agent)
+            return agent
+
+    def replace(self, name: str, agent: Any) -> None:
+        """
+        Replace the agent registered under ``name``, keeping its
+        position.
+
+        Raises:
+            KeyError: If no agent has that name.
+        """
+        with self._lock:
+            matches = self._by_name.get(name)
+            if not matches:
+                raise KeyError(name)
+            old = matches[0]
+
+            self._insert(agent)
+            self._agents = [
+                agent if a is old else a for a in self._agents
+            ]
+            self._drop(old)
+
+    def reindex(self, agent: Any) -> None:
+        """Refresh the indexes of an agent whose attributes changed."""
+        with self._lock:
+            self._drop(agent)
+            self._insert(agent)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset()
+
+    # Lock-free reads
+
+    def get(self, name: str) -> Any:
+        """
+        Return the first agent with ``name``.
+
+        Raises:
+            KeyError: If no agent has that name.
+        """
+        return self._by_name[name][0]
+
+    def find(self, name: str) -> Optional[Any]:
+        """Return the first agent with ``name``, or None."""
+        matches = self._by_name.get(name)
+        return matches[0] if matches else None
+
+    def find_by_id(self, agent_id: Any) -> Optional[Any]:
+        """Return the agent with ``agent_id``, or None."""
+        return self._by_id.get(agent_id)
+
+    def find_by_tag(self, tag: str) -> List[Any]:
+        """Return every agent carrying ``tag``."""
+        return list(self._by_tag.get(tag, ()))
+
+    def where(self, **criteria: Any) -> List[Any]:
+        """
+        Return the agents whose attributes equal every given value.
+
+        Indexed attributes are answered from their index; any others
+        filter the smallest indexed candidate set, or every agent if no
+        criterion is indexed.
+
+        Examples:
+        >>> collection.where(model_name="gpt-4o", status="idle")
+        """
+        candidates = self.snapshot()
+        used = None
+        for field, value in criteria.items():
+            index = self._indexes.get(field)
+            if index is None:
+                continue
+            matches = tuple(index.get(value, ()))
+            if used is None or len(matches) < len(candidates):
+                candidates, used = matches, field
+
+        remaining = {
+            field: value
+            for field, value in criteria.items()
+            if field != used
+        }
+        return [
+            agent
+            for agent in candidates
+            if all(
+                getattr(agent, field, None) == value
+                for field, value in remaining.items()
+            )
+        ]
+
+    def query(
+        self, condition: Optional[Callable[[Any], bool]] = None
+    ) -> List[Any]:
+        """Return the agents matching ``condition``, or all of them."""
+        agents = self.snapshot()
+        if condition is None:
+            return list(agents)
+        return [agent for agent in agents if condition(agent)]
+
+    def names(self) -> List[str]:
+        """Names of every agent, in insertion order."""
+        return [self.name_fn(agent) for agent in self.snapshot()]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Name to first agent with that name."""
+        return {
+            name: agents[0]
+            for name, agents in list(self._by_name.items())
+        }
+
+    def snapshot(self) -> Tuple[Any, ...]:
+        """The current agents as an immutable tuple."""
+        return tuple(self._agents)
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.snapshot())
+
+    def __contains__(self, item: Any) -> bool:
+        if isinstance(item, str):
+            return item in self._by_name
+        matches = self._by_name.get(self.name_fn(item), ())
+        return any(agent is item for agent in matches)
@@ -1,27 +1,40 @@
+import itertools
 import json
 import logging
+import math
+import re
 import time
 import uuid
+from collections import Counter, deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from swarm_models.tiktoken_wrapper import TikTokenizer
 
 logger = logging.getLogger(__name__)
 
+_TERM_PATTERN = re.compile(r"\w+")
+
+
+def tokenize_terms(text: str) -> List[str]:
+    """Lowercase word terms used by the search index."""
+    return _TERM_PATTERN.findall(text.lower())
+
 
 class MemoryMetadata(BaseModel):
     """Metadata for memory entries"""
 
-    timestamp: Optional[float] = time.time()
+    timestamp: Optional[float] = Field(default_factory=time.time)
     role: Optional[str] = None
     agent_name: Optional[str] = None
     session_id: Optional[str] = None
     memory_type: Optional[str] = None  # 'short_term' or 'long_term'
     token_count: Optional[int] = None
-    message_id: Optional[str] = str(uuid.uuid4())
+    message_id: Optional[str] = Field(
+        default_factory=lambda: str(uuid.uuid4())
+    )
 
 
 class MemoryEntry(BaseModel):
@@ -40,6 +53,132 @@ class MemoryConfig(BaseModel):
     enable_long_term_memory: Optional[bool] = False
     auto_archive: Optional[bool] = True
     archive_threshold: Optional[float] = 0.8  # Archive when 80% full
+    # Archive down to this usage so archiving happens in batches
+    # rather than one entry per new message
+    archive_target: Optional[float] = 0.5
+
+
+class InvertedIndex:
+    """
+    Term index over memory entries, with optional BM25 ranking.
+
+    Entries are tokenized once when added; a search only touches the
+    postings of the query terms, so its cost depends on how many
+    entries match rather than on how many are stored.
+
+    Args:
+        k1 (float): BM25 term-frequency saturation.
+        b (float): BM25 document-length normalization.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._docs: Dict[int, Tuple[MemoryEntry, Counter, int]] = {}
+        self._keys: Dict[int, int] = {}
+        self._sequence = itertools.count()
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, entry: MemoryEntry) -> None:
+        terms = Counter(tokenize_terms(entry.content or ""))
+        length = sum(terms.values())
+        key = next(self._sequence)
+        self._keys[id(entry)] = key
+        self._docs[key] = (entry, terms, length)
+        self._total_length += length
+        for term, count in terms.items():
+            self._postings.setdefault(term, {})[key] = count
+
+    def remove(self, entry: MemoryEntry) -> None:
+        key = self._keys.pop(id(entry), None)
+        if key is None:
+            return
+        _, terms, length = self._docs.pop(key)
+        self._total_length -= length
+        for term in terms:
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self._docs.clear()
+        self._keys.clear()
+        self._total_length = 0
+
+    def search(
+        self,
+        query: str,
+        ranked: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[MemoryEntry]:
+        """
+        Find entries matching ``query``.
+
+        Args:
+            query (str): Search text, split into word terms.
+            ranked (bool): Score entries containing any query term with
+                BM25 and return the best first. Otherwise return the
+                entries containing every term, oldest first.
+            limit (Optional[int]): Maximum number of entries to return.
+
+        Returns:
+            List[MemoryEntry]: Matching entries.
+        """
+        terms = list(dict.fromkeys(tokenize_terms(query)))
+        if not terms:
+            return []
+
+        if ranked:
+            keys = self._bm25(terms)
+        else:
+            postings = sorted(
+                (self._postings.get(term, {}) for term in terms),
+                key=len,
+            )
+            keys = sorted(
+                key
+                for key in postings[0]
+                if all(key in other for other in postings[1:])
+            )
+
+        if limit is not None:
+            keys = keys[:limit]
+        return [self._docs[key][0] for key in keys]
+
+    def _bm25(self, terms: List[str]) -> List[int]:
+        size = len(self._docs)
+        average_length = self._total_length / size if size else 0
+        scores: Dict[int, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(
+                1
+                + (size - len(postings) + 0.5) / (len(postings) + 0.5)
+            )
+            for key, count in postings.items():
+                length = self._docs[key][2]
+                norm = (
+                    1
+                    - self.b
+                    + self.b
+                    * (
+                        length / average_length
+                        if average_length
+                        else 0
+                    )
+                )
+                scores[key] = scores.get(key, 0.0) + idf * (
+                    count * (self.k1 + 1) / (count + self.k1 * norm)
+                )
+        return sorted(scores, key=lambda key: (-scores[key], key))
 
 
 class MemoryManager:
@@ -47,6 +186,11 @@ class MemoryManager:
     Manages both short-term and long-term memory for an agent, handling token limits,
     archival, and context retrieval.
 
+    Token totals are kept as running counters, short-term memory is a
+    deque archived from the front in batches, and entries are indexed
+    by term on insert, so adding, archiving and searching stay cheap as
+    a session grows.
+
     Args:
         config (MemoryConfig): Configuration for memory management
         tokenizer (Optional[Any]): Tokenizer to use for token counting
@@ -64,13 +208,62 @@ class MemoryManager:
         self.long_term_memory = long_term_memory
 
         # Initialize memories
-        self.short_term_memory: List[MemoryEntry] = []
+        self.short_term_memory: Deque[MemoryEntry] = deque()
         self.system_messages: List[MemoryEntry] = []
 
+        # Running token totals and search indexes, kept in step with
+        # the memories above
+        self._short_term_tokens = 0
+        self._system_tokens = 0
+        self._short_term_index = InvertedIndex()
+        self._system_index = InvertedIndex()
+        self._warned_no_long_term = False
+
         # Memory statistics
         self.total_tokens_processed: int = 0
         self.archived_entries_count: int = 0
 
+    @staticmethod
+    def _tokens(entry: MemoryEntry) -> int:
+        return (entry.metadata and entry.metadata.token_count) or 0
+
+    def _push_short_term(
+        self, entry: MemoryEntry, left: bool = False
+    ) -> None:
+        if left:
+            self.short_term_memory.appendleft(entry)
+        else:
+            self.short_term_memory.append(entry)
+        self._short_term_tokens += self._tokens(entry)
+        self._short_term_index.add(entry)
+
+    def _pop_short_term(self) -> MemoryEntry:
+        entry = self.short_term_memory.popleft()
+        self._short_term_tokens -= self._tokens(entry)
+        self._short_term_index.remove(entry)
+        return entry
+
+    def _push_system(self, entry: MemoryEntry) -> None:
+        self.system_messages.append(entry)
+        self._system_tokens += self._tokens(entry)
+        self._system_index.add(entry)
+
+    def _rebuild(self) -> None:
+        """Recompute counters and indexes from the stored memories."""
+        short_term, system = (
+            list(self.short_term_memory),
+            list(self.system_messages),
+        )
+        self.short_term_memory = deque()
+        self.system_messages = []
+        self._short_term_tokens = self._system_tokens = 0
+        self._short_term_index.clear()
+        self._system_index.clear()
+        for entry in short_term:
+            self._push_short_term(entry)
+        for entry in system:
+            self._push_system(entry)
+
     def create_memory_entry(
         self,
         content: str,
@@ -108,9 +301,9 @@ class MemoryManager:
         )
 
         if is_system:
-            self.system_messages.append(entry)
+            self._push_system(entry)
         else:
-            self.short_term_memory.append(entry)
+            self._push_short_term(entry)
 
         # Check if archiving is needed
         if self.should_archive():
@@ -120,17 +313,11 @@ class MemoryManager:
 
     def get_current_token_count(self) -> int:
         """Get total tokens in short-term memory"""
-        return sum(
-            entry.metadata.token_count
-            for entry in self.short_term_memory
-        )
+        return self._short_term_tokens
 
     def get_system_messages_token_count(self) -> int:
         """Get total tokens in system messages"""
-        return sum(
-            entry.metadata.token_count
-            for entry in self.system_messages
-        )
+        return self._system_tokens
 
     def should_archive(self) -> bool:
         """Check if archiving is needed based on configuration"""
@@ -144,24 +331,46 @@ class MemoryManager:
         return current_usage >= self.config.archive_threshold
 
     def archive_old_memories(self) -> None:
-        """Move older memories to long-term storage"""
+        """
+        Move the oldest memories to long-term storage in one batch,
+        until usage drops below ``archive_target``.
+        """
         if not self.long_term_memory:
-            logger.warning(
-                "No long-term memory storage configured for archiving"
-            )
+            if not self._warned_no_long_term:
+                logger.warning(
+                    "No long-term memory storage configured for archiving"
+                )
+                self._warned_no_long_term = True
             return
 
-        while self.should_archive():
-            # Get oldest non-system message
-            if not self.short_term_memory:
-                break
+        target = self.config.archive_target
+        if target is None or target > self.config.archive_threshold:
+            target = self.config.archive_threshold
+        target_tokens = target * self.config.max_short_term_tokens
 
-            oldest_entry = self.short_term_memory.pop(0)
+        batch = []
+        while (
+            self.short_term_memory
+            and self._short_term_tokens >= target_tokens
+        ):
+            batch.append(self._pop_short_term())
 
-            # Store in long-term memory
-            self.store_in_long_term_memory(oldest_entry)
+        for position, entry in enumerate(batch):
+            if not self._write_long_term(entry):
+                # Put back everything not archived, oldest first
+                for unarchived in reversed(batch[position:]):
+                    self._push_short_term(unarchived, left=True)
+                break
             self.archived_entries_count += 1
 
+    def _write_long_term(self, entry: MemoryEntry) -> bool:
+        try:
+            self.long_term_memory.add(str(entry.model_dump()))
+            return True
+        except Exception as e:
+            logger.error(f"Error storing in long-term memory: {e}")
+            return False
+
     def store_in_long_term_memory(self, entry: MemoryEntry) -> None:
         """Store a memory entry in long-term memory"""
         if self.long_term_memory is None:
@@ -170,12 +379,9 @@ class MemoryManager:
             )
             return
 
-        try:
-            self.long_term_memory.add(str(entry.model_dump()))
-        except Exception as e:
-            logger.error(f"Error storing in long-term memory: {e}")
+        if not self._write_long_term(entry):
             # Re-add to short-term if storage fails
-            self.short_term_memory.insert(0, entry)
+            self._push_short_term(entry, left=True)
 
     def get_relevant_context(
         self, query: str, max_tokens: Optional[int] = None
@@ -218,24 +424,46 @@ class MemoryManager:
     def truncate_to_token_limit(
         self, text: str, max_tokens: int
     ) -> str:
-        """Truncate text to fit within token limit"""
-        current_tokens = self.tokenizer.count_tokens(text)
+        """
+        Truncate text to fit within token limit, keeping whole
+        sentences.
+
+        Tokenizers with ``encode`` and ``decode`` are run once over the
+        text; the cut is made on the decoded token prefix.
+        """
+        if not (
+            hasattr(self.tokenizer, "encode")
+            and hasattr(self.tokenizer, "decode")
+        ):
+            return self._truncate_by_sentence(text, max_tokens)
+
+        tokens = self.tokenizer.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+
+        prefix = self.tokenizer.decode(tokens[:max_tokens])
+        if text.startswith(prefix):
+            # Also catch a sentence break that straddles the cut
+            cut = text.rfind(". ", 0, len(prefix) + 2)
+        else:
+            cut = prefix.rfind(". ")
+        return prefix[:cut] if cut != -1 else ""
 
-        if current_tokens <= max_tokens:
+    def _truncate_by_sentence(
+        self, text: str, max_tokens: int
+    ) -> str:
+        """Fallback for tokenizers that can only count tokens."""
+        if self.tokenizer.count_tokens(text) <= max_tokens:
             return text
 
-        # Truncate by splitting into sentences and rebuilding
-        sentences = text.split(". ")
         result = []
         current_count = 0
-
-        for sentence in sentences:
+        for sentence in text.split(". "):
             sentence_tokens = self.tokenizer.count_tokens(sentence)
-            if current_count + sentence_tokens <= max_tokens:
-                result.append(sentence)
-                current_count += sentence_tokens
-            else:
+            if current_count + sentence_tokens > max_tokens:
                 break
+            result.append(sentence)
+            current_count += sentence_tokens
 
         return ". ".join(result)
 
@@ -245,12 +473,18 @@ class MemoryManager:
         """Clear short-term memory with option to preserve system messages"""
         if not preserve_system:
             self.system_messages.clear()
+            self._system_tokens = 0
+            self._system_index.clear()
         self.short_term_memory.clear()
+        self._short_term_tokens = 0
+        self._short_term_index.clear()
         logger.info(
             "Cleared short-term memory"
-            + " (preserved system messages)"
-            if preserve_system
-            else ""
+            + (
+                " (preserved system messages)"
+                if preserve_system
+                else ""
+            )
         )
 
     def get_memory_stats(self) -> Dict[str, Any]:
@@ -317,10 +551,11 @@ class MemoryManager:
                 MemoryEntry(**entry)
                 for entry in data["system_messages"]
             ]
-            self.short_term_memory = [
+            self.short_term_memory = deque(
                 MemoryEntry(**entry)
                 for entry in data["short_term_memory"]
-            ]
+            )
+            self._rebuild()
 
             logger.info(f"Loaded memory snapshot from {file_path}")
 
@@ -329,14 +564,25 @@ class MemoryManager:
             raise
 
     def search_memories(
-        self, query: str, memory_type: str = "all"
+        self,
+        query: str,
+        memory_type: str = "all",
+        ranked: bool = False,
+        limit: Optional[int] = None,
     ) -> List[MemoryEntry]:
         """
         Search through memories of specified type
 
+        Short-term and system memories are matched on whole words
+        through their term index, case-insensitively.
+
         Args:
             query (str): Search query
             memory_type (str): Type of memories to search ("short_term", "system", "long_term", or "all")
+            ranked (bool): Rank short-term and system matches with BM25,
+                allowing entries that contain only some query words.
+                By default entries must contain every query word.
+            limit (Optional[int]): Maximum matches per memory type.
 
         Returns:
             List[MemoryEntry]: Matching memory entries
@@ -345,20 +591,12 @@ class MemoryManager:
 
         if memory_type in ["short_term", "all"]:
             results.extend(
-                [
-                    entry
-                    for entry in self.short_term_memory
-                    if query.lower() in entry.content.lower()
-                ]
+                self._short_term_index.search(query, ranked, limit)
             )
 
         if memory_type in ["system", "all"]:
             results.extend(
-                [
-                    entry
-                    for entry in self.system_messages
-                    if query.lower() in entry.content.lower()
-                ]
+                self._system_index.search(query, ranked, limit)
             )
 
         if (
@@ -1,11 +1,12 @@
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
-from typing import Any, Callable, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field
 
 from swarms import Agent
+from swarms.structs.agent_collection import AgentCollection
 from swarms.utils.loguru_logger import logger
 
 
@@ -46,8 +47,9 @@ class AgentRegistry:
         description (str): A description of the registry.
         return_json (bool): Indicates whether to return data in JSON format.
         auto_save (bool): Indicates whether to automatically save changes to the registry.
-        agents (Dict[str, Agent]): A dictionary of agents in the registry, keyed by agent name.
-        lock (Lock): A lock for thread-safe operations on the registry.
+        agents (Mapping[str, Agent]): Read-only view of the agents in the registry, keyed by agent name.
+        collection (AgentCollection): Indexed storage behind ``agents``.
+        lock (Lock): A lock for thread-safe updates to ``agent_registry``.
         agent_registry (AgentRegistrySchema): The schema for the agent registry.
     """
 
@@ -75,7 +77,7 @@ class AgentRegistry:
         self.description = description
         self.return_json = return_json
         self.auto_save = auto_save
-        self.agents: Dict[str, Agent] = {}
+        self.collection = AgentCollection(unique_names=True)
         self.lock = Lock()
 
         # Initialize the agent registry
@@ -102,22 +104,23 @@ class AgentRegistry:
         """
         name = agent.agent_name
 
+        try:
+            self.collection.add(agent)
+        except ValueError:
+            logger.error(f"Agent with name {name} already exists.")
+            raise
         self.agent_to_py_model(agent)
+        logger.info(f"Agent {name} added successfully.")
 
-        with self.lock:
-            if name in self.agents:
-                logger.error(
-                    f"Agent with name {name} already exists."
-                )
-                raise ValueError(
-                    f"Agent with name {name} already exists."
-                )
-            try:
-                self.agents[name] = agent
-                logger.info(f"Agent {name} added successfully.")
-            except ValidationError as e:
-                logger.error(f"Validation error: {e}")
-                raise
+    @property
+    def agents(self) -> Mapping[str, Agent]:
+        """
+        Read-only snapshot of the registered agents keyed by name.
+
+        Writing to it raises ``TypeError``; use :meth:`add`,
+        :meth:`update_agent` or :meth:`delete` instead.
+        """
+        return MappingProxyType(self.collection.as_dict())
 
     def add_many(self, agents: List[Agent]) -> None:
         """
@@ -130,17 +133,14 @@ class AgentRegistry:
             ValueError: If any of the agent_names already exist in the registry.
             ValidationError: If the input data is invalid.
         """
-        with ThreadPoolExecutor() as executor:
-            futures = {
-                executor.submit(self.add, agent): agent
-                for agent in agents
-            }
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Error adding agent: {e}")
-                    raise
+        try:
+            self.collection.add_many(agents)
+        except ValueError as e:
+            logger.error(f"Error adding agent: {e}")
+            raise
+        for agent in agents:
+            self.agent_to_py_model(agent)
+        logger.info(f"{len(agents)} agents added successfully.")
 
     def delete(self, agent_name: str) -> None:
         """
@@ -152,15 +152,12 @@ class AgentRegistry:
         Raises:
             KeyError: If the agent_name does not exist in the registry.
         """
-        with self.lock:
-            try:
-                del self.agents[agent_name]
-                logger.info(
-                    f"Agent {agent_name} deleted successfully."
-                )
-            except KeyError as e:
-                logger.error(f"Error: {e}")
-                raise
+        try:
+            self.collection.remove(agent_name)
+            logger.info(f"Agent {agent_name} deleted successfully.")
+        except KeyError as e:
+            logger.error(f"Error: {e}")
+            raise
 
     def update_agent(self, agent_name: str, new_agent: Agent) -> None:
         """
@@ -174,22 +171,16 @@ class AgentRegistry:
             KeyError: If the agent_name does not exist in the registry.
             ValidationError: If the input data is invalid.
         """
-        with self.lock:
-            if agent_name not in self.agents:
-                logger.error(
-                    f"Agent with name {agent_name} does not exist."
-                )
-                raise KeyError(
-                    f"Agent with name {agent_name} does not exist."
-                )
-            try:
-                self.agents[agent_name] = new_agent
-                logger.info(
-                    f"Agent {agent_name} updated successfully."
-                )
-            except ValidationError as e:
-                logger.error(f"Validation error: {e}")
-                raise
+        try:
+            self.collection.replace(agent_name, new_agent)
+            logger.info(f"Agent {agent_name} updated successfully.")
+        except KeyError:
+            logger.error(
+                f"Agent with name {agent_name} does not exist."
+            )
+            raise KeyError(
+                f"Agent with name {agent_name} does not exist."
+            )
 
     def get(self, agent_name: str) -> Agent:
         """
@@ -204,16 +195,13 @@ class AgentRegistry:
         Raises:
             KeyError: If the agent_name does not exist in the registry.
         """
-        with self.lock:
-            try:
-                agent = self.agents[agent_name]
-                logger.info(
-                    f"Agent {agent_name} retrieved successfully."
-                )
-                return agent
-            except KeyError as e:
-                logger.error(f"Error: {e}")
-                raise
+        try:
+            agent = self.collection.get(agent_name)
+            logger.info(f"Agent {agent_name} retrieved successfully.")
+            return agent
+        except KeyError as e:
+            logger.error(f"Error: {e}")
+            raise
 
     def list_agents(self) -> List[str]:
         """
@@ -223,10 +211,9 @@ class AgentRegistry:
             List[str]: A list of all agent names.
         """
         try:
-            with self.lock:
-                agent_names = list(self.agents.keys())
-                logger.info("Listing all agents.")
-                return agent_names
+            agent_names = self.collection.names()
+            logger.info("Listing all agents.")
+            return agent_names
         except Exception as e:
             logger.error(f"Error: {e}")
             raise e
@@ -239,10 +226,9 @@ class AgentRegistry:
             List[Agent]: A list of all agents.
         """
         try:
-            with self.lock:
-                agents = list(self.agents.values())
-                logger.info("Returning all agents.")
-                return agents
+            agents = self.collection.query()
+            logger.info("Returning all agents.")
+            return agents
         except Exception as e:
             logger.error(f"Error: {e}")
             raise e
@@ -253,6 +239,9 @@ class AgentRegistry:
         """
         Queries agents based on a condition.
 
+        Reads a copy-on-write snapshot, so queries never block
+        concurrent updates.
+
         Args:
             condition (Optional[Callable[[Agent], bool]]): A function that takes an agent and returns a boolean indicating
                                                            whether the agent meets the condition.
@@ -261,19 +250,13 @@ class AgentRegistry:
             List[Agent]: A list of agents that meet the condition.
         """
         try:
-            with self.lock:
-                if condition is None:
-                    agents = list(self.agents.values())
-                    logger.info("Querying all agents.")
-                    return agents
-
-                agents = [
-                    agent
-                    for agent in self.agents.values()
-                    if condition(agent)
-                ]
-                logger.info("Querying agents with condition.")
-                return agents
+            agents = self.collection.query(condition)
+            logger.info(
+                "Querying all agents."
+                if condition is None
+                else "Querying agents with condition."
+            )
+            return agents
         except Exception as e:
             logger.error(f"Error: {e}")
             raise e
@@ -288,19 +271,41 @@ class AgentRegistry:
         Returns:
             Agent: The agent with the given name.
         """
-        try:
-            with ThreadPoolExecutor() as executor:
-                futures = {
-                    executor.submit(self.get, agent_name): agent_name
-                    for agent_name in self.agents.keys()
-                }
-                for future in as_completed(futures):
-                    agent = future.result()
-                    if agent.agent_name == agent_name:
-                        return agent
-        except Exception as e:
-            logger.error(f"Error: {e}")
-            raise e
+        return self.collection.find(agent_name)
+
+    def find_agent_by_id(self, agent_id: str) -> Optional[Agent]:
+        """
+        Find an agent by its id.
+
+        Args:
+            agent_id (str): The id of the agent to find.
+
+        Returns:
+            Optional[Agent]: The agent with the given id, if any.
+        """
+        return self.collection.find_by_id(agent_id)
+
+    def find_agents_by_tag(self, tag: str) -> List[Agent]:
+        """
+        Find the agents carrying a tag.
+
+        Args:
+            tag (str): The tag to look up.
+
+        Returns:
+            List[Agent]: The agents with the tag.
+        """
+        return self.collection.find_by_tag(tag)
+
+    def where(self, **criteria: Any) -> List[Agent]:
+        """
+        Find the agents whose attributes equal the given values, using
+        the collection's indexes where available.
+
+        Returns:
+            List[Agent]: The matching agents.
+        """
+        return self.collection.where(**criteria)
 
     def agent_to_py_model(self, agent: Agent):
         """
@@ -327,4 +332,5 @@ class AgentRegistry:
             f"Agent {agent_name} converted to Pydantic model."
         )
 
-        self.agent_registry.agents.append(schema)
+        with self.lock:
+            self.agent_registry.agents.append(schema)
@@ -1,29 +1,109 @@
-from typing import List, Optional
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
 
+import numpy as np
 from tenacity import retry, stop_after_attempt, wait_exponential
-from typing import Union, Callable, Any
+
 from swarms import Agent
-from swarms.utils.loguru_logger import initialize_logger
-from swarms.utils.lazy_loader import lazy_import_decorator
-from swarms.utils.auto_download_check_packages import (
-    auto_check_and_download_package,
+from swarms.structs.vector_index import (
+    EmbeddingFunction,
+    NumpyVectorIndex,
+    VectorIndex,
 )
-
+from swarms.utils.lazy_loader import lazy_import_decorator
+from swarms.utils.loguru_logger import initialize_logger
 
 logger = initialize_logger(log_folder="agent_router")
 
 
+class AgentProfile:
+    """
+    Routing vector for one agent, built from its profile and history.
+
+    The profile embedding is fixed. Recent interactions keep their own
+    vectors in a bounded window; when one falls out of the window it is
+    folded into a decayed summary vector, so every interaction keeps an
+    exponentially decaying weight without the cost of updates growing
+    with history.
+
+    Args:
+        profile (np.ndarray): Embedding of the name, description and
+            system prompt.
+        max_recent (int): Interaction vectors kept individually.
+        decay (float): Weight multiplier per newer interaction.
+        profile_weight (float): Weight of the profile vector.
+        history_weight (float): Weight of the normalized history vector.
+    """
+
+    def __init__(
+        self,
+        profile: np.ndarray,
+        max_recent: int = 16,
+        decay: float = 0.8,
+        profile_weight: float = 1.0,
+        history_weight: float = 0.5,
+    ):
+        self.profile = _normalize(profile)
+        self.recent: Deque[np.ndarray] = deque(maxlen=max_recent)
+        self.summary = np.zeros_like(self.profile)
+        self.decay = decay
+        self.profile_weight = profile_weight
+        self.history_weight = history_weight
+        self.interactions = 0
+
+    def add(self, vector: np.ndarray) -> None:
+        """Add one interaction embedding as the newest entry."""
+        if len(self.recent) == self.recent.maxlen:
+            self.summary = self.summary * self.decay + self.recent[0]
+        self.recent.append(_normalize(vector))
+        self.interactions += 1
+
+    def vector(self) -> np.ndarray:
+        """The combined routing vector."""
+        history = self.summary * self.decay ** len(self.recent)
+        for age, vector in enumerate(reversed(self.recent)):
+            history = history + vector * self.decay**age
+        return (
+            self.profile_weight * self.profile
+            + self.history_weight * _normalize(history)
+        )
+
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
 @lazy_import_decorator
 class AgentRouter:
     """
     Initialize the AgentRouter.
 
     Args:
-        collection_name (str): Name of the collection in the vector database.
-        persist_directory (str): Directory to persist the vector database.
+        collection_name (str): Name of the index, used as its directory
+            under ``persist_directory``.
+        persist_directory (str): Directory :meth:`save` and :meth:`load`
+            use.
         n_agents (int): Number of agents to return in queries.
-        *args: Additional arguments to pass to the chromadb Client.
-        **kwargs: Additional keyword arguments to pass to the chromadb Client.
+        embedding_fn (Optional[EmbeddingFunction]): Embeds a batch of
+            texts. Defaults to a local hashing embedding.
+        index (Optional[VectorIndex]): Vector index to route with.
+            Defaults to a :class:`NumpyVectorIndex`. :meth:`save` and
+            :meth:`load` need its class to provide ``save(path)`` and
+            a ``load(path, embedding_fn=...)`` classmethod.
+        max_recent_interactions (int): Interaction vectors kept per
+            agent before older ones are folded into its summary.
+        history_decay (float): Weight multiplier applied per newer
+            interaction.
+        profile_weight (float): Weight of the profile embedding in the
+            routing vector.
+        history_weight (float): Weight of the interaction history in the
+            routing vector.
+        embedding_batch_size (int): Maximum texts per embedding call
+            when indexing interactions.
     """
 
     def __init__(
@@ -31,25 +111,50 @@ class AgentRouter:
         collection_name: str = "agents",
         persist_directory: str = "./vector_db",
         n_agents: int = 1,
-        *args,
-        **kwargs,
+        embedding_fn: Optional[EmbeddingFunction] = None,
+        index: Optional[VectorIndex] = None,
+        max_recent_interactions: int = 16,
+        history_decay: float = 0.8,
+        profile_weight: float = 1.0,
+        history_weight: float = 0.5,
+        embedding_batch_size: int = 32,
     ):
-        try:
-            import chromadb
-        except ImportError:
-            auto_check_and_download_package(
-                "chromadb", package_manager="pip", upgrade=True
-            )
-            import chromadb
-
         self.collection_name = collection_name
         self.n_agents = n_agents
         self.persist_directory = persist_directory
-        self.client = chromadb.Client(*args, **kwargs)
-        self.collection = self.client.create_collection(
-            collection_name
+        # An empty index is falsy, so test for None explicitly
+        self.index = (
+            NumpyVectorIndex(embedding_fn=embedding_fn)
+            if index is None
+            else index
         )
         self.agents: List[Agent] = []
+        self.agents_by_name: Dict[str, Agent] = {}
+        self.max_recent_interactions = max_recent_interactions
+        self.history_decay = history_decay
+        self.profile_weight = profile_weight
+        self.history_weight = history_weight
+        self.embedding_batch_size = embedding_batch_size
+
+        self.profiles: Dict[str, AgentProfile] = {}
+        self._history_seen: Dict[str, int] = {}
+        self._pending: List[tuple] = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="agent-router"
+        )
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(
+            self.persist_directory, self.collection_name
+        )
+
+    @staticmethod
+    def _profile_text(agent: Agent) -> str:
+        return (
+            f"{agent.name} {agent.description} {agent.system_prompt}"
+        )
 
     @retry(
         stop=stop_after_attempt(3),
@@ -57,28 +162,22 @@ class AgentRouter:
     )
     def add_agent(self, agent: Agent) -> None:
         """
-        Add an agent to the vector database.
+        Add an agent to the vector index.
 
         Args:
             agent (Agent): The agent to add.
 
         Raises:
-            Exception: If there's an error adding the agent to the vector database.
+            Exception: If there's an error adding the agent to the vector index.
         """
         try:
-            agent_text = f"{agent.name} {agent.description} {agent.system_prompt}"
-            self.collection.add(
-                documents=[agent_text],
-                metadatas=[{"name": agent.name}],
-                ids=[agent.name],
-            )
-            self.agents.append(agent)
+            self._index_profiles([agent])
             logger.info(
-                f"Added agent {agent.name} to the vector database."
+                f"Added agent {agent.name} to the vector index."
             )
         except Exception as e:
             logger.error(
-                f"Error adding agent {agent.name} to the vector database: {str(e)}"
+                f"Error adding agent {agent.name} to the vector index: {str(e)}"
             )
             raise
 
@@ -86,41 +185,173 @@ class AgentRouter:
         self, agents: List[Union[Agent, Callable, Any]]
     ) -> None:
         """
-        Add multiple agents to the vector database.
+        Add multiple agents to the vector index in one embedding batch.
 
         Args:
             agents (List[Union[Agent, Callable, Any]]): List of agents to add.
         """
-        for agent in agents:
-            self.add_agent(agent)
+        if not agents:
+            return
+        self._index_profiles(agents)
+        logger.info(
+            f"Added {len(agents)} agents to the vector index."
+        )
+
+    def _new_profile(self, vector: np.ndarray) -> AgentProfile:
+        return AgentProfile(
+            vector,
+            max_recent=self.max_recent_interactions,
+            decay=self.history_decay,
+            profile_weight=self.profile_weight,
+            history_weight=self.history_weight,
+        )
 
-    def update_agent_history(self, agent_name: str) -> None:
+    def _index_profiles(self, agents: List[Agent]) -> None:
+        """Embed agent profiles in one batch and index them."""
+        vectors = self.index.embed(
+            [self._profile_text(agent) for agent in agents]
+        )
+        with self._lock:
+            for agent, vector in zip(agents, vectors):
+                if agent.name not in self.agents_by_name:
+                    self.agents.append(agent)
+                self.agents_by_name[agent.name] = agent
+                self.profiles[agent.name] = self._new_profile(vector)
+            self.index.upsert(
+                [agent.name for agent in agents],
+                vectors,
+                [{"name": agent.name} for agent in agents],
+            )
+
+    def remove_agent(self, agent_name: str) -> None:
+        """
+        Remove an agent from the router.
+
+        Args:
+            agent_name (str): The name of the agent to remove.
+        """
+        with self._lock:
+            agent = self.agents_by_name.pop(agent_name, None)
+            if agent is not None:
+                self.agents.remove(agent)
+            self.profiles.pop(agent_name, None)
+            self._history_seen.pop(agent_name, None)
+            self.index.delete([agent_name])
+
+    def update_agent_history(self, agent_name: str) -> Future:
         """
-        Update the agent's entry in the vector database with its interaction history.
+        Index the messages added to an agent's history since the last
+        update.
+
+        Each message is embedded once, in a background batch, and folded
+        into the agent's routing vector, so the cost does not grow with
+        the length of the history.
 
         Args:
             agent_name (str): The name of the agent to update.
+
+        Returns:
+            Future: Resolves once the new messages are indexed.
         """
-        agent = next(
-            (a for a in self.agents if a.name == agent_name), None
-        )
-        if agent:
-            history = agent.short_memory.return_history_as_string()
-            history_text = " ".join(history)
-            updated_text = f"{agent.name} {agent.description} {agent.system_prompt} {history_text}"
-
-            self.collection.update(
-                ids=[agent_name],
-                documents=[updated_text],
-                metadatas=[{"name": agent_name}],
-            )
-            logger.info(
-                f"Updated agent {agent_name} with interaction history."
-            )
-        else:
+        agent = self.agents_by_name.get(agent_name)
+        if agent is None:
             logger.warning(
-                f"Agent {agent_name} not found in the database."
+                f"Agent {agent_name} not found in the index."
             )
+            future = Future()
+            future.set_result(None)
+            return future
+
+        history = agent.short_memory.conversation_history
+        seen = min(
+            self._history_seen.get(agent_name, 0), len(history)
+        )
+        self._history_seen[agent_name] = len(history)
+        texts = [
+            f"{message['role']}: {message['content']}"
+            for message in history[seen:]
+        ]
+        logger.info(
+            f"Queued {len(texts)} new messages for agent {agent_name}."
+        )
+        return self.record_interactions(agent_name, texts)
+
+    def record_interactions(
+        self, agent_name: str, texts: List[str]
+    ) -> Future:
+        """
+        Queue interactions to be embedded and added to an agent's
+        routing vector.
+
+        Interactions queued while an embedding job is running are
+        batched into the next one.
+
+        Args:
+            agent_name (str): The agent the interactions belong to.
+            texts (List[str]): The interaction texts.
+
+        Returns:
+            Future: Resolves once the interactions are indexed.
+        """
+        with self._lock:
+            self._pending.extend((agent_name, text) for text in texts)
+        return self._executor.submit(self._index_pending)
+
+    def _index_pending(self) -> None:
+        """Embed queued interactions in batches and refresh the index."""
+        while True:
+            with self._lock:
+                batch = self._pending[: self.embedding_batch_size]
+                del self._pending[: self.embedding_batch_size]
+            if not batch:
+                return
+
+            vectors = self.index.embed([text for _, text in batch])
+            with self._lock:
+                touched = {}
+                for (name, _), vector in zip(batch, vectors):
+                    profile = self.profiles.get(name)
+                    if profile is None:
+                        continue
+                    profile.add(vector)
+                    touched[name] = profile
+                if touched:
+                    self.index.upsert(
+                        list(touched),
+                        [p.vector() for p in touched.values()],
+                        [{"name": name} for name in touched],
+                    )
+
+    def flush(self) -> None:
+        """Block until every queued interaction is indexed."""
+        self._executor.submit(self._index_pending).result()
+
+    def shutdown(self) -> None:
+        """Index queued interactions and stop the background worker."""
+        self._executor.shutdown(wait=True)
+
+    def find_best_agents(
+        self, task: str, n_agents: Optional[int] = None
+    ) -> List[Agent]:
+        """
+        Find the agents best matching a task, best first.
+
+        Args:
+            task (str): The task description.
+            n_agents (Optional[int]): How many agents to return.
+                Defaults to ``self.n_agents``.
+
+        Returns:
+            List[Agent]: The matching agents.
+        """
+        matches = self.index.query_text(
+            task, n_agents or self.n_agents
+        )
+        return [
+            self.agents_by_name[name]
+            for name, _ in matches
+            if name in self.agents_by_name
+        ]
 
     @retry(
         stop=stop_after_attempt(3),
@@ -132,10 +363,11 @@ class AgentRouter:
         """
         Find the best agent for a given task.
 
+        Routing costs one embedding and one matrix-vector product over
+        the agent profiles.
+
         Args:
             task (str): The task description.
-            *args: Additional arguments to pass to the collection.query method.
-            **kwargs: Additional keyword arguments to pass to the collection.query method.
 
         Returns:
             Optional[Agent]: The best matching agent, if found.
@@ -144,23 +376,11 @@ class AgentRouter:
             Exception: If there's an error finding the best agent.
         """
         try:
-            results = self.collection.query(
-                query_texts=[task],
-                n_results=self.n_agents,
-                *args,
-                **kwargs,
-            )
+            matches = self.index.query_text(task, 1)
 
-            if results["ids"]:
-                best_match_name = results["ids"][0][0]
-                best_agent = next(
-                    (
-                        a
-                        for a in self.agents
-                        if a.name == best_match_name
-                    ),
-                    None,
-                )
+            if matches:
+                best_match_name = matches[0][0]
+                best_agent = self.agents_by_name.get(best_match_name)
                 if best_agent:
                     logger.info(
                         f"Found best matching agent: {best_match_name}"
@@ -180,6 +400,47 @@ class AgentRouter:
             logger.error(f"Error finding best agent: {str(e)}")
             raise
 
+    def save(self) -> None:
+        """Save the index to ``persist_directory``."""
+        self.index.save(self.index_path)
+
+    def load(self, agents: List[Agent]) -> None:
+        """
+        Load a saved index and attach the agents it routes to.
+
+        The saved routing vectors are kept; interaction windows start
+        empty, so the first new interaction re-bases an agent's vector
+        on its profile and the interactions recorded from then on.
+
+        Args:
+            agents (List[Agent]): Agents whose names match the saved
+                entries.
+
+        Raises:
+            TypeError: If the index class has no ``load`` method.
+        """
+        index_class = type(self.index)
+        if not hasattr(index_class, "load"):
+            raise TypeError(
+                f"{index_class.__name__} does not support loading"
+            )
+        self.index = index_class.load(
+            self.index_path, embedding_fn=self.index.embedding_fn
+        )
+        vectors = self.index.embed(
+            [self._profile_text(agent) for agent in agents]
+        )
+        with self._lock:
+            self.agents = list(agents)
+            self.agents_by_name = {
+                agent.name: agent for agent in agents
+            }
+            self.profiles = {
+                agent.name: self._new_profile(vector)
+                for agent, vector in zip(agents, vectors)
+            }
+            self._history_seen = {}
+
 
 # # Example usage
 # if __name__ == "__main__":
@@ -2,19 +2,22 @@ import asyncio
 import json
 import logging
 import os
+import re
 import threading
 import uuid
+from collections import defaultdict, deque
 from contextlib import asynccontextmanager
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
 from logging.handlers import RotatingFileHandler
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
 from swarms.structs.agent import Agent
 from swarms.structs.base_workflow import BaseWorkflow
+from swarms.structs.majority_voting import normalize_answer
 from swarms.utils.loguru_logger import initialize_logger
 
 # Base logger initialization
@@ -63,10 +66,43 @@ class SpeakerMessage(BaseModel):
 
 
 class GroupChatConfig(BaseModel):
+    """
+    Settings for ``AsyncWorkflow.run_group_chat``.
+
+    Attributes:
+        max_turns: Upper bound on the number of turns.
+        timeout_per_turn: Seconds a speaker may take for one turn; a
+            speaker's own ``timeout`` applies if it is shorter.
+        require_all_speakers: Never end before every required speaker
+            has contributed.
+        allow_concurrent: Run the speakers of a turn concurrently.
+        overlap_turns: With concurrent speakers, start a speaker's next
+            turn as soon as another speaker's message from the current
+            turn is available instead of waiting for the whole turn.
+        termination: Predicates checked after each completed turn; the
+            chat ends when any returns True. Names refer to
+            ``TERMINATION_PREDICATES``; callables take a
+            :class:`GroupChatProgress`.
+        novelty_threshold: Fraction of new words below which a turn
+            counts as adding no new information.
+        history_window: Messages passed as ``history`` in each turn's
+            context. Older messages are folded into ``summary``.
+        summarizer: Folds an evicted message into the running summary.
+            Defaults to appending a truncated line per message.
+        save_history: Append the chat to the speaker system's history.
+    """
+
     max_turns: int = 10
     timeout_per_turn: float = 30.0
     require_all_speakers: bool = False
     allow_concurrent: bool = True
+    overlap_turns: bool = False
+    termination: List[Union[str, Callable]] = Field(
+        default_factory=lambda: ["consensus", "no_new_information"]
+    )
+    novelty_threshold: float = 0.1
+    history_window: int = 10
+    summarizer: Optional[Callable] = None
     save_history: bool = True
 
 
@@ -90,12 +126,46 @@ class SpeakerConfig:
 
 
 class SharedMemory:
-    """Thread-safe shared memory implementation with persistence"""
+    """
+    Thread-safe shared memory with write-behind persistence.
+
+    Writes land in memory and mark the key dirty; a background thread
+    appends the latest value of each dirty key to a JSON-lines log once
+    ``flush_interval`` seconds pass or ``flush_threshold`` keys are
+    dirty, so agents never wait on disk I/O and repeated writes to a
+    key cost one log record per flush. The log is compacted to one
+    record per key once it grows past ``compact_ratio`` times the live
+    key count. Reads go straight to the in-memory dict without locking.
+    Call :meth:`close` (or :meth:`aclose`) to flush durably.
+
+    Args:
+        persistence_path (Optional[str]): Log file. None keeps the
+            memory in-process only.
+        flush_interval (float): Maximum seconds a write stays unflushed.
+        flush_threshold (int): Dirty keys that trigger an early flush.
+        compact_ratio (float): Log records per live key that trigger a
+            compaction.
+    """
 
-    def __init__(self, persistence_path: Optional[str] = None):
-        self._memory = {}
+    def __init__(
+        self,
+        persistence_path: Optional[str] = None,
+        flush_interval: float = 1.0,
+        flush_threshold: int = 100,
+        compact_ratio: float = 4.0,
+    ):
+        self._memory: Dict[str, SharedMemoryItem] = {}
+        self._dirty: Dict[str, SharedMemoryItem] = {}
         self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
         self._persistence_path = persistence_path
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self.compact_ratio = compact_ratio
+        self._log_records = 0
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
         self._load_from_disk()
 
     def set(
@@ -105,44 +175,305 @@ class SharedMemory:
         author: str,
         metadata: Dict[str, Any] = None,
     ) -> None:
+        item = SharedMemoryItem(
+            key=key,
+            value=value,
+            timestamp=datetime.utcnow(),
+            author=author,
+            metadata=metadata or {},
+        )
         with self._lock:
-            item = SharedMemoryItem(
-                key=key,
-                value=value,
-                timestamp=datetime.utcnow(),
-                author=author,
-                metadata=metadata or {},
-            )
+            # Update both under one lock so the value logged for a key
+            # is always the one left in memory
             self._memory[key] = item
-            self._persist_to_disk()
+            if not self._persistence_path:
+                return
+            self._dirty[key] = item
+            dirty = len(self._dirty)
+        self._ensure_flusher()
+        if dirty >= self.flush_threshold:
+            self._wake.set()
 
     def get(self, key: str) -> Optional[Any]:
-        with self._lock:
-            item = self._memory.get(key)
-            return item.value if item else None
+        item = self._memory.get(key)
+        return item.value if item else None
 
     def get_with_metadata(
         self, key: str
     ) -> Optional[SharedMemoryItem]:
-        with self._lock:
-            return self._memory.get(key)
+        return self._memory.get(key)
 
-    def _persist_to_disk(self) -> None:
-        if self._persistence_path:
-            with open(self._persistence_path, "w") as f:
-                json.dump(
-                    {k: asdict(v) for k, v in self._memory.items()}, f
-                )
+    def keys(self) -> List[str]:
+        return list(self._memory)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Point-in-time copy of every key and value."""
+        return {
+            key: item.value
+            for key, item in list(self._memory.items())
+        }
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        author: str,
+        metadata: Dict[str, Any] = None,
+    ) -> None:
+        self.set(key, value, author, metadata)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        return self.get(key)
+
+    async def aflush(self) -> None:
+        await asyncio.to_thread(self.flush)
+
+    async def aclose(self) -> None:
+        await asyncio.to_thread(self.close)
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or not self._flusher.is_alive():
+            with self._lock:
+                if (
+                    self._flusher is None
+                    or not self._flusher.is_alive()
+                ):
+                    self._closed.clear()
+                    self._flusher = threading.Thread(
+                        target=self._flush_loop,
+                        name="shared-memory-flush",
+                        daemon=True,
+                    )
+                    self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while not self._closed.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing shared memory: {e}")
+
+    def flush(self) -> None:
+        """Append every dirty key to the log and fsync it."""
+        if not self._persistence_path:
+            return
+
+        with self._io_lock:
+            with self._lock:
+                dirty, self._dirty = self._dirty, {}
+            if not dirty:
+                return
+
+            with open(self._persistence_path, "a") as f:
+                for item in dirty.values():
+                    f.write(json.dumps(asdict(item), default=str))
+                    f.write("\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._log_records += len(dirty)
+
+            if self._log_records > self.compact_ratio * max(
+                len(self._memory), 1
+            ):
+                self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the log with one record per live key."""
+        tmp_path = f"{self._persistence_path}.tmp"
+        with self._lock:
+            items = list(self._memory.values())
+        with open(tmp_path, "w") as f:
+            for item in items:
+                f.write(json.dumps(asdict(item), default=str))
+                f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._persistence_path)
+        self._log_records = len(items)
+
+    def close(self) -> None:
+        """Stop the background flusher and flush what is left."""
+        self._closed.set()
+        self._wake.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+
+    @staticmethod
+    def _item_from_dict(data: Dict[str, Any]) -> SharedMemoryItem:
+        if isinstance(data.get("timestamp"), str):
+            data["timestamp"] = datetime.fromisoformat(
+                data["timestamp"]
+            )
+        return SharedMemoryItem(**data)
 
     def _load_from_disk(self) -> None:
-        if self._persistence_path and os.path.exists(
+        if not (
             self._persistence_path
+            and os.path.exists(self._persistence_path)
         ):
-            with open(self._persistence_path, "r") as f:
-                data = json.load(f)
-                self._memory = {
-                    k: SharedMemoryItem(**v) for k, v in data.items()
+            return
+
+        with open(self._persistence_path, "r") as f:
+            content = f.read()
+
+        records, legacy = [], False
+        lines = content.splitlines()
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                if number == len(lines):
+                    logger.warning(
+                        "Ignoring torn final record in shared memory log"
+                    )
+                    break
+                raise
+            if not (
+                isinstance(record, dict)
+                and "key" in record
+                and "author" in record
+            ):
+                legacy = True
+                break
+            records.append(record)
+
+        if legacy:
+            # Stores written before the log format: one JSON object
+            records = list(json.loads(content).values())
+
+        for record in records:
+            item = self._item_from_dict(record)
+            self._memory[item.key] = item
+        self._log_records = len(records)
+
+        if legacy or (content and not content.endswith("\n")):
+            self._compact()
+
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+@dataclass
+class GroupChatProgress:
+    """
+    Incrementally maintained state the termination predicates read.
+
+    Each completed turn is recorded once, so checking for termination
+    costs the size of the latest turn, not of the whole chat.
+    """
+
+    config: GroupChatConfig
+    required_roles: set = field(default_factory=set)
+    turns: List[List[SpeakerMessage]] = field(default_factory=list)
+    spoken_roles: set = field(default_factory=set)
+    seen_words: set = field(default_factory=set)
+    last_novelty: float = 1.0
+
+    def record_turn(self, turn: List[SpeakerMessage]) -> None:
+        words = set()
+        for message in turn:
+            if message.content is None:
+                continue
+            self.spoken_roles.add(message.role)
+            words.update(
+                _WORD_PATTERN.findall(str(message.content).lower())
+            )
+        new_words = words - self.seen_words
+        self.last_novelty = (
+            len(new_words) / len(words) if words else 0.0
+        )
+        self.seen_words |= new_words
+        self.turns.append(turn)
+
+
+def _answers(turn: List[SpeakerMessage]) -> List[str]:
+    return [
+        normalize_answer(message.content)
+        for message in turn
+        if message.content is not None
+    ]
+
+
+def consensus_reached(progress: GroupChatProgress) -> bool:
+    """Every answer in the latest turn agrees (with the previous turn
+    too when only one speaker answered)."""
+    if not progress.turns:
+        return False
+    answers = _answers(progress.turns[-1])
+    if len(answers) == 1 and len(progress.turns) > 1:
+        answers += _answers(progress.turns[-2])
+    return len(answers) > 1 and len(set(answers)) == 1
+
+
+def no_new_information(progress: GroupChatProgress) -> bool:
+    """The latest turn added almost no words not seen before."""
+    return (
+        len(progress.turns) > 1
+        and progress.last_novelty < progress.config.novelty_threshold
+    )
+
+
+def required_speakers_done(progress: GroupChatProgress) -> bool:
+    """Every required speaker has contributed."""
+    return progress.required_roles.issubset(progress.spoken_roles)
+
+
+TERMINATION_PREDICATES: Dict[
+    str, Callable[[GroupChatProgress], bool]
+] = {
+    "consensus": consensus_reached,
+    "no_new_information": no_new_information,
+    "required_speakers": required_speakers_done,
+}
+
+
+def _summarize_message(
+    summary: str, message: "SpeakerMessage"
+) -> str:
+    line = f"{message.agent_name}: {str(message.content)[:200]}"
+    return f"{summary}\n{line}"[-2000:] if summary else line
+
+
+class ChatHistoryWindow:
+    """Bounded recent history plus a running summary of older turns."""
+
+    def __init__(
+        self,
+        size: int,
+        summarizer: Optional[Callable] = None,
+    ):
+        self.window: Deque[SpeakerMessage] = deque()
+        self.size = size
+        self.summarizer = summarizer or _summarize_message
+        self.summary = ""
+
+    def add(self, message: SpeakerMessage) -> None:
+        if message.content is None:
+            return
+        self.window.append(message)
+        while len(self.window) > self.size:
+            self.summary = self.summarizer(
+                self.summary, self.window.popleft()
+            )
+
+    def context(self) -> Dict[str, Any]:
+        return {
+            "history": [
+                {
+                    "agent_name": message.agent_name,
+                    "role": message.role,
+                    "content": message.content,
                 }
+                for message in self.window
+            ],
+            "summary": self.summary,
+        }
 
 
 class SpeakerSystem:
@@ -167,10 +498,15 @@ class SpeakerSystem:
         config: SpeakerConfig,
         input_data: Any,
         context: Dict[str, Any] = None,
+        deadline: Optional[float] = None,
     ) -> SpeakerMessage:
+        timeout = config.timeout
+        if deadline is not None:
+            remaining = deadline - asyncio.get_running_loop().time()
+            timeout = max(min(timeout, remaining), 0)
         try:
             result = await asyncio.wait_for(
-                config.agent.arun(input_data), timeout=config.timeout
+                config.agent.arun(input_data), timeout=timeout
             )
 
             return SpeakerMessage(
@@ -265,12 +601,15 @@ class AsyncWorkflow(BaseWorkflow):
             self.speaker_system.add_speaker(config)
 
     async def run_concurrent_speakers(
-        self, task: str, context: Dict[str, Any] = None
+        self,
+        task: str,
+        context: Dict[str, Any] = None,
+        deadline: Optional[float] = None,
     ) -> List[SpeakerMessage]:
         """Run all concurrent speakers in parallel"""
         concurrent_tasks = [
             self.speaker_system._execute_speaker(
-                config, task, context
+                config, task, context, deadline
             )
             for config in self.speaker_system.speakers.values()
             if config.concurrent
@@ -282,7 +621,10 @@ class AsyncWorkflow(BaseWorkflow):
         return [r for r in results if isinstance(r, SpeakerMessage)]
 
     async def run_sequential_speakers(
-        self, task: str, context: Dict[str, Any] = None
+        self,
+        task: str,
+        context: Dict[str, Any] = None,
+        deadline: Optional[float] = None,
     ) -> List[SpeakerMessage]:
         """Run non-concurrent speakers in sequence"""
         results = []
@@ -292,7 +634,7 @@ class AsyncWorkflow(BaseWorkflow):
         ):
             if not config.concurrent:
                 result = await self.speaker_system._execute_speaker(
-                    config, task, context
+                    config, task, context, deadline
                 )
                 results.append(result)
         return results
@@ -300,72 +642,235 @@ class AsyncWorkflow(BaseWorkflow):
     async def run_group_chat(
         self, initial_message: str, context: Dict[str, Any] = None
     ) -> List[SpeakerMessage]:
-        """Run a group chat discussion among speakers"""
+        """
+        Run a group chat discussion among speakers.
+
+        After each completed turn the configured termination predicates
+        are checked, so the chat stops as soon as it converges instead
+        of always running ``max_turns``. Each turn's context carries a
+        bounded history window and a summary of older messages.
+        """
         if not self.enable_group_chat:
             raise ValueError(
                 "Group chat is not enabled for this workflow"
             )
 
+        config = self.group_chat_config
+        progress = GroupChatProgress(
+            config=config,
+            required_roles={
+                role
+                for role, speaker in self.speaker_system.speakers.items()
+                if speaker.required
+            },
+        )
+        history = ChatHistoryWindow(
+            config.history_window, config.summarizer
+        )
+
+        if config.allow_concurrent and config.overlap_turns:
+            messages = await self._run_overlapped_chat(
+                initial_message, context, progress, history
+            )
+        else:
+            messages = await self._run_turn_by_turn_chat(
+                initial_message, context, progress, history
+            )
+
+        if config.save_history:
+            self.speaker_system.message_history.extend(messages)
+
+        return messages
+
+    def _turn_context(
+        self,
+        turn: int,
+        history: ChatHistoryWindow,
+        context: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        return {"turn": turn, **history.context(), **(context or {})}
+
+    async def _run_turn_by_turn_chat(
+        self,
+        initial_message: str,
+        context: Optional[Dict[str, Any]],
+        progress: GroupChatProgress,
+        history: ChatHistoryWindow,
+    ) -> List[SpeakerMessage]:
         messages: List[SpeakerMessage] = []
-        current_turn = 0
+        loop = asyncio.get_running_loop()
 
-        while current_turn < self.group_chat_config.max_turns:
-            turn_context = {
-                "turn": current_turn,
-                "history": messages,
-                **(context or {}),
-            }
+        for current_turn in range(self.group_chat_config.max_turns):
+            turn_context = self._turn_context(
+                current_turn, history, context
+            )
+            turn_input = (
+                initial_message
+                if current_turn == 0
+                else messages[-1].content
+            )
+            deadline = (
+                loop.time() + self.group_chat_config.timeout_per_turn
+            )
 
             if self.group_chat_config.allow_concurrent:
                 turn_messages = await self.run_concurrent_speakers(
-                    (
-                        initial_message
-                        if current_turn == 0
-                        else messages[-1].content
-                    ),
-                    turn_context,
+                    turn_input, turn_context, deadline
                 )
             else:
                 turn_messages = await self.run_sequential_speakers(
-                    (
-                        initial_message
-                        if current_turn == 0
-                        else messages[-1].content
-                    ),
-                    turn_context,
+                    turn_input, turn_context, deadline
                 )
 
+            for message in turn_messages:
+                message.metadata["turn"] = current_turn
+                history.add(message)
             messages.extend(turn_messages)
+            progress.record_turn(turn_messages)
 
             # Check if we should continue the conversation
-            if self._should_end_group_chat(messages):
+            if self._should_end_group_chat(progress):
                 break
 
-            current_turn += 1
-
-        if self.group_chat_config.save_history:
-            self.speaker_system.message_history.extend(messages)
-
         return messages
 
+    async def _run_overlapped_chat(
+        self,
+        initial_message: str,
+        context: Optional[Dict[str, Any]],
+        progress: GroupChatProgress,
+        history: ChatHistoryWindow,
+    ) -> List[SpeakerMessage]:
+        """
+        Run each speaker in its own loop. A speaker starts turn N+1 as
+        soon as another speaker's turn-N message is available, and
+        turns are checked for termination as they complete.
+        """
+        config = self.group_chat_config
+        speakers = [
+            speaker
+            for speaker in self.speaker_system.speakers.values()
+            if speaker.concurrent
+        ]
+        if not speakers:
+            return []
+
+        loop = asyncio.get_running_loop()
+        turns: Dict[int, List[SpeakerMessage]] = defaultdict(list)
+        changed = asyncio.Condition()
+        stop = asyncio.Event()
+        state = {"next_turn": 0}
+
+        def input_for(speaker: SpeakerConfig, turn: int):
+            """Latest turn message from another speaker, if ready."""
+            posted = turns[turn]
+            others = [
+                m
+                for m in posted
+                if m.content is not None
+                and (
+                    len(speakers) == 1
+                    or m.agent_name != speaker.agent.agent_name
+                )
+            ]
+            if others:
+                return others[-1]
+            if len(posted) == len(speakers):
+                answered = [
+                    m for m in posted if m.content is not None
+                ]
+                return answered[-1] if answered else posted[-1]
+            return None
+
+        def complete_turns():
+            while not stop.is_set() and len(
+                turns[state["next_turn"]]
+            ) == len(speakers):
+                progress.record_turn(turns[state["next_turn"]])
+                state["next_turn"] += 1
+                if (
+                    self._should_end_group_chat(progress)
+                    or state["next_turn"] == config.max_turns
+                ):
+                    stop.set()
+
+        async def speak(speaker: SpeakerConfig):
+            turn_input = initial_message
+            for turn in range(config.max_turns):
+                if turn > 0:
+                    async with changed:
+                        await changed.wait_for(
+                            lambda: stop.is_set()
+                            or input_for(speaker, turn - 1)
+                            is not None
+                        )
+                    if stop.is_set():
+                        return
+                    previous = input_for(speaker, turn - 1)
+                    if previous.content is not None:
+                        turn_input = previous.content
+
+                message = await self.speaker_system._execute_speaker(
+                    speaker,
+                    turn_input,
+                    self._turn_context(turn, history, context),
+                    loop.time() + config.timeout_per_turn,
+                )
+                message.metadata["turn"] = turn
+                async with changed:
+                    turns[turn].append(message)
+                    history.add(message)
+                    complete_turns()
+                    changed.notify_all()
+                if stop.is_set():
+                    return
+
+        tasks = [asyncio.create_task(speak(s)) for s in speakers]
+        stopped = asyncio.create_task(stop.wait())
+        try:
+            pending = set(tasks)
+            while pending and not stop.is_set():
+                _, pending = await asyncio.wait(
+                    pending | {stopped},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                pending.discard(stopped)
+        finally:
+            stopped.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Keep only turns that were checked; in-flight work past the
+        # stopping turn is discarded
+        return [
+            message
+            for turn in range(state["next_turn"])
+            for message in turns[turn]
+        ]
+
     def _should_end_group_chat(
-        self, messages: List[SpeakerMessage]
+        self, progress: GroupChatProgress
     ) -> bool:
-        """Determine if group chat should end based on messages"""
-        if not messages:
+        """Determine if group chat should end after the latest turn"""
+        if not progress.turns or not any(
+            message.content is not None
+            for message in progress.turns[-1]
+        ):
             return True
 
         # Check if all required speakers have participated
-        if self.group_chat_config.require_all_speakers:
-            participating_roles = {msg.role for msg in messages}
-            required_roles = {
-                role
-                for role, config in self.speaker_system.speakers.items()
-                if config.required
-            }
-            if not required_roles.issubset(participating_roles):
-                return False
+        if (
+            self.group_chat_config.require_all_speakers
+            and not required_speakers_done(progress)
+        ):
+            return False
 
+        for predicate in self.group_chat_config.termination:
+            if isinstance(predicate, str):
+                predicate = TERMINATION_PREDICATES[predicate]
+            if predicate(progress):
+                return True
         return False
 
     @asynccontextmanager
@@ -453,7 +958,7 @@ class AsyncWorkflow(BaseWorkflow):
                     )
 
                 # Store speaker outputs in shared memory
-                self.shared_memory.set(
+                await self.shared_memory.aset(
                     "speaker_outputs",
                     [msg.dict() for msg in speaker_outputs],
                     "workflow",
@@ -496,9 +1001,7 @@ class AsyncWorkflow(BaseWorkflow):
                     ],
                     metadata={
                         "max_workers": self.max_workers,
-                        "shared_memory_keys": list(
-                            self.shared_memory._memory.keys()
-                        ),
+                        "shared_memory_keys": self.shared_memory.keys(),
                         "group_chat_enabled": self.enable_group_chat,
                         "total_speaker_messages": len(
                             speaker_outputs
@@ -603,7 +1106,8 @@ class AsyncWorkflow(BaseWorkflow):
                     end_time,
                 )
 
-            # Clear shared memory if configured
+            # Flush pending writes durably, then clear shared memory
+            await self.shared_memory.aclose()
             self.shared_memory._memory.clear()
 
         except Exception as e:
@@ -17,6 +17,7 @@ from typing import (
 import yaml
 
 from swarms.structs.agent import Agent
+from swarms.structs.agent_collection import AgentCollection
 from swarms.structs.conversation import Conversation
 from swarms.structs.omni_agent_types import AgentType
 from pydantic import BaseModel
@@ -226,13 +227,38 @@ class BaseSwarm(ABC):
     def step(self):
         """Step the swarm"""
 
+    @property
+    def agent_collection(self) -> AgentCollection:
+        """
+        Name, id, tag and attribute indexes over ``self.agents``.
+
+        Built lazily and kept in step by the methods that modify the
+        swarm. If ``self.agents`` is replaced or resized directly, the
+        indexes are rebuilt on the next lookup.
+        """
+        agents = self.agents or []
+        collection = self.__dict__.get("_agent_collection")
+        if (
+            collection is None
+            or self.__dict__.get("_indexed_agents") is not agents
+            or len(collection) != len(agents)
+        ):
+            collection = AgentCollection(agents)
+            self._agent_collection = collection
+            self._indexed_agents = agents
+        return collection
+
     def add_agent(self, agent: AgentType):
         """Add a agent to the swarm"""
+        collection = self.agent_collection
         self.agents.append(agent)
+        collection.add(agent)
 
     def add_agents(self, agents: List[AgentType]):
         """Add a list of agents to the swarm"""
+        collection = self.agent_collection
         self.agents.extend(agents)
+        collection.add_many(agents)
 
     def add_agent_by_id(self, agent_id: str):
         """Add a agent to the swarm by id"""
@@ -241,13 +267,13 @@ class BaseSwarm(ABC):
 
     def remove_agent(self, agent: AgentType):
         """Remove a agent from the swarm"""
+        collection = self.agent_collection
         self.agents.remove(agent)
+        collection.remove(agent)
 
     def get_agent_by_name(self, name: str):
         """Get a agent by name"""
-        for agent in self.agents:
-            if agent.name == name:
-                return agent
+        return self.agent_collection.find(name)
 
     def reset_all_agents(self):
         """Resets the state of all agents."""
@@ -275,10 +301,7 @@ class BaseSwarm(ABC):
         Returns:
             Agent: The Agent object if found, None otherwise.
         """
-        for agent in self.agents:
-            if agent.agent_name == name:
-                return agent
-        return None
+        return self.agent_collection.find(name)
 
     def self_find_agent_by_id(self, id: uuid.UUID):
         """
@@ -290,10 +313,7 @@ class BaseSwarm(ABC):
         Returns:
             Agent: The Agent object if found, None otherwise.
         """
-        for agent in self.agents:
-            if agent.id == id:
-                return agent
-        return None
+        return self.agent_collection.find_by_id(id)
 
     def agent_exists(self, name: str):
         """
@@ -305,7 +325,29 @@ class BaseSwarm(ABC):
         Returns:
             bool: True if the agent exists, False otherwise.
         """
-        return self.self_find_agent_by_name(name) is not None
+        return name in self.agent_collection
+
+    def find_agents_by_tag(self, tag: str) -> List[AgentType]:
+        """
+        Find the agents carrying a tag.
+
+        Args:
+            tag (str): The tag to look up.
+
+        Returns:
+            List[AgentType]: The agents with the tag.
+        """
+        return self.agent_collection.find_by_tag(tag)
+
+    def where(self, **criteria: Any) -> List[AgentType]:
+        """
+        Find the agents whose attributes equal the given values, using
+        the collection's indexes where available.
+
+        Returns:
+            List[AgentType]: The matching agents.
+        """
+        return self.agent_collection.where(**criteria)
 
     def direct_message(
         self,
@@ -320,6 +362,7 @@ class BaseSwarm(ABC):
 
     def get_agent_by_id(self, id: str) -> AgentType:
         """Locate a agent by id"""
+        return self.agent_collection.find_by_id(id)
 
     def assign_task(self, agent: AgentType, task: Any) -> Dict:
         """Assign a task to a agent"""
@@ -471,10 +514,7 @@ class BaseSwarm(ABC):
         """
         Select an agent through their name
         """
-        # Find agent with id
-        for agent in self.agents:
-            if agent.name == agent_name:
-                return agent
+        return self.agent_collection.find(agent_name)
 
     def task_assignment_by_id(
         self, task: str, agent_id: str, *args, **kwargs
@@ -483,7 +523,7 @@ class BaseSwarm(ABC):
         Assign a task to an agent
         """
         # Assign task to agent by their agent id
-        agent = self.select_agent(agent_id)
+        agent = self.get_agent_by_id(agent_id)
         return agent.run(task, *args, **kwargs)
 
     def task_assignment_by_name(
@@ -518,11 +558,11 @@ class BaseSwarm(ABC):
 
     def add_llm(self, agent: Callable):
         """Add an llm to the god mode"""
-        self.agents.append(agent)
+        self.add_agent(agent)
 
     def remove_llm(self, agent: Callable):
         """Remove an llm from the god mode"""
-        self.agents.remove(agent)
+        self.remove_agent(agent)
 
     def run_all(self, task: str = None, *args, **kwargs):
         """Run all agents
@@ -698,6 +738,8 @@ class BaseSwarm(ABC):
 
     def __setitem__(self, index, value):
         self.agents[index] = value
+        # Same length, so force a rebuild on the next lookup
+        self.__dict__.pop("_agent_collection", None)
 
     def __delitem__(self, index):
         del self.agents[index]
@@ -709,7 +751,11 @@ class BaseSwarm(ABC):
         return reversed(self.agents)
 
     def __contains__(self, value):
-        return value in self.agents
+        # Membership of the agent object itself; names go through
+        # agent_exists
+        if isinstance(value, str):
+            return value in self.agents
+        return value in self.agent_collection
 
     def agent_error_handling_check(self):
         try:
@@ -1,6 +1,7 @@
 import asyncio
 import json
 import time
+import uuid
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -8,10 +9,11 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import networkx as nx
 from loguru import logger
 from pydantic import BaseModel, Field
-from swarms.utils.auto_download_check_packages import (
-    auto_check_and_download_package,
-)
 from swarms.structs.agent import Agent
+from swarms.structs.vector_index import (
+    EmbeddingFunction,
+    NumpyVectorIndex,
+)
 
 # Configure logging
 logger.add(
@@ -46,26 +48,16 @@ class SwarmOutput(BaseModel):
 
 
 class SwarmMemory:
-    """Vector-based memory system for GraphSwarm using ChromaDB."""
-
-    def __init__(self, collection_name: str = "swarm_memories"):
-        """Initialize SwarmMemory with ChromaDB."""
-
-        try:
-            import chromadb
-        except ImportError:
-            auto_check_and_download_package(
-                "chromadb", package_manager="pip", upgrade=True
-            )
-            import chromadb
+    """Vector-based memory system for GraphSwarm."""
 
-        self.client = chromadb.Client()
-
-        # Get or create collection
-        self.collection = self.client.get_or_create_collection(
-            name=collection_name,
-            metadata={"description": "GraphSwarm execution memories"},
-        )
+    def __init__(
+        self,
+        collection_name: str = "swarm_memories",
+        embedding_fn: Optional[EmbeddingFunction] = None,
+    ):
+        """Initialize SwarmMemory with an in-process vector index."""
+        self.collection_name = collection_name
+        self.index = NumpyVectorIndex(embedding_fn=embedding_fn)
 
     def store_execution(self, task: str, result: SwarmOutput):
         """Store execution results in vector memory."""
@@ -96,15 +88,12 @@ class SwarmMemory:
                 ),
             }
 
-            # Store in ChromaDB
-            self.collection.add(
-                documents=[json.dumps(document)],
-                metadatas=[metadata],
-                ids=[f"exec_{datetime.now().timestamp()}"],
+            # Store in the vector index, keyed by the task text
+            metadata["document"] = json.dumps(document)
+            self.index.upsert_texts(
+                [f"exec_{uuid.uuid4().hex}"], [task], [metadata]
             )
 
-            print("added to database")
-
             logger.info(f"Stored execution in memory: {task}")
 
         except Exception as e:
@@ -115,23 +104,17 @@ class SwarmMemory:
     def get_similar_executions(self, task: str, limit: int = 5):
         """Retrieve similar past executions."""
         try:
-            # Query ChromaDB for similar executions
-            results = self.collection.query(
-                query_texts=[task],
-                n_results=limit,
-                include=["documents", "metadatas"],
-            )
-
-            print(results)
+            # Query the index for similar executions
+            matches = self.index.query_text(task, limit)
 
-            if not results["documents"]:
+            if not matches:
                 return []
 
             # Process results
             executions = []
-            for doc, metadata in zip(
-                results["documents"][0], results["metadatas"][0]
-            ):
+            for exec_id, _ in matches:
+                metadata = self.index.get_metadata(exec_id)
+                doc = metadata["document"]
                 doc_dict = json.loads(doc)
                 executions.append(
                     {
@@ -175,10 +158,7 @@ class SwarmMemory:
 
     def clear_memory(self):
         """Clear all memories."""
-        self.client.delete_collection(self.collection.name)
-        self.collection = self.client.get_or_create_collection(
-            name=self.collection.name
-        )
+        self.index.clear()
 
 
 class GraphSwarm:
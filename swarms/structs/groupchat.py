@@ -1,7 +1,10 @@
-from typing import List, Dict, Optional, Union, Callable, Any
+from typing import List, Dict, Optional, Tuple, Union, Callable, Any
 from pydantic import BaseModel, Field
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 import json
+import math
+import re
 from uuid import uuid4
 import logging
 from swarms.structs.agent import Agent
@@ -104,6 +107,142 @@ class AgentWrapper:
         )
 
 
+def _words(text: str) -> set:
+    return set(re.findall(r"[a-z0-9]+", (text or "").lower()))
+
+
+def _next_in_order(
+    chat: "GroupChat", last_speaker: AgentWrapper
+) -> AgentWrapper:
+    agents = chat.wrapped_agents
+    if last_speaker not in agents:
+        return agents[0]
+    return agents[(agents.index(last_speaker) + 1) % len(agents)]
+
+
+def _best_scored(
+    chat: "GroupChat",
+    last_speaker: AgentWrapper,
+    scores: List[float],
+) -> AgentWrapper:
+    """Return the highest scoring agent, breaking ties in round-robin order."""
+    agents = chat.wrapped_agents
+    start = (
+        agents.index(last_speaker) + 1
+        if last_speaker in agents
+        else 0
+    )
+    order = [
+        (start + offset) % len(agents)
+        for offset in range(len(agents))
+    ]
+    best = order[0]
+    for i in order[1:]:
+        if scores[i] > scores[best]:
+            best = i
+    return agents[best]
+
+
+def round_robin_speaker(
+    chat: "GroupChat", last_speaker: AgentWrapper
+) -> AgentWrapper:
+    """Select agents in a fixed rotation."""
+    return _next_in_order(chat, last_speaker)
+
+
+def affinity_speaker(
+    chat: "GroupChat", last_speaker: AgentWrapper
+) -> AgentWrapper:
+    """Select the agent whose profile best matches the latest message.
+
+    Uses cosine similarity of ``chat.embedding_fn`` vectors when one is
+    configured, and keyword overlap with the agent's name, description
+    and system prompt otherwise.
+    """
+    if not chat.state.messages:
+        return _next_in_order(chat, last_speaker)
+    latest = chat.state.messages[-1].content
+
+    if chat.embedding_fn is not None:
+        query = chat.embedding_fn(latest)
+        scores = [
+            _cosine(query, chat._agent_profile_embedding(agent))
+            for agent in chat.wrapped_agents
+        ]
+    else:
+        words = _words(latest)
+        scores = [
+            len(words & chat._agent_profile_words(agent))
+            for agent in chat.wrapped_agents
+        ]
+
+    # Discourage an agent from answering itself
+    for i, agent in enumerate(chat.wrapped_agents):
+        if agent is last_speaker and len(chat.wrapped_agents) > 1:
+            scores[i] = float("-inf")
+    return _best_scored(chat, last_speaker, scores)
+
+
+def bidding_speaker(
+    chat: "GroupChat", last_speaker: AgentWrapper
+) -> AgentWrapper:
+    """Select the agent with the highest bid for the current context.
+
+    Agents bid through an optional ``bid(context) -> float`` method;
+    agents without one bid 0.
+    """
+    context = chat.get_context()
+    scores = []
+    for agent in chat.wrapped_agents:
+        bid = getattr(agent.agent, "bid", None)
+        try:
+            scores.append(
+                float(bid(context)) if callable(bid) else 0.0
+            )
+        except Exception as e:
+            logger.warning(f"Bid from {agent.agent_name} failed: {e}")
+            scores.append(0.0)
+    return _best_scored(chat, last_speaker, scores)
+
+
+def llm_speaker(
+    chat: "GroupChat", last_speaker: AgentWrapper
+) -> AgentWrapper:
+    """Ask the selector agent to name the next speaker."""
+    selection_prompt = (
+        chat.selection_prompt_prefix
+        + f"Last speaker: {last_speaker.agent_name}\n\n"
+        + "Conversation history:\n"
+        + chat.get_context()
+    )
+    next_speaker_name = chat.selector_agent.run(
+        selection_prompt
+    ).strip()
+    return next(
+        agent
+        for agent in chat.wrapped_agents
+        if agent.agent_name in next_speaker_name
+    )
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(
+        sum(y * y for y in b)
+    )
+    return dot / norm if norm else 0.0
+
+
+SpeakerSelector = Callable[["GroupChat", AgentWrapper], AgentWrapper]
+
+SPEAKER_SELECTION_STRATEGIES: Dict[str, SpeakerSelector] = {
+    "llm": llm_speaker,
+    "round_robin": round_robin_speaker,
+    "affinity": affinity_speaker,
+    "bidding": bidding_speaker,
+}
+
+
 class GroupChat:
     """Enhanced GroupChat manager with state persistence and comprehensive logging.
 
@@ -113,6 +252,8 @@ class GroupChat:
     - Configurable agent selection
     - Early stopping conditions
     - Conversation export capabilities
+    - Bounded context: a rolling window of recent messages plus a
+      running summary compacted in the background
 
     The GroupChat coordinates multiple agents to have a goal-directed conversation,
     with one agent speaking at a time based on a selector agent's decisions.
@@ -128,6 +269,9 @@ class GroupChat:
         rules (Optional[str]): Rules governing the conversation
         state_path (Optional[str]): Path to save conversation state
         showcase_agents_on (bool): Whether to showcase agent capabilities
+        speaker_selection (Union[str, Callable]): Speaker selection strategy
+        context_window (int): Number of recent messages shown to agents
+        summary_agent (Optional[Union["Agent", Callable]]): Agent that compacts older messages
     """
 
     def __init__(
@@ -142,6 +286,11 @@ class GroupChat:
         rules: Optional[str] = None,
         state_path: Optional[str] = None,
         showcase_agents_on: bool = False,
+        speaker_selection: Union[str, SpeakerSelector] = "llm",
+        context_window: int = 10,
+        summary_agent: Optional[Union["Agent", Callable]] = None,
+        compact_every: int = 5,
+        embedding_fn: Optional[Callable[[str], List[float]]] = None,
     ):
         """Initialize a new GroupChat instance.
 
@@ -156,9 +305,19 @@ class GroupChat:
             rules: Rules governing the conversation
             state_path: Path to save conversation state
             showcase_agents_on: Whether to showcase agent capabilities
+            speaker_selection: A name from SPEAKER_SELECTION_STRATEGIES
+                ("llm", "round_robin", "affinity", "bidding") or a callable
+                taking the chat and the last speaker
+            context_window: Number of recent messages shown to agents and
+                the selector
+            summary_agent: Agent that folds messages leaving the window into
+                a running summary. Runs in the background; disabled when None
+            compact_every: Number of evicted messages per compaction
+            embedding_fn: Text embedding function used by the "affinity"
+                strategy; keyword overlap is used when None
 
         Raises:
-            ValueError: If no agents are provided
+            ValueError: If no agents are provided or the strategy is unknown
         """
         self.name = name
         self.description = description
@@ -170,10 +329,39 @@ class GroupChat:
         self.rules = rules
         self.state_path = state_path
         self.showcase_agents_on = showcase_agents_on
+        self.context_window = context_window
+        self.compact_every = compact_every
+        self.embedding_fn = embedding_fn
 
         if not agents:
             raise ValueError("At least two agents are required")
 
+        if callable(speaker_selection):
+            self.speaker_selection = speaker_selection
+        elif speaker_selection in SPEAKER_SELECTION_STRATEGIES:
+            self.speaker_selection = SPEAKER_SELECTION_STRATEGIES[
+                speaker_selection
+            ]
+        else:
+            raise ValueError(
+                f"Unknown speaker selection strategy: {speaker_selection}"
+            )
+
+        # Rendered "role: content" lines, kept alongside state.messages
+        self._rendered: List[str] = []
+        self.running_summary = ""
+        self._summarized_upto = 0
+        self._summary_future: Optional[Future] = None
+        self._summary_executor: Optional[ThreadPoolExecutor] = None
+        self.summary_agent = (
+            AgentWrapper(summary_agent, "Summarizer")
+            if summary_agent is not None
+            else None
+        )
+        self._selection_prompt_prefix: Optional[str] = None
+        # Keyed by ("words" | "embedding", id(agent))
+        self._profile_cache: Dict[Tuple[str, int], Any] = {}
+
         # Generate unique state path if not provided
         self.state_path = (
             state_path or f"group_chat_{uuid4().hex}.json"
@@ -213,6 +401,7 @@ class GroupChat:
             messages=[],
             interactions=[],
         )
+        self._rendered_state = self.state
 
         # Showcase agents if enabled
         if self.showcase_agents_on is True:
@@ -312,14 +501,163 @@ class GroupChat:
             role: Speaker's role/name
             content: Message content
         """
+        self._sync_rendered()
         message = Message(role=role, content=content)
         self.state.messages.append(message)
+        self._rendered.append(f"{role}: {content}")
+        self._maybe_compact()
         self.save_state()
 
+    @property
+    def selection_prompt_prefix(self) -> str:
+        """The static part of the selector prompt, built once."""
+        if self._selection_prompt_prefix is None:
+            self._selection_prompt_prefix = (
+                f"Current speakers: {[agent.agent_name for agent in self.wrapped_agents]}\n"
+                f"Group objective: {self.state.group_objective}\n\n"
+                "Based on the conversation history and group objective, "
+                "select the next most appropriate speaker.\n"
+                "Only return the speaker's name.\n\n"
+            )
+        return self._selection_prompt_prefix
+
+    def _agent_profile_text(self, agent: AgentWrapper) -> str:
+        return " ".join(
+            str(part)
+            for part in (
+                agent.agent_name,
+                getattr(agent.agent, "description", None),
+                agent.system_prompt
+                or getattr(agent.agent, "system_prompt", None),
+            )
+            if isinstance(part, str)
+        )
+
+    def _agent_profile_words(self, agent: AgentWrapper) -> set:
+        key = ("words", id(agent))
+        if key not in self._profile_cache:
+            self._profile_cache[key] = _words(
+                self._agent_profile_text(agent).replace("_", " ")
+            )
+        return self._profile_cache[key]
+
+    def _agent_profile_embedding(
+        self, agent: AgentWrapper
+    ) -> List[float]:
+        key = ("embedding", id(agent))
+        if key not in self._profile_cache:
+            self._profile_cache[key] = self.embedding_fn(
+                self._agent_profile_text(agent)
+            )
+        return self._profile_cache[key]
+
+    def _sync_rendered(self) -> None:
+        """Rebuild the rendered lines if ``state`` changed underneath."""
+        replaced = self._rendered_state is not self.state
+        if replaced:
+            # State was replaced, e.g. by load_state; the summary and
+            # any pending compaction describe the old conversation
+            self._summary_future = None
+            self.running_summary = ""
+            self._summarized_upto = 0
+        if replaced or len(self._rendered) != len(
+            self.state.messages
+        ):
+            self._rendered = [
+                f"{msg.role}: {msg.content}"
+                for msg in self.state.messages
+            ]
+            self._rendered_state = self.state
+
+    def get_context(self) -> str:
+        """Return the bounded context shown to agents.
+
+        Consists of the running summary, when there is one, followed by
+        the last ``context_window`` messages.
+        """
+        self._sync_rendered()
+        self._collect_summary()
+        window = "\n".join(self._rendered[-self.context_window :])
+        if self.running_summary:
+            return (
+                "Summary of the earlier conversation:\n"
+                f"{self.running_summary}\n\n{window}"
+            )
+        return window
+
+    def _collect_summary(self) -> None:
+        """Adopt a finished background compaction, if any."""
+        future = self._summary_future
+        if future is None or not future.done():
+            return
+        self._summary_future = None
+        try:
+            summary, upto = future.result()
+        except Exception as e:
+            logger.warning(f"Summary compaction failed: {str(e)}")
+            return
+        self.running_summary = summary
+        self._summarized_upto = upto
+
+    def _maybe_compact(self) -> None:
+        """Fold messages that left the window into the running summary.
+
+        Compaction runs on a background thread; until it finishes, agents
+        keep seeing the previous summary.
+        """
+        if self.summary_agent is None:
+            return
+        self._collect_summary()
+        if self._summary_future is not None:
+            return
+
+        evicted_upto = max(
+            len(self._rendered) - self.context_window, 0
+        )
+        if evicted_upto - self._summarized_upto < self.compact_every:
+            return
+
+        evicted = "\n".join(
+            self._rendered[self._summarized_upto : evicted_upto]
+        )
+        previous = self.running_summary
+
+        def compact():
+            prompt = (
+                "Update the summary of this conversation with the new "
+                "messages. Keep decisions, open questions and facts.\n\n"
+                f"Current summary:\n{previous}\n\n"
+                f"New messages:\n{evicted}"
+            )
+            return str(self.summary_agent.run(prompt)), evicted_upto
+
+        if self._summary_executor is None:
+            self._summary_executor = ThreadPoolExecutor(max_workers=1)
+        self._summary_future = self._summary_executor.submit(compact)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the background summary worker.
+
+        ``run`` calls this without waiting, so a compaction still in
+        flight finishes on its own and is picked up by the next
+        :meth:`get_context`. A later compaction starts a new worker.
+
+        Args:
+            wait: Block until a pending compaction finishes and adopt it
+        """
+        executor, self._summary_executor = (
+            self._summary_executor,
+            None,
+        )
+        if executor is not None:
+            executor.shutdown(wait=wait)
+        if wait:
+            self._collect_summary()
+
     def select_next_speaker(
         self, last_speaker: AgentWrapper
     ) -> AgentWrapper:
-        """Select the next speaker using the selector agent.
+        """Select the next speaker using the configured strategy.
 
         Args:
             last_speaker: The agent who spoke last
@@ -328,45 +666,16 @@ class GroupChat:
             AgentWrapper: The next agent to speak
 
         Note:
-            Falls back to round-robin selection if selector agent fails
+            Falls back to round-robin selection if the strategy fails
         """
-        conversation_history = "\n".join(
-            [
-                f"{msg.role}: {msg.content}"
-                for msg in self.state.messages
-            ]
-        )
-
-        selection_prompt = f"""
-        Current speakers: {[agent.agent_name for agent in self.wrapped_agents]}
-        Last speaker: {last_speaker.agent_name}
-        Group objective: {self.state.group_objective}
-        
-        Based on the conversation history and group objective, select the next most appropriate speaker.
-        Only return the speaker's name.
-        
-        Conversation history:
-        {conversation_history}
-        """
-
         try:
-            next_speaker_name = self.selector_agent.run(
-                selection_prompt
-            ).strip()
-            return next(
-                agent
-                for agent in self.wrapped_agents
-                if agent.agent_name in next_speaker_name
-            )
+            return self.speaker_selection(self, last_speaker)
         except (StopIteration, Exception) as e:
             logger.warning(
-                f"Selector agent failed: {str(e)}. Falling back to round-robin."
+                f"Speaker selection failed: {str(e)}. Falling back to round-robin."
             )
             # Fallback to round-robin if selection fails
-            current_idx = self.wrapped_agents.index(last_speaker)
-            return self.wrapped_agents[
-                (current_idx + 1) % len(self.wrapped_agents)
-            ]
+            return _next_in_order(self, last_speaker)
 
     def run(self, task: str) -> str:
         """Execute the group chat conversation.
@@ -397,14 +706,7 @@ class GroupChat:
                 )
 
                 # Prepare context and get response
-                conversation_history = "\n".join(
-                    [
-                        f"{msg.role}: {msg.content}"
-                        for msg in self.state.messages[
-                            -10:
-                        ]  # Last 10 messages for context
-                    ]
-                )
+                conversation_history = self.get_context()
 
                 try:
                     response = current_speaker.run(
@@ -443,6 +745,8 @@ class GroupChat:
         except Exception as e:
             logger.error(f"Error in GroupChat execution: {str(e)}")
             raise
+        finally:
+            self.shutdown(wait=False)
 
     def get_conversation_summary(self) -> Dict[str, Any]:
         """Return a summary of the conversation.
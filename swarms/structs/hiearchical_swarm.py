@@ -1,4 +1,10 @@
-from typing import List, Any
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 from swarms.utils.loguru_logger import initialize_logger
@@ -93,6 +99,14 @@ class HierarchicalOrderCall(BaseModel):
         ...,
         description="The main specific task to be assigned to the agent. Be very specific and direct.",
     )
+    order_id: Optional[str] = Field(
+        None,
+        description="Optional identifier for this order so other orders can depend on it.",
+    )
+    depends_on: List[str] = Field(
+        default_factory=list,
+        description="The order_ids that must complete before this order starts. Leave empty for independent orders so they run in parallel.",
+    )
 
 
 # For not agent creation
@@ -158,6 +172,7 @@ class HierarchicalAgentSwarm(BaseSwarm):
         director_planning_prompt: str = None,
         template_base_worker_llm: BaseLLM = None,
         swarm_history: str = None,
+        max_workers: Optional[int] = None,
         *args,
         **kwargs,
     ):
@@ -170,6 +185,7 @@ class HierarchicalAgentSwarm(BaseSwarm):
             temperature (float): The temperature setting for text generation.
             base_model (BaseModel): The base model for the function caller.
             parallel_tool_calls (bool): Whether to run tool calls in parallel.
+            max_workers (Optional[int]): Maximum number of orders executed concurrently.
         """
         super().__init__(
             name=name,
@@ -188,6 +204,7 @@ class HierarchicalAgentSwarm(BaseSwarm):
         self.director_planning_prompt = director_planning_prompt
         self.template_base_worker_llm = template_base_worker_llm
         self.swarm_history = swarm_history
+        self.max_workers = max_workers
 
         # Check if the agents are set
         self.agents_check()
@@ -198,6 +215,10 @@ class HierarchicalAgentSwarm(BaseSwarm):
         # Add agents to the registry
         self.add_agents_into_registry(self.agents)
 
+        # Name to agent index used to resolve orders
+        self.agents_by_name: Dict[str, Agent] = {}
+        self._index_agents()
+
         # Swarm History
         self.conversation = Conversation(time_enabled=True)
 
@@ -271,6 +292,7 @@ class HierarchicalAgentSwarm(BaseSwarm):
         )
 
         self.agents.append(agent_name)
+        self.agents_by_name.setdefault(agent_name.name, agent_name)
 
         logger.info(f"Running agent: {agent_name} on task: {task}")
         output = agent_name.run(task)
@@ -388,21 +410,123 @@ class HierarchicalAgentSwarm(BaseSwarm):
         else:
             return response
 
+    def _resolve_order_dependencies(
+        self, orders: List[dict]
+    ) -> List[List[int]]:
+        """
+        Map each order to the indices of the orders it depends on.
+
+        Orders are identified by their ``order_id``, falling back to
+        their position in the list.
+
+        Raises:
+            ValueError: If the dependencies contain a cycle.
+        """
+        ids = {
+            str(order.get("order_id") or index): index
+            for index, order in enumerate(orders)
+        }
+        dependencies = []
+        for index, order in enumerate(orders):
+            resolved = []
+            for dependency in order.get("depends_on") or []:
+                if str(dependency) not in ids:
+                    logger.warning(
+                        f"Order {index} depends on unknown order {dependency}; ignoring"
+                    )
+                    continue
+                resolved.append(ids[str(dependency)])
+            dependencies.append(resolved)
+
+        # Kahn's algorithm to reject cycles before dispatching anything
+        remaining = [len(deps) for deps in dependencies]
+        ready = [i for i, count in enumerate(remaining) if count == 0]
+        visited = 0
+        while ready:
+            current = ready.pop()
+            visited += 1
+            for index, deps in enumerate(dependencies):
+                if current in deps:
+                    remaining[index] -= 1
+                    if remaining[index] == 0:
+                        ready.append(index)
+        if visited != len(orders):
+            raise ValueError("Order dependencies contain a cycle.")
+
+        return dependencies
+
+    def _run_order(
+        self, agent_name: str, task: str
+    ) -> Tuple[str, float]:
+        start_time = time.perf_counter()
+        response = self.run_worker_agent(name=agent_name, task=task)
+        return response, time.perf_counter() - start_time
+
     def distribute_orders_to_agents(self, order_dict: dict) -> str:
-        # Now we need to parse the CallTeam object
-        # and distribute the orders to the agents
-        responses = []
+        """
+        Run the director's orders on the worker agents.
+
+        Independent orders run concurrently on a bounded thread pool,
+        but orders for the same agent run one at a time, since an
+        agent's memory is not safe to share. An order that lists
+        ``depends_on`` starts only after those orders finish and
+        receives their responses as context. The conversation is
+        updated in the original order once all responses are in.
 
-        for order in order_dict["orders"]:
+        Args:
+            order_dict (dict): A ``CallTeam`` payload with an ``orders`` list.
+
+        Returns:
+            str: The concatenated per-order logs, including latency.
+        """
+        orders = [
+            order if isinstance(order, dict) else order.model_dump()
+            for order in order_dict["orders"]
+        ]
+        dependencies = self._resolve_order_dependencies(orders)
+        results: Dict[int, Tuple[str, float]] = {}
+        pending = set(range(len(orders)))
+        running = {}
+        busy_agents = set()
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor:
+            while pending or running:
+                for index in sorted(pending):
+                    agent_name = orders[index]["agent_name"]
+                    if agent_name in busy_agents:
+                        continue
+                    if all(
+                        dep in results for dep in dependencies[index]
+                    ):
+                        task = orders[index]["task"]
+                        if dependencies[index]:
+                            context = "\n".join(
+                                f"{orders[dep]['agent_name']}: {results[dep][0]}"
+                                for dep in dependencies[index]
+                            )
+                            task = f"{task}\n\nResults from previous orders:\n{context}"
+                        future = executor.submit(
+                            self._run_order, agent_name, task
+                        )
+                        running[future] = index
+                        pending.discard(index)
+                        busy_agents.add(agent_name)
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    busy_agents.discard(orders[index]["agent_name"])
+                    results[index] = future.result()
+
+        responses = []
+        for index, order in enumerate(orders):
             agent_name = order["agent_name"]
             task = order["task"]
+            response, latency = results[index]
 
-            # Find and run the agent
-            response = self.run_worker_agent(
-                name=agent_name, task=task
-            )
-
-            log = f"Agent: {agent_name} completed task: {task} with response: {response}"
+            log = f"Agent: {agent_name} completed task: {task} with response: {response} (latency: {latency:.2f}s)"
             self.conversation.add(
                 role=agent_name, content=task + response
             )
@@ -443,6 +567,7 @@ class HierarchicalAgentSwarm(BaseSwarm):
 
         # Add agents into the registry
         self.agents.append(agent_name)
+        self.agents_by_name.setdefault(agent_name.name, agent_name)
 
         return agent_name
 
@@ -558,6 +683,13 @@ class HierarchicalAgentSwarm(BaseSwarm):
 
         return prompt
 
+    def _index_agents(self) -> None:
+        """Rebuild the name to agent index from ``self.agents``."""
+        self.agents_by_name = {}
+        for agent in self.agents:
+            # Keep the first agent for duplicate names, like a linear scan
+            self.agents_by_name.setdefault(agent.name, agent)
+
     def find_agent_by_name(
         self, agent_name: str = None, *args, **kwargs
     ):
@@ -571,7 +703,11 @@ class HierarchicalAgentSwarm(BaseSwarm):
             Agent: The agent with the specified name, or None if not found.
 
         """
-        for agent in self.agents:
-            if agent.name == agent_name:
-                return agent
-        return None
+        agent = self.agents_by_name.get(agent_name)
+        if agent is None and len(self.agents_by_name) != len(
+            self.agents
+        ):
+            # self.agents was modified directly; refresh the index
+            self._index_agents()
+            agent = self.agents_by_name.get(agent_name)
+        return agent
@@ -1,7 +1,8 @@
 import concurrent.futures
+import math
 import re
 from collections import Counter
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from swarms.structs.agent import Agent
 from swarms.structs.conversation import Conversation
@@ -109,6 +110,77 @@ def majority_voting(answers: List[str]):
     return answer
 
 
+def normalize_answer(answer: Any) -> str:
+    """
+    Normalizes an answer so trivially different responses vote together.
+
+    Lowercases, collapses whitespace and strips surrounding quotes and
+    trailing punctuation, so "Paris." and " paris" count as one answer.
+
+    Args:
+        answer (Any): The raw agent response.
+
+    Returns:
+        str: The normalized answer.
+    """
+    if isinstance(answer, list):
+        answer = " ".join(str(part) for part in answer)
+    text = " ".join(str(answer).split()).lower()
+    return text.strip("\"'`").rstrip(".!?;:,").strip()
+
+
+class VoteTally:
+    """
+    Incrementally counts votes into buckets of equivalent answers.
+
+    Args:
+        normalizer (Callable[[Any], str]): Maps a response to its vote key.
+        similarity_fn (Optional[Callable[[str, str], bool]]): Optional
+            semantic bucketing hook. Called with a new vote key and an
+            existing bucket key; returning True merges the vote into
+            that bucket.
+    """
+
+    def __init__(
+        self,
+        normalizer: Callable[[Any], str] = normalize_answer,
+        similarity_fn: Optional[Callable[[str, str], bool]] = None,
+    ):
+        self.normalizer = normalizer
+        self.similarity_fn = similarity_fn
+        self.buckets: Dict[str, List[Tuple[int, Any]]] = {}
+
+    def add(self, index: int, response: Any) -> int:
+        """
+        Records a vote and returns the size of the bucket it joined.
+
+        Args:
+            index (int): Position of the voting agent.
+            response (Any): The agent's response.
+        """
+        key = self.normalizer(response)
+        if key not in self.buckets and self.similarity_fn is not None:
+            for existing in self.buckets:
+                if self.similarity_fn(key, existing):
+                    key = existing
+                    break
+        votes = self.buckets.setdefault(key, [])
+        votes.append((index, response))
+        return len(votes)
+
+    def winner(self) -> Optional[Tuple[str, List[Tuple[int, Any]]]]:
+        """Returns the largest bucket, breaking ties by the earliest agent."""
+        if not self.buckets:
+            return None
+        return max(
+            self.buckets.items(),
+            key=lambda item: (
+                len(item[1]),
+                -min(index for index, _ in item[1]),
+            ),
+        )
+
+
 class MajorityVoting:
     """
     Class representing a majority voting system for agents.
@@ -119,6 +191,12 @@ class MajorityVoting:
             If not provided, the default majority voting function is used.
         autosave (bool, optional): A boolean indicating whether to autosave the conversation to a file.
         verbose (bool, optional): A boolean indicating whether to enable verbose logging.
+        quorum (Union[int, float], optional): Votes needed for one answer to end the run early.
+            An int is a vote count and a float is a fraction of the agents. Defaults to a strict majority.
+        early_stopping (bool, optional): Whether to stop once the quorum is reached. Defaults to True.
+        normalizer (Callable, optional): Maps responses to vote keys. Defaults to normalize_answer.
+        similarity_fn (Callable, optional): Semantic bucketing hook, see VoteTally.
+        max_workers (int, optional): Maximum number of agents run at once. Defaults to the number of agents.
     Examples:
         >>> from swarms.structs.agent import Agent
         >>> from swarms.structs.majority_voting import MajorityVoting
@@ -141,6 +219,11 @@ class MajorityVoting:
         output_parser: Optional[Callable] = majority_voting,
         autosave: bool = False,
         verbose: bool = False,
+        quorum: Optional[Union[int, float]] = None,
+        early_stopping: bool = True,
+        normalizer: Callable[[Any], str] = normalize_answer,
+        similarity_fn: Optional[Callable[[str, str], bool]] = None,
+        max_workers: Optional[int] = None,
         *args,
         **kwargs,
     ):
@@ -148,6 +231,12 @@ class MajorityVoting:
         self.output_parser = output_parser
         self.autosave = autosave
         self.verbose = verbose
+        self.quorum = quorum
+        self.early_stopping = early_stopping
+        self.normalizer = normalizer
+        self.similarity_fn = similarity_fn
+        self.max_workers = max_workers
+        self.agents_consulted = 0
 
         self.conversation = Conversation(
             time_enabled=True, *args, **kwargs
@@ -168,10 +257,23 @@ class MajorityVoting:
             f" {', '.join(agent.agent_name for agent in self.agents)}"
         )
 
+    def quorum_size(self) -> int:
+        """Returns the number of matching votes that ends a run early."""
+        if self.quorum is None:
+            return len(self.agents) // 2 + 1
+        if isinstance(self.quorum, float):
+            return max(1, math.ceil(self.quorum * len(self.agents)))
+        return self.quorum
+
     def run(self, task: str, *args, **kwargs) -> List[Any]:
         """
         Runs the majority voting system and returns the majority vote.
 
+        Votes are tallied as agents finish. Once one answer reaches the
+        quorum, agents that have not started are cancelled and running
+        ones are ignored; ``agents_consulted`` records how many votes
+        were counted.
+
         Args:
             task (str): The task to be performed by the agents.
             *args: Variable length argument list.
@@ -181,21 +283,46 @@ class MajorityVoting:
             List[Any]: The majority vote.
 
         """
-        # Route to each agent
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            logger.info("Running agents concurrently")
+        tally = VoteTally(self.normalizer, self.similarity_fn)
+        quorum = self.quorum_size()
+        responses: Dict[int, Any] = {}
 
-            futures = [
-                executor.submit(agent.run, task, *args)
-                for agent in self.agents
-            ]
-            results = [
-                future.result()
-                for future in concurrent.futures.as_completed(futures)
-            ]
-
-        # Add responses to conversation and log them
-        for agent, response in zip(self.agents, results):
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers or max(len(self.agents), 1)
+        )
+        try:
+            logger.info("Running agents concurrently")
+            futures = {
+                executor.submit(agent.run, task, *args): index
+                for index, agent in enumerate(self.agents)
+            }
+            for future in concurrent.futures.as_completed(futures):
+                index = futures[future]
+                try:
+                    response = future.result()
+                except Exception as error:
+                    logger.error(
+                        f"Agent {self.agents[index].agent_name} failed: {error}"
+                    )
+                    continue
+
+                responses[index] = response
+                votes = tally.add(index, response)
+                if self.early_stopping and votes >= quorum:
+                    logger.info(
+                        f"Quorum of {quorum} reached after {len(responses)} of {len(self.agents)} agents"
+                    )
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        self.agents_consulted = len(responses)
+
+        # Add responses to conversation in agent order and log them
+        ordered = [responses[index] for index in sorted(responses)]
+        for index in sorted(responses):
+            agent = self.agents[index]
+            response = responses[index]
             response = (
                 response if isinstance(response, list) else [response]
             )
@@ -205,20 +332,17 @@ class MajorityVoting:
                 f" {response}]"
             )
 
-        # Perform majority voting on the conversation
-        responses = [
-            message["content"]
-            for message in self.conversation.conversation_history
-            if message["role"] == "agent"
-        ]
-
-        # If an output parser is provided, parse the responses
-        if self.output_parser is not None:
-            majority_vote = self.output_parser(
-                responses, *args, **kwargs
-            )
-        else:
-            majority_vote = majority_voting(responses)
+        # The default parser is answered by the tally itself
+        if self.output_parser is None or (
+            self.output_parser is majority_voting
+        ):
+            winner = tally.winner()
+            if winner is None:
+                return majority_voting([])
+            _, votes = winner
+            return min(votes, key=lambda vote: vote[0])[1]
+
+        majority_vote = self.output_parser(ordered, *args, **kwargs)
 
         # Return the majority vote
         return majority_vote
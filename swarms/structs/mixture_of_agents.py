@@ -1,6 +1,7 @@
 import asyncio
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -64,6 +65,8 @@ class MixtureOfAgents:
         aggregator_agent: Agent = None,
         aggregator_system_prompt: str = "",
         layers: int = 3,
+        layer_concurrency: Optional[int] = None,
+        layer_quorum: Optional[int] = None,
     ) -> None:
         """
         Initialize the Mixture of Agents class with agents and configuration.
@@ -75,6 +78,8 @@ class MixtureOfAgents:
             aggregator_agent (Agent, optional): The aggregator agent to be used in the mixture. Defaults to None.
             aggregator_system_prompt (str, optional): The system prompt for the aggregator agent. Defaults to "".
             layers (int, optional): The number of layers to process in the mixture. Defaults to 3.
+            layer_concurrency (Optional[int], optional): Maximum agent runs in flight per layer across a batch. Defaults to None (unlimited).
+            layer_quorum (Optional[int], optional): In run_batched, move to the next layer once this many agents of a layer have answered. Defaults to None (wait for all).
         """
         self.name = name
         self.description = description
@@ -82,6 +87,20 @@ class MixtureOfAgents:
         self.aggregator_agent: Agent = aggregator_agent
         self.aggregator_system_prompt: str = aggregator_system_prompt
         self.layers: int = layers
+        self.layer_concurrency = layer_concurrency
+        self.layer_quorum = layer_quorum
+
+        # Event loop shared by concurrent run and run_batched calls,
+        # stopped when the last of them returns
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._loop_users = 0
+        self._layer_semaphores: Dict[int, asyncio.Semaphore] = {}
+
+        # Agents keep per-run state, so each one runs a task at a time
+        self._agent_locks: Dict[int, threading.Lock] = {}
+        self._agent_locks_lock = threading.Lock()
 
         self.input_schema = MixtureOfAgentsInput(
             name=name,
@@ -153,6 +172,25 @@ class MixtureOfAgents:
             )
         )
 
+    def _with_previous(
+        self, task: str, prev_responses: Optional[List[str]]
+    ) -> str:
+        """
+        Prepends the previous layer's responses to the task.
+
+        They go in the task rather than the agent's system prompt, which
+        is shared by every task the agent runs.
+        """
+        if not prev_responses:
+            return task
+        return (
+            self._get_final_system_prompt(
+                self.aggregator_system_prompt, prev_responses
+            )
+            + "\n\n"
+            + task
+        )
+
     async def _run_agent_async(
         self,
         agent: Agent,
@@ -173,20 +211,13 @@ class MixtureOfAgents:
         # Update the task in the output schema
         self.output_schema.task = task
 
-        # If there are previous responses, update the agent's system prompt
-        if prev_responses:
-            system_prompt_with_responses = (
-                self._get_final_system_prompt(
-                    self.aggregator_system_prompt, prev_responses
-                )
-            )
-            agent.system_prompt = system_prompt_with_responses
-
         # Run the agent asynchronously
-        response = await asyncio.to_thread(agent.run, task)
-        self.output_schema.normal_agent_outputs.append(
-            agent.agent_output
+        response, output = await asyncio.to_thread(
+            self._run_agent_locked,
+            agent,
+            self._with_previous(task, prev_responses),
         )
+        self.output_schema.normal_agent_outputs.append(output)
 
         # Log the agent's response
         print(f"Agent {agent.agent_name} response: {response}")
@@ -226,6 +257,222 @@ class MixtureOfAgents:
 
         print(f"Final Aggregated Response: {final_result}")
 
+    def _acquire_loop(self) -> asyncio.AbstractEventLoop:
+        """Returns the background event loop, starting it if needed."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._layer_semaphores = {}
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, daemon=True
+                )
+                self._loop_thread.start()
+            self._loop_users += 1
+            return self._loop
+
+    def _release_loop(self) -> None:
+        """Stops the background event loop once nothing is using it."""
+        with self._loop_lock:
+            self._loop_users -= 1
+            if self._loop_users > 0:
+                return
+            loop, self._loop = self._loop, None
+            thread, self._loop_thread = self._loop_thread, None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _submit(self, coroutine) -> Any:
+        loop = self._acquire_loop()
+        try:
+            return asyncio.run_coroutine_threadsafe(
+                coroutine, loop
+            ).result()
+        finally:
+            self._release_loop()
+
+    def __enter__(self) -> "MixtureOfAgents":
+        """Keeps one event loop alive across calls in the block."""
+        self._acquire_loop()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._release_loop()
+
+    def _run_agent_locked(
+        self, agent: Agent, task: str
+    ) -> Tuple[str, Any]:
+        """
+        Runs an agent while holding its lock, returning the response and
+        a snapshot of the agent's output.
+
+        The lock is taken in the worker thread, so a run whose caller
+        was cancelled still holds it until the agent is done.
+        """
+        with self._agent_locks_lock:
+            lock = self._agent_locks.setdefault(
+                id(agent), threading.Lock()
+            )
+        with lock:
+            response = agent.run(task)
+            output = agent.agent_output
+            if output is not None:
+                output = output.model_copy(deep=True)
+            return response, output
+
+    def _layer_semaphore(
+        self, layer: int
+    ) -> Optional[asyncio.Semaphore]:
+        if self.layer_concurrency is None:
+            return None
+        if layer not in self._layer_semaphores:
+            self._layer_semaphores[layer] = asyncio.Semaphore(
+                self.layer_concurrency
+            )
+        return self._layer_semaphores[layer]
+
+    async def _run_layer_agent(
+        self,
+        layer: int,
+        agent: Agent,
+        task: str,
+        prev_responses: Optional[List[str]],
+        outputs: List[Any],
+    ) -> str:
+        """
+        Runs one agent for one task.
+
+        Runs of the same agent are serialized, so tasks of a batch only
+        overlap on different agents.
+        """
+        task = self._with_previous(task, prev_responses)
+
+        semaphore = self._layer_semaphore(layer)
+        if semaphore is None:
+            response, output = await asyncio.to_thread(
+                self._run_agent_locked, agent, task
+            )
+        else:
+            async with semaphore:
+                response, output = await asyncio.to_thread(
+                    self._run_agent_locked, agent, task
+                )
+
+        outputs.append(output)
+        return response
+
+    async def _run_layer(
+        self,
+        layer: int,
+        task: str,
+        prev_responses: Optional[List[str]],
+        outputs: List[Any],
+    ) -> List[str]:
+        """
+        Runs every reference agent for one layer of one task.
+
+        Returns the responses of the first ``layer_quorum`` agents to
+        succeed, in agent order; stragglers are cancelled.
+        """
+        pending = [
+            asyncio.ensure_future(
+                self._run_layer_agent(
+                    layer, agent, task, prev_responses, outputs
+                )
+            )
+            for agent in self.agents
+        ]
+        needed = min(self.layer_quorum or len(pending), len(pending))
+
+        succeeded = set()
+        errors = []
+        remaining = set(pending)
+        while len(succeeded) < needed and remaining:
+            done, remaining = await asyncio.wait(
+                remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is None:
+                    succeeded.add(future)
+                else:
+                    errors.append(future.exception())
+                    logger.error(
+                        f"Layer {layer} agent failed: {future.exception()}"
+                    )
+
+        for future in remaining:
+            future.cancel()
+
+        if not succeeded:
+            raise errors[0]
+
+        return [
+            future.result()
+            for future in pending
+            if future in succeeded
+        ]
+
+    async def _run_pipeline(self, task: str) -> MixtureOfAgentsOutput:
+        """Runs one task through every layer and the aggregator."""
+        outputs: List[Any] = []
+
+        results = await self._run_layer(0, task, None, outputs)
+        for layer in range(1, self.layers - 1):
+            results = await self._run_layer(
+                layer, task, results, outputs
+            )
+
+        summary = await self._run_layer_agent(
+            self.layers,
+            self.aggregator_agent,
+            task,
+            results,
+            outputs,
+        )
+
+        return MixtureOfAgentsOutput(
+            id="MixtureOfAgents",
+            task=task,
+            InputConfig=self.input_schema.model_dump(),
+            normal_agent_outputs=outputs,
+            aggregator_agent_summary=summary,
+        )
+
+    async def _run_batched_async(
+        self, tasks: List[str]
+    ) -> List[MixtureOfAgentsOutput]:
+        return await asyncio.gather(
+            *[self._run_pipeline(task) for task in tasks]
+        )
+
+    def run_batched(self, tasks: List[str]) -> List[str]:
+        """
+        Runs many tasks with their layers pipelined.
+
+        Each task moves through the layers independently, so a later
+        task's first layer overlaps an earlier task's later layers on
+        other agents. Each agent still runs one task at a time.
+        ``layer_concurrency`` bounds the agent runs in flight per layer
+        and ``layer_quorum`` lets a task advance once that many agents
+        of a layer have answered.
+
+        The background event loop stops when the call returns; use the
+        instance as a context manager to keep it across calls.
+
+        Args:
+            tasks (List[str]): The tasks to run.
+
+        Returns:
+            List[str]: The JSON output of each task, in task order.
+        """
+        outputs = self._submit(self._run_batched_async(tasks))
+
+        results = []
+        for output in outputs:
+            log_agent_data(output.model_dump())
+            results.append(output.model_dump_json(indent=4))
+        return results
+
     def run(self, task: str) -> None:
         """
         Synchronous wrapper to run the async process.
@@ -233,7 +480,7 @@ class MixtureOfAgents:
         Args:
             task (str): The task for the mixture of agents.
         """
-        asyncio.run(self._run_async(task))
+        self._submit(self._run_async(task))
 
         self.output_schema.task = task
 
@@ -1,6 +1,24 @@
-from multiprocessing import Manager, Pool, cpu_count
-from typing import Sequence, Union, Callable, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import multiprocessing
+import signal
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import cpu_count
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from swarms.structs.agent import Agent
 from swarms.structs.base_workflow import BaseWorkflow
@@ -9,59 +27,180 @@ from swarms.utils.loguru_logger import initialize_logger
 logger = initialize_logger(log_folder="multi_process_workflow")
 
 
+class AgentSpec:
+    """
+    A picklable recipe for building an agent inside a worker process.
+
+    Live ``Agent`` objects hold locks, executors and loggers, so they are
+    expensive or impossible to pickle. A spec carries only the factory
+    and its arguments; each worker builds the agent the first time it is
+    needed and then reuses it.
+
+    Args:
+        factory (Callable[..., Any]): An importable callable returning the
+            agent, such as the ``Agent`` class itself.
+        *args: Positional arguments for the factory.
+        **kwargs: Keyword arguments for the factory.
+
+    Example:
+        >>> spec = AgentSpec(Agent, agent_name="analyst", model_name="gpt-4o-mini")
+        >>> workflow = MultiProcessWorkflow(agents=[spec])
+    """
+
+    def __init__(self, factory: Callable[..., Any], *args, **kwargs):
+        self.factory = factory
+        self.args = args
+        self.kwargs = kwargs
+        self.agent_name = kwargs.get(
+            "agent_name", getattr(factory, "__name__", "agent")
+        )
+
+    def build(self) -> Any:
+        return self.factory(*self.args, **self.kwargs)
+
+
+class JobTimeoutError(BaseException):
+    """
+    Raised inside a worker when a job exceeds its timeout.
+
+    Derives from BaseException, like KeyboardInterrupt, so retry loops
+    that catch Exception inside the job cannot swallow it. It is turned
+    into an ordinary failed outcome at the job boundary.
+    """
+
+
+# Per-process state, filled by the pool initializer
+_worker_specs: List[Any] = []
+_worker_agents: Dict[int, Any] = {}
+
+
+def _init_worker(specs: List[Any]) -> None:
+    global _worker_specs
+    _worker_specs = specs
+    _worker_agents.clear()
+
+
+def _get_worker_agent(index: int) -> Any:
+    if index not in _worker_agents:
+        spec = _worker_specs[index]
+        _worker_agents[index] = (
+            spec.build() if isinstance(spec, AgentSpec) else spec
+        )
+    return _worker_agents[index]
+
+
+def _raise_timeout(signum, frame):
+    raise JobTimeoutError("Job exceeded its timeout")
+
+
+def _run_job(job: Tuple) -> Any:
+    kind, target, payload, args, kwargs = job
+    if kind == "agent":
+        agent = _get_worker_agent(target)
+        if hasattr(agent, "run"):
+            return agent.run(payload, *args, **kwargs)
+        return agent(payload, *args, **kwargs)
+    return target(payload, *args, **kwargs)
+
+
+def _run_chunk(
+    chunk: List[Tuple[int, Tuple]], timeout: Optional[float]
+) -> List[Tuple[int, bool, Any]]:
+    """
+    Runs a chunk of jobs in a worker process.
+
+    Each job gets its own timeout, enforced with an interval timer in
+    the worker. Errors are returned as strings so unpicklable exceptions
+    cannot break the pool.
+    """
+    use_timer = timeout is not None and hasattr(signal, "setitimer")
+    if use_timer:
+        previous = signal.signal(signal.SIGALRM, _raise_timeout)
+
+    outcomes = []
+    try:
+        for job_id, job in chunk:
+            try:
+                if use_timer:
+                    signal.setitimer(signal.ITIMER_REAL, timeout)
+                result = _run_job(job)
+                if use_timer:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+                outcomes.append((job_id, True, result))
+            except (Exception, JobTimeoutError) as error:
+                outcomes.append(
+                    (
+                        job_id,
+                        False,
+                        f"{type(error).__name__}: {error}",
+                    )
+                )
+            finally:
+                if use_timer:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+    finally:
+        if use_timer:
+            signal.signal(signal.SIGALRM, previous)
+    return outcomes
+
+
 class MultiProcessWorkflow(BaseWorkflow):
     """
     Initialize a MultiProcessWorkflow object.
 
+    Agents run in a persistent process pool, so CPU-heavy work such as
+    parsing and code execution is not serialized by the GIL. Agents are
+    sent to the workers once, as picklable :class:`AgentSpec` recipes or
+    plain picklable callables, and each worker builds and caches them
+    lazily. Jobs are submitted in chunks; each has its own timeout, and
+    jobs lost to a crashed worker are retried on a fresh pool, where
+    only the job that crashed is charged a retry.
+
     Args:
         max_workers (int): The maximum number of workers to use for parallel processing.
         autosave (bool): Flag indicating whether to automatically save the workflow.
-        agents (List[Union[Agent, Callable]]): A list of Agent objects or callable functions representing the workflow tasks.
+        agents (List[Union[AgentSpec, Agent, Callable]]): The agents, as specs, agents or callables taking a task.
+        timeout (Optional[float]): Seconds allowed per job. Defaults to None (no limit).
+        max_retries (int): Retries for a job that fails, times out or loses its worker. Defaults to 1.
+        chunksize (int): Jobs sent to a worker per submission. Defaults to 1.
+        mp_context (Optional[str]): Multiprocessing start method. Defaults to the platform default.
         *args: Additional positional arguments.
         **kwargs: Additional keyword arguments.
 
     Example:
-    >>> from swarms.structs.multi_process_workflow import MultiProcessingWorkflow
-    >>> from swarms.structs.task import Task
-    >>> from datetime import datetime
-    >>> from time import sleep
-    >>>
-    >>> # Define a simple task
-    >>> def simple_task():
-    >>>     sleep(1)
-    >>>     return datetime.now()
+    >>> from swarms.structs.multi_process_workflow import AgentSpec, MultiProcessWorkflow
     >>>
-    >>> # Create a task object
-    >>> task = Task(
-    >>>     name="Simple Task",
-    >>>     execute=simple_task,
-    >>>     priority=1,
-    >>> )
+    >>> def word_count(task: str) -> int:
+    >>>     return len(task.split())
     >>>
-    >>> # Create a workflow with the task
-    >>> workflow = MultiProcessingWorkflow(tasks=[task])
+    >>> with MultiProcessWorkflow(agents=[word_count], timeout=10) as workflow:
+    >>>     results = workflow.batched_run(["a b", "c d e"])
     >>>
-    >>> # Run the workflow
-    >>> results = workflow.run(task)
-    >>>
-    >>> # Print the results
     >>> print(results)
+    [[2], [3]]
     """
 
     def __init__(
         self,
         max_workers: int = 5,
         autosave: bool = True,
-        agents: Sequence[Union[Agent, Callable]] = None,
+        agents: Sequence[Union[AgentSpec, Agent, Callable]] = None,
+        timeout: Optional[float] = None,
+        max_retries: int = 1,
+        chunksize: int = 1,
+        mp_context: Optional[str] = None,
         *args,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
-        self.max_workers = max_workers
+        self.max_workers = max_workers or cpu_count()
         self.autosave = autosave
         self.agents = agents
-
-        self.max_workers or cpu_count()
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.chunksize = max(1, chunksize)
+        self.mp_context = mp_context
+        self._pool: Optional[ProcessPoolExecutor] = None
 
         # Log
         logger.info(
@@ -75,144 +214,273 @@ class MultiProcessWorkflow(BaseWorkflow):
         # Log the agents
         if self.agents is not None:
             for agent in self.agents:
-                logger.info(f"Agent: {agent.agent_name}")
+                logger.info(f"Agent: {self._agent_name(agent)}")
+
+    @staticmethod
+    def _agent_name(agent: Any) -> str:
+        return getattr(
+            agent,
+            "agent_name",
+            getattr(agent, "__name__", type(agent).__name__),
+        )
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Returns the worker pool, starting it and shipping the agent specs on first use."""
+        if self._pool is None:
+            context = (
+                multiprocessing.get_context(self.mp_context)
+                if self.mp_context
+                else None
+            )
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(list(self.agents or []),),
+            )
+        return self._pool
+
+    def _reset_pool(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def shutdown(self) -> None:
+        """Stops the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
 
-    def execute_task(self, task: str, *args, **kwargs):
-        """Execute a task and handle exceptions.
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def _execute_jobs(self, jobs: List[Tuple]) -> List[Any]:
+        """
+        Runs jobs on the process pool and returns their results in order.
+
+        When a worker dies, every chunk in flight fails with the pool,
+        so those jobs become suspects and are rerun one at a time
+        without being charged an attempt. Only a job that crashes its
+        worker while running alone counts the crash as a failure. Jobs
+        that fail after ``max_retries`` retries are logged and yield
+        None.
+        """
+        pending: Dict[int, Tuple] = dict(enumerate(jobs))
+        attempts: Dict[int, int] = {job_id: 0 for job_id in pending}
+        results: List[Any] = [None] * len(jobs)
+        suspects: List[int] = []
+
+        def record_failure(job_id: int, reason: str) -> None:
+            attempts[job_id] += 1
+            if attempts[job_id] > self.max_retries:
+                logger.error(
+                    f"Job {job_id} failed after {attempts[job_id]} attempts: {reason}"
+                )
+                pending.pop(job_id)
+
+        def record_outcomes(outcomes) -> None:
+            for job_id, ok, value in outcomes:
+                if ok:
+                    results[job_id] = value
+                    pending.pop(job_id)
+                else:
+                    record_failure(job_id, value)
+
+        while pending:
+            if suspects:
+                # Alone on the pool, a crash can only be this job's
+                job_id = suspects.pop(0)
+                try:
+                    record_outcomes(
+                        self._get_pool()
+                        .submit(
+                            _run_chunk,
+                            [(job_id, pending[job_id])],
+                            self.timeout,
+                        )
+                        .result()
+                    )
+                except BrokenProcessPool as error:
+                    self._reset_pool()
+                    record_failure(job_id, f"worker crashed: {error}")
+                continue
+
+            pool = self._get_pool()
+            job_ids = list(pending)
+            chunks = [
+                job_ids[i : i + self.chunksize]
+                for i in range(0, len(job_ids), self.chunksize)
+            ]
+            broken = False
+            try:
+                futures = {
+                    pool.submit(
+                        _run_chunk,
+                        [
+                            (job_id, pending[job_id])
+                            for job_id in chunk
+                        ],
+                        self.timeout,
+                    ): chunk
+                    for chunk in chunks
+                }
+            except BrokenProcessPool:
+                self._reset_pool()
+                continue
+
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    outcomes = future.result()
+                except BrokenProcessPool:
+                    # Any in-flight chunk may have lost its worker to
+                    # another chunk's crash
+                    broken = True
+                    suspects.extend(chunk)
+                    continue
+                record_outcomes(outcomes)
+
+            if broken:
+                self._reset_pool()
+
+        return results
+
+    def _agent_jobs(self, task: str, args, kwargs) -> List[Tuple]:
+        return [
+            ("agent", index, task, args, kwargs)
+            for index in range(len(self.agents or []))
+        ]
+
+    def execute_task(self, task: str, *args, **kwargs) -> List[Any]:
+        """Execute a task on every agent in this process and handle exceptions.
 
         Args:
-            task (Task): The task to execute.
+            task (str): The task to execute.
             *args: Additional positional arguments for the task execution.
             **kwargs: Additional keyword arguments for the task execution.
 
         Returns:
-            Any: The result of the task execution.
+            List[Any]: The result of each agent, in agent order, or None
+            for an agent that failed.
 
         """
-        try:
-            if self.agents is not None:
-                # Execute the task
-                for agent in self.agents:
-                    result = agent.run(task, *args, **kwargs)
-
-            return result
-
-        except Exception as e:
-            logger.error(
-                (
-                    "An error occurred during execution of task"
-                    f" {task}: {str(e)}"
-                ),
-            )
-            return None
-
-    def run(self, task: str, *args, **kwargs):
-        """Run the workflow.
+        results = []
+        for agent in self.agents or []:
+            try:
+                if isinstance(agent, AgentSpec):
+                    agent = agent.build()
+                run = agent.run if hasattr(agent, "run") else agent
+                results.append(run(task, *args, **kwargs))
+            except Exception as e:
+                logger.error(
+                    (
+                        "An error occurred during execution of task"
+                        f" {task}: {str(e)}"
+                    ),
+                )
+                results.append(None)
+        return results
+
+    def run(self, task: str, *args, **kwargs) -> Optional[List[Any]]:
+        """Run the task on every agent in parallel worker processes.
 
         Args:
-            task (Task): The task to run.
+            task (str): The task to run.
             *args: Additional positional arguments for the task execution.
             **kwargs: Additional keyword arguments for the task execution.
 
         Returns:
-            List[Any]: The results of all executed tasks.
+            List[Any]: The result of each agent, in agent order.
 
         """
         try:
-            results = []
-            with Manager() as manager:
-                with Pool(
-                    processes=self.max_workers, *args, **kwargs
-                ) as pool:
-                    # Using manager.list() to collect results in a process safe way
-                    results_list = manager.list()
-                    jobs = [
-                        pool.apply_async(
-                            self.execute_task,  # Pass the function, not the function call
-                            args=(task,)
-                            + args,  # Pass the arguments as a tuple
-                            kwds=kwargs,  # Pass the keyword arguments as a dictionary
-                            callback=results_list.append,
-                            timeout=task.timeout,
-                        )
-                        for agent in self.agents
-                    ]
-
-                    # Wait for all jobs to complete
-                    for job in jobs:
-                        job.get()
-
-                    results = list(results_list)
-
-                return results
+            return self._execute_jobs(
+                self._agent_jobs(task, args, kwargs)
+            )
         except Exception as error:
             logger.error(f"Error in run: {error}")
             return None
 
-    async def async_run(self, task: str, *args, **kwargs):
-        """Asynchronously run the workflow.
+    async def async_run(
+        self, task: str, *args, **kwargs
+    ) -> Optional[List[Any]]:
+        """Asynchronously run the workflow without blocking the event loop.
 
         Args:
-            task (Task): The task to run.
+            task (str): The task to run.
             *args: Additional positional arguments for the task execution.
             **kwargs: Additional keyword arguments for the task execution.
 
         Returns:
-            List[Any]: The results of all executed tasks.
+            List[Any]: The result of each agent, in agent order.
 
         """
-        try:
-            results = []
-            with ThreadPoolExecutor(
-                max_workers=self.max_workers
-            ) as executor:
-                futures = [
-                    executor.submit(
-                        self.execute_task, task, *args, **kwargs
-                    )
-                    for _ in range(len(self.agents))
-                ]
-                for future in as_completed(futures):
-                    result = future.result()
-                    results.append(result)
-
-            return results
-        except Exception as error:
-            logger.error(f"Error in async_run: {error}")
-            return None
+        return await asyncio.to_thread(
+            self.run, task, *args, **kwargs
+        )
 
     def batched_run(
         self, tasks: List[str], batch_size: int = 5, *args, **kwargs
-    ):
-        """Run tasks in batches.
+    ) -> Optional[List[List[Any]]]:
+        """Run many tasks on every agent in the process pool.
 
         Args:
             tasks (List[str]): A list of tasks to run.
-            batch_size (int): The size of each batch.
+            batch_size (int): Number of jobs sent to a worker at a time.
             *args: Additional positional arguments for the task execution.
             **kwargs: Additional keyword arguments for the task execution.
 
         Returns:
-            List[Any]: The results of all executed tasks.
+            List[List[Any]]: For each task, the result of each agent.
 
         """
         try:
-            results = []
-            for i in range(0, len(tasks), batch_size):
-                batch = tasks[i : i + batch_size]
-                with Pool(processes=self.max_workers) as pool:
-                    results_list = pool.map(
-                        self.execute_task, batch, *args, **kwargs
-                    )
-                    results.extend(results_list)
-
-            return results
+            chunksize, self.chunksize = self.chunksize, max(
+                1, batch_size
+            )
+            try:
+                jobs = [
+                    job
+                    for task in tasks
+                    for job in self._agent_jobs(task, args, kwargs)
+                ]
+                flat = self._execute_jobs(jobs)
+            finally:
+                self.chunksize = chunksize
+
+            width = len(self.agents or [])
+            return [
+                flat[i : i + width]
+                for i in range(0, len(flat), width)
+            ]
         except Exception as error:
             logger.error(f"Error in batched_run: {error}")
             return None
 
+    def map(
+        self, function: Callable[..., Any], items: Iterable[Any]
+    ) -> List[Any]:
+        """Run a picklable function over items in the process pool.
+
+        Use this for CPU-heavy tool work, such as parsing or code
+        execution, that should not hold the GIL of the calling process.
+
+        Args:
+            function (Callable[..., Any]): An importable function taking one item.
+            items (Iterable[Any]): The inputs.
+
+        Returns:
+            List[Any]: The results, in input order.
+        """
+        return self._execute_jobs(
+            [("call", function, item, (), {}) for item in items]
+        )
+
     def concurrent_run(self, tasks: List[str], *args, **kwargs):
-        """Run tasks concurrently.
+        """Run tasks concurrently on threads in this process.
 
         Args:
             tasks (List[str]): A list of tasks to run.
@@ -220,11 +488,10 @@ class MultiProcessWorkflow(BaseWorkflow):
             **kwargs: Additional keyword arguments for the task execution.
 
         Returns:
-            List[Any]: The results of all executed tasks.
+            List[List[Any]]: For each task, the result of each agent.
 
         """
         try:
-            results = []
             with ThreadPoolExecutor(
                 max_workers=self.max_workers
             ) as executor:
@@ -234,11 +501,7 @@ class MultiProcessWorkflow(BaseWorkflow):
                     )
                     for task in tasks
                 ]
-                for future in as_completed(futures):
-                    result = future.result()
-                    results.append(result)
-
-            return results
+                return [future.result() for future in futures]
         except Exception as error:
             logger.error(f"Error in concurrent_run: {error}")
             return None
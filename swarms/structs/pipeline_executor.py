@@ -0,0 +1,253 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from swarms.utils.loguru_logger import initialize_logger
+
+logger = initialize_logger(log_folder="pipeline_executor")
+
+# Sentinel passed down a stage queue once its producers are finished
+_STOP = object()
+
+
+class _Failure:
+    """Carries an item's exception through the remaining stages."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+@dataclass
+class PipelineStage:
+    """
+    One step of a :class:`PipelineExecutor`.
+
+    Attributes:
+        name (str): Name used in logs and statistics.
+        fn (Callable[[Any], Any]): Transforms an item from the previous stage.
+        workers (int): Number of threads serving this stage.
+        queue_size (Optional[int]): Capacity of the stage's input queue.
+            Defaults to twice the worker count.
+    """
+
+    name: str
+    fn: Callable[[Any], Any]
+    workers: int = 1
+    queue_size: Optional[int] = None
+
+
+@dataclass
+class StageStats:
+    """
+    Runtime statistics for one pipeline stage.
+
+    Attributes:
+        name (str): The stage name.
+        workers (int): Number of threads serving the stage.
+        processed (int): Items completed successfully.
+        failed (int): Items whose stage function raised.
+        busy_seconds (float): Total time spent inside the stage function.
+        queue_depth (int): Items waiting in the input queue at the last sample.
+        max_queue_depth (int): Largest queue depth observed.
+    """
+
+    name: str
+    workers: int
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    first_start: Optional[float] = field(default=None, repr=False)
+    last_end: Optional[float] = field(default=None, repr=False)
+
+    @property
+    def throughput(self) -> float:
+        """Items per second over the stage's active period."""
+        if self.first_start is None or self.last_end is None:
+            return 0.0
+        elapsed = self.last_end - self.first_start
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "workers": self.workers,
+            "processed": self.processed,
+            "failed": self.failed,
+            "busy_seconds": self.busy_seconds,
+            "throughput": self.throughput,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+class PipelineExecutor:
+    """
+    Streams items through a chain of stages running concurrently.
+
+    Every stage has its own bounded input queue and worker threads, so
+    while stage k works on item i, stage k - 1 can already work on item
+    i + 1. For a batch, throughput approaches that of the slowest stage
+    rather than the sum of all stages. Results are returned in input
+    order.
+
+    Args:
+        stages (List[PipelineStage]): The stages, in order.
+
+    Example:
+        >>> pipeline = PipelineExecutor(
+        ...     [
+        ...         PipelineStage("double", lambda x: x * 2),
+        ...         PipelineStage("inc", lambda x: x + 1, workers=2),
+        ...     ]
+        ... )
+        >>> pipeline.run([1, 2, 3])
+        [3, 5, 7]
+    """
+
+    def __init__(self, stages: List[PipelineStage]):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = stages
+        self.stats: List[StageStats] = [
+            StageStats(name=stage.name, workers=stage.workers)
+            for stage in stages
+        ]
+        self._stats_lock = threading.Lock()
+
+    def _worker(
+        self,
+        position: int,
+        inbox: queue.Queue,
+        outbox: Optional[queue.Queue],
+        results: List[Any],
+        remaining: List[int],
+        remaining_lock: threading.Lock,
+    ) -> None:
+        stage = self.stages[position]
+        stats = self.stats[position]
+        next_workers = (
+            self.stages[position + 1].workers
+            if outbox is not None
+            else 0
+        )
+
+        while True:
+            entry = inbox.get()
+            depth = inbox.qsize()
+            with self._stats_lock:
+                stats.queue_depth = depth
+                stats.max_queue_depth = max(
+                    stats.max_queue_depth, depth
+                )
+
+            if entry is _STOP:
+                with remaining_lock:
+                    remaining[position] -= 1
+                    last = remaining[position] == 0
+                # The last worker out tells the next stage to stop
+                if last:
+                    for _ in range(next_workers):
+                        outbox.put(_STOP)
+                return
+
+            index, value = entry
+            if not isinstance(value, _Failure):
+                start = time.monotonic()
+                try:
+                    value = stage.fn(value)
+                    failed = False
+                except Exception as error:
+                    logger.error(
+                        f"Stage {stage.name} failed on item {index}: {error}"
+                    )
+                    value = _Failure(error)
+                    failed = True
+                end = time.monotonic()
+                with self._stats_lock:
+                    if stats.first_start is None:
+                        stats.first_start = start
+                    stats.last_end = end
+                    stats.busy_seconds += end - start
+                    if failed:
+                        stats.failed += 1
+                    else:
+                        stats.processed += 1
+
+            if outbox is None:
+                results[index] = value
+            else:
+                outbox.put((index, value))
+
+    def run(self, items: Iterable[Any]) -> List[Any]:
+        """
+        Runs every item through all stages.
+
+        Args:
+            items (Iterable[Any]): Inputs to the first stage.
+
+        Returns:
+            List[Any]: The last stage's outputs, in input order.
+
+        Raises:
+            Exception: The error of the first failed item, once the
+                whole batch has drained.
+        """
+        items = list(items)
+        results: List[Any] = [None] * len(items)
+        self.stats = [
+            StageStats(name=stage.name, workers=stage.workers)
+            for stage in self.stages
+        ]
+
+        queues = [
+            queue.Queue(maxsize=stage.queue_size or 2 * stage.workers)
+            for stage in self.stages
+        ]
+        remaining = [stage.workers for stage in self.stages]
+        remaining_lock = threading.Lock()
+
+        threads = []
+        for position, stage in enumerate(self.stages):
+            outbox = (
+                queues[position + 1]
+                if position + 1 < len(self.stages)
+                else None
+            )
+            for _ in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(
+                        position,
+                        queues[position],
+                        outbox,
+                        results,
+                        remaining,
+                        remaining_lock,
+                    ),
+                    daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+
+        # Blocking puts apply backpressure from the first stage
+        for index, item in enumerate(items):
+            queues[0].put((index, item))
+        for _ in range(self.stages[0].workers):
+            queues[0].put(_STOP)
+
+        for thread in threads:
+            thread.join()
+
+        for value in results:
+            if isinstance(value, _Failure):
+                raise value.error
+        return results
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Returns per-stage throughput and queue statistics."""
+        with self._stats_lock:
+            return [stats.to_dict() for stats in self.stats]
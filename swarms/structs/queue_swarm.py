@@ -1,6 +1,7 @@
+import itertools
 import queue
 import threading
-from typing import List
+from typing import List, Optional, Tuple
 from swarms.structs.agent import Agent
 from pydantic import BaseModel
 import os
@@ -27,6 +28,10 @@ class SwarmRunMetadata(BaseModel):
     outputs: List[AgentOutput]
 
 
+# How often idle workers check whether the pool is stopping
+_POLL_INTERVAL = 0.05
+
+
 class TaskQueueSwarm(BaseSwarm):
     """
     A swarm that processes tasks from a queue using multiple agents on different threads.
@@ -40,10 +45,13 @@ class TaskQueueSwarm(BaseSwarm):
         workspace_dir (str, optional): The directory path of the workspace. Defaults to os.getenv("WORKSPACE_DIR").
         return_metadata_on (bool, optional): Whether to return the swarm metadata after running. Defaults to False.
         max_loops (int, optional): The maximum number of loops to run the swarm. Defaults to 1.
+        max_queue_size (int, optional): Maximum number of queued tasks; 0 means unbounded. Defaults to 0.
+        overflow_policy (str, optional): What add_task does when the queue is full: "block" or "reject". Defaults to "block".
+        max_concurrent_per_agent (int, optional): Number of worker threads, and so concurrent tasks, per agent. Defaults to 1.
 
     Attributes:
         agents (List[Agent]): A list of agents of class Agent.
-        task_queue (queue.Queue): A queue to store the tasks.
+        task_queue (queue.PriorityQueue): A queue of ``(priority, deadline, sequence, task)`` entries.
         lock (threading.Lock): A lock for thread synchronization.
         autosave_on (bool): Whether to automatically save the swarm metadata.
         save_file_path (str): The file path to save the swarm metadata.
@@ -63,6 +71,9 @@ class TaskQueueSwarm(BaseSwarm):
         workspace_dir: str = os.getenv("WORKSPACE_DIR"),
         return_metadata_on: bool = False,
         max_loops: int = 1,
+        max_queue_size: int = 0,
+        overflow_policy: str = "block",
+        max_concurrent_per_agent: int = 1,
         *args,
         **kwargs,
     ):
@@ -74,7 +85,7 @@ class TaskQueueSwarm(BaseSwarm):
             **kwargs,
         )
         self.agents = agents
-        self.task_queue = queue.Queue()
+        self.task_queue = queue.PriorityQueue(maxsize=max_queue_size)
         self.lock = threading.Lock()
         self.autosave_on = autosave_on
         self.save_file_path = save_file_path
@@ -83,6 +94,19 @@ class TaskQueueSwarm(BaseSwarm):
         )
         self.return_metadata_on = return_metadata_on
         self.max_loops = max_loops
+        self.overflow_policy = overflow_policy
+        self.max_concurrent_per_agent = max_concurrent_per_agent
+
+        self._sequence = itertools.count()
+        self._workers: List[threading.Thread] = []
+        self._stop_now = threading.Event()
+        self._stopping = threading.Event()
+        # One buffer per worker, appended to only by its own thread,
+        # merged into the metadata on export and dropped on stop
+        self._result_buffers: List[
+            List[Tuple[str, str, str, str]]
+        ] = []
+        self.expired_tasks = 0
 
         current_time = time.strftime("%Y%m%d%H%M%S")
         self.metadata = SwarmRunMetadata(
@@ -111,34 +135,86 @@ class TaskQueueSwarm(BaseSwarm):
             "Reliability checks successful. Swarm is ready for usage."
         )
 
-    def add_task(self, task: str):
-        """Adds a task to the queue."""
-        self.task_queue.put(task)
+    def add_task(
+        self,
+        task: str,
+        priority: int = 0,
+        deadline: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Adds a task to the queue.
+
+        Args:
+            task (str): The task to run.
+            priority (int): Lower values run first. Defaults to 0.
+            deadline (Optional[float]): Epoch time after which the task is
+                dropped instead of run. Among equal priorities, earlier
+                deadlines run first.
+            timeout (Optional[float]): With the "block" overflow policy,
+                how long to wait for space in a full queue.
+
+        Raises:
+            queue.Full: If the queue is full and the overflow policy is
+                "reject", or the blocking timeout expires.
+        """
+        entry = (
+            priority,
+            deadline if deadline is not None else float("inf"),
+            next(self._sequence),
+            task,
+        )
+        try:
+            if self.overflow_policy == "reject":
+                self.task_queue.put_nowait(entry)
+            else:
+                self.task_queue.put(entry, timeout=timeout)
+        except queue.Full:
+            logger.warning(
+                f"Task queue is full; rejecting task: {task}"
+            )
+            raise
 
-    def _process_task(self, agent: Agent):
-        """Processes tasks from the queue using the provided agent."""
-        while True:
+    def _process_task(
+        self,
+        agent: Agent,
+        results: List[Tuple[str, str, str, str]],
+    ):
+        """Processes tasks from the queue using the provided agent until stopped."""
+        while not self._stop_now.is_set():
+            # Poll instead of queueing stop entries, which a full
+            # bounded queue would have no room for
             try:
-                task = self.task_queue.get_nowait()
+                _, deadline, _, task = self.task_queue.get(
+                    timeout=_POLL_INTERVAL
+                )
             except queue.Empty:
-                break
+                if self._stopping.is_set():
+                    break
+                continue
             try:
+                if deadline < time.time():
+                    logger.warning(
+                        f"Dropping task past its deadline: {task}"
+                    )
+                    with self.lock:
+                        self.expired_tasks += 1
+                    continue
+
                 logger.info(
                     f"Agent {agent.agent_name} is running task: {task}"
                 )
                 result = agent.run(task)
+                results.append(
+                    (
+                        agent.agent_name,
+                        task,
+                        result,
+                        time.strftime("%Y-%m-%d %H:%M:%S"),
+                    )
+                )
                 with self.lock:
                     self.metadata.tasks_completed += 1
-                    self.metadata.outputs.append(
-                        AgentOutput(
-                            agent_name=agent.agent_name,
-                            task=task,
-                            result=result,
-                            timestamp=time.strftime(
-                                "%Y-%m-%d %H:%M:%S"
-                            ),
-                        )
-                    )
                 logger.info(
                     f"Agent {agent.agent_name} completed task: {task}"
                 )
@@ -151,27 +227,68 @@ class TaskQueueSwarm(BaseSwarm):
             finally:
                 self.task_queue.task_done()
 
-    def run(self):
-        """Runs the swarm by having agents pick up tasks from the queue."""
+    @property
+    def is_running(self) -> bool:
+        return any(worker.is_alive() for worker in self._workers)
+
+    def start(self) -> None:
+        """
+        Start the persistent worker pool.
+
+        Workers block on the queue and keep serving tasks added with
+        :meth:`add_task` until :meth:`stop` is called.
+        """
+        if self.is_running:
+            return
+
         logger.info(f"Starting swarm run: {self.metadata.run_id}")
+        self._stop_now.clear()
+        self._stopping.clear()
+        self._workers = []
+        for agent in self.agents:
+            for _ in range(self.max_concurrent_per_agent):
+                buffer: List[Tuple[str, str, str, str]] = []
+                self._result_buffers.append(buffer)
+                worker = threading.Thread(
+                    target=self._process_task,
+                    args=(agent, buffer),
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
 
-        threads = [
-            threading.Thread(
-                target=self._process_task, args=(agent,), daemon=True
-            )
-            for agent in self.agents
-        ]
+    def stop(self, drain: bool = True) -> None:
+        """
+        Stop the worker pool.
 
-        for thread in threads:
-            thread.start()
+        Args:
+            drain (bool): Finish every queued task before stopping. When
+                False, workers exit after their current task and queued
+                tasks are left in the queue.
+        """
+        if not self._workers:
+            return
 
-        self.task_queue.join()
+        if drain:
+            self.task_queue.join()
+        else:
+            self._stop_now.set()
 
-        for thread in threads:
-            thread.join()
+        self._stopping.set()
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
 
+        with self.lock:
+            self._merge_results()
+            self._result_buffers = []
         self.metadata.end_time = time.strftime("%Y%m%d%H%M%S")
 
+    def run(self):
+        """Runs the swarm by having agents pick up tasks from the queue until it is empty."""
+        self.start()
+        self.stop(drain=True)
+
         if self.autosave_on:
             self.save_json_to_file()
 
@@ -179,6 +296,26 @@ class TaskQueueSwarm(BaseSwarm):
         #     return self.metadata.model_dump_json(indent=4)
         return self.export_metadata()
 
+    def _merge_results(self) -> None:
+        """Move results from the per-worker buffers into the metadata."""
+        merged = []
+        for buffer in self._result_buffers:
+            # Swap out the buffer contents without blocking its worker
+            count = len(buffer)
+            merged.extend(buffer[:count])
+            del buffer[:count]
+
+        merged.sort(key=lambda row: row[3])
+        for agent_name, task, result, timestamp in merged:
+            self.metadata.outputs.append(
+                AgentOutput(
+                    agent_name=agent_name,
+                    task=task,
+                    result=result,
+                    timestamp=timestamp,
+                )
+            )
+
     def save_json_to_file(self):
         json_string = self.export_metadata()
         file_path = os.path.join(
@@ -190,4 +327,6 @@ class TaskQueueSwarm(BaseSwarm):
         logger.info(f"Metadata saved to {file_path}")
 
     def export_metadata(self):
-        return self.metadata.model_dump_json(indent=4)
+        with self.lock:
+            self._merge_results()
+            return self.metadata.model_dump_json(indent=4)
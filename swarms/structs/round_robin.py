@@ -1,4 +1,5 @@
 import random
+import threading
 from swarms.structs.base_swarm import BaseSwarm
 from typing import List
 from swarms.structs.agent import Agent
@@ -6,6 +7,10 @@ from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 from swarms.schemas.agent_step_schemas import ManySteps
+from swarms.structs.pipeline_executor import (
+    PipelineExecutor,
+    PipelineStage,
+)
 import tenacity
 from swarms.utils.loguru_logger import initialize_logger
 
@@ -61,6 +66,7 @@ class RoundRobinSwarm(BaseSwarm):
 
     Methods:
         run(task: str, *args, **kwargs) -> Any: Executes the given task on the agents in a round-robin fashion.
+        run_pipelined(tasks: List[str]) -> List[Any]: Streams a batch of tasks through the agents concurrently.
 
     """
 
@@ -94,6 +100,7 @@ class RoundRobinSwarm(BaseSwarm):
             self.return_json_on = return_json_on
             self.index = 0
             self.max_retries = max_retries
+            self.pipeline_stats = []
 
             # Store the metadata for the run
             self.output_schema = MetadataSchema(
@@ -213,6 +220,86 @@ class RoundRobinSwarm(BaseSwarm):
             logger.error(f"Round-robin execution failed: {str(e)}")
             raise
 
+    def run_pipelined(
+        self,
+        tasks: List[str],
+        workers_per_agent: int = 1,
+        queue_size: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Streams a batch of tasks through the round-robin chain.
+
+        Each agent, repeated for every loop, is a pipeline stage with its
+        own bounded queue, so agent k works on one task while agent k + 1
+        works on the previous one. As in :meth:`run`, every task starts
+        at the agent at ``index`` and ``callback`` is called with each
+        loop's result, here once per task and from worker threads, so it
+        must be thread-safe. Results are returned as a list even when
+        ``return_json_on`` is set; use :meth:`export_metadata` for the
+        metadata. An agent keeps per-run memory, so each agent instance
+        runs one task at a time, including across the stages of later
+        loops. Per-stage throughput and queue depth are stored in
+        ``pipeline_stats``.
+
+        Args:
+            tasks (List[str]): The tasks to execute.
+            workers_per_agent (int): Workers per agent stage. Runs of
+                the same agent are still serialized, so extra workers
+                only keep the next task ready.
+            queue_size (Optional[int]): Capacity of each stage queue.
+
+        Returns:
+            List[str]: The final result of each task, in task order.
+
+        Raises:
+            ValueError: If no agents are configured
+        """
+        if not self.agents:
+            logger.error("No agents configured for the swarm")
+            raise ValueError("No agents configured for the swarm")
+
+        locks = {id(agent): threading.Lock() for agent in self.agents}
+
+        # The same rotation run uses, starting at the current index
+        order = self.agents[self.index :] + self.agents[: self.index]
+
+        def make_stage(loop: int, position: int, agent: Agent):
+            def run_agent(task: str) -> str:
+                with locks[id(agent)]:
+                    result = self._execute_agent(agent, task)
+                if self.callback and position == len(order) - 1:
+                    try:
+                        self.callback(loop, result)
+                    except Exception as e:
+                        logger.error(
+                            f"Callback execution failed: {str(e)}"
+                        )
+                return result
+
+            return PipelineStage(
+                name=f"{agent.agent_name}-loop-{loop + 1}",
+                fn=run_agent,
+                workers=workers_per_agent,
+                queue_size=queue_size,
+            )
+
+        stages = [
+            make_stage(loop, position, agent)
+            for loop in range(self.max_loops)
+            for position, agent in enumerate(order)
+        ]
+        pipeline = PipelineExecutor(stages)
+        try:
+            return pipeline.run(tasks)
+        finally:
+            self.pipeline_stats = pipeline.report()
+            for stats in self.pipeline_stats:
+                logger.info(
+                    f"Stage {stats['name']}: {stats['processed']} tasks, "
+                    f"{stats['throughput']:.2f} tasks/s, "
+                    f"max queue depth {stats['max_queue_depth']}"
+                )
+
     def export_metadata(self):
         """Export the execution metadata as JSON"""
         try:
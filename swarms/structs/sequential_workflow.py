@@ -1,7 +1,12 @@
-from typing import List, Optional
+import threading
+from typing import Any, Dict, List, Optional
 from swarms.structs.agent import Agent
 from swarms.structs.rearrange import AgentRearrange
 from swarms.structs.output_types import OutputType
+from swarms.structs.pipeline_executor import (
+    PipelineExecutor,
+    PipelineStage,
+)
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from swarms.utils.loguru_logger import initialize_logger
 
@@ -43,6 +48,7 @@ class SequentialWorkflow:
         self.output_type = output_type
         self.return_json = return_json
         self.shared_memory_system = shared_memory_system
+        self.pipeline_stats = []
 
         self.reliability_check()
 
@@ -182,6 +188,120 @@ class SequentialWorkflow:
             )
             raise
 
+    def run_pipelined(
+        self,
+        tasks: List[str],
+        workers_per_agent: int = 1,
+        queue_size: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Streams a batch of tasks through the agents as a pipeline.
+
+        Every agent is a stage with its own bounded input queue and
+        workers, so different tasks occupy different agents at the same
+        time and batch throughput approaches that of the slowest agent.
+        Agents get the same prompts as in :meth:`run`, and each task's
+        result is shaped by ``output_type`` the same way; ``return_json``
+        is not applied per task. An agent keeps per-run memory, so each
+        agent instance runs one task at a time, including across the
+        stages of later loops. Per-stage throughput and queue depth are
+        stored in ``pipeline_stats``.
+
+        Args:
+            tasks (List[str]): The tasks for the agents to execute.
+            workers_per_agent (int): Workers per stage. Runs of the same
+                agent are still serialized, so extra workers only keep
+                the next task ready.
+            queue_size (Optional[int]): Capacity of each stage queue.
+
+        Returns:
+            List[Any]: The output of each task, in task order.
+
+        Raises:
+            ValueError: If tasks is None or empty
+            Exception: If any error occurs during task execution
+        """
+        if not tasks or not all(
+            isinstance(task, str) for task in tasks
+        ):
+            raise ValueError(
+                "Tasks must be a non-empty list of strings"
+            )
+
+        locks = {id(agent): threading.Lock() for agent in self.agents}
+        last = len(self.agents) - 1
+
+        def make_stage(position: int, agent: Agent) -> PipelineStage:
+            previous = self.agents[position - 1] if position else None
+
+            def run_agent(state: Dict[str, Any]) -> Dict[str, Any]:
+                # The prompt AgentRearrange builds for a sequential flow
+                current = state["current"]
+                if previous is None:
+                    prefix = "Initial task: "
+                else:
+                    prefix = f"Previous agent {previous.agent_name} output: {current}\n"
+                prompt = prefix + str(current) if current else prefix
+
+                with locks[id(agent)]:
+                    result = str(
+                        agent.run(
+                            task=prompt, is_last=position == last
+                        )
+                    )
+                    self.agent_rearrange.output_schema.outputs.append(
+                        agent.agent_output
+                    )
+                return {
+                    "current": result,
+                    "all": state["all"]
+                    + [
+                        f"Agent Name: {agent.agent_name} \n Output: {result} "
+                    ],
+                    "dict": {
+                        **state["dict"],
+                        agent.agent_name: result,
+                    },
+                }
+
+            return PipelineStage(
+                name=agent.agent_name,
+                fn=run_agent,
+                workers=workers_per_agent,
+                queue_size=queue_size,
+            )
+
+        stages = [
+            make_stage(position, agent)
+            for _ in range(self.max_loops)
+            for position, agent in enumerate(self.agents)
+        ]
+        pipeline = PipelineExecutor(stages)
+        try:
+            states = pipeline.run(
+                {"current": task, "all": [], "dict": {}}
+                for task in tasks
+            )
+        except Exception as e:
+            logger.error(
+                f"An error occurred while executing the pipelined batch of tasks: {e}"
+            )
+            raise
+        finally:
+            self.pipeline_stats = pipeline.report()
+
+        return [self._format_output(state) for state in states]
+
+    def _format_output(self, state: Dict[str, Any]) -> Any:
+        """Shapes one task's responses like AgentRearrange.run."""
+        if self.output_type == "all":
+            return " ".join(state["all"])
+        if self.output_type == "list":
+            return state["all"]
+        if self.output_type == "dict":
+            return state["dict"]
+        return state["current"]
+
     async def run_async(self, task: str) -> str:
         """
         Executes the task through the agents in the dynamically constructed flow asynchronously.
@@ -3,9 +3,8 @@ import csv
 import datetime
 import os
 import uuid
-from typing import List, Union
+from typing import List, Optional, Union
 
-import aiofiles
 from pydantic import BaseModel, Field
 
 from swarms.structs.agent import Agent
@@ -47,6 +46,91 @@ class SwarmRunMetadata(BaseModel):
     )
 
 
+class ResultSink:
+    """
+    Incrementally persists agent outputs to a CSV file and a JSON Lines file.
+
+    Rows are written as soon as they are produced and the files are
+    flushed and fsynced every ``flush_every`` rows and on close, so a
+    crash loses at most one buffer of results.
+
+    Args:
+        csv_path (Optional[str]): The CSV file to append rows to.
+        jsonl_path (Optional[str]): The JSON Lines file to append rows to.
+        run_id (str): The run identifier written to every CSV row.
+        flush_every (int): Number of rows between flush and fsync.
+    """
+
+    CSV_HEADER = [
+        "Run ID",
+        "Agent Name",
+        "Task",
+        "Result",
+        "Timestamp",
+    ]
+
+    def __init__(
+        self,
+        csv_path: Optional[str] = None,
+        jsonl_path: Optional[str] = None,
+        run_id: str = None,
+        flush_every: int = 10,
+    ):
+        self.run_id = run_id or str(uuid.uuid4())
+        self.flush_every = max(1, flush_every)
+        self.rows_written = 0
+        self._csv_file = None
+        self._csv_writer = None
+        self._jsonl_file = None
+
+        if csv_path:
+            file_exists = os.path.exists(csv_path)
+            self._csv_file = open(csv_path, mode="a", newline="")
+            self._csv_writer = csv.writer(self._csv_file)
+            if not file_exists:
+                self._csv_writer.writerow(self.CSV_HEADER)
+
+        if jsonl_path:
+            folder = os.path.dirname(jsonl_path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            self._jsonl_file = open(jsonl_path, mode="a")
+
+    def write(self, output: AgentOutput) -> None:
+        """Append one agent output to every open file."""
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(
+                [
+                    self.run_id,
+                    output.agent_name,
+                    output.task,
+                    output.result,
+                    output.timestamp,
+                ]
+            )
+        if self._jsonl_file is not None:
+            self._jsonl_file.write(output.model_dump_json() + "\n")
+
+        self.rows_written += 1
+        if self.rows_written % self.flush_every == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """Flush buffered rows and fsync them to disk."""
+        for file in (self._csv_file, self._jsonl_file):
+            if file is not None:
+                file.flush()
+                os.fsync(file.fileno())
+
+    def close(self) -> None:
+        """Flush and close every open file."""
+        self.flush()
+        for file in (self._csv_file, self._jsonl_file):
+            if file is not None:
+                file.close()
+        self._csv_file = self._csv_writer = self._jsonl_file = None
+
+
 class SpreadSheetSwarm(BaseSwarm):
     """
     A swarm that processes tasks concurrently using multiple agents.
@@ -59,6 +143,8 @@ class SpreadSheetSwarm(BaseSwarm):
         save_file_path (str, optional): The file path to save the swarm metadata as a CSV file. Defaults to "spreedsheet_swarm.csv".
         max_loops (int, optional): The number of times to repeat the swarm tasks. Defaults to 1.
         workspace_dir (str, optional): The directory path of the workspace. Defaults to the value of the "WORKSPACE_DIR" environment variable.
+        retain_outputs (bool, optional): Whether to keep every output in ``metadata.outputs``. Disable to bound memory on large swarms; results are still streamed to disk. Defaults to True.
+        flush_every (int, optional): Number of rows written between flushes to disk. Defaults to 10.
         *args: Additional positional arguments.
         **kwargs: Additional keyword arguments.
     """
@@ -72,6 +158,8 @@ class SpreadSheetSwarm(BaseSwarm):
         save_file_path: str = None,
         max_loops: int = 1,
         workspace_dir: str = os.getenv("WORKSPACE_DIR"),
+        retain_outputs: bool = True,
+        flush_every: int = 10,
         *args,
         **kwargs,
     ):
@@ -88,6 +176,8 @@ class SpreadSheetSwarm(BaseSwarm):
         self.autosave_on = autosave_on
         self.max_loops = max_loops
         self.workspace_dir = workspace_dir
+        self.retain_outputs = retain_outputs
+        self.flush_every = flush_every
 
         self.save_file_path = (
             f"spreadsheet_swarm_{time}_run_id_{uuid_hex}.csv"
@@ -143,15 +233,11 @@ class SpreadSheetSwarm(BaseSwarm):
         logger.info(f"Running the swarm with task: {task}")
         self.metadata.start_time = time
 
-        # Run the asyncio event loop
+        # Run the asyncio event loop once for execution and persistence
         asyncio.run(self._run_tasks(task, *args, **kwargs))
 
         self.metadata.end_time = time
 
-        # Synchronously save metadata
-        logger.info("Saving metadata to CSV and JSON...")
-        asyncio.run(self._save_metadata())
-
         if self.autosave_on:
             self.data_to_json_file()
 
@@ -159,9 +245,32 @@ class SpreadSheetSwarm(BaseSwarm):
 
         return self.metadata.model_dump_json(indent=4)
 
+    def _create_sink(self) -> Optional[ResultSink]:
+        """
+        Create the sink that streams results to disk, if autosave is on.
+        """
+        if not self.autosave_on:
+            return None
+
+        logger.info(
+            f"Saving swarm metadata to: {self.save_file_path}"
+        )
+        return ResultSink(
+            csv_path=self.save_file_path,
+            jsonl_path=os.path.join(
+                self._output_folder(),
+                f"spreedsheet-swarm-{self.metadata.run_id}_outputs.jsonl",
+            ),
+            run_id=self.metadata.run_id,
+            flush_every=self.flush_every,
+        )
+
+    def _output_folder(self) -> str:
+        return f"{self.workspace_dir}/Spreedsheet-Swarm-{self.name}/{self.name}"
+
     async def _run_tasks(self, task: str, *args, **kwargs):
         """
-        Run the swarm tasks concurrently.
+        Run the swarm tasks concurrently, persisting each result as it completes.
 
         Args:
             task (str): The task to be executed by the swarm.
@@ -182,12 +291,15 @@ class SpreadSheetSwarm(BaseSwarm):
                     )
                 )
 
-        # Run all tasks concurrently
-        results = await asyncio.gather(*tasks)
-
-        # Process the results
-        for result in results:
-            self._track_output(*result)
+        sink = self._create_sink()
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                output = self._track_output(*(await next_result))
+                if sink is not None:
+                    sink.write(output)
+        finally:
+            if sink is not None:
+                sink.close()
 
     def _run_agent_task(self, agent, task, *args, **kwargs):
         """
@@ -214,16 +326,20 @@ class SpreadSheetSwarm(BaseSwarm):
             agent_name (str): The name of the agent that completed the task.
             task (str): The task that was completed.
             result (str): The result of the completed task.
+
+        Returns:
+            AgentOutput: The recorded output.
         """
         self.metadata.tasks_completed += 1
-        self.metadata.outputs.append(
-            AgentOutput(
-                agent_name=agent_name,
-                task=task,
-                result=result,
-                timestamp=time,
-            )
+        output = AgentOutput(
+            agent_name=agent_name,
+            task=task,
+            result=result,
+            timestamp=time,
         )
+        if self.retain_outputs:
+            self.metadata.outputs.append(output)
+        return output
 
     def export_to_json(self):
         """
@@ -237,58 +353,14 @@ class SpreadSheetSwarm(BaseSwarm):
     def data_to_json_file(self):
         """
         Save the swarm metadata to a JSON file.
+
+        Individual outputs are streamed to a JSON Lines file during the
+        run, so this file holds the run summary plus any retained outputs.
         """
-        out = self.export_to_json()
+        out = self.metadata.model_dump_json()
 
         create_file_in_folder(
-            folder_path=f"{self.workspace_dir}/Spreedsheet-Swarm-{self.name}/{self.name}",
+            folder_path=self._output_folder(),
             file_name=f"spreedsheet-swarm-{self.metadata.run_id}_metadata.json",
             content=out,
         )
-
-    async def _save_metadata(self):
-        """
-        Save the swarm metadata to CSV and JSON.
-        """
-        if self.autosave_on:
-            await self._save_to_csv()
-
-    async def _save_to_csv(self):
-        """
-        Save the swarm metadata to a CSV file.
-        """
-        logger.info(
-            f"Saving swarm metadata to: {self.save_file_path}"
-        )
-        run_id = uuid.uuid4()
-
-        # Check if file exists before opening it
-        file_exists = os.path.exists(self.save_file_path)
-
-        async with aiofiles.open(
-            self.save_file_path, mode="a"
-        ) as file:
-            writer = csv.writer(file)
-
-            # Write header if file doesn't exist
-            if not file_exists:
-                await writer.writerow(
-                    [
-                        "Run ID",
-                        "Agent Name",
-                        "Task",
-                        "Result",
-                        "Timestamp",
-                    ]
-                )
-
-            for output in self.metadata.outputs:
-                await writer.writerow(
-                    [
-                        str(run_id),
-                        output.agent_name,
-                        output.task,
-                        output.result,
-                        output.timestamp,
-                    ]
-                )
@@ -1,7 +1,9 @@
 import random
-from threading import Lock
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Condition, Lock
 from time import sleep
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Union
 
 from swarms.structs.agent import Agent
 from swarms.structs.base_swarm import BaseSwarm
@@ -9,6 +11,52 @@ from swarms.utils.loguru_logger import initialize_logger
 
 logger = initialize_logger(log_folder="swarm_load_balancer")
 
+# A selection policy picks one agent name from the candidates using the
+# balancer's per-agent statistics.
+SelectionPolicy = Callable[[List[str], "AgentLoadBalancer"], str]
+
+
+def random_policy(
+    candidates: List[str], balancer: "AgentLoadBalancer"
+) -> str:
+    """Pick a candidate uniformly at random."""
+    return random.choice(candidates)
+
+
+def least_outstanding_policy(
+    candidates: List[str], balancer: "AgentLoadBalancer"
+) -> str:
+    """Pick the candidate with the fewest in-flight requests."""
+    return min(candidates, key=lambda name: balancer.in_flight[name])
+
+
+def ewma_latency_policy(
+    candidates: List[str], balancer: "AgentLoadBalancer"
+) -> str:
+    """Pick the candidate with the lowest expected latency given its load."""
+    return min(
+        candidates,
+        key=lambda name: balancer.ewma_latency[name]
+        * (balancer.in_flight[name] + 1),
+    )
+
+
+def power_of_two_policy(
+    candidates: List[str], balancer: "AgentLoadBalancer"
+) -> str:
+    """Sample two candidates and keep the less loaded, faster one."""
+    if len(candidates) < 2:
+        return candidates[0]
+    return ewma_latency_policy(random.sample(candidates, 2), balancer)
+
+
+SELECTION_POLICIES: Dict[str, SelectionPolicy] = {
+    "random": random_policy,
+    "least_outstanding": least_outstanding_policy,
+    "ewma_latency": ewma_latency_policy,
+    "power_of_two": power_of_two_policy,
+}
+
 
 class AgentLoadBalancer(BaseSwarm):
     """
@@ -19,6 +67,11 @@ class AgentLoadBalancer(BaseSwarm):
         max_retries (int, optional): The maximum number of retries for a task if it fails. Defaults to 3.
         max_loops (int, optional): The maximum number of loops to run a task. Defaults to 5.
         cooldown_time (float, optional): The cooldown time between retries. Defaults to 0.
+        selection_policy (Union[str, SelectionPolicy], optional): How to pick among available agents: "random", "least_outstanding", "ewma_latency", "power_of_two", or a callable. Defaults to "least_outstanding".
+        max_concurrent_per_agent (int, optional): Tasks an agent may run at once. Defaults to 1.
+        ewma_alpha (float, optional): Smoothing factor for the latency average. Defaults to 0.3.
+        eject_after_failures (int, optional): Consecutive failures before an agent is ejected. 0 disables ejection. Defaults to 3.
+        ejection_time (float, optional): Seconds an ejected agent is skipped. Defaults to 30.
 
     Attributes:
         agents (List[Agent]): The list of agents available for task execution.
@@ -26,6 +79,8 @@ class AgentLoadBalancer(BaseSwarm):
         max_retries (int): The maximum number of retries for a task if it fails.
         max_loops (int): The maximum number of loops to run a task.
         agent_performance (Dict[str, Dict[str, int]]): The performance statistics of each agent.
+        in_flight (Dict[str, int]): The number of tasks each agent is running.
+        ewma_latency (Dict[str, float]): Exponentially weighted average latency per agent, in seconds.
         lock (Lock): A lock to ensure thread safety.
         cooldown_time (float): The cooldown time between retries.
 
@@ -35,7 +90,7 @@ class AgentLoadBalancer(BaseSwarm):
         update_performance: Update the performance statistics of an agent.
         log_performance: Log the performance statistics of all agents.
         run_task: Run a single task using an available agent.
-        run_multiple_tasks: Run multiple tasks using available agents.
+        run_multiple_tasks: Run multiple tasks concurrently using available agents.
         run_task_with_loops: Run a task multiple times using an available agent.
         run_task_with_callback: Run a task with a callback function.
         run_task_with_timeout: Run a task with a timeout.
@@ -48,6 +103,13 @@ class AgentLoadBalancer(BaseSwarm):
         max_retries: int = 3,
         max_loops: int = 5,
         cooldown_time: float = 0,
+        selection_policy: Union[
+            str, SelectionPolicy
+        ] = "least_outstanding",
+        max_concurrent_per_agent: int = 1,
+        ewma_alpha: float = 0.3,
+        eject_after_failures: int = 3,
+        ejection_time: float = 30.0,
     ):
         self.agents = agents
         self.agent_status = {
@@ -60,7 +122,29 @@ class AgentLoadBalancer(BaseSwarm):
             for agent in agents
         }
         self.lock = Lock()
+        self.agent_available = Condition(self.lock)
         self.cooldown_time = cooldown_time
+        self.selection_policy = (
+            SELECTION_POLICIES[selection_policy]
+            if isinstance(selection_policy, str)
+            else selection_policy
+        )
+        self.max_concurrent_per_agent = max_concurrent_per_agent
+        self.ewma_alpha = ewma_alpha
+        self.eject_after_failures = eject_after_failures
+        self.ejection_time = ejection_time
+
+        self.agents_by_name = {
+            agent.agent_name: agent for agent in agents
+        }
+        self.in_flight = {agent.agent_name: 0 for agent in agents}
+        self.ewma_latency = {
+            agent.agent_name: 0.0 for agent in agents
+        }
+        self.consecutive_failures = {
+            agent.agent_name: 0 for agent in agents
+        }
+        self.ejected_until: Dict[str, float] = {}
         self.swarm_initialization()
 
     def swarm_initialization(self):
@@ -82,26 +166,103 @@ class AgentLoadBalancer(BaseSwarm):
 
         logger.info("Load Balancer Initialized Successfully!")
 
+    def _candidates(self) -> List[str]:
+        """Names of agents that can take another task. Caller holds the lock."""
+        now = time.monotonic()
+        candidates = []
+        ejected = []
+        for name, available in self.agent_status.items():
+            if not available:
+                continue
+            if self.ejected_until.get(name, 0) > now:
+                ejected.append(name)
+            else:
+                candidates.append(name)
+        if candidates or len(self.ejected_until) < len(
+            self.agent_status
+        ):
+            return candidates
+        # Every agent is ejected; fall back to them rather than stall
+        return ejected
+
+    def _acquire_agent(
+        self, block: bool = False, timeout: Optional[float] = None
+    ) -> Optional[Agent]:
+        """
+        Select an agent with the selection policy and reserve a slot on it.
+
+        Args:
+            block (bool): Wait until an agent frees up instead of returning None.
+            timeout (Optional[float]): Maximum seconds to wait when blocking.
+
+        Returns:
+            Optional[Agent]: The reserved agent, or None if none is available.
+        """
+        with self.agent_available:
+            candidates = self._candidates()
+            if not candidates and block:
+                self.agent_available.wait_for(
+                    lambda: bool(self._candidates()), timeout=timeout
+                )
+                candidates = self._candidates()
+            if not candidates:
+                return None
+
+            name = self.selection_policy(candidates, self)
+            self.in_flight[name] += 1
+            if self.in_flight[name] >= self.max_concurrent_per_agent:
+                self.agent_status[name] = False
+            return self.agents_by_name[name]
+
+    def _release_agent(
+        self, agent: Agent, success: bool, latency: float
+    ) -> None:
+        """Free the agent's slot and record the outcome of its task."""
+        name = agent.agent_name
+        with self.agent_available:
+            self.in_flight[name] -= 1
+            self.agent_status[name] = True
+            self.ewma_latency[name] = (
+                latency
+                if self.ewma_latency[name] == 0
+                else self.ewma_alpha * latency
+                + (1 - self.ewma_alpha) * self.ewma_latency[name]
+            )
+
+            if success:
+                self.consecutive_failures[name] = 0
+                self.ejected_until.pop(name, None)
+            else:
+                self.consecutive_failures[name] += 1
+                if (
+                    self.eject_after_failures
+                    and self.consecutive_failures[name]
+                    >= self.eject_after_failures
+                ):
+                    logger.warning(
+                        f"Ejecting agent {name} for {self.ejection_time}s after {self.consecutive_failures[name]} consecutive failures"
+                    )
+                    self.ejected_until[name] = (
+                        time.monotonic() + self.ejection_time
+                    )
+            self.agent_available.notify()
+
     def get_available_agent(self) -> Optional[Agent]:
         """
-        Get an available agent for task execution.
+        Get an available agent for task execution, chosen by the selection policy.
 
         Returns:
             Optional[Agent]: An available agent, or None if no agents are available.
 
         """
         with self.lock:
-            available_agents = [
-                agent
-                for agent in self.agents
-                if self.agent_status[agent.agent_name]
-            ]
-            logger.info(
-                f"Available agents: {[agent.agent_name for agent in available_agents]}"
-            )
-            if not available_agents:
+            candidates = self._candidates()
+            logger.info(f"Available agents: {candidates}")
+            if not candidates:
                 return None
-            return random.choice(available_agents)
+            return self.agents_by_name[
+                self.selection_policy(candidates, self)
+            ]
 
     def set_agent_status(self, agent: Agent, status: bool) -> None:
         """
@@ -112,8 +273,10 @@ class AgentLoadBalancer(BaseSwarm):
             status (bool): The status to set for the agent.
 
         """
-        with self.lock:
+        with self.agent_available:
             self.agent_status[agent.agent_name] = status
+            if status:
+                self.agent_available.notify()
 
     def update_performance(self, agent: Agent, success: bool) -> None:
         """
@@ -157,18 +320,23 @@ class AgentLoadBalancer(BaseSwarm):
             RuntimeError: If no available agents are found to handle the request.
 
         """
+        return self._run(task, False, *args, **kwargs)
+
+    def _run(self, task: str, block: bool, *args, **kwargs) -> str:
         try:
             retries = 0
             while retries < self.max_retries:
-                agent = self.get_available_agent()
+                agent = self._acquire_agent(block=block)
                 if not agent:
                     raise RuntimeError(
                         "No available agents to handle the request."
                     )
 
+                start_time = time.perf_counter()
+                success = False
                 try:
-                    self.set_agent_status(agent, False)
                     output = agent.run(task, *args, **kwargs)
+                    success = True
                     self.update_performance(agent, True)
                     return output
                 except Exception as e:
@@ -181,7 +349,11 @@ class AgentLoadBalancer(BaseSwarm):
                     if retries >= self.max_retries:
                         raise e
                 finally:
-                    self.set_agent_status(agent, True)
+                    self._release_agent(
+                        agent,
+                        success,
+                        time.perf_counter() - start_time,
+                    )
         except Exception as e:
             logger.error(
                 f"Task failed: {e} try again by optimizing the code."
@@ -190,7 +362,11 @@ class AgentLoadBalancer(BaseSwarm):
 
     def run_multiple_tasks(self, tasks: List[str]) -> List[str]:
         """
-        Run multiple tasks using available agents.
+        Run multiple tasks concurrently using available agents.
+
+        Tasks wait for a free agent instead of failing when every agent
+        is busy, so at most ``len(agents) * max_concurrent_per_agent``
+        tasks run at once.
 
         Args:
             tasks (List[str]): The list of tasks to be executed.
@@ -199,11 +375,15 @@ class AgentLoadBalancer(BaseSwarm):
             List[str]: The list of outputs corresponding to each task execution.
 
         """
-        results = []
-        for task in tasks:
-            result = self.run(task)
-            results.append(result)
-        return results
+        capacity = len(self.agents) * self.max_concurrent_per_agent
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(capacity, len(tasks)))
+        ) as executor:
+            futures = [
+                executor.submit(self._run, task, True)
+                for task in tasks
+            ]
+            return [future.result() for future in futures]
 
     def run_task_with_loops(self, task: str) -> List[str]:
         """
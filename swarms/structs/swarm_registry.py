@@ -1,12 +1,51 @@
-from pydantic.v1 import BaseModel
-from typing import List, Callable
+from pydantic.v1 import BaseModel, PrivateAttr
+from typing import Any, List, Callable, Optional
+from swarms.structs.agent_collection import AgentCollection
 from swarms.utils.loguru_logger import initialize_logger
 
 logger = initialize_logger(log_folder="swarm_registry")
 
 
+def swarm_name(swarm: Any) -> Optional[str]:
+    """Name a swarm is registered under."""
+    return getattr(swarm, "__name__", None) or getattr(
+        swarm, "name", None
+    )
+
+
+def _describe(swarm: Callable) -> str:
+    doc = (swarm.__doc__ or "").strip()
+    description = (
+        doc.split("\n")[0]
+        if doc
+        else getattr(swarm, "description", "")
+    )
+    agent_count = len(getattr(swarm, "agents", None) or [])
+    task_count = len(getattr(swarm, "tasks", None) or [])
+    return f"Swarm: {swarm_name(swarm)}\nDescription: {description}\nAgents: {agent_count}\nTasks: {task_count}"
+
+
 class SwarmRegistry(BaseModel):
     swarm_pool: List[Callable] = []
+    _collection: Optional[AgentCollection] = PrivateAttr(None)
+    _indexed_pool: Optional[List[Callable]] = PrivateAttr(None)
+
+    @property
+    def collection(self) -> AgentCollection:
+        """
+        Name index over ``swarm_pool``, rebuilt if the pool was replaced
+        or resized directly.
+        """
+        if (
+            self._collection is None
+            or self._indexed_pool is not self.swarm_pool
+            or len(self._collection) != len(self.swarm_pool)
+        ):
+            self._collection = AgentCollection(
+                self.swarm_pool, indexes=(), name_fn=swarm_name
+            )
+            self._indexed_pool = self.swarm_pool
+        return self._collection
 
     def add(self, swarm: Callable, *args, **kwargs):
         """
@@ -15,7 +54,9 @@ class SwarmRegistry(BaseModel):
         Args:
             swarm (Callable): The swarm to add to the registry.
         """
-        self.swarm_pool.append(swarm, *args, **kwargs)
+        collection = self.collection
+        self.swarm_pool.append(swarm)
+        collection.add(swarm)
 
     def query(self, swarm_name: str) -> Callable:
         """
@@ -33,24 +74,14 @@ class SwarmRegistry(BaseModel):
         if not swarm_name:
             raise ValueError("No swarm name provided.")
 
-        for swarm in self.swarm_pool:
-            if swarm.__name__ == swarm_name:
-                name = swarm.__name__
-                description = (
-                    swarm.__doc__.strip().split("\n")[0]
-                    or swarm.description
-                )
-                agent_count = len(swarm.agents)
-                task_count = len(swarm.tasks)
-
-                log = f"Swarm: {name}\nDescription: {description}\nAgents: {agent_count}\nTasks: {task_count}"
-                logger.info(log)
-
-            return swarm
+        swarm = self.collection.find(swarm_name)
+        if swarm is None:
+            raise ValueError(
+                f"Swarm '{swarm_name}' not found in registry."
+            )
 
-        raise ValueError(
-            f"Swarm '{swarm_name}' not found in registry."
-        )
+        logger.info(_describe(swarm))
+        return swarm
 
     def remove(self, swarm_name: str):
         """
@@ -59,13 +90,14 @@ class SwarmRegistry(BaseModel):
         Args:
             swarm_name (str): The name of the swarm to remove.
         """
-        for swarm in self.swarm_pool:
-            if swarm.__name__ == swarm_name:
-                self.swarm_pool.remove(swarm)
-                return
-        raise ValueError(
-            f"Swarm '{swarm_name}' not found in registry."
-        )
+        collection = self.collection
+        try:
+            swarm = collection.remove(swarm_name)
+        except KeyError:
+            raise ValueError(
+                f"Swarm '{swarm_name}' not found in registry."
+            )
+        self.swarm_pool.remove(swarm)
 
     def list_swarms(self) -> List[str]:
         """
@@ -78,18 +110,9 @@ class SwarmRegistry(BaseModel):
             raise ValueError("No swarms found in registry.")
 
         for swarm in self.swarm_pool:
-            name = swarm.__name__
-            description = (
-                swarm.__doc__.strip().split("\n")[0]
-                or swarm.description
-            )
-            agent_count = len(swarm.agents)
-            task_count = len(swarm.tasks)
-
-            log = f"Swarm: {name}\nDescription: {description}\nAgents: {agent_count}\nTasks: {task_count}"
-            logger.info(log)
+            logger.info(_describe(swarm))
 
-        return [swarm.__name__ for swarm in self.swarm_pool]
+        return self.collection.names()
 
     def run(self, swarm_name: str, *args, **kwargs):
         """
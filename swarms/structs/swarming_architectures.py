@@ -1,6 +1,9 @@
 import asyncio
 import math
-from typing import List, Union
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -45,10 +48,152 @@ class Conversation(BaseModel):
         }
 
 
+class TopologyRuntime:
+    """
+    Shared execution runtime for the swarm topologies in this module.
+
+    A topology describes its work as a list of ``(agent, task)`` calls.
+    Calls to different agents run concurrently, up to
+    ``max_concurrency`` at a time, while the calls for any one agent are
+    queued and run in order, so an agent never handles two tasks at
+    once. Results are returned in call order.
+
+    Args:
+        max_concurrency (Optional[int]): Maximum number of agents running
+            at once. Defaults to one thread per agent.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        self.max_concurrency = max_concurrency
+
+    def _pool_size(self, jobs: int) -> int:
+        return max(1, min(self.max_concurrency or jobs, jobs))
+
+    def run(self, calls: Sequence[Tuple[Any, str]]) -> List[Any]:
+        """
+        Runs the calls and returns their responses in call order.
+
+        Raises:
+            Exception: The first error raised by an agent, in call order.
+        """
+        if not calls:
+            return []
+
+        queues: Dict[int, deque] = {}
+        for index, (agent, task) in enumerate(calls):
+            queues.setdefault(id(agent), deque()).append(
+                (index, agent, task)
+            )
+
+        results: List[Any] = [None] * len(calls)
+
+        def drain(pending: deque) -> None:
+            while pending:
+                index, agent, task = pending.popleft()
+                results[index] = agent.run(task)
+
+        with ThreadPoolExecutor(
+            max_workers=self._pool_size(len(queues))
+        ) as executor:
+            futures = [
+                executor.submit(drain, pending)
+                for pending in queues.values()
+            ]
+        for future in futures:
+            future.result()
+        return results
+
+    def run_shared_queue(
+        self, agents: Sequence[Any], tasks: Sequence[str]
+    ) -> List[Tuple[Any, Any]]:
+        """
+        Lets every agent pull tasks from one shared queue until it is empty.
+
+        Returns:
+            List[Tuple[Any, Any]]: ``(agent, response)`` for each task, in
+            task order.
+        """
+        pending = deque(enumerate(tasks))
+        results: List[Tuple[Any, Any]] = [None] * len(tasks)
+
+        def work(agent: Any) -> None:
+            while True:
+                try:
+                    index, task = pending.popleft()
+                except IndexError:
+                    return
+                results[index] = (agent, agent.run(task))
+
+        with ThreadPoolExecutor(
+            max_workers=self._pool_size(len(agents))
+        ) as executor:
+            futures = [
+                executor.submit(work, agent) for agent in agents
+            ]
+        for future in futures:
+            future.result()
+        return results
+
+    async def arun(
+        self, calls: Sequence[Tuple[Any, str]]
+    ) -> List[Any]:
+        """Async variant of :meth:`run` that keeps the event loop free."""
+        return await asyncio.to_thread(self.run, calls)
+
+
+def _assign(
+    tasks: List[str], agent_indices: Sequence[int]
+) -> List[Tuple[int, str]]:
+    """
+    Pairs agent indices with tasks taken from the front of ``tasks``.
+
+    Consumed tasks are removed from ``tasks`` in one slice deletion
+    rather than repeated ``pop(0)`` calls.
+    """
+    pending = deque(tasks)
+    assignments = []
+    for index in agent_indices:
+        if not pending:
+            break
+        assignments.append((index, pending.popleft()))
+    del tasks[: len(assignments)]
+    return assignments
+
+
+def _run_logged(
+    calls: List[Tuple[Any, str]],
+    max_concurrency: Optional[int],
+    conversation: Optional["Conversation"] = None,
+) -> List[Any]:
+    """Runs calls on a :class:`TopologyRuntime` and logs them in call order."""
+    responses = TopologyRuntime(max_concurrency).run(calls)
+    if conversation is not None:
+        for (agent, task), response in zip(calls, responses):
+            conversation.add_log(
+                agent_name=agent.agent_name,
+                task=task,
+                response=response,
+            )
+    return responses
+
+
+def _result(
+    conversation: "Conversation",
+    responses: List[Any],
+    return_full_history: bool,
+) -> Union[dict, List[Any]]:
+    return (
+        conversation.return_history()
+        if return_full_history
+        else responses
+    )
+
+
 def circular_swarm(
     agents: AgentListType,
     tasks: List[str],
     return_full_history: bool = True,
+    max_concurrency: Optional[int] = None,
 ) -> Union[dict, List[str]]:
     """
     Implements a circular swarm where agents pass tasks in a circular manner.
@@ -57,6 +202,7 @@ def circular_swarm(
     - agents (AgentListType): A list of Agent objects to participate in the swarm.
     - tasks (List[str]): A list of tasks to be processed by the agents.
     - return_full_history (bool, optional): If True, returns the full conversation history. Defaults to True.
+    - max_concurrency (Optional[int], optional): Maximum number of agents running at once. Defaults to None (one per agent).
 
     Returns:
     - Union[dict, List[str]]: If return_full_history is True, returns a dictionary containing the conversation history. Otherwise, returns a list of responses.
@@ -72,91 +218,104 @@ def circular_swarm(
         raise ValueError("Agents and tasks lists cannot be empty.")
 
     conversation = Conversation()
-    responses = []
+    calls = [(agent, task) for task in tasks for agent in flat_agents]
+    responses = _run_logged(calls, max_concurrency, conversation)
 
-    for task in tasks:
-        for agent in flat_agents:
-            response = agent.run(task)
-            conversation.add_log(
-                agent_name=agent.agent_name,
-                task=task,
-                response=response,
-            )
-            responses.append(response)
+    return _result(conversation, responses, return_full_history)
 
-    if return_full_history:
-        return conversation.return_history()
-    else:
-        return responses
 
-
-def grid_swarm(agents: AgentListType, tasks: List[str]):
+def grid_swarm(
+    agents: AgentListType,
+    tasks: List[str],
+    max_concurrency: Optional[int] = None,
+) -> List[str]:
     grid_size = int(
         len(agents) ** 0.5
     )  # Assuming agents can form a perfect square grid
-    for i in range(grid_size):
-        for j in range(grid_size):
-            if tasks:
-                task = tasks.pop(0)
-                agents[i * grid_size + j].run(task)
+    # Grid cells are independent, so they all run concurrently
+    assignments = _assign(tasks, range(grid_size * grid_size))
+    return _run_logged(
+        [(agents[index], task) for index, task in assignments],
+        max_concurrency,
+    )
 
 
-# Linear Swarm: Agents process tasks in a sequential linear manner
+# Linear Swarm: Each agent in turn takes the next task from the list
 def linear_swarm(
     agents: AgentListType,
     tasks: List[str],
     return_full_history: bool = True,
+    max_concurrency: Optional[int] = None,
 ) -> Union[str, List[str]]:
     if not agents or not tasks:
         raise ValueError("Agents and tasks lists cannot be empty.")
 
     conversation = Conversation()
-    responses = []
-
-    for agent in agents:
-        if tasks:
-            task = tasks.pop(0)
-            response = agent.run(task)
-            conversation.add_log(
-                agent_name=agent.agent_name,
-                task=task,
-                response=response,
-            )
-            responses.append(response)
-
-    return (
-        conversation.return_history()
-        if return_full_history
-        else responses
+    assignments = _assign(tasks, range(len(agents)))
+    responses = _run_logged(
+        [(agents[index], task) for index, task in assignments],
+        max_concurrency,
+        conversation,
     )
 
+    return _result(conversation, responses, return_full_history)
+
 
-# Star Swarm: A central agent first processes all tasks, followed by others
+# Star Swarm: A central agent first processes each task, followed by the spokes
 def star_swarm(
     agents: AgentListType,
     tasks: List[str],
     return_full_history: bool = True,
+    max_concurrency: Optional[int] = None,
 ) -> Union[str, List[str]]:
     if not agents or not tasks:
         raise ValueError("Agents and tasks lists cannot be empty.")
 
     conversation = Conversation()
     center_agent = agents[0]  # The central agent
-    responses = []
-
-    for task in tasks:
-        # Central agent processes the task
-        center_response = center_agent.run(task)
-        conversation.add_log(
-            agent_name=center_agent.agent_name,
-            task=task,
-            response=center_response,
+    spokes = list(agents[1:])
+
+    # The center works through the tasks in order while the spokes
+    # follow one task behind it, each spoke handling one task at a time
+    center_done = [threading.Event() for _ in tasks]
+    center_responses: List[Any] = [None] * len(tasks)
+    spoke_responses = [[None] * len(spokes) for _ in tasks]
+    failed = threading.Event()
+
+    def follow(position: int, agent: Any) -> None:
+        for index, task in enumerate(tasks):
+            center_done[index].wait()
+            if failed.is_set():
+                return
+            spoke_responses[index][position] = agent.run(task)
+
+    with ThreadPoolExecutor(
+        max_workers=TopologyRuntime(max_concurrency)._pool_size(
+            len(spokes)
         )
-        responses.append(center_response)
+    ) as executor:
+        futures = [
+            executor.submit(follow, position, agent)
+            for position, agent in enumerate(spokes)
+        ]
+        try:
+            for index, task in enumerate(tasks):
+                center_responses[index] = center_agent.run(task)
+                center_done[index].set()
+        except Exception:
+            failed.set()
+            for event in center_done:
+                event.set()
+            raise
+    for future in futures:
+        future.result()
 
-        # Other agents process the same task
-        for agent in agents[1:]:
-            response = agent.run(task)
+    responses = []
+    for index, task in enumerate(tasks):
+        for agent, response in zip(
+            [center_agent] + spokes,
+            [center_responses[index]] + spoke_responses[index],
+        ):
             conversation.add_log(
                 agent_name=agent.agent_name,
                 task=task,
@@ -164,43 +323,34 @@ def star_swarm(
             )
             responses.append(response)
 
-    return (
-        conversation.return_history()
-        if return_full_history
-        else responses
-    )
+    return _result(conversation, responses, return_full_history)
 
 
-# Mesh Swarm: Agents work on tasks randomly from a task queue until all tasks are processed
+# Mesh Swarm: Agents pull tasks from a shared queue until all tasks are processed
 def mesh_swarm(
     agents: AgentListType,
     tasks: List[str],
     return_full_history: bool = True,
+    max_concurrency: Optional[int] = None,
 ) -> Union[str, List[str]]:
     if not agents or not tasks:
         raise ValueError("Agents and tasks lists cannot be empty.")
 
     conversation = Conversation()
-    task_queue = tasks.copy()
-    responses = []
+    results = TopologyRuntime(max_concurrency).run_shared_queue(
+        agents, tasks
+    )
 
-    while task_queue:
-        for agent in agents:
-            if task_queue:
-                task = task_queue.pop(0)
-                response = agent.run(task)
-                conversation.add_log(
-                    agent_name=agent.agent_name,
-                    task=task,
-                    response=response,
-                )
-                responses.append(response)
+    responses = []
+    for task, (agent, response) in zip(tasks, results):
+        conversation.add_log(
+            agent_name=agent.agent_name,
+            task=task,
+            response=response,
+        )
+        responses.append(response)
 
-    return (
-        conversation.return_history()
-        if return_full_history
-        else responses
-    )
+    return _result(conversation, responses, return_full_history)
 
 
 # Pyramid Swarm: Agents are arranged in a pyramid structure
@@ -208,49 +358,68 @@ def pyramid_swarm(
     agents: AgentListType,
     tasks: List[str],
     return_full_history: bool = True,
+    max_concurrency: Optional[int] = None,
 ) -> Union[str, List[str]]:
     if not agents or not tasks:
         raise ValueError("Agents and tasks lists cannot be empty.")
 
     conversation = Conversation()
-    responses = []
 
     levels = int(
         (-1 + (1 + 8 * len(agents)) ** 0.5) / 2
     )  # Number of levels in the pyramid
 
-    for i in range(levels):
-        for j in range(i + 1):
-            if tasks:
-                task = tasks.pop(0)
-                agent_index = int(i * (i + 1) / 2 + j)
-                response = agents[agent_index].run(task)
-                conversation.add_log(
-                    agent_name=agents[agent_index].agent_name,
-                    task=task,
-                    response=response,
-                )
-                responses.append(response)
+    indices = [
+        int(i * (i + 1) / 2 + j)
+        for i in range(levels)
+        for j in range(i + 1)
+    ]
+    assignments = _assign(tasks, indices)
+    responses = _run_logged(
+        [(agents[index], task) for index, task in assignments],
+        max_concurrency,
+        conversation,
+    )
 
-    return (
-        conversation.return_history()
-        if return_full_history
-        else responses
+    return _result(conversation, responses, return_full_history)
+
+
+def _run_indexed(
+    agents: AgentListType,
+    tasks: List[str],
+    indices: Sequence[int],
+    max_concurrency: Optional[int],
+) -> List[str]:
+    """Hands one task to each listed agent index and runs them concurrently."""
+    assignments = _assign(tasks, indices)
+    return _run_logged(
+        [(agents[index], task) for index, task in assignments],
+        max_concurrency,
     )
 
 
-def fibonacci_swarm(agents: AgentListType, tasks: List[str]):
+def fibonacci_swarm(
+    agents: AgentListType,
+    tasks: List[str],
+    max_concurrency: Optional[int] = None,
+):
     fib = [1, 1]
     while len(fib) < len(agents):
         fib.append(fib[-1] + fib[-2])
-    for i in range(len(fib)):
-        for j in range(fib[i]):
-            if tasks:
-                task = tasks.pop(0)
-                agents[int(sum(fib[:i]) + j)].run(task)
+    indices = [
+        int(sum(fib[:i]) + j)
+        for i in range(len(fib))
+        for j in range(fib[i])
+    ]
+    indices = [index for index in indices if index < len(agents)]
+    return _run_indexed(agents, tasks, indices, max_concurrency)
 
 
-def prime_swarm(agents: AgentListType, tasks: List[str]):
+def prime_swarm(
+    agents: AgentListType,
+    tasks: List[str],
+    max_concurrency: Optional[int] = None,
+):
     primes = [
         2,
         3,
@@ -278,69 +447,107 @@ def prime_swarm(agents: AgentListType, tasks: List[str]):
         89,
         97,
     ]  # First 25 prime numbers
-    for prime in primes:
-        if prime < len(agents) and tasks:
-            task = tasks.pop(0)
-            agents[prime].run(task)
+    indices = [prime for prime in primes if prime < len(agents)]
+    return _run_indexed(agents, tasks, indices, max_concurrency)
 
 
-def power_swarm(agents: List[str], tasks: List[str]):
+def power_swarm(
+    agents: List[str],
+    tasks: List[str],
+    max_concurrency: Optional[int] = None,
+):
     powers = [2**i for i in range(int(len(agents) ** 0.5))]
-    for power in powers:
-        if power < len(agents) and tasks:
-            task = tasks.pop(0)
-            agents[power].run(task)
+    indices = [power for power in powers if power < len(agents)]
+    return _run_indexed(agents, tasks, indices, max_concurrency)
 
 
-def log_swarm(agents: AgentListType, tasks: List[str]):
-    for i in range(len(agents)):
-        if 2**i < len(agents) and tasks:
-            task = tasks.pop(0)
-            agents[2**i].run(task)
+def log_swarm(
+    agents: AgentListType,
+    tasks: List[str],
+    max_concurrency: Optional[int] = None,
+):
+    indices = [2**i for i in range(len(agents)) if 2**i < len(agents)]
+    return _run_indexed(agents, tasks, indices, max_concurrency)
 
 
-def exponential_swarm(agents: AgentListType, tasks: List[str]):
-    for i in range(len(agents)):
-        index = min(int(2**i), len(agents) - 1)
-        if tasks:
-            task = tasks.pop(0)
-            agents[index].run(task)
+def exponential_swarm(
+    agents: AgentListType,
+    tasks: List[str],
+    max_concurrency: Optional[int] = None,
+):
+    indices = [
+        min(int(2**i), len(agents) - 1) for i in range(len(agents))
+    ]
+    return _run_indexed(agents, tasks, indices, max_concurrency)
 
 
-def geometric_swarm(agents, tasks):
+def geometric_swarm(
+    agents, tasks, max_concurrency: Optional[int] = None
+):
     ratio = 2
-    for i in range(range(len(agents))):
-        index = min(int(ratio**2), len(agents) - 1)
-        if tasks:
-            task = tasks.pop(0)
-            agents[index].run(task)
+    indices = [
+        min(int(ratio**i), len(agents) - 1)
+        for i in range(len(agents))
+    ]
+    return _run_indexed(agents, tasks, indices, max_concurrency)
 
 
-def harmonic_swarm(agents: AgentListType, tasks: List[str]):
-    for i in range(1, len(agents) + 1):
-        index = min(int(len(agents) / i), len(agents) - 1)
-        if tasks:
-            task = tasks.pop(0)
-            agents[index].run(task)
+def harmonic_swarm(
+    agents: AgentListType,
+    tasks: List[str],
+    max_concurrency: Optional[int] = None,
+):
+    indices = [
+        min(int(len(agents) / i), len(agents) - 1)
+        for i in range(1, len(agents) + 1)
+    ]
+    return _run_indexed(agents, tasks, indices, max_concurrency)
 
 
-def staircase_swarm(agents: AgentListType, task: str):
-    step = len(agents) // 5
-    for i in range(len(agents)):
-        index = (i // step) * step
-        agents[index].run(task)
+def staircase_swarm(
+    agents: AgentListType,
+    task: str,
+    max_concurrency: Optional[int] = None,
+):
+    step = max(len(agents) // 5, 1)
+    indices = [(i // step) * step for i in range(len(agents))]
+    return _run_logged(
+        [(agents[index], task) for index in indices],
+        max_concurrency,
+    )
 
 
-def sigmoid_swarm(agents: AgentListType, task: str):
-    for i in range(len(agents)):
-        index = int(len(agents) / (1 + math.exp(-i)))
-        agents[index].run(task)
+def sigmoid_swarm(
+    agents: AgentListType,
+    task: str,
+    max_concurrency: Optional[int] = None,
+):
+    indices = [
+        min(int(len(agents) / (1 + math.exp(-i))), len(agents) - 1)
+        for i in range(len(agents))
+    ]
+    return _run_logged(
+        [(agents[index], task) for index in indices],
+        max_concurrency,
+    )
 
 
-def sinusoidal_swarm(agents: AgentListType, task: str):
-    for i in range(len(agents)):
-        index = int((math.sin(i) + 1) / 2 * len(agents))
-        agents[index].run(task)
+def sinusoidal_swarm(
+    agents: AgentListType,
+    task: str,
+    max_concurrency: Optional[int] = None,
+):
+    indices = [
+        min(
+            int((math.sin(i) + 1) / 2 * len(agents)),
+            len(agents) - 1,
+        )
+        for i in range(len(agents))
+    ]
+    return _run_logged(
+        [(agents[index], task) for index in indices],
+        max_concurrency,
+    )
 
 
 async def one_to_three(
@@ -358,7 +565,7 @@ async def one_to_three(
         Exception: If there is an error while sending the message.
 
     Returns:
-        None
+        List[Any]: The response of each receiving agent.
     """
     if len(agents) != 3:
         raise ValueError("The number of agents must be exactly 3.")
@@ -370,13 +577,10 @@ async def one_to_three(
         raise ValueError("The sender cannot be empty.")
 
     try:
-        receive_tasks = []
-        for agent in agents:
-            receive_tasks.append(
-                agent.receive_message(sender.agent_name, task)
-            )
-
-        await asyncio.gather(*receive_tasks)
+        message = f"Message from {sender.agent_name}: {task}"
+        return await TopologyRuntime().arun(
+            [(agent, message) for agent in agents]
+        )
     except Exception as error:
         logger.error(
             f"[ERROR][CLASS: Agent][METHOD: one_to_three] {error}"
@@ -442,8 +646,11 @@ def one_to_one(
 
 # Broadcasting: A message from one agent to many
 async def broadcast(
-    sender: Agent, agents: AgentListType, task: str
-) -> None:
+    sender: Agent,
+    agents: AgentListType,
+    task: str,
+    max_concurrency: Optional[int] = None,
+) -> dict:
     """
     Facilitates broadcasting of a message from one agent to multiple agents.
 
@@ -451,6 +658,10 @@ async def broadcast(
         sender (Agent): The agent sending the message.
         agents (AgentListType): The list of agents to receive the message.
         task (str): The message to be sent.
+        max_concurrency (Optional[int], optional): Maximum number of agents running at once.
+
+    Returns:
+        dict: The conversation history of the broadcast.
 
     Raises:
         ValueError: If the sender, agents, or task is empty.
@@ -462,14 +673,16 @@ async def broadcast(
         raise ValueError("Sender, agents, and task cannot be empty.")
 
     try:
-        receive_tasks = []
-        for agent in agents:
-            receive_tasks.append(agent.run(task))
+        calls = [(agent, task) for agent in agents]
+        responses = await TopologyRuntime(max_concurrency).arun(calls)
+        for agent, response in zip(agents, responses):
             conversation.add_log(
-                agent_name=agent.agent_name, task=task, response=task
+                agent_name=agent.agent_name,
+                task=task,
+                response=response,
             )
-
-        await asyncio.gather(*receive_tasks)
     except Exception as error:
         logger.error(f"Error during broadcast: {error}")
         raise error
+
+    return conversation.return_history()
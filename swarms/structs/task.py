@@ -35,7 +35,8 @@ class Task(BaseModel):
         dependencies (List[Task]): List of tasks that need to be completed before this task can be executed.
 
     Methods:
-        execute: Execute the task by calling the agent or model with the arguments and keyword arguments.
+        step: Execute the task by calling the agent or model with the arguments and keyword arguments.
+        execute: Runs the agent once and records the result, raising on failure.
         handle_scheduled_task: Handles the execution of a scheduled task.
         set_trigger: Sets the trigger for the task.
         set_action: Sets the action for the task.
@@ -142,56 +143,66 @@ class Task(BaseModel):
         if self.trigger is None or self.trigger():
             try:
                 logger.info(f"Executing task: {task}")
-                self.result = self.agent.run(task, *args, **kwargs)
-
-                # Ensure the result is either a string or a dict
-                if isinstance(self.result, str):
-                    logger.info(f"Task result: {self.result}")
-                elif isinstance(self.result, dict):
-                    logger.info(f"Task result: {self.result}")
-                else:
-                    logger.error(
-                        "Task result must be either a string or a dict"
-                    )
-
-                # Add the result to the history
-                self.history.append(self.result)
-
-                # If an action is specified, execute it
-                if self.action is not None:
-                    try:
-                        logger.info(
-                            f"Executing action for task: {task}"
-                        )
-                        self.action()
-                    except Exception as error:
-                        logger.error(f"[ERROR][Task] {error}")
+                return self.execute(task, *args, **kwargs)
             except Exception as error:
                 logger.error(f"[ERROR][Task] {error}")
         else:
             logger.info(f"Task {task} is not triggered")
 
+    def execute(self, task: str = None, *args, **kwargs) -> Any:
+        """
+        Run the agent once and record the result, raising on failure.
+
+        Unlike :meth:`step`, this does not check dependencies, the
+        condition or the trigger, and errors from the agent propagate so
+        callers such as :class:`TaskScheduler` can retry.
+
+        Returns:
+            Any: The agent's result.
+        """
+        run = (
+            self.agent.run
+            if hasattr(self.agent, "run")
+            else self.agent
+        )
+        self.result = run(
+            task, *self.args, *args, **self.kwargs, **kwargs
+        )
+
+        # Ensure the result is either a string or a dict
+        if isinstance(self.result, (str, dict)):
+            logger.info(f"Task result: {self.result}")
+        else:
+            logger.error(
+                "Task result must be either a string or a dict"
+            )
+
+        # Add the result to the history
+        self.history.append(self.result)
+
+        # If an action is specified, execute it
+        if self.action is not None:
+            try:
+                logger.info(f"Executing action for task: {task}")
+                self.action()
+            except Exception as error:
+                logger.error(f"[ERROR][Task] {error}")
+
+        return self.result
+
     def run(self, task: str = None, *args, **kwargs):
         now = datetime.now()
 
-        # If the task is scheduled for the future, schedule it
+        # If the task is scheduled for the future, wait for it. Use
+        # TaskScheduler to run scheduled tasks without blocking.
         if self.schedule_time and self.schedule_time > now:
             delay = (self.schedule_time - now).total_seconds()
             logger.info(
                 f"Scheduling task: {self.description} for {self.schedule_time}"
             )
-            self.scheduler.enter(
-                delay,
-                1,
-                self.step,
-                argument=(task, args, kwargs),
-            )
-            self.scheduler.run()
+            time.sleep(delay)
 
-            # We need to return the result
-        else:
-            # If no scheduling or the time has already passed run the task
-            return self.step(task, *args, **kwargs)
+        return self.step(task, *args, **kwargs)
 
     def handle_scheduled_task(self):
         """
@@ -215,7 +226,7 @@ class Task(BaseModel):
                     self.schedule_time - datetime.now()
                 ).total_seconds()
                 self.scheduler.enter(delay, 1, self.execute)
-                self.scheduler_run()
+                self.scheduler.run()
         except Exception as error:
             logger.error(f"[ERROR][Task] {error}")
 
@@ -282,10 +293,12 @@ class Task(BaseModel):
             for task in self.dependencies:
                 if not task.is_completed():
                     return False
+            return True
         except Exception as error:
             logger.error(
                 f"[ERROR][Task][check_dependency_completion] {error}"
             )
+            return False
 
     def context(
         self,
@@ -0,0 +1,487 @@
+import heapq
+import json
+import os
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from swarms.structs.task import Task
+from swarms.utils.loguru_logger import initialize_logger
+
+logger = initialize_logger(log_folder="task_scheduler")
+
+# Terminal states that satisfy a dependency
+DONE_STATES = ("completed", "skipped")
+
+
+@dataclass
+class TaskRecord:
+    """Scheduler bookkeeping for a single task."""
+
+    task_id: str
+    task: Task
+    task_input: Optional[str] = None
+    depends_on: List[str] = field(default_factory=list)
+    max_retries: int = 0
+    status: str = "pending"
+    attempts: int = 0
+    error: Optional[str] = None
+    dependents: List[str] = field(default_factory=list)
+    remaining: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.task.name,
+            "status": self.status,
+            "attempts": self.attempts,
+            "result": self.task.result,
+            "error": self.error,
+            "depends_on": self.depends_on,
+        }
+
+
+class TaskScheduler:
+    """
+    Runs a graph of :class:`Task` objects concurrently.
+
+    Tasks become ready once every dependency has completed, either
+    declared with ``depends_on`` or through ``Task.dependencies``. Ready
+    tasks run on a thread pool in priority order; tasks with a future
+    ``schedule_time`` and tasks waiting out a retry backoff sit on a
+    timer heap until they are due. Nothing is ordered except what is
+    declared, so independent tasks run at full parallelism.
+
+    Args:
+        max_workers (int): Maximum number of tasks running at once.
+        max_retries (int): Default number of retries per task.
+        retry_backoff (float): Delay in seconds before the first retry.
+            Each further retry doubles it.
+        max_backoff (float): Upper bound on the retry delay.
+        max_concurrent_per_agent (Optional[int]): Maximum number of
+            tasks sharing one agent that may run at once. None means
+            unlimited.
+        state_path (Optional[str]): JSON file the task states are
+            checkpointed to. When it already exists, tasks it records
+            as completed are restored instead of run again.
+        checkpoint_interval (float): Minimum seconds between
+            checkpoints while running. A final checkpoint is always
+            written when ``run`` returns.
+
+    Examples:
+    >>> scheduler = TaskScheduler(max_workers=4)
+    >>> research = scheduler.add_task(Task(agent=researcher), task_input="Find sources")
+    >>> scheduler.add_task(Task(agent=writer), task_input="Write it up", depends_on=[research])
+    >>> results = scheduler.run()
+    """
+
+    def __init__(
+        self,
+        max_workers: int = os.cpu_count() or 4,
+        max_retries: int = 0,
+        retry_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        max_concurrent_per_agent: Optional[int] = None,
+        state_path: Optional[str] = None,
+        checkpoint_interval: float = 1.0,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+        self.max_concurrent_per_agent = max_concurrent_per_agent
+        self.state_path = state_path
+        self.checkpoint_interval = checkpoint_interval
+
+        self.records: Dict[str, TaskRecord] = {}
+        self._ids_by_task: Dict[int, str] = {}
+        self._timers: List[tuple] = []
+        self._ready: List[tuple] = []
+        self._seq = 0
+        self._last_checkpoint = 0.0
+        self._lock = threading.Lock()
+        self._saved = self._read_state()
+
+    def add_task(
+        self,
+        task: Task,
+        task_id: Optional[str] = None,
+        task_input: Optional[str] = None,
+        depends_on: Optional[List[str]] = None,
+        max_retries: Optional[int] = None,
+    ) -> str:
+        """
+        Register a task with the scheduler.
+
+        Args:
+            task (Task): The task to run.
+            task_id (Optional[str]): Unique id for the task. Defaults to
+                the task name and its position, which is stable across
+                runs that add tasks in the same order.
+            task_input (Optional[str]): Input passed to the task's agent.
+                Defaults to the task description.
+            depends_on (Optional[List[str]]): Ids of tasks that must
+                complete first, in addition to ``task.dependencies``.
+            max_retries (Optional[int]): Retries for this task. Defaults
+                to the scheduler's ``max_retries``.
+
+        Returns:
+            str: The task id.
+        """
+        with self._lock:
+            if task_id is None:
+                task_id = f"{task.name}-{len(self.records)}"
+            if task_id in self.records:
+                raise ValueError(f"Duplicate task id: {task_id}")
+
+            record = TaskRecord(
+                task_id=task_id,
+                task=task,
+                task_input=(
+                    task_input
+                    if task_input is not None
+                    else task.description
+                ),
+                depends_on=list(depends_on or []),
+                max_retries=(
+                    self.max_retries
+                    if max_retries is None
+                    else max_retries
+                ),
+            )
+
+            saved = self._saved.get(task_id)
+            if saved and saved["status"] in DONE_STATES:
+                record.status = saved["status"]
+                record.attempts = saved["attempts"]
+                task.result = saved["result"]
+
+            self.records[task_id] = record
+            self._ids_by_task[id(task)] = task_id
+            return task_id
+
+    def _resolve_dependencies(self):
+        """Map ``Task.dependencies`` to ids and build the reverse edges."""
+        # Dependencies added here may have dependencies of their own
+        pending = list(self.records.values())
+        while pending:
+            record = pending.pop()
+            for dependency in record.task.dependencies:
+                dep_id = self._ids_by_task.get(id(dependency))
+                if dep_id is None:
+                    dep_id = self.add_task(dependency)
+                    pending.append(self.records[dep_id])
+                if dep_id not in record.depends_on:
+                    record.depends_on.append(dep_id)
+
+        for record in self.records.values():
+            record.dependents = []
+        for record in self.records.values():
+            for dep_id in record.depends_on:
+                if dep_id not in self.records:
+                    raise ValueError(
+                        f"Task {record.task_id} depends on unknown task {dep_id}"
+                    )
+                self.records[dep_id].dependents.append(record.task_id)
+
+    def _check_acyclic(self):
+        """Raise ValueError if the dependency graph has a cycle."""
+        indegree = {
+            task_id: len(record.depends_on)
+            for task_id, record in self.records.items()
+        }
+        frontier = [t for t, d in indegree.items() if d == 0]
+        visited = 0
+        while frontier:
+            task_id = frontier.pop()
+            visited += 1
+            for dependent in self.records[task_id].dependents:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    frontier.append(dependent)
+
+        if visited != len(self.records):
+            raise ValueError("Task dependencies contain a cycle")
+
+    def _prime(self):
+        """Reset pending tasks and queue the ones with no open dependencies."""
+        self._resolve_dependencies()
+        self._check_acyclic()
+        self._timers.clear()
+        self._ready.clear()
+
+        for record in self.records.values():
+            if record.status in DONE_STATES:
+                continue
+            record.status = "pending"
+            record.error = None
+            record.remaining = sum(
+                1
+                for dep_id in record.depends_on
+                if self.records[dep_id].status not in DONE_STATES
+            )
+
+        for record in self.records.values():
+            if record.status == "pending" and record.remaining == 0:
+                self._enqueue(record)
+
+    def _enqueue(self, record: TaskRecord, delay: float = 0.0):
+        """Put a task on the ready queue, or the timer heap if not yet due."""
+        self._seq += 1
+        run_at = time.time() + delay
+        schedule_time = record.task.schedule_time
+        if schedule_time is not None:
+            run_at = max(run_at, schedule_time.timestamp())
+
+        if run_at > time.time():
+            record.status = "scheduled"
+            heapq.heappush(
+                self._timers, (run_at, self._seq, record.task_id)
+            )
+        else:
+            record.status = "ready"
+            heapq.heappush(
+                self._ready,
+                (
+                    -(record.task.priority or 0),
+                    self._seq,
+                    record.task_id,
+                ),
+            )
+
+    def _release_timers(self):
+        """Move every due timer onto the ready queue."""
+        now = time.time()
+        while self._timers and self._timers[0][0] <= now:
+            _, _, task_id = heapq.heappop(self._timers)
+            self._enqueue(self.records[task_id])
+
+    @staticmethod
+    def _execute(record: TaskRecord) -> bool:
+        """Run a task on a worker thread, returning False if skipped."""
+        task = record.task
+        if task.condition is not None and not task.condition():
+            return False
+        if task.trigger is not None and not task.trigger():
+            return False
+        task.execute(record.task_input)
+        return True
+
+    def _on_done(self, record: TaskRecord, future: Future):
+        error = future.exception()
+        if error is None:
+            record.status = (
+                "completed" if future.result() else "skipped"
+            )
+            logger.info(f"Task {record.task_id} {record.status}")
+            for dependent_id in record.dependents:
+                dependent = self.records[dependent_id]
+                dependent.remaining -= 1
+                if (
+                    dependent.remaining == 0
+                    and dependent.status == "pending"
+                ):
+                    self._enqueue(dependent)
+            return
+
+        record.error = str(error)
+        if record.attempts <= record.max_retries:
+            delay = min(
+                self.retry_backoff * 2 ** (record.attempts - 1),
+                self.max_backoff,
+            )
+            logger.warning(
+                f"Task {record.task_id} failed ({error}), retrying in {delay:.2f}s"
+            )
+            self._enqueue(record, delay)
+            return
+
+        logger.error(
+            f"Task {record.task_id} failed after {record.attempts} attempts: {error}"
+        )
+        record.status = "failed"
+        self._block_dependents(record)
+
+    def _block_dependents(self, record: TaskRecord):
+        """Mark everything downstream of a failed task as blocked."""
+        stack = list(record.dependents)
+        while stack:
+            dependent = self.records[stack.pop()]
+            if dependent.status == "pending":
+                dependent.status = "blocked"
+                dependent.error = (
+                    f"Dependency {record.task_id} failed"
+                )
+                stack.extend(dependent.dependents)
+
+    def _next_runnable(self, running_per_agent: Dict[int, int]):
+        """Pop the highest-priority ready task whose agent has capacity."""
+        deferred = []
+        found = None
+        while self._ready:
+            entry = heapq.heappop(self._ready)
+            record = self.records[entry[2]]
+            key = id(record.task.agent)
+            if (
+                self.max_concurrent_per_agent is None
+                or running_per_agent.get(key, 0)
+                < self.max_concurrent_per_agent
+            ):
+                found = record
+                break
+            deferred.append(entry)
+
+        for entry in deferred:
+            heapq.heappush(self._ready, entry)
+        return found
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run every registered task, honouring dependencies and schedules.
+
+        Returns:
+            Dict[str, Any]: Task id to result. Tasks that failed, were
+            skipped, or were blocked by a failed dependency map to None.
+        """
+        self._prime()
+        running: Dict[Future, TaskRecord] = {}
+        running_per_agent: Dict[int, int] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="task-scheduler",
+        ) as pool:
+            while True:
+                self._release_timers()
+
+                while len(running) < self.max_workers:
+                    record = self._next_runnable(running_per_agent)
+                    if record is None:
+                        break
+                    record.status = "running"
+                    record.attempts += 1
+                    key = id(record.task.agent)
+                    running_per_agent[key] = (
+                        running_per_agent.get(key, 0) + 1
+                    )
+                    running[pool.submit(self._execute, record)] = (
+                        record
+                    )
+
+                if not running and not self._timers:
+                    break
+
+                timeout = (
+                    max(self._timers[0][0] - time.time(), 0)
+                    if self._timers
+                    else None
+                )
+                if not running:
+                    time.sleep(timeout)
+                    continue
+
+                done, _ = wait(
+                    running,
+                    timeout=timeout,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    record = running.pop(future)
+                    running_per_agent[id(record.task.agent)] -= 1
+                    self._on_done(record, future)
+
+                self._maybe_checkpoint()
+
+        self.save_state()
+        return self.results()
+
+    def start(self) -> Future:
+        """
+        Run the scheduler on a background thread.
+
+        Returns:
+            Future: Resolves to the result of :meth:`run`.
+        """
+        future: Future = Future()
+
+        def target():
+            try:
+                future.set_result(self.run())
+            except BaseException as error:
+                future.set_exception(error)
+
+        threading.Thread(
+            target=target, name="task-scheduler", daemon=True
+        ).start()
+        return future
+
+    def results(self) -> Dict[str, Any]:
+        """Task id to result for every task that completed."""
+        return {
+            task_id: (
+                record.task.result
+                if record.status == "completed"
+                else None
+            )
+            for task_id, record in self.records.items()
+        }
+
+    def status(self) -> Dict[str, str]:
+        """Task id to current status."""
+        return {
+            task_id: record.status
+            for task_id, record in self.records.items()
+        }
+
+    def _maybe_checkpoint(self):
+        if (
+            self.state_path
+            and time.time() - self._last_checkpoint
+            >= self.checkpoint_interval
+        ):
+            self.save_state()
+
+    def save_state(self, path: Optional[str] = None):
+        """
+        Write the state of every task to a JSON file.
+
+        The file is replaced atomically so a crash mid-write never
+        leaves a truncated checkpoint behind.
+
+        Args:
+            path (Optional[str]): Destination. Defaults to ``state_path``.
+        """
+        path = path or self.state_path
+        if not path:
+            return
+
+        state = {
+            task_id: record.to_dict()
+            for task_id, record in self.records.items()
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(state, file, indent=4, default=str)
+        os.replace(tmp_path, path)
+        self._last_checkpoint = time.time()
+
+    def _read_state(self) -> Dict[str, Dict[str, Any]]:
+        if not self.state_path or not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path) as file:
+                return json.load(file)
+        except (OSError, json.JSONDecodeError) as error:
+            logger.error(
+                f"Could not load task state from {self.state_path}: {error}"
+            )
+            return {}
@@ -0,0 +1,582 @@
+import json
+import os
+import re
+import shutil
+import threading
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from swarm_models.tiktoken_wrapper import TikTokenizer
+
+from swarms.structs.conversation import Conversation
+from swarms.structs.vector_index import (
+    EmbeddingFunction,
+    HashingEmbedding,
+    NumpyVectorIndex,
+)
+from swarms.utils.loguru_logger import initialize_logger
+
+logger = initialize_logger(log_folder="tiered_memory")
+
+Message = Dict[str, Any]
+
+# Folds evicted messages into the running summary
+Summarizer = Callable[[str, List[Message]], str]
+
+PINNED_ROLES = ("System: ", "system")
+
+_SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+|\n+")
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def render_messages(messages: List[Message]) -> str:
+    """Render messages the way ``Conversation`` renders its history."""
+    return "\n".join(
+        f"{message['role']}: {message['content']}\n\n"
+        for message in messages
+    )
+
+
+def extractive_summary(
+    summary: str, messages: List[Message], max_sentences: int = 12
+) -> str:
+    """
+    Fold messages into a summary by keeping the most informative
+    sentences.
+
+    Sentences from the previous summary and the new messages are scored
+    by the average frequency of their words across all of them, and the
+    best ``max_sentences`` are kept in their original order.
+
+    Args:
+        summary (str): The previous summary.
+        messages (List[Message]): Messages to fold in.
+        max_sentences (int): Sentences to keep.
+
+    Returns:
+        str: The new summary.
+    """
+    sentences = [
+        sentence.strip()
+        for text in [summary]
+        + [f"{m['role']}: {m['content']}" for m in messages]
+        for sentence in _SENTENCE_PATTERN.split(str(text))
+        if sentence.strip()
+    ]
+    words = [
+        _WORD_PATTERN.findall(sentence.lower())
+        for sentence in sentences
+    ]
+    frequencies = Counter(
+        word for sentence in words for word in sentence
+    )
+
+    def score(position: int) -> float:
+        if not words[position]:
+            return 0.0
+        return sum(frequencies[w] for w in words[position]) / len(
+            words[position]
+        )
+
+    keep = sorted(
+        sorted(range(len(sentences)), key=score, reverse=True)[
+            :max_sentences
+        ]
+    )
+    return " ".join(sentences[position] for position in keep)
+
+
+def llm_summarizer(llm: Any) -> Summarizer:
+    """
+    Build a summarizer that asks ``llm`` to update the summary.
+
+    Args:
+        llm (Any): A model with a ``run(task)`` method.
+
+    Returns:
+        Summarizer: The summarizer.
+    """
+
+    def summarize(summary: str, messages: List[Message]) -> str:
+        return llm.run(
+            "Update the summary of an ongoing conversation with the"
+            " new messages. Keep facts, decisions and open questions;"
+            " drop pleasantries. Reply with the summary only.\n\n"
+            f"Current summary:\n{summary or '(empty)'}\n\n"
+            f"New messages:\n{render_messages(messages)}"
+        )
+
+    return summarize
+
+
+class _ColdSegment:
+    """
+    A sealed slice of the cold index, memory-mapped from disk.
+
+    Holds the normalized vectors written by ``NumpyVectorIndex.save``
+    and the archive offset of each row, so no per-message objects are
+    kept in memory.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.vectors = np.load(
+            os.path.join(path, "vectors.npy"), mmap_mode="r"
+        )
+        self.offsets = np.load(
+            os.path.join(path, "offsets.npy"), mmap_mode="r"
+        )
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def query(
+        self, vector: np.ndarray, k: int
+    ) -> List[Tuple[int, float]]:
+        if not len(self) or k < 1:
+            return []
+        scores = self.vectors @ vector
+        k = min(k, len(scores))
+        top = np.argpartition(scores, -k)[-k:]
+        return [(int(self.offsets[i]), float(scores[i])) for i in top]
+
+
+class TieredMemory:
+    """
+    Bounded three-tier memory for long-running agents.
+
+    - Hot: the agent's ``Conversation`` itself, trimmed by
+      :meth:`compact` to its pinned system messages plus the most
+      recent messages within ``hot_max_tokens``.
+    - Warm: a rolling summary of everything evicted from the hot tier,
+      updated on a background thread by ``summarizer``.
+    - Cold: evicted messages appended verbatim to a JSON-lines archive
+      on disk, with a local vector index for retrieval. Message text is
+      read back from disk. Only the newest ``cold_segment_rows`` index
+      rows are held in memory; older rows are sealed into segments on
+      disk and memory-mapped.
+
+    :meth:`build_prompt` assembles a prompt from all three tiers within
+    a token budget, so prompt size and resident memory stay flat
+    however long the agent runs. The in-memory rows are saved by
+    :meth:`save`; on startup only the part of the archive after the
+    last indexed message is read, which covers a crash or a run that
+    never called :meth:`save`.
+
+    Args:
+        path (Optional[str]): Directory for the cold archive. A
+            previous archive and index found there are reused.
+        hot_max_tokens (int): Token budget of the hot window.
+        warm_max_tokens (int): Token cap on the rolling summary.
+        cold_top_k (int): Archived messages to retrieve per prompt.
+        summarizer (Optional[Summarizer]): Folds evicted messages into
+            the summary. Defaults to :func:`extractive_summary`; use
+            :func:`llm_summarizer` for model-written summaries.
+        tokenizer (Optional[Any]): Object with ``count_tokens``.
+        embedding_fn (Optional[EmbeddingFunction]): Embeds archived
+            messages. Defaults to :class:`HashingEmbedding`.
+        pinned_roles (Tuple[str, ...]): Roles never evicted.
+        cold_segment_rows (int): Archived messages indexed in memory
+            before they are sealed into a memory-mapped segment.
+            Defaults to 4096, about 4 MB at 256 dimensions.
+
+    Examples:
+    >>> memory = TieredMemory("agent_workspace/memory")
+    >>> agent = Agent(llm=llm, tiered_memory=memory)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        hot_max_tokens: int = 2048,
+        warm_max_tokens: int = 512,
+        cold_top_k: int = 3,
+        summarizer: Optional[Summarizer] = None,
+        tokenizer: Optional[Any] = None,
+        embedding_fn: Optional[EmbeddingFunction] = None,
+        pinned_roles: Tuple[str, ...] = PINNED_ROLES,
+        cold_segment_rows: int = 4096,
+    ):
+        self.path = path or os.path.join(
+            "agent_workspace", f"memory-{uuid.uuid4().hex[:8]}"
+        )
+        self.hot_max_tokens = hot_max_tokens
+        self.warm_max_tokens = warm_max_tokens
+        self.cold_top_k = cold_top_k
+        self.summarizer = summarizer or extractive_summary
+        self.tokenizer = tokenizer or TikTokenizer()
+        self.pinned_roles = pinned_roles
+        self.cold_segment_rows = max(1, cold_segment_rows)
+
+        os.makedirs(self.path, exist_ok=True)
+        self.archive_path = os.path.join(self.path, "archive.jsonl")
+        self.index_path = os.path.join(self.path, "index")
+        self.segments_path = os.path.join(self.path, "segments")
+        self.summary_path = os.path.join(self.path, "summary.json")
+
+        self._lock = threading.Lock()
+        self._load_cold_index(
+            embedding_fn or HashingEmbedding(dim=256)
+        )
+
+        self.summary = ""
+        if os.path.exists(self.summary_path):
+            with open(self.summary_path) as file:
+                self.summary = json.load(file).get("summary", "")
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tiered-memory"
+        )
+
+    def _count(self, messages: List[Message]) -> int:
+        return self.tokenizer.count_tokens(render_messages(messages))
+
+    def _split(
+        self, conversation: Conversation
+    ) -> Tuple[List[Message], List[Message]]:
+        pinned, hot = [], []
+        for message in conversation.conversation_history:
+            if message.get("role") in self.pinned_roles:
+                pinned.append(message)
+            else:
+                hot.append(message)
+        return pinned, hot
+
+    def compact(self, conversation: Conversation) -> int:
+        """
+        Evict the oldest unpinned messages until the hot window fits
+        ``hot_max_tokens``. The latest message is always kept.
+
+        Evicted messages are archived to disk straight away and
+        summarized in the background.
+
+        Args:
+            conversation (Conversation): The hot tier to trim in place.
+
+        Returns:
+            int: Number of messages evicted.
+        """
+        pinned, hot = self._split(conversation)
+        counts = [self._count([message]) for message in hot]
+        total = sum(counts)
+
+        evict = 0
+        while evict < len(hot) - 1 and total > self.hot_max_tokens:
+            total -= counts[evict]
+            evict += 1
+        if not evict:
+            return 0
+
+        evicted = hot[:evict]
+        evicted_ids = {id(message) for message in evicted}
+        conversation.conversation_history = [
+            message
+            for message in conversation.conversation_history
+            if id(message) not in evicted_ids
+        ]
+
+        self._archive(evicted)
+        self._executor.submit(self._summarize, evicted)
+        logger.info(f"Moved {evict} messages out of the hot window")
+        return evict
+
+    @property
+    def indexed_messages(self) -> int:
+        """Number of archived messages covered by the cold index."""
+        return len(self.cold_index) + sum(
+            len(segment) for segment in self._segments
+        )
+
+    def _line_end(self, offset: Optional[int]) -> int:
+        """Archive offset just past the message written at ``offset``."""
+        if offset is None:
+            return 0
+        with open(self.archive_path, "rb") as file:
+            file.seek(offset)
+            return offset + len(file.readline())
+
+    def _load_cold_index(
+        self, embedding_fn: EmbeddingFunction
+    ) -> None:
+        """
+        Open the sealed segments and the saved in-memory rows, then
+        index whatever the archive gained after them.
+        """
+        self._segments: List[_ColdSegment] = []
+        if os.path.isdir(self.segments_path):
+            for name in sorted(os.listdir(self.segments_path)):
+                path = os.path.join(self.segments_path, name)
+                if name.endswith(".tmp"):
+                    # A seal interrupted before its rename
+                    shutil.rmtree(path, ignore_errors=True)
+                    continue
+                self._segments.append(_ColdSegment(path))
+
+        sealed_upto = 0
+        if self._segments and len(self._segments[-1]):
+            sealed_upto = self._line_end(
+                int(self._segments[-1].offsets[-1])
+            )
+
+        self.cold_index = NumpyVectorIndex(embedding_fn)
+        if os.path.exists(
+            os.path.join(self.index_path, "index.json")
+        ):
+            saved = NumpyVectorIndex.load(
+                self.index_path, embedding_fn=embedding_fn, mmap=False
+            )
+            # Rows saved before a later seal are already in a segment
+            if all(int(id) >= sealed_upto for id in saved.ids):
+                self.cold_index = saved
+
+        offsets = [int(id) for id in self.cold_index.ids]
+        self._indexed_upto = (
+            self._line_end(max(offsets)) if offsets else sealed_upto
+        )
+        self._index_archive_tail()
+
+    def _archive(self, messages: List[Message]) -> None:
+        ids, texts, metadatas = [], [], []
+        with self._lock:
+            with open(self.archive_path, "ab") as file:
+                for message in messages:
+                    offset = file.tell()
+                    file.write(
+                        json.dumps(message, default=str).encode()
+                        + b"\n"
+                    )
+                    ids.append(str(offset))
+                    texts.append(
+                        f"{message['role']}: {message['content']}"
+                    )
+                    metadatas.append({"offset": offset})
+                file.flush()
+                os.fsync(file.fileno())
+                end = file.tell()
+            self._index(ids, texts, metadatas, end)
+
+    def _index(
+        self,
+        ids: List[str],
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        end: int,
+    ) -> None:
+        """
+        Index archived messages, sealing the in-memory rows into a
+        segment whenever they reach ``cold_segment_rows``.
+        """
+        while ids:
+            room = self.cold_segment_rows - len(self.cold_index)
+            if room <= 0:
+                self._seal()
+                continue
+            self.cold_index.upsert_texts(
+                ids[:room], texts[:room], metadatas[:room]
+            )
+            ids, texts, metadatas = (
+                ids[room:],
+                texts[room:],
+                metadatas[room:],
+            )
+            if len(self.cold_index) >= self.cold_segment_rows:
+                self._seal()
+        self._indexed_upto = end
+
+    def _seal(self) -> None:
+        """Move the in-memory rows into a memory-mapped segment."""
+        path = os.path.join(
+            self.segments_path, f"{len(self._segments):06d}"
+        )
+        staging = path + ".tmp"
+        self.cold_index.save(staging)
+        np.save(
+            os.path.join(staging, "offsets.npy"),
+            np.array(
+                [int(id) for id in self.cold_index.ids],
+                dtype=np.int64,
+            ),
+        )
+        os.replace(staging, path)
+        self._segments.append(_ColdSegment(path))
+        self.cold_index.clear()
+
+    def _index_archive_tail(self, batch_size: int = 256) -> None:
+        """Index archived messages written after ``_indexed_upto``."""
+        if not os.path.exists(self.archive_path):
+            return
+        ids, texts, metadatas = [], [], []
+        indexed = 0
+        with open(self.archive_path, "rb") as file:
+            file.seek(self._indexed_upto)
+            offset = self._indexed_upto
+            for line in file:
+                line_offset, offset = offset, offset + len(line)
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    # A write cut short by a crash
+                    continue
+                ids.append(str(line_offset))
+                texts.append(
+                    f"{message['role']}: {message['content']}"
+                )
+                metadatas.append({"offset": line_offset})
+                indexed += 1
+                if len(ids) >= batch_size:
+                    self._index(ids, texts, metadatas, offset)
+                    ids, texts, metadatas = [], [], []
+        self._index(ids, texts, metadatas, offset)
+        if indexed:
+            logger.info(
+                f"Indexed {indexed} archived messages missing from the saved index"
+            )
+
+    def _summarize(self, messages: List[Message]) -> None:
+        try:
+            summary = self.summarizer(self.summary, messages)
+        except Exception as error:
+            logger.error(
+                f"Summarizing evicted messages failed: {error}"
+            )
+            return
+        self.summary = self._truncate(summary, self.warm_max_tokens)
+
+    def _truncate(self, text: str, max_tokens: int) -> str:
+        if max_tokens <= 0:
+            return ""
+        if self.tokenizer.count_tokens(text) <= max_tokens:
+            return text
+        if hasattr(self.tokenizer, "encode") and hasattr(
+            self.tokenizer, "decode"
+        ):
+            return self.tokenizer.decode(
+                self.tokenizer.encode(text)[:max_tokens]
+            )
+        words = text.split()
+        while (
+            words
+            and self.tokenizer.count_tokens(" ".join(words))
+            > max_tokens
+        ):
+            words = words[: len(words) * 3 // 4]
+        return " ".join(words)
+
+    def search(
+        self, query: str, k: Optional[int] = None
+    ) -> List[Message]:
+        """
+        Retrieve the archived messages most similar to ``query``.
+
+        Args:
+            query (str): Text to match.
+            k (Optional[int]): Messages to return. Defaults to
+                ``cold_top_k``.
+
+        Returns:
+            List[Message]: Matching messages, in archive order.
+        """
+        if not query or not self.indexed_messages:
+            return []
+        k = k or self.cold_top_k
+        vector = self.cold_index.embed([query])[0]
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector = vector / norm
+
+        with self._lock:
+            hits = [
+                (self.cold_index.get_metadata(id)["offset"], score)
+                for id, score in self.cold_index.query(vector, k)
+            ]
+            for segment in self._segments:
+                hits.extend(segment.query(vector, k))
+        best = sorted(hits, key=lambda hit: hit[1], reverse=True)[:k]
+        offsets = sorted(
+            offset for offset, score in best if score > 0
+        )
+        messages = []
+        with open(self.archive_path, "rb") as file:
+            for offset in offsets:
+                file.seek(offset)
+                messages.append(json.loads(file.readline()))
+        return messages
+
+    def build_prompt(
+        self,
+        conversation: Conversation,
+        query: Optional[str] = None,
+        max_tokens: int = 8192,
+    ) -> str:
+        """
+        Assemble a prompt from all three tiers within ``max_tokens``.
+
+        Pinned messages come first, then the rolling summary, then
+        archived messages relevant to ``query``, then the hot window.
+        Space is claimed in priority order: pinned messages, the most
+        recent hot messages, the summary, and finally retrieved
+        messages.
+
+        Args:
+            conversation (Conversation): The hot tier.
+            query (Optional[str]): Text to retrieve archived messages
+                for, usually the current task.
+            max_tokens (int): Token budget for the prompt.
+
+        Returns:
+            str: The prompt.
+        """
+        pinned, hot = self._split(conversation)
+        budget = max_tokens - self._count(pinned)
+
+        recent: List[Message] = []
+        for message in reversed(hot):
+            cost = self._count([message])
+            if recent and cost > budget:
+                break
+            recent.insert(0, message)
+            budget -= cost
+
+        sections: List[Message] = []
+        summary = {
+            "role": "Summary of earlier conversation",
+            "content": "",
+        }
+        room = budget - self._count([summary])
+        if self.summary and room > 0:
+            summary["content"] = self._truncate(self.summary, room)
+            sections.append(summary)
+            budget -= self._count([summary])
+
+        for message in self.search(query or ""):
+            archived = {
+                "role": f"{message['role']} (earlier)",
+                "content": message["content"],
+            }
+            cost = self._count([archived])
+            if cost > budget:
+                break
+            sections.append(archived)
+            budget -= cost
+
+        return render_messages(pinned + sections + recent)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait for pending summaries to finish."""
+        self._executor.submit(lambda: None).result(timeout)
+
+    def save(self) -> None:
+        """Persist the cold index and the summary next to the archive."""
+        self.flush()
+        with self._lock:
+            self.cold_index.save(self.index_path)
+        with open(self.summary_path, "w") as file:
+            json.dump({"summary": self.summary}, file)
+
+    def close(self) -> None:
+        """Finish pending summaries, save, and stop the worker."""
+        self.save()
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,347 @@
+import json
+import os
+import re
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+
+from swarms.utils.loguru_logger import initialize_logger
+
+logger = initialize_logger(log_folder="vector_index")
+
+# Maps a batch of texts to a batch of vectors, one row per text
+EmbeddingFunction = Callable[[List[str]], Sequence[Sequence[float]]]
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class HashingEmbedding:
+    """
+    Local bag-of-words embedding using the hashing trick.
+
+    Each lowercase word is hashed into one of ``dim`` buckets with a
+    stable CRC32, so vectors are reproducible across processes and
+    saved indexes stay valid. It needs no model download or network
+    access, which makes it a reasonable default for routing over short
+    agent descriptions; pass a real model's embedding function for
+    semantic matching.
+
+    Args:
+        dim (int): Size of the output vectors.
+    """
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+
+    def __call__(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in _TOKEN_PATTERN.findall(text.lower()):
+                bucket = zlib.crc32(token.encode()) % self.dim
+                vectors[row, bucket] += 1.0
+        return vectors
+
+
+class VectorIndex(ABC):
+    """
+    Interface for the vector stores used to route and recall by
+    similarity.
+
+    Backends implement the vector operations; the text helpers embed
+    through ``embedding_fn`` and delegate to them.
+
+    Args:
+        embedding_fn (Optional[EmbeddingFunction]): Embeds a batch of
+            texts. Defaults to :class:`HashingEmbedding`.
+    """
+
+    def __init__(
+        self, embedding_fn: Optional[EmbeddingFunction] = None
+    ):
+        self.embedding_fn = embedding_fn or HashingEmbedding()
+
+    @abstractmethod
+    def upsert(
+        self,
+        ids: List[str],
+        vectors: Sequence[Sequence[float]],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """Insert vectors, replacing any existing entries with the same id."""
+
+    @abstractmethod
+    def delete(self, ids: Iterable[str]) -> None:
+        """Remove entries; unknown ids are ignored."""
+
+    @abstractmethod
+    def query(
+        self, vector: Sequence[float], k: int = 1
+    ) -> List[Tuple[str, float]]:
+        """Return up to ``k`` (id, cosine similarity) pairs, best first."""
+
+    @abstractmethod
+    def get_metadata(self, id: str) -> Dict[str, Any]:
+        """Return the metadata stored with an entry."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def __contains__(self, id: str) -> bool: ...
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Embed a batch of texts as a float32 matrix."""
+        vectors = np.asarray(
+            self.embedding_fn(texts), dtype=np.float32
+        )
+        return vectors.reshape(len(texts), -1)
+
+    def upsert_texts(
+        self,
+        ids: List[str],
+        texts: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """Embed ``texts`` and upsert them under ``ids``."""
+        self.upsert(ids, self.embed(texts), metadatas)
+
+    def query_text(
+        self, text: str, k: int = 1
+    ) -> List[Tuple[str, float]]:
+        """Embed ``text`` and return its ``k`` nearest entries."""
+        return self.query(self.embed([text])[0], k)
+
+
+class NumpyVectorIndex(VectorIndex):
+    """
+    In-process vector index backed by a contiguous float32 matrix.
+
+    Rows are L2-normalized on insert, so a query is a single
+    matrix-vector product followed by an ``argpartition`` top-k.
+    Capacity doubles as entries are added, deletes move the last row
+    into the freed slot, and indexes can be saved with ``np.save`` and
+    memory-mapped back with :meth:`load`.
+
+    Args:
+        embedding_fn (Optional[EmbeddingFunction]): Embeds a batch of
+            texts. Defaults to :class:`HashingEmbedding`.
+        dim (Optional[int]): Vector size. Inferred from the first
+            insert when not given.
+        initial_capacity (int): Rows allocated up front.
+    """
+
+    def __init__(
+        self,
+        embedding_fn: Optional[EmbeddingFunction] = None,
+        dim: Optional[int] = None,
+        initial_capacity: int = 64,
+    ):
+        super().__init__(embedding_fn)
+        self.dim = dim
+        self._capacity = initial_capacity
+        self._matrix: Optional[np.ndarray] = None
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._metadatas: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._positions
+
+    @property
+    def ids(self) -> List[str]:
+        return list(self._ids)
+
+    def _reserve(self, rows: int):
+        """Make room for ``rows`` more entries, keeping memory contiguous."""
+        needed = len(self._ids) + rows
+        if self._matrix is None:
+            self._capacity = max(self._capacity, needed)
+            self._matrix = np.zeros(
+                (self._capacity, self.dim), dtype=np.float32
+            )
+            return
+        if (
+            needed <= self._matrix.shape[0]
+            and self._matrix.flags.writeable
+        ):
+            return
+
+        self._capacity = max(self._matrix.shape[0], 1)
+        while self._capacity < needed:
+            self._capacity *= 2
+        matrix = np.zeros(
+            (self._capacity, self.dim), dtype=np.float32
+        )
+        matrix[: len(self._ids)] = self._matrix[: len(self._ids)]
+        self._matrix = matrix
+
+    def upsert(
+        self,
+        ids: List[str],
+        vectors: Sequence[Sequence[float]],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(
+            len(ids), -1
+        )
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+        if vectors.shape[1] != self.dim:
+            raise ValueError(
+                f"Expected vectors of size {self.dim}, got {vectors.shape[1]}"
+            )
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms == 0, 1, norms)
+
+        with self._lock:
+            new_ids = [
+                id for id in dict.fromkeys(ids) if id not in self
+            ]
+            self._reserve(len(new_ids))
+            for id in new_ids:
+                self._positions[id] = len(self._ids)
+                self._ids.append(id)
+
+            rows = [self._positions[id] for id in ids]
+            self._matrix[rows] = vectors
+            for i, id in enumerate(ids):
+                if metadatas is not None:
+                    self._metadatas[id] = metadatas[i]
+                else:
+                    self._metadatas.setdefault(id, {})
+
+    def delete(self, ids: Iterable[str]) -> None:
+        with self._lock:
+            for id in ids:
+                row = self._positions.pop(id, None)
+                if row is None:
+                    continue
+                self._metadatas.pop(id, None)
+                last = len(self._ids) - 1
+                if row != last:
+                    self._reserve(0)
+                    moved = self._ids[last]
+                    self._matrix[row] = self._matrix[last]
+                    self._ids[row] = moved
+                    self._positions[moved] = row
+                self._ids.pop()
+
+    def query(
+        self, vector: Sequence[float], k: int = 1
+    ) -> List[Tuple[str, float]]:
+        with self._lock:
+            size = len(self._ids)
+            if size == 0 or k < 1:
+                return []
+
+            query = np.asarray(vector, dtype=np.float32).reshape(-1)
+            norm = np.linalg.norm(query)
+            if norm:
+                query = query / norm
+
+            scores = self._matrix[:size] @ query
+            k = min(k, size)
+            if k < size:
+                top = np.argpartition(scores, -k)[-k:]
+            else:
+                top = np.arange(size)
+            top = top[np.argsort(scores[top])[::-1]]
+            return [(self._ids[i], float(scores[i])) for i in top]
+
+    def get_metadata(self, id: str) -> Dict[str, Any]:
+        return self._metadatas[id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+            self._positions.clear()
+            self._metadatas.clear()
+            self._matrix = None
+
+    def save(self, path: str) -> None:
+        """
+        Save the index to a directory.
+
+        Vectors go to ``vectors.npy`` and ids and metadata to
+        ``index.json``.
+
+        Args:
+            path (str): Directory to write to. Created if missing.
+        """
+        os.makedirs(path, exist_ok=True)
+        with self._lock:
+            size = len(self._ids)
+            matrix = (
+                self._matrix[:size]
+                if self._matrix is not None
+                else np.zeros((0, self.dim or 0), dtype=np.float32)
+            )
+            np.save(os.path.join(path, "vectors.npy"), matrix)
+            with open(os.path.join(path, "index.json"), "w") as file:
+                json.dump(
+                    {
+                        "dim": self.dim,
+                        "ids": self._ids,
+                        "metadatas": [
+                            self._metadatas[id] for id in self._ids
+                        ],
+                    },
+                    file,
+                    default=str,
+                )
+        logger.info(f"Saved {size} vectors to {path}")
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        embedding_fn: Optional[EmbeddingFunction] = None,
+        mmap: bool = True,
+    ) -> "NumpyVectorIndex":
+        """
+        Load an index written by :meth:`save`.
+
+        Args:
+            path (str): Directory the index was saved to.
+            embedding_fn (Optional[EmbeddingFunction]): Must match the
+                function the index was built with.
+            mmap (bool): Memory-map the vectors read-only instead of
+                reading them into memory. The first write copies them.
+
+        Returns:
+            NumpyVectorIndex: The loaded index.
+        """
+        with open(os.path.join(path, "index.json")) as file:
+            state = json.load(file)
+
+        index = cls(embedding_fn=embedding_fn, dim=state["dim"])
+        index._matrix = np.load(
+            os.path.join(path, "vectors.npy"),
+            mmap_mode="r" if mmap else None,
+        )
+        index._capacity = index._matrix.shape[0]
+        index._ids = list(state["ids"])
+        index._positions = {id: i for i, id in enumerate(index._ids)}
+        index._metadatas = dict(zip(index._ids, state["metadatas"]))
+        return index
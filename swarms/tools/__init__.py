@@ -29,6 +29,15 @@ from swarms.tools.cohere_func_call_schema import (
 )
 from swarms.tools.tool_registry import ToolStorage, tool_registry
 from swarms.tools.json_utils import base_model_to_json
+from swarms.tools.schema_cache import (
+    SchemaCache,
+    clear_schema_cache,
+    schema_cache,
+)
+from swarms.tools.tool_parse_exec import (
+    ToolDispatcher,
+    parse_and_execute_json,
+)
 
 
 __all__ = [
@@ -53,4 +62,9 @@ __all__ = [
     "ToolStorage",
     "tool_registry",
     "base_model_to_json",
+    "ToolDispatcher",
+    "parse_and_execute_json",
+    "SchemaCache",
+    "clear_schema_cache",
+    "schema_cache",
 ]
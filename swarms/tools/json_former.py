@@ -7,6 +7,7 @@ from swarms.tools.logits_processor import (
     NumberStoppingCriteria,
     OutputNumbersTokens,
     StringStoppingCriteria,
+    get_tokenizer_vocabulary,
 )
 from swarm_models.base_llm import BaseLLM
 from swarms.utils.auto_download_check_packages import (
@@ -352,15 +353,15 @@ class Jsonformer:
                     logits[top_indices].argsort(descending=True)
                 ]
 
+                vocabulary = get_tokenizer_vocabulary(self.tokenizer)
                 found_comma = False
                 found_close_bracket = False
 
-                for token_id in sorted_token_ids:
-                    decoded_token = self.tokenizer.decode(token_id)
-                    if "," in decoded_token:
+                for token_id in sorted_token_ids.tolist():
+                    if token_id in vocabulary.comma_ids:
                         found_comma = True
                         break
-                    if "]" in decoded_token:
+                    if token_id in vocabulary.bracket_ids:
                         found_close_bracket = True
                         break
 
@@ -1,3 +1,8 @@
+import os
+import threading
+import weakref
+from typing import Dict, List, Set
+
 from swarms.utils.auto_download_check_packages import (
     auto_check_and_download_package,
 )
@@ -20,12 +25,124 @@ except ImportError:
     import transformers
 
 
+class TokenizerVocabulary:
+    """
+    Decoded vocabulary and derived token-id sets for a single tokenizer.
+
+    Decoding a full vocabulary costs one ``tokenizer.decode`` per token,
+    so instances are built once per tokenizer through
+    :func:`get_tokenizer_vocabulary` and shared by every logits
+    processor and stopping criterion that uses that tokenizer.
+
+    Attributes:
+        token_strings (List[str]): Decoded text of each token id, with
+            special tokens decoded to an empty string.
+        number_mask (torch.BoolTensor): Tokens allowed while generating
+            a number (digits, a single ".", or whitespace).
+        digit_ids (Set[int]): Token ids whose text contains a digit.
+        quote_ids (Set[int]): Token ids whose text contains ``"``.
+        comma_ids (Set[int]): Token ids whose text contains ``,``.
+        bracket_ids (Set[int]): Token ids whose text contains ``]``.
+    """
+
+    def __init__(self, tokenizer: transformers.PreTrainedTokenizer):  # type: ignore
+        vocab_size = len(tokenizer)
+        special_ids = set(getattr(tokenizer, "all_special_ids", []))
+
+        self.token_strings: List[str] = [""] * vocab_size
+        self.number_mask = torch.zeros(vocab_size, dtype=torch.bool)
+        self.digit_ids: Set[int] = set()
+        self.quote_ids: Set[int] = set()
+        self.comma_ids: Set[int] = set()
+        self.bracket_ids: Set[int] = set()
+
+        for token_id in tokenizer.get_vocab().values():
+            if token_id >= vocab_size:
+                continue
+
+            raw = tokenizer.decode(token_id)
+            stripped = raw.strip()
+            if stripped == "" or (
+                all(c.isdigit() or c == "." for c in stripped)
+                and stripped.count(".") <= 1
+            ):
+                self.number_mask[token_id] = True
+
+            if token_id in special_ids:
+                continue
+
+            self.token_strings[token_id] = raw
+            if any(c.isdigit() for c in raw):
+                self.digit_ids.add(token_id)
+            if '"' in raw:
+                self.quote_ids.add(token_id)
+            if "," in raw:
+                self.comma_ids.add(token_id)
+            if "]" in raw:
+                self.bracket_ids.add(token_id)
+
+
+_vocabulary_cache: "weakref.WeakKeyDictionary" = (
+    weakref.WeakKeyDictionary()
+)
+_vocabulary_cache_by_id: Dict[int, TokenizerVocabulary] = {}
+_vocabulary_cache_lock = threading.Lock()
+
+
+def get_tokenizer_vocabulary(
+    tokenizer: transformers.PreTrainedTokenizer,  # type: ignore
+) -> TokenizerVocabulary:
+    """
+    Return the memoized :class:`TokenizerVocabulary` for a tokenizer.
+
+    The vocabulary is built on first use and shared across instances
+    and threads. Entries are dropped when the tokenizer is garbage
+    collected.
+
+    Args:
+        tokenizer (PreTrainedTokenizer): The tokenizer to index.
+
+    Returns:
+        TokenizerVocabulary: The cached vocabulary for the tokenizer.
+    """
+    try:
+        vocabulary = _vocabulary_cache.get(tokenizer)
+    except TypeError:
+        vocabulary = _vocabulary_cache_by_id.get(id(tokenizer))
+
+    if vocabulary is not None:
+        return vocabulary
+
+    with _vocabulary_cache_lock:
+        try:
+            vocabulary = _vocabulary_cache.get(tokenizer)
+            if vocabulary is None:
+                vocabulary = TokenizerVocabulary(tokenizer)
+                _vocabulary_cache[tokenizer] = vocabulary
+        except TypeError:
+            # Tokenizers that cannot be weakly referenced are keyed by id
+            vocabulary = _vocabulary_cache_by_id.get(id(tokenizer))
+            if vocabulary is None:
+                vocabulary = TokenizerVocabulary(tokenizer)
+                _vocabulary_cache_by_id[id(tokenizer)] = vocabulary
+
+    return vocabulary
+
+
+def clear_tokenizer_vocabulary_cache() -> None:
+    """Drop every cached tokenizer vocabulary."""
+    with _vocabulary_cache_lock:
+        _vocabulary_cache.clear()
+        _vocabulary_cache_by_id.clear()
+
+
 class StringStoppingCriteria(transformers.StoppingCriteria):
     def __init__(
         self, tokenizer: transformers.PreTrainedTokenizer, prompt_length: int  # type: ignore
     ):
         self.tokenizer = tokenizer
         self.prompt_length = prompt_length
+        self.quote_ids = get_tokenizer_vocabulary(tokenizer).quote_ids
 
     def __call__(
         self,
@@ -35,14 +152,7 @@ class StringStoppingCriteria(transformers.StoppingCriteria):
         if len(input_ids[0]) <= self.prompt_length:
             return False
 
-        last_token_id = input_ids[0][-1]
-        last_token = self.tokenizer.decode(
-            last_token_id, skip_special_tokens=True
-        )
-
-        result = '"' in last_token
-
-        return result
+        return int(input_ids[0][-1]) in self.quote_ids
 
 
 class NumberStoppingCriteria(transformers.StoppingCriteria):
@@ -56,15 +166,51 @@ class NumberStoppingCriteria(transformers.StoppingCriteria):
         self.precision = precision
         self.prompt_length = prompt_length
 
+        # Decoded suffix, extended only with newly generated tokens
+        self._decoded = ""
+        self._decoded_length = prompt_length
+
+    # Tokens re-decoded before the new ones. Decoding slices on their
+    # own is not the same as decoding the sequence: SentencePiece drops
+    # the leading "▁" space of a slice, and byte-level tokens can split
+    # a character, so the new text is the difference between decoding
+    # the overlap with and without the new tokens.
+    OVERLAP = 4
+
+    def _decode_new_text(self, sequence: List[int]) -> str:
+        start = max(
+            self.prompt_length, self._decoded_length - self.OVERLAP
+        )
+        before = self.tokenizer.decode(
+            sequence[start : self._decoded_length],
+            skip_special_tokens=True,
+        )
+        after = self.tokenizer.decode(
+            sequence[start:], skip_special_tokens=True
+        )
+        shared = len(os.path.commonprefix([before, after]))
+        if shared < len(before):
+            # The overlap decoded differently with more context, e.g. a
+            # completed multi-byte character; replace its tail
+            self._decoded = self._decoded[
+                : len(self._decoded) - (len(before) - shared)
+            ]
+        return after[shared:]
+
     def __call__(
         self,
         input_ids: torch.LongTensor,  # type: ignore
         scores: torch.FloatTensor,  # type: ignore
     ) -> bool:
-        decoded = self.tokenizer.decode(
-            input_ids[0][self.prompt_length :],
-            skip_special_tokens=True,
-        )
+        sequence = input_ids[0]
+        if len(sequence) < self._decoded_length:
+            # A new generation reused this criterion; start over
+            self._decoded = ""
+            self._decoded_length = self.prompt_length
+
+        self._decoded += self._decode_new_text(sequence.tolist())
+        self._decoded_length = len(sequence)
+        decoded = self._decoded
 
         if decoded.count(".") > 1:
             return True
@@ -89,17 +235,9 @@ class OutputNumbersTokens(transformers.LogitsWarper):
     def __init__(self, tokenizer: transformers.PreTrainedTokenizer, prompt: str):  # type: ignore
         self.tokenizer = tokenizer
         self.tokenized_prompt = tokenizer(prompt, return_tensors="pt")
-        vocab_size = len(tokenizer)
-        self.allowed_mask = torch.zeros(vocab_size, dtype=torch.bool)
-
-        for _, token_id in tokenizer.get_vocab().items():
-            token_str = tokenizer.decode(token_id).strip()
-
-            if token_str == "" or (
-                all(c.isdigit() or c == "." for c in token_str)
-                and token_str.count(".") <= 1
-            ):
-                self.allowed_mask[token_id] = True
+        self.allowed_mask = get_tokenizer_vocabulary(
+            tokenizer
+        ).number_mask
 
     def __call__(self, _, scores):
         mask = self.allowed_mask.expand_as(scores)
@@ -1,7 +1,13 @@
 from swarms.tools.prebuilt.math_eval import math_eval
 from swarms.tools.prebuilt.code_executor import CodeExecutor
+from swarms.tools.prebuilt.interpreter_pool import (
+    ExecutionResult,
+    InterpreterPool,
+)
 
 __all__ = [
     "math_eval",
     "CodeExecutor",
+    "ExecutionResult",
+    "InterpreterPool",
 ]
@@ -1,7 +1,38 @@
+import functools
 import os
 import subprocess
+import threading
+from typing import Callable, Optional
+
 from loguru import logger
-from swarm_models.tiktoken_wrapper import TikTokenizer
+
+from swarms.tools.prebuilt.interpreter_pool import InterpreterPool
+
+
+@functools.lru_cache(maxsize=256)
+def _format_with_black(code: str) -> str:
+    import black
+
+    return black.format_str(code, mode=black.FileMode())
+
+
+def _memory_limiter(
+    memory_limit_mb: Optional[int],
+) -> Optional[Callable[[], None]]:
+    """
+    Return a ``preexec_fn`` that caps the child's address space, or
+    None when there is no limit or the platform cannot apply one.
+    """
+    if not memory_limit_mb or os.name != "posix":
+        return None
+
+    def limit() -> None:
+        import resource
+
+        size = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (size, size))
+
+    return limit
 
 
 class CodeExecutor:
@@ -9,7 +40,8 @@ class CodeExecutor:
     A class to execute Python code and return the output as a string.
 
     The class also logs the input and output using loguru and stores the outputs
-    in a folder called 'artifacts'.
+    in a folder called 'artifacts'. Python code runs on a pool of warm
+    interpreters, so repeated executions do not pay interpreter startup.
 
     Methods:
         execute(code: str) -> str:
@@ -21,17 +53,40 @@ class CodeExecutor:
         max_output_length: int = 1000,
         artifacts_directory: str = "artifacts",
         language: str = "python3",
+        format_code: bool = True,
+        use_pool: bool = True,
+        pool_size: int = 2,
+        timeout: Optional[float] = None,
+        memory_limit_mb: Optional[int] = None,
     ) -> None:
         """
         Initializes the CodeExecutor class and sets up the logging.
+
+        Args:
+            max_output_length (int): Maximum number of output characters kept.
+            artifacts_directory (str): Directory for the execution log.
+            language (str): Interpreter command used when the pool is disabled.
+            format_code (bool): Whether to format code with black before running it.
+            use_pool (bool): Whether to run code on a pool of warm interpreters.
+            pool_size (int): Number of pooled interpreters.
+            timeout (Optional[float]): Per-execution timeout in seconds.
+            memory_limit_mb (Optional[int]): Address-space limit in MB for
+                the interpreter running the code, pooled or not. Applied
+                on POSIX only.
         """
         self.max_output_length = max_output_length
         self.artifacts_dir = artifacts_directory
         self.language = language
+        self.enable_formatting = format_code
+        self.use_pool = use_pool
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self._pool: Optional[InterpreterPool] = None
+        self._pool_lock = threading.Lock()
 
         os.makedirs(self.artifacts_dir, exist_ok=True)
         self.setup_logging()
-        self.tokenizer = TikTokenizer()
 
     def setup_logging(self) -> None:
         """
@@ -46,10 +101,25 @@ class CodeExecutor:
             "Logger initialized and artifacts directory set up."
         )
 
+    @property
+    def pool(self) -> InterpreterPool:
+        """The interpreter pool, started on first use."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = InterpreterPool(
+                        size=self.pool_size,
+                        memory_limit_mb=self.memory_limit_mb,
+                    )
+        return self._pool
+
     def format_code(self, code: str) -> str:
         """
         Formats the given Python code using black.
 
+        Results are cached, so re-running the same snippet does not
+        format it again.
+
         Args:
             code (str): The Python code to format.
 
@@ -60,22 +130,34 @@ class CodeExecutor:
             ValueError: If the code cannot be formatted.
         """
         try:
-            import black
-
-            formatted_code = black.format_str(
-                code, mode=black.FileMode()
-            )
-            return formatted_code
+            return _format_with_black(code)
         except Exception as e:
             logger.error(f"Error formatting code: {e}")
             raise ValueError(f"Error formatting code: {e}") from e
 
-    def execute(self, code: str) -> str:
+    def _truncate(self, output: str) -> str:
+        if (
+            self.max_output_length
+            and len(output) > self.max_output_length
+        ):
+            logger.warning(
+                f"Output length exceeds {self.max_output_length} characters. Truncating output."
+            )
+            output = output[: self.max_output_length] + "..."
+        return output
+
+    def execute(
+        self,
+        code: str,
+        on_output: Optional[Callable[[str, str], None]] = None,
+    ) -> str:
         """
         Executes the given Python code and returns the output.
 
         Args:
             code (str): The Python code to execute.
+            on_output (Optional[Callable[[str, str], None]]): Called with
+                ``(stream, data)`` as output is produced by pooled runs.
 
         Returns:
             str: The output of the executed code.
@@ -83,35 +165,73 @@ class CodeExecutor:
         Raises:
             RuntimeError: If there is an error during the execution of the code.
         """
+        if self.enable_formatting:
+            code = self.format_code(code)
+        logger.info(f"Executing code:\n{code}")
+
+        if not self.use_pool:
+            return self._execute_subprocess(code)
+
+        # Capture one extra character so truncation can be detected
+        result = self.pool.execute(
+            code,
+            timeout=self.timeout,
+            max_output_length=(
+                self.max_output_length + 1
+                if self.max_output_length
+                else None
+            ),
+            on_output=on_output,
+        )
+        if result.timed_out:
+            logger.error(
+                f"Code execution timed out after {self.timeout}s"
+            )
+            raise RuntimeError(
+                f"Error executing code: timed out after {self.timeout}s"
+            )
+        if result.error:
+            logger.error(f"Error executing code: {result.error}")
+            raise RuntimeError(
+                f"Error executing code: {result.error}"
+            )
+
+        logger.info(f"Code output:\n{result.stdout}")
+        return self._truncate(result.stdout)
+
+    def _execute_subprocess(self, code: str) -> str:
         try:
-            formatted_code = self.format_code(code)
-            logger.info(f"Executing code:\n{formatted_code}")
             completed_process = subprocess.run(
-                [self.language, "-c", formatted_code],
+                [self.language, "-c", code],
                 capture_output=True,
                 text=True,
                 check=True,
+                timeout=self.timeout,
+                preexec_fn=_memory_limiter(self.memory_limit_mb),
             )
-            output = completed_process.stdout
-            logger.info(f"Code output:\n{output}")
-            token_count = self.tokenizer.count_tokens(output)
-            print(token_count)
-
-            if (
-                self.max_output_length
-                and token_count > self.max_output_length
-            ):
-                logger.warning(
-                    f"Output length exceeds {self.max_output_length} characters. Truncating output."
-                )
-                output = output[: self.max_output_length] + "..."
-
-            return output
         except subprocess.CalledProcessError as e:
             logger.error(f"Error executing code: {e.stderr}")
             raise RuntimeError(
                 f"Error executing code: {e.stderr}"
             ) from e
+        except subprocess.TimeoutExpired as e:
+            logger.error(
+                f"Code execution timed out after {self.timeout}s"
+            )
+            raise RuntimeError(
+                f"Error executing code: timed out after {self.timeout}s"
+            ) from e
+
+        output = completed_process.stdout
+        logger.info(f"Code output:\n{output}")
+        return self._truncate(output)
+
+    def shutdown(self) -> None:
+        """Stop the pooled interpreters."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
 
 
 # # Example usage:
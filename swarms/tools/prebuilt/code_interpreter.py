@@ -17,6 +17,7 @@ class SubprocessCodeInterpreter:
         debug_mode (bool): Whether to print debug statements.
         output_queue (queue.Queue): A queue that is filled with output from the subprocess.
         done (threading.Event): An event that is set when the subprocess is done running code.
+        timeout (float): Seconds to wait for a run to finish before the subprocess is terminated.
 
     Example:
     """
@@ -28,6 +29,7 @@ class SubprocessCodeInterpreter:
         max_retries: int = 3,
         verbose: bool = False,
         retry_count: int = 0,
+        timeout: float = None,
         *args,
         **kwargs,
     ):
@@ -37,6 +39,7 @@ class SubprocessCodeInterpreter:
         self.max_retries = max_retries
         self.verbose = verbose
         self.retry_count = retry_count
+        self.timeout = timeout
         self.output_queue = queue.Queue()
         self.done = threading.Event()
 
@@ -172,25 +175,36 @@ class SubprocessCodeInterpreter:
                     }
                     return
 
+        deadline = (
+            time.monotonic() + self.timeout if self.timeout else None
+        )
         while True:
-            if not self.output_queue.empty():
-                yield self.output_queue.get()
-            else:
-                time.sleep(0.1)
             try:
-                output = self.output_queue.get(
-                    timeout=0.3
-                )  # Waits for 0.3 seconds
-                yield output
+                # Block on the queue instead of polling so output is
+                # yielded as soon as the reader threads produce it
+                yield self.output_queue.get(timeout=0.1)
+                continue
             except queue.Empty:
-                if self.done.is_set():
-                    # Try to yank 3 more times from it... maybe there's something in there...
-                    # (I don't know if this actually helps. Maybe we just need to yank 1 more time)
-                    for _ in range(3):
-                        if not self.output_queue.empty():
-                            yield self.output_queue.get()
-                        time.sleep(0.2)
-                    break
+                pass
+
+            if self.done.is_set():
+                while True:
+                    try:
+                        yield self.output_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                break
+
+            if deadline is not None and time.monotonic() > deadline:
+                self.terminate()
+                self.process = None
+                yield {
+                    "output": (
+                        "Execution timed out after"
+                        f" {self.timeout} seconds."
+                    )
+                }
+                break
 
     def handle_stream_output(self, stream, is_error_stream):
         """Handle the output from the subprocess
@@ -0,0 +1,494 @@
+import json
+import queue
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from swarms.utils.loguru_logger import logger
+
+# Program run by every pooled interpreter. It executes each request in a
+# fresh namespace, restores the working directory, environment and
+# sys.path afterwards, and reports output and completion as JSON lines.
+# Imported modules stay warm, along with any state they hold.
+_WORKER_BOOTSTRAP = r"""
+import codecs
+import io
+import json
+import os
+import sys
+import threading
+import traceback
+
+# The protocol gets its own copy of the original stdout; fd 1 becomes a
+# pipe so output written straight to it (os.system, subprocesses, C
+# extensions) is forwarded as output instead of corrupting the protocol
+_protocol_out = os.fdopen(os.dup(1), "w", buffering=1)
+_send_lock = threading.Lock()
+
+
+def _send(message):
+    with _send_lock:
+        _protocol_out.write(json.dumps(message) + "\n")
+        _protocol_out.flush()
+
+
+_raw_read, _raw_write = os.pipe()
+os.dup2(_raw_write, 1)
+os.close(_raw_write)
+sys.__stdout__ = sys.stdout = open(1, "w", buffering=1, closefd=False)
+
+_MARKER = b"\x00swarms-interpreter-drained\x00"
+_drained = threading.Event()
+
+
+def _pump():
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    pending = b""
+    while True:
+        chunk = os.read(_raw_read, 65536)
+        if not chunk:
+            return
+        pending += chunk
+        while _MARKER in pending:
+            before, _, pending = pending.partition(_MARKER)
+            data = decoder.decode(before)
+            if data:
+                _send({"type": "output", "stream": "stdout", "data": data})
+            _drained.set()
+        # Hold back what could be the start of a marker
+        keep = len(_MARKER) - 1
+        if len(pending) > keep:
+            data = decoder.decode(pending[:-keep])
+            pending = pending[-keep:]
+            if data:
+                _send({"type": "output", "stream": "stdout", "data": data})
+
+
+threading.Thread(target=_pump, daemon=True).start()
+
+
+def _drain_raw_output():
+    _drained.clear()
+    os.write(1, _MARKER)
+    _drained.wait()
+
+
+class _Stream(io.TextIOBase):
+    def __init__(self, name):
+        self.name = name
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if data:
+            _send({"type": "output", "stream": self.name, "data": data})
+        return len(data)
+
+
+_memory_limit = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+if _memory_limit:
+    try:
+        import resource
+
+        resource.setrlimit(
+            resource.RLIMIT_AS, (_memory_limit, _memory_limit)
+        )
+    except Exception:
+        pass
+
+_cwd = os.getcwd()
+_environ = dict(os.environ)
+_path = list(sys.path)
+_threads = threading.active_count()
+
+_send({"type": "ready"})
+
+for _line in sys.stdin:
+    _request = json.loads(_line)
+    _error = None
+    sys.stdout = _Stream("stdout")
+    sys.stderr = _Stream("stderr")
+    sys.stdin = io.StringIO()
+    try:
+        exec(
+            compile(_request["code"], "<code>", "exec"),
+            {"__name__": "__main__"},
+        )
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            _error = f"SystemExit: {e.code}"
+    except BaseException:
+        _error = traceback.format_exc()
+    finally:
+        sys.stdout = sys.__stdout__
+        sys.stderr = sys.__stderr__
+        sys.stdin = sys.__stdin__
+        os.chdir(_cwd)
+        if os.environ != _environ:
+            os.environ.clear()
+            os.environ.update(_environ)
+        sys.path[:] = _path
+    _drain_raw_output()
+    _send(
+        {
+            "type": "done",
+            "error": _error,
+            "stray_threads": threading.active_count() > _threads,
+        }
+    )
+"""
+
+
+@dataclass
+class ExecutionResult:
+    """
+    The outcome of running one code snippet in a pooled interpreter.
+
+    Attributes:
+        stdout (str): Captured standard output, at most ``max_output_length`` characters.
+        stderr (str): Captured standard error, at most ``max_output_length`` characters.
+        error (Optional[str]): Traceback of an uncaught exception, if any.
+        timed_out (bool): Whether the execution exceeded its timeout.
+        truncated (bool): Whether any output was dropped by the capture bound.
+        duration (float): Wall-clock execution time in seconds.
+    """
+
+    stdout: str = ""
+    stderr: str = ""
+    error: Optional[str] = None
+    timed_out: bool = False
+    truncated: bool = False
+    duration: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return self.error is None and not self.timed_out
+
+
+class _BoundedBuffer:
+    """Collects text up to a fixed number of characters."""
+
+    def __init__(self, limit: Optional[int]):
+        self.limit = limit
+        self.parts: List[str] = []
+        self.size = 0
+        self.truncated = False
+
+    def write(self, data: str) -> None:
+        if self.limit is None:
+            self.parts.append(data)
+            return
+
+        remaining = self.limit - self.size
+        if remaining <= 0:
+            self.truncated = self.truncated or bool(data)
+            return
+        if len(data) > remaining:
+            data = data[:remaining]
+            self.truncated = True
+        self.parts.append(data)
+        self.size += len(data)
+
+    def getvalue(self) -> str:
+        return "".join(self.parts)
+
+
+class PooledInterpreter:
+    """
+    A single pre-started interpreter process managed by :class:`InterpreterPool`.
+
+    Args:
+        python_executable (str): The interpreter used to start the worker.
+        memory_limit_mb (Optional[int]): Address-space limit applied to the worker.
+    """
+
+    def __init__(
+        self,
+        python_executable: str = sys.executable,
+        memory_limit_mb: Optional[int] = None,
+    ):
+        self.python_executable = python_executable
+        self.memory_limit_mb = memory_limit_mb
+        self.executions = 0
+        self.has_stray_threads = False
+        self.process: Optional[subprocess.Popen] = None
+        self.messages: queue.Queue = queue.Queue()
+        self.start()
+
+    def start(self) -> None:
+        """Start the worker process and wait until it is ready."""
+        memory_limit = (self.memory_limit_mb or 0) * 1024 * 1024
+        self.process = subprocess.Popen(
+            [
+                self.python_executable,
+                "-u",
+                "-c",
+                _WORKER_BOOTSTRAP,
+                str(memory_limit),
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        self.messages = queue.Queue()
+        self.executions = 0
+        self.has_stray_threads = False
+        threading.Thread(
+            target=self._read_messages,
+            args=(self.process, self.messages),
+            daemon=True,
+        ).start()
+
+        message = self.messages.get()
+        if message.get("type") != "ready":
+            raise RuntimeError("Interpreter worker failed to start")
+
+    @staticmethod
+    def _read_messages(
+        process: subprocess.Popen, messages: queue.Queue
+    ) -> None:
+        for line in iter(process.stdout.readline, ""):
+            try:
+                message = json.loads(line)
+            except ValueError:
+                message = None
+            if not isinstance(message, dict):
+                # Anything that is not a protocol message is output
+                message = {
+                    "type": "output",
+                    "stream": "stdout",
+                    "data": line,
+                }
+            messages.put(message)
+        messages.put({"type": "exit"})
+
+    def is_alive(self) -> bool:
+        return (
+            self.process is not None and self.process.poll() is None
+        )
+
+    def terminate(self) -> None:
+        """Kill the worker process."""
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+
+    def execute(
+        self,
+        code: str,
+        timeout: Optional[float] = None,
+        max_output_length: Optional[int] = None,
+        on_output: Optional[Callable[[str, str], None]] = None,
+    ) -> ExecutionResult:
+        """
+        Run code in the worker and collect its output.
+
+        Args:
+            code (str): The Python code to execute.
+            timeout (Optional[float]): Seconds to wait before killing the worker.
+            max_output_length (Optional[int]): Maximum characters kept per stream.
+            on_output (Optional[Callable[[str, str], None]]): Called with
+                ``(stream, data)`` as output is produced.
+
+        Returns:
+            ExecutionResult: The captured result.
+        """
+        start_time = time.monotonic()
+        deadline = start_time + timeout if timeout else None
+        stdout = _BoundedBuffer(max_output_length)
+        stderr = _BoundedBuffer(max_output_length)
+        result = ExecutionResult()
+
+        if not self.messages.empty():
+            # Leftovers from an earlier run mean the worker is out of
+            # sync; start a fresh one rather than misattribute them
+            logger.warning(
+                "Interpreter has unread messages; restarting it"
+            )
+            self.terminate()
+            self.start()
+
+        self.executions += 1
+        self.process.stdin.write(json.dumps({"code": code}) + "\n")
+        self.process.stdin.flush()
+
+        while True:
+            remaining = (
+                None
+                if deadline is None
+                else max(deadline - time.monotonic(), 0)
+            )
+            try:
+                message = self.messages.get(timeout=remaining)
+            except queue.Empty:
+                logger.warning(
+                    f"Code execution exceeded {timeout}s; restarting interpreter"
+                )
+                self.terminate()
+                result.timed_out = True
+                break
+
+            kind = message.get("type")
+            if kind == "output":
+                stream = message.get("stream", "stdout")
+                data = str(message.get("data", ""))
+                (stderr if stream == "stderr" else stdout).write(data)
+                if on_output is not None:
+                    on_output(stream, data)
+            elif kind == "done":
+                result.error = message.get("error")
+                self.has_stray_threads = bool(
+                    message.get("stray_threads")
+                )
+                break
+            elif kind == "exit":
+                # Reap it now, so is_alive cannot report a worker that
+                # has closed its pipes but not yet exited
+                self.terminate()
+                result.error = (
+                    "Interpreter process exited unexpectedly"
+                )
+                break
+            else:
+                # Never hand a desynchronized worker back to the pool
+                logger.warning(
+                    f"Unexpected interpreter message {kind!r}; restarting interpreter"
+                )
+                self.terminate()
+                result.error = "Interpreter protocol error"
+                break
+
+        result.stdout = stdout.getvalue()
+        result.stderr = stderr.getvalue()
+        result.truncated = stdout.truncated or stderr.truncated
+        result.duration = time.monotonic() - start_time
+        return result
+
+
+class InterpreterPool:
+    """
+    A pool of warm Python interpreters.
+
+    Interpreters are started ahead of time and reused across executions,
+    so a snippet pays only for its own run time instead of interpreter
+    startup. Each execution runs in a fresh ``__main__`` namespace, and
+    the working directory, ``os.environ`` and ``sys.path`` are restored
+    after it. Imported modules are not reloaded, so state a snippet
+    leaves on a module carries over to later runs on that worker; use
+    ``max_executions_per_worker=1`` when runs must be fully isolated.
+    A worker that times out, crashes or leaves threads running is
+    replaced, and workers are recycled after
+    ``max_executions_per_worker`` runs.
+
+    Args:
+        size (int): Number of interpreters kept warm.
+        python_executable (str): The interpreter to start.
+        memory_limit_mb (Optional[int]): Address-space limit per interpreter.
+        max_executions_per_worker (Optional[int]): Recycle a worker after this many runs.
+
+    Example:
+        >>> pool = InterpreterPool(size=2)
+        >>> pool.execute("print('hello')").stdout
+        'hello\\n'
+        >>> pool.shutdown()
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        python_executable: str = sys.executable,
+        memory_limit_mb: Optional[int] = None,
+        max_executions_per_worker: Optional[int] = 100,
+    ):
+        self.size = size
+        self.python_executable = python_executable
+        self.memory_limit_mb = memory_limit_mb
+        self.max_executions_per_worker = max_executions_per_worker
+        self.idle: queue.Queue = queue.Queue()
+        self._closed = False
+
+        for _ in range(size):
+            self.idle.put(self._new_worker())
+
+    def _new_worker(self) -> PooledInterpreter:
+        return PooledInterpreter(
+            python_executable=self.python_executable,
+            memory_limit_mb=self.memory_limit_mb,
+        )
+
+    def _replace(
+        self, worker: PooledInterpreter
+    ) -> PooledInterpreter:
+        """
+        Swap a worker for a fresh one. If that fails the dead worker is
+        kept, so the pool never loses a slot; it is restarted the next
+        time it is checked out.
+        """
+        worker.terminate()
+        try:
+            return self._new_worker()
+        except Exception as e:
+            logger.error(f"Failed to start an interpreter: {e}")
+            return worker
+
+    def execute(
+        self,
+        code: str,
+        timeout: Optional[float] = None,
+        max_output_length: Optional[int] = None,
+        on_output: Optional[Callable[[str, str], None]] = None,
+    ) -> ExecutionResult:
+        """
+        Run code on the next free interpreter, blocking until one is available.
+
+        See :meth:`PooledInterpreter.execute` for the arguments.
+        """
+        if self._closed:
+            raise RuntimeError("InterpreterPool has been shut down")
+
+        worker = self.idle.get()
+        try:
+            if not worker.is_alive():
+                worker.start()
+            return worker.execute(
+                code,
+                timeout=timeout,
+                max_output_length=max_output_length,
+                on_output=on_output,
+            )
+        finally:
+            if self._closed:
+                worker.terminate()
+            elif (
+                not worker.is_alive()
+                or worker.has_stray_threads
+                or (
+                    self.max_executions_per_worker
+                    and worker.executions
+                    >= self.max_executions_per_worker
+                )
+            ):
+                self.idle.put(self._replace(worker))
+            else:
+                self.idle.put(worker)
+
+    def shutdown(self) -> None:
+        """Terminate every interpreter in the pool."""
+        self._closed = True
+        while True:
+            try:
+                self.idle.get_nowait().terminate()
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
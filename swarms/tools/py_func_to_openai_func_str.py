@@ -21,6 +21,8 @@ from pydantic import BaseModel, Field
 from pydantic.version import VERSION as PYDANTIC_VERSION
 from typing_extensions import Annotated, Literal, get_args, get_origin
 
+from swarms.tools.schema_cache import schema_cache
+
 T = TypeVar("T")
 
 __all__ = (
@@ -420,6 +422,20 @@ def get_openai_function_schema_from_func(
     ```
 
     """
+    return schema_cache.get_or_create(
+        schema_cache.function_key(function, name, description),
+        lambda: _build_openai_function_schema(
+            function, name=name, description=description
+        ),
+    )
+
+
+def _build_openai_function_schema(
+    function: Callable[..., Any],
+    *,
+    name: Optional[str] = None,
+    description: str = None,
+) -> Dict[str, Any]:
     typed_signature = get_typed_signature(function)
     required = get_required_params(typed_signature)
     default_values = get_default_values(typed_signature)
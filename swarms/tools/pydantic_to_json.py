@@ -2,6 +2,7 @@ from typing import Any, List
 
 from docstring_parser import parse
 from pydantic import BaseModel
+from swarms.tools.schema_cache import schema_cache
 from swarms.utils.loguru_logger import initialize_logger
 
 logger = initialize_logger("pydantic_to_json")
@@ -51,6 +52,16 @@ def base_model_to_openai_function(
         dict[str, Any]: A dictionary representation of the functions.
 
     """
+    return schema_cache.get_or_create(
+        schema_cache.model_key(pydantic_type, output_str),
+        lambda: _build_openai_function(pydantic_type, output_str),
+    )
+
+
+def _build_openai_function(
+    pydantic_type: type[BaseModel],
+    output_str: bool = False,
+) -> dict[str, Any]:
     schema = pydantic_type.model_json_schema()
 
     # Fetch the name of the class
@@ -0,0 +1,242 @@
+import copy
+import hashlib
+import inspect
+import json
+import marshal
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from pydantic import BaseModel
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(
+        "Cached schemas are read-only; copy.deepcopy one to edit it."
+    )
+
+
+class _FrozenDict(dict):
+    """A dict that rejects writes; deep copies are plain dicts."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __deepcopy__(self, memo):
+        return {
+            key: copy.deepcopy(value, memo)
+            for key, value in self.items()
+        }
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class _FrozenList(list):
+    """A list that rejects writes; deep copies are plain lists."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = _read_only
+    clear = sort = reverse = _read_only
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return _FrozenDict(
+            (key, _freeze(item)) for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    return value
+
+
+class SchemaCache:
+    """
+    Process-wide cache of generated OpenAI function schemas.
+
+    Schemas are stored pre-serialized as JSON and, once requested as
+    objects, as read-only dicts and lists, so a hit is a lookup with no
+    copy and still never shares mutable state between callers. Callers
+    that need to edit a schema should ``copy.deepcopy`` it, which
+    returns plain dicts and lists. Functions are
+    keyed by module, qualname, a hash of their bytecode and their
+    signature, so redefining a function with a different body or
+    annotations produces a new entry. Pydantic models are keyed by the
+    model class.
+
+    Example:
+        >>> cache = SchemaCache()
+        >>> cache.get_or_create(("k",), lambda: {"a": 1})
+        {'a': 1}
+        >>> cache.stats()["hits"]
+        0
+    """
+
+    def __init__(self):
+        self._entries: Dict[Hashable, str] = {}
+        self._frozen: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def function_key(
+        function: Callable[..., Any], *extra: Hashable
+    ) -> Optional[Hashable]:
+        """
+        Build the cache key for a function, or None if it cannot be keyed.
+
+        Args:
+            function (Callable[..., Any]): The function being converted.
+            *extra (Hashable): Additional inputs that affect the schema,
+                such as an overridden name or description.
+        """
+        code = getattr(function, "__code__", None)
+        if code is None:
+            return None
+        try:
+            code_hash = hashlib.sha1(marshal.dumps(code)).hexdigest()
+            signature = str(inspect.signature(function))
+        except (TypeError, ValueError):
+            return None
+        return (
+            "function",
+            getattr(function, "__module__", None),
+            getattr(function, "__qualname__", None),
+            code_hash,
+            signature,
+        ) + extra
+
+    @staticmethod
+    def model_key(
+        pydantic_type: Any, *extra: Hashable
+    ) -> Optional[Hashable]:
+        """
+        Build the cache key for a pydantic model class, or None if it cannot be keyed.
+        """
+        if not (
+            isinstance(pydantic_type, type)
+            and issubclass(pydantic_type, BaseModel)
+        ):
+            return None
+        return ("model", pydantic_type) + extra
+
+    def get_json(
+        self, key: Optional[Hashable], factory: Callable[[], Any]
+    ) -> str:
+        """
+        Return the serialized schema for ``key``, building it with ``factory`` on a miss.
+
+        Args:
+            key (Optional[Hashable]): The cache key; None bypasses the cache.
+            factory (Callable[[], Any]): Builds the schema on a miss.
+
+        Returns:
+            str: The schema serialized as JSON.
+        """
+        if key is None:
+            return json.dumps(factory())
+
+        with self._lock:
+            serialized = self._entries.get(key)
+            if serialized is not None:
+                self.hits += 1
+                return serialized
+
+        serialized = json.dumps(factory())
+        with self._lock:
+            self.misses += 1
+            return self._entries.setdefault(key, serialized)
+
+    def get_or_create(
+        self, key: Optional[Hashable], factory: Callable[[], Any]
+    ) -> Any:
+        """
+        Like :meth:`get_json`, but returns the schema as read-only dicts
+        and lists, shared by every caller.
+
+        Schemas that cannot be serialized to JSON are returned as built
+        and not cached.
+        """
+        if key is None:
+            return factory()
+
+        with self._lock:
+            frozen = self._frozen.get(key)
+            if frozen is None and key in self._entries:
+                frozen = _freeze(json.loads(self._entries[key]))
+                self._frozen[key] = frozen
+            if frozen is not None:
+                self.hits += 1
+                return frozen
+
+        value = factory()
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError):
+            return value
+        frozen = _freeze(json.loads(serialized))
+        with self._lock:
+            self.misses += 1
+            self._entries.setdefault(key, serialized)
+            return self._frozen.setdefault(key, frozen)
+
+    def invalidate(self, target: Any = None) -> None:
+        """
+        Drop cached schemas.
+
+        Args:
+            target (Any): A function or pydantic model class whose
+                entries should be dropped. Drops everything when None.
+        """
+        identity = (
+            getattr(target, "__module__", None),
+            getattr(target, "__qualname__", None),
+        )
+
+        def stale(key: Hashable) -> bool:
+            if target is None:
+                return True
+            if isinstance(target, type):
+                return key[0] == "model" and key[1] is target
+            return key[0] == "function" and key[1:3] == identity
+
+        with self._lock:
+            self._entries = {
+                key: value
+                for key, value in self._entries.items()
+                if not stale(key)
+            }
+            self._frozen = {
+                key: value
+                for key, value in self._frozen.items()
+                if not stale(key)
+            }
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss and entry counts."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+
+schema_cache = SchemaCache()
+
+
+def clear_schema_cache(target: Any = None) -> None:
+    """
+    Invalidate the process-wide schema cache.
+
+    Args:
+        target (Any): A function or pydantic model class to invalidate.
+            Clears the whole cache when None.
+    """
+    schema_cache.invalidate(target)
@@ -1,5 +1,14 @@
+import asyncio
+import functools
+import inspect
 import json
-from typing import List, Any, Callable
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from pydantic import ConfigDict, create_model
 
 from swarms.utils.parse_code import extract_code_from_markdown
 from swarms.utils.loguru_logger import initialize_logger
@@ -7,64 +16,166 @@ from swarms.utils.loguru_logger import initialize_logger
 logger = initialize_logger(log_folder="tool_parse_exec")
 
 
-def parse_and_execute_json(
-    functions: List[Callable[..., Any]],
-    json_string: str,
-    parse_md: bool = False,
-    verbose: bool = False,
-    return_str: bool = True,
-) -> dict:
+@functools.lru_cache(maxsize=1024)
+def _compile_validator(
+    func: Callable[..., Any],
+) -> Optional[type]:
     """
-    Parses and executes a JSON string containing function names and parameters.
+    Build a pydantic model validating keyword arguments for ``func``.
 
-    Args:
-        functions (List[callable]): A list of callable functions.
-        json_string (str): The JSON string to parse and execute.
-        parse_md (bool): Flag indicating whether to extract code from Markdown.
-        verbose (bool): Flag indicating whether to enable verbose logging.
-        return_str (bool): Flag indicating whether to return a JSON string.
-    Returns:
-        dict: A dictionary containing the results of executing the functions with the parsed parameters.
+    The model is derived once per function from its signature and type
+    hints. Returns None when no model can be built, in which case
+    arguments are passed through unchecked.
     """
-    if not functions or not json_string:
-        raise ValueError("Functions and JSON string are required")
+    try:
+        signature = inspect.signature(func)
+    except (TypeError, ValueError):
+        return None
 
-    if parse_md:
-        json_string = extract_code_from_markdown(json_string)
+    try:
+        hints = typing.get_type_hints(func)
+    except Exception:
+        hints = {}
+
+    fields = {}
+    extra = "forbid"
+    for name, param in signature.parameters.items():
+        if param.kind == inspect.Parameter.VAR_POSITIONAL:
+            continue
+        if param.kind == inspect.Parameter.VAR_KEYWORD:
+            extra = "allow"
+            continue
+        default = (
+            ...
+            if param.default is inspect.Parameter.empty
+            else param.default
+        )
+        fields[name] = (hints.get(name, Any), default)
 
     try:
-        # Create function name to function mapping
-        function_dict = {func.__name__: func for func in functions}
+        return create_model(
+            f"{getattr(func, '__name__', 'tool')}_arguments",
+            __config__=ConfigDict(
+                arbitrary_types_allowed=True, extra=extra
+            ),
+            **fields,
+        )
+    except Exception:
+        return None
 
-        if verbose:
-            logger.info(
-                f"Available functions: {list(function_dict.keys())}"
+
+class ToolDispatcher:
+    """
+    Executes parsed function calls against a fixed set of tools.
+
+    The dispatcher is built once per tool set: it indexes tools by name
+    and precompiles an argument validator for each from its signature
+    and type hints. Independent calls in one response run concurrently
+    on a bounded thread pool with per-tool timeouts, and ``async`` tools
+    are awaited natively.
+
+    Args:
+        functions (List[Callable]): The tools to dispatch to.
+        max_workers (int): Maximum number of calls executed at once.
+        timeout (Optional[float]): Default per-call timeout in seconds.
+        tool_timeouts (Optional[Dict[str, float]]): Per-tool timeout overrides.
+        validate (bool): Whether to validate arguments before calling a tool.
+    """
+
+    def __init__(
+        self,
+        functions: List[Callable[..., Any]],
+        max_workers: int = 8,
+        timeout: Optional[float] = None,
+        tool_timeouts: Optional[Dict[str, float]] = None,
+        validate: bool = True,
+    ):
+        self.functions = tuple(functions)
+        self.function_dict = {
+            func.__name__: func for func in self.functions
+        }
+        self.validators = (
+            {
+                name: _compile_validator(func)
+                for name, func in self.function_dict.items()
+            }
+            if validate
+            else {}
+        )
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.tool_timeouts = tool_timeouts or {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="tool-dispatch",
             )
-            logger.info(f"Processing JSON: {json_string}")
+        return self._executor
 
-        # Parse JSON data
-        data = json.loads(json_string)
+    def matches(self, functions: List[Callable[..., Any]]) -> bool:
+        """Return True if the dispatcher was built for these tools."""
+        return len(functions) == len(self.functions) and all(
+            a is b for a, b in zip(functions, self.functions)
+        )
 
-        # Handle both single function and function list formats
-        function_list = []
-        if "functions" in data:
-            function_list = data["functions"]
-        elif "function" in data:
-            function_list = [data["function"]]
-        else:
-            function_list = [
-                data
-            ]  # Assume entire object is single function
+    def timeout_for(self, name: str) -> Optional[float]:
+        return self.tool_timeouts.get(name, self.timeout)
 
-        # Ensure function_list is a list and filter None values
-        if isinstance(function_list, dict):
-            function_list = [function_list]
-        function_list = [f for f in function_list if f]
+    def prepare_arguments(
+        self, name: str, parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Validate and coerce ``parameters`` for the tool ``name``."""
+        validator = self.validators.get(name)
+        if validator is None:
+            return parameters
 
-        if verbose:
-            logger.info(f"Processing {len(function_list)} functions")
+        validated = validator.model_validate(parameters)
+        arguments = {
+            key: getattr(validated, key)
+            for key in parameters
+            if key in validator.model_fields
+        }
+        arguments.update(validated.model_extra or {})
+        return arguments
+
+    def _call(self, name: str, parameters: Dict[str, Any]) -> Any:
+        func = self.function_dict[name]
+        arguments = self.prepare_arguments(name, parameters)
+        if inspect.iscoroutinefunction(func):
+            return asyncio.run(
+                asyncio.wait_for(
+                    func(**arguments), self.timeout_for(name)
+                )
+            )
+        return func(**arguments)
 
-        results = {}
+    async def _acall(
+        self, name: str, parameters: Dict[str, Any]
+    ) -> Any:
+        func = self.function_dict[name]
+        arguments = self.prepare_arguments(name, parameters)
+        if inspect.iscoroutinefunction(func):
+            coroutine = func(**arguments)
+        else:
+            loop = asyncio.get_running_loop()
+            coroutine = loop.run_in_executor(
+                self.executor, functools.partial(func, **arguments)
+            )
+        return await asyncio.wait_for(
+            coroutine, self.timeout_for(name)
+        )
+
+    def _split_calls(
+        self,
+        function_list: List[Dict[str, Any]],
+        results: Dict[str, Any],
+        verbose: bool,
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        calls = []
         for function_data in function_list:
             function_name = function_data.get("name")
             parameters = function_data.get("parameters", {})
@@ -78,36 +189,213 @@ def parse_and_execute_json(
                     f"Executing {function_name} with params: {parameters}"
                 )
 
-            if function_name not in function_dict:
+            if function_name not in self.function_dict:
                 logger.warning(f"Function {function_name} not found")
                 results[function_name] = None
                 continue
 
+            # Reserve the slot so results keep the request order
+            results[function_name] = None
+            calls.append((function_name, parameters))
+        return calls
+
+    @staticmethod
+    def _record(
+        results: Dict[str, Any],
+        name: str,
+        result: Any = None,
+        error: Optional[BaseException] = None,
+        verbose: bool = False,
+    ) -> None:
+        if error is None:
+            results[name] = str(result)
+            if verbose:
+                logger.info(f"Result for {name}: {result}")
+        else:
+            logger.error(f"Error executing {name}: {str(error)}")
+            results[name] = f"Error: {str(error)}"
+
+    def dispatch(
+        self,
+        function_list: List[Dict[str, Any]],
+        verbose: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Execute function calls, concurrently when there is more than one.
+
+        Args:
+            function_list (List[Dict[str, Any]]): Calls of the form
+                ``{"name": ..., "parameters": {...}}``.
+            verbose (bool): Flag indicating whether to enable verbose logging.
+
+        Returns:
+            Dict[str, Any]: Stringified result (or error message) per function name.
+        """
+        results: Dict[str, Any] = {}
+        calls = self._split_calls(function_list, results, verbose)
+
+        if (
+            len(calls) == 1
+            and self.timeout_for(calls[0][0]) is None
+            and not inspect.iscoroutinefunction(
+                self.function_dict[calls[0][0]]
+            )
+        ):
+            name, parameters = calls[0]
             try:
-                result = function_dict[function_name](**parameters)
-                results[function_name] = str(result)
-                if verbose:
-                    logger.info(
-                        f"Result for {function_name}: {result}"
-                    )
+                self._record(
+                    results,
+                    name,
+                    self._call(name, parameters),
+                    verbose=verbose,
+                )
             except Exception as e:
-                logger.error(
-                    f"Error executing {function_name}: {str(e)}"
+                self._record(results, name, error=e)
+            return results
+
+        submitted = [
+            (
+                name,
+                time.monotonic(),
+                self.executor.submit(self._call, name, parameters),
+            )
+            for name, parameters in calls
+        ]
+        for name, started, future in submitted:
+            timeout = self.timeout_for(name)
+            remaining = (
+                None
+                if timeout is None
+                else max(started + timeout - time.monotonic(), 0)
+            )
+            try:
+                self._record(
+                    results,
+                    name,
+                    future.result(timeout=remaining),
+                    verbose=verbose,
+                )
+            except (FutureTimeoutError, asyncio.TimeoutError):
+                future.cancel()
+                self._record(
+                    results,
+                    name,
+                    error=TimeoutError(
+                        f"{name} timed out after {timeout}s"
+                    ),
                 )
-                results[function_name] = f"Error: {str(e)}"
+            except Exception as e:
+                self._record(results, name, error=e)
+        return results
 
-        # Format final results
-        if len(results) == 1:
-            # Return single result directly
-            data = {"result": next(iter(results.values()))}
-        else:
-            # Return all results
-            data = {
-                "results": results,
-                "summary": "\n".join(
-                    f"{k}: {v}" for k, v in results.items()
-                ),
-            }
+    async def adispatch(
+        self,
+        function_list: List[Dict[str, Any]],
+        verbose: bool = False,
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`dispatch` for callers running an event loop."""
+        results: Dict[str, Any] = {}
+        calls = self._split_calls(function_list, results, verbose)
+        outcomes = await asyncio.gather(
+            *(self._acall(name, params) for name, params in calls),
+            return_exceptions=True,
+        )
+        for (name, _), outcome in zip(calls, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                outcome = TimeoutError(
+                    f"{name} timed out after {self.timeout_for(name)}s"
+                )
+            if isinstance(outcome, BaseException):
+                self._record(results, name, error=outcome)
+            else:
+                self._record(results, name, outcome, verbose=verbose)
+        return results
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Release the dispatcher's worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+def _parse_function_list(json_string: str) -> List[Dict[str, Any]]:
+    data = json.loads(json_string)
+
+    # Handle both single function and function list formats
+    function_list = []
+    if "functions" in data:
+        function_list = data["functions"]
+    elif "function" in data:
+        function_list = [data["function"]]
+    else:
+        function_list = [
+            data
+        ]  # Assume entire object is single function
+
+    # Ensure function_list is a list and filter None values
+    if isinstance(function_list, dict):
+        function_list = [function_list]
+    return [f for f in function_list if f]
+
+
+def _format_results(results: Dict[str, Any]) -> dict:
+    if len(results) == 1:
+        # Return single result directly
+        return {"result": next(iter(results.values()))}
+
+    # Return all results
+    return {
+        "results": results,
+        "summary": "\n".join(f"{k}: {v}" for k, v in results.items()),
+    }
+
+
+def parse_and_execute_json(
+    functions: Union[List[Callable[..., Any]], ToolDispatcher],
+    json_string: str,
+    parse_md: bool = False,
+    verbose: bool = False,
+    return_str: bool = True,
+) -> dict:
+    """
+    Parses and executes a JSON string containing function names and parameters.
+
+    Args:
+        functions (Union[List[callable], ToolDispatcher]): A list of callable
+            functions, or a prebuilt dispatcher to reuse across calls.
+        json_string (str): The JSON string to parse and execute.
+        parse_md (bool): Flag indicating whether to extract code from Markdown.
+        verbose (bool): Flag indicating whether to enable verbose logging.
+        return_str (bool): Flag indicating whether to return a JSON string.
+    Returns:
+        dict: A dictionary containing the results of executing the functions with the parsed parameters.
+    """
+    if not functions or not json_string:
+        raise ValueError("Functions and JSON string are required")
+
+    if parse_md:
+        json_string = extract_code_from_markdown(json_string)
+
+    dispatcher = (
+        functions
+        if isinstance(functions, ToolDispatcher)
+        else ToolDispatcher(functions)
+    )
+
+    try:
+        if verbose:
+            logger.info(
+                f"Available functions: {list(dispatcher.function_dict.keys())}"
+            )
+            logger.info(f"Processing JSON: {json_string}")
+
+        function_list = _parse_function_list(json_string)
+
+        if verbose:
+            logger.info(f"Processing {len(function_list)} functions")
+
+        results = dispatcher.dispatch(function_list, verbose=verbose)
+        data = _format_results(results)
 
         if return_str:
             return json.dumps(data)
@@ -122,3 +410,6 @@ def parse_and_execute_json(
         error = f"Error parsing and executing JSON: {str(e)}"
         logger.error(error)
         return {"error": error}
+    finally:
+        if dispatcher is not functions:
+            dispatcher.shutdown()
@@ -18,6 +18,16 @@ from swarms.utils.parse_code import extract_code_from_markdown
 from swarms.utils.pdf_to_text import pdf_to_text
 from swarms.utils.try_except_wrapper import try_except_wrapper
 from swarms.utils.calculate_func_metrics import profile_func
+from swarms.utils.llm_cache import (
+    CachedLLM,
+    LLMCache,
+    set_default_llm_cache,
+)
+from swarms.utils.rate_limiter import (
+    RateLimiter,
+    configure_rate_limit,
+    get_rate_limiter,
+)
 
 
 __all__ = [
@@ -37,4 +47,10 @@ __all__ = [
     "pdf_to_text",
     "try_except_wrapper",
     "profile_func",
+    "CachedLLM",
+    "LLMCache",
+    "set_default_llm_cache",
+    "RateLimiter",
+    "configure_rate_limit",
+    "get_rate_limiter",
 ]
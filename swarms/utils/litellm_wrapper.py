@@ -1,15 +1,97 @@
 try:
-    from litellm import completion
+    from litellm import acompletion, completion
 except ImportError:
     import subprocess
 
     subprocess.check_call(["pip", "install", "litellm"])
     import litellm
-    from litellm import completion
+    from litellm import acompletion, completion
 
     litellm.set_verbose = True
     litellm.ssl_verify = False
 
+import asyncio
+import inspect
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from swarms.utils.llm_cache import (
+    CacheMissError,
+    LLMCache,
+    cache_key,
+    get_default_llm_cache,
+)
+from swarms.utils.loguru_logger import initialize_logger
+from swarms.utils.rate_limiter import (
+    RateLimiter,
+    RateSlot,
+    get_rate_limiter,
+)
+
+logger = initialize_logger(log_folder="litellm_wrapper")
+
+DEFAULT_MAX_CONCURRENCY = 32
+
+# Concurrent async requests allowed per model, shared by every LiteLLM
+_model_concurrency: Dict[str, int] = {}
+
+# Older litellm releases do not accept a shared aiohttp session
+_SUPPORTS_SHARED_SESSION = (
+    "shared_session" in inspect.signature(acompletion).parameters
+)
+
+
+class _LoopResources:
+    """Async state for one event loop; asyncio objects cannot cross loops."""
+
+    def __init__(self):
+        self.semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.inflight: Dict[str, asyncio.Future] = {}
+        self.session = None
+
+
+_loop_resources: "weakref.WeakKeyDictionary" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _resources() -> _LoopResources:
+    loop = asyncio.get_running_loop()
+    resources = _loop_resources.get(loop)
+    if resources is None:
+        resources = _loop_resources[loop] = _LoopResources()
+    return resources
+
+
+def set_model_concurrency(model_name: str, limit: int) -> None:
+    """
+    Cap concurrent async requests to ``model_name`` across all LiteLLM
+    instances. Applies to event loops that have not used the model yet.
+    """
+    _model_concurrency[model_name] = limit
+
+
+async def _shared_session():
+    """The event loop's long-lived HTTP session, created on first use."""
+    import aiohttp
+
+    resources = _resources()
+    if resources.session is None or resources.session.closed:
+        # Per-model semaphores bound concurrency, not the pool size
+        resources.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0)
+        )
+    return resources.session
+
+
+async def close_shared_session() -> None:
+    """Close the current event loop's shared HTTP session."""
+    resources = _loop_resources.get(asyncio.get_running_loop())
+    if resources is not None and resources.session is not None:
+        await resources.session.close()
+        resources.session = None
+
 
 class LiteLLM:
     """
@@ -25,6 +107,9 @@ class LiteLLM:
         temperature: float = 0.5,
         max_tokens: int = 4000,
         ssl_verify: bool = False,
+        cache: Optional[LLMCache] = None,
+        max_concurrency: Optional[int] = None,
+        coalesce: bool = True,
     ):
         """
         Initialize the LiteLLM with the given parameters.
@@ -35,6 +120,9 @@ class LiteLLM:
             stream (bool, optional): Whether to stream the output. Defaults to False.
             temperature (float, optional): The temperature for the model. Defaults to 0.5.
             max_tokens (int, optional): The maximum number of tokens to generate. Defaults to 4000.
+            cache (LLMCache, optional): Response cache. Defaults to the process-wide cache set with set_default_llm_cache, if any.
+            max_concurrency (int, optional): Concurrent async requests allowed for this model across all instances. Defaults to 32.
+            coalesce (bool, optional): Share one request between identical concurrent arun calls. Defaults to True.
         """
         self.model_name = model_name
         self.system_prompt = system_prompt
@@ -42,6 +130,12 @@ class LiteLLM:
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.ssl_verify = ssl_verify
+        self.cache = (
+            get_default_llm_cache() if cache is None else cache
+        )
+        self.coalesce = coalesce
+        if max_concurrency is not None:
+            set_model_concurrency(model_name, max_concurrency)
 
     def _prepare_messages(self, task: str) -> list:
         """
@@ -80,6 +174,57 @@ class LiteLLM:
 
             messages = self._prepare_messages(task)
 
+            if self.cache is None:
+                return self._complete(messages, *args, **kwargs)
+
+            return self.cache.call(
+                self._payload(messages, args, kwargs),
+                lambda: self._complete(messages, *args, **kwargs),
+            )
+        except CacheMissError:
+            raise
+        except Exception as error:
+            print(error)
+
+    def _payload(
+        self, messages: list, args: tuple, kwargs: dict
+    ) -> Dict[str, Any]:
+        return {
+            "model": self.model_name,
+            "messages": messages,
+            "stream": self.stream,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "args": args,
+            "kwargs": kwargs,
+        }
+
+    def _estimate_tokens(
+        self, limiter: RateLimiter, messages: list
+    ) -> int:
+        # Only worth counting when the model has a token budget
+        if limiter.token_bucket is None:
+            return 0
+        characters = sum(
+            len(str(message["content"])) for message in messages
+        )
+        return characters // 4 + (self.max_tokens or 0)
+
+    @staticmethod
+    def _settle(slot: RateSlot, response: Any) -> None:
+        usage = getattr(response, "usage", None)
+        total = getattr(usage, "total_tokens", None)
+        if total is not None:
+            slot.used_tokens(total)
+
+    def _complete(self, messages: list, *args, **kwargs):
+        if self.stream:
+            return self._stream(messages, *args, **kwargs)
+
+        limiter = get_rate_limiter(self.model_name)
+        with limiter.slot(
+            self._estimate_tokens(limiter, messages)
+        ) as slot:
             response = completion(
                 model=self.model_name,
                 messages=messages,
@@ -89,14 +234,224 @@ class LiteLLM:
                 *args,
                 **kwargs,
             )
+            self._settle(slot, response)
+
+        content = response.choices[
+            0
+        ].message.content  # Accessing the content
+
+        return content
+
+    def _stream(self, messages: list, *args, **kwargs):
+        # Hold the model's slot until the stream is fully read, and
+        # yield content deltas as they arrive
+        limiter = get_rate_limiter(self.model_name)
+        with limiter.slot(
+            self._estimate_tokens(limiter, messages), publish=False
+        ) as slot:
+            response = completion(
+                model=self.model_name,
+                messages=messages,
+                stream=True,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                *args,
+                **kwargs,
+            )
+            for chunk in response:
+                # Providers that report usage do so on a final chunk
+                self._settle(slot, chunk)
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
 
-            content = response.choices[
-                0
-            ].message.content  # Accessing the content
+    async def arun(self, task: str, *args, **kwargs):
+        """
+        Run the LLM model for the given task without blocking a thread.
 
-            return content
+        Requests share the event loop's HTTP session and wait on the
+        model's concurrency semaphore and rate limiter. Identical
+        requests already in flight on the same loop are coalesced into
+        one call unless ``coalesce`` is off or the output is streamed.
+
+        Args:
+            task (str): The task to run the model for.
+            *args: Additional positional arguments to pass to the model.
+            **kwargs: Additional keyword arguments to pass to the model.
+
+        Returns:
+            str: The content of the response, or an async iterator of
+            content deltas when streaming.
+
+        Raises:
+            Exception: Any error from the model call, after logging it.
+        """
+        try:
+            messages = self._prepare_messages(task)
+            payload = self._payload(messages, args, kwargs)
+            if self.stream or not self.coalesce:
+                return await self._acached(
+                    payload, messages, *args, **kwargs
+                )
+
+            inflight = _resources().inflight
+            key = cache_key(payload)
+            future = inflight.get(key)
+            if future is None:
+                future = asyncio.ensure_future(
+                    self._acached(payload, messages, *args, **kwargs)
+                )
+                inflight[key] = future
+                future.add_done_callback(
+                    lambda done: (
+                        inflight.pop(key)
+                        if inflight.get(key) is done
+                        else None
+                    )
+                )
+            # Shielded so one caller's cancellation does not cancel the
+            # request for everyone else waiting on it
+            return await asyncio.shield(future)
+        except CacheMissError:
+            raise
         except Exception as error:
-            print(error)
+            logger.error(
+                f"Error in arun for {self.model_name}: {error}"
+            )
+            raise
+
+    async def abatched_run(
+        self,
+        tasks: List[str],
+        *args,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[Any]:
+        """
+        Run many tasks concurrently on the current event loop.
+
+        Args:
+            tasks (List[str]): The tasks to run.
+            return_exceptions (bool, optional): Return a failed task's
+                exception in its place instead of raising the first one.
+                Defaults to False.
+
+        Returns:
+            List[Any]: One response per task, in order.
+        """
+        return await asyncio.gather(
+            *(self.arun(task, *args, **kwargs) for task in tasks),
+            return_exceptions=return_exceptions,
+        )
+
+    def batched_run(
+        self,
+        tasks: List[str],
+        *args,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[Any]:
+        """
+        Run many tasks concurrently from synchronous code.
+
+        Called from a thread that is already running an event loop,
+        such as a notebook, the batch runs on a helper thread and this
+        call blocks that loop until it is done; async code should await
+        :meth:`abatched_run` instead.
+
+        Args:
+            tasks (List[str]): The tasks to run.
+            return_exceptions (bool, optional): Return a failed task's
+                exception in its place instead of raising the first one.
+                Defaults to False.
+
+        Returns:
+            List[Any]: One response per task, in order.
+        """
+
+        async def run_all():
+            try:
+                return await self.abatched_run(
+                    tasks,
+                    *args,
+                    return_exceptions=return_exceptions,
+                    **kwargs,
+                )
+            finally:
+                await close_shared_session()
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(run_all())
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, run_all()).result()
+
+    async def _acached(
+        self, payload: dict, messages: list, *args, **kwargs
+    ):
+        if self.cache is None:
+            return await self._acomplete(messages, *args, **kwargs)
+        return await self.cache.acall(
+            payload,
+            lambda: self._acomplete(messages, *args, **kwargs),
+        )
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        semaphores = _resources().semaphores
+        semaphore = semaphores.get(self.model_name)
+        if semaphore is None:
+            semaphore = semaphores[self.model_name] = (
+                asyncio.Semaphore(
+                    _model_concurrency.get(
+                        self.model_name, DEFAULT_MAX_CONCURRENCY
+                    )
+                )
+            )
+        return semaphore
+
+    async def _acompletion(self, messages: list, *args, **kwargs):
+        if _SUPPORTS_SHARED_SESSION:
+            kwargs.setdefault(
+                "shared_session", await _shared_session()
+            )
+        return await acompletion(
+            model=self.model_name,
+            messages=messages,
+            stream=self.stream,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            *args,
+            **kwargs,
+        )
+
+    async def _acomplete(self, messages: list, *args, **kwargs):
+        if self.stream:
+            return self._astream(messages, *args, **kwargs)
+
+        limiter = get_rate_limiter(self.model_name)
+        async with self._semaphore(), limiter.aslot(
+            self._estimate_tokens(limiter, messages)
+        ) as slot:
+            response = await self._acompletion(
+                messages, *args, **kwargs
+            )
+            self._settle(slot, response)
+        return response.choices[0].message.content
+
+    async def _astream(self, messages: list, *args, **kwargs):
+        # Hold the model's slot until the stream is fully read
+        limiter = get_rate_limiter(self.model_name)
+        async with self._semaphore(), limiter.aslot(
+            self._estimate_tokens(limiter, messages), publish=False
+        ) as slot:
+            response = await self._acompletion(
+                messages, *args, **kwargs
+            )
+            async for chunk in response:
+                self._settle(slot, chunk)
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
 
     def __call__(self, task: str, *args, **kwargs):
         """
@@ -0,0 +1,458 @@
+import hashlib
+import inspect
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from swarms.utils.loguru_logger import initialize_logger
+
+logger = initialize_logger(log_folder="llm_cache")
+
+CACHE_MODES = ("read_write", "record", "replay", "off")
+
+# Sampling settings read from an llm object when building cache keys
+SAMPLING_ATTRIBUTES = (
+    "model_name",
+    "model",
+    "system_prompt",
+    "temperature",
+    "top_p",
+    "top_k",
+    "max_tokens",
+    "frequency_penalty",
+    "presence_penalty",
+    "stop",
+    "seed",
+    "tools",
+    "tool_choice",
+    "response_format",
+)
+
+
+_MISS = object()
+
+
+class CacheMissError(KeyError):
+    """Raised in replay mode when a call was never recorded."""
+
+
+def cache_key(payload: Dict[str, Any]) -> str:
+    """
+    Content address of an LLM call.
+
+    Args:
+        payload (Dict[str, Any]): Everything that determines the
+            response: model, messages, sampling parameters, tools.
+
+    Returns:
+        str: SHA-256 hex digest of the canonical JSON encoding.
+    """
+    encoded = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _to_json(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if hasattr(value, "dict") and callable(value.dict):
+        return value.dict()
+    return value
+
+
+async def _aiter_chunks(chunks: List[Any]) -> AsyncIterator[Any]:
+    for chunk in chunks:
+        yield chunk
+
+
+def _json_default(obj: Any) -> Any:
+    converted = _to_json(obj)
+    return converted if converted is not obj else str(obj)
+
+
+def _encode(value: Any, stream: bool) -> str:
+    return json.dumps(
+        {"stream": stream, "value": value}, default=_json_default
+    )
+
+
+class LLMCache:
+    """
+    Content-addressed cache for LLM responses.
+
+    Responses are keyed by :func:`cache_key` over the model, messages
+    and sampling parameters. Lookups hit an in-memory LRU first and,
+    when ``path`` is set, a SQLite database that persists across runs.
+    Values round-trip through JSON, so every hit returns a fresh copy.
+
+    Modes:
+
+    - ``read_write``: serve hits, call the model on misses and store the
+      result.
+    - ``record``: always call the model and store each result, keyed
+      also by how many times the same call was made so far. Repeated
+      identical calls at a non-zero temperature keep their own answers.
+    - ``replay``: serve recorded results in the same order and raise
+      :class:`CacheMissError` instead of calling the model, so a whole
+      swarm run can be reproduced offline.
+    - ``off``: bypass the cache.
+
+    Args:
+        path (Optional[str]): SQLite file for the on-disk tier.
+        max_entries (int): Capacity of the in-memory LRU tier.
+        mode (str): One of ``CACHE_MODES``.
+
+    Examples:
+    >>> cache = LLMCache("llm_cache.db", mode="record")
+    >>> agent = Agent(llm=llm, llm_cache=cache)
+    >>> cache.stats()
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = 1024,
+        mode: str = "read_write",
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(
+                f"Unknown cache mode {mode}, expected one of {CACHE_MODES}"
+            )
+        self.path = path
+        self.max_entries = max_entries
+        self.mode = mode
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._occurrences: Counter = Counter()
+        self._lock = threading.RLock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                " latency REAL NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+        self.hits = 0
+        self.misses = 0
+        self.saved_latency = 0.0
+
+    def __len__(self) -> int:
+        if self._db is not None:
+            with self._lock:
+                return self._db.execute(
+                    "SELECT COUNT(*) FROM responses"
+                ).fetchone()[0]
+        return len(self._memory)
+
+    def _lookup(self, key: str) -> Optional[tuple]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT value, latency FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._remember(key, (row[0], row[1]))
+            return row[0], row[1]
+
+    def _remember(self, key: str, entry: tuple) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _store(self, key: str, encoded: str, latency: float) -> None:
+        with self._lock:
+            self._remember(key, (encoded, latency))
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                    (key, encoded, latency, time.time()),
+                )
+                self._db.commit()
+
+    def _key(self, payload: Dict[str, Any]) -> str:
+        if self.mode in ("record", "replay"):
+            base = cache_key(payload)
+            with self._lock:
+                occurrence = self._occurrences[base]
+                self._occurrences[base] += 1
+            return cache_key({"call": base, "occurrence": occurrence})
+        return cache_key(payload)
+
+    def call(
+        self, payload: Dict[str, Any], fn: Callable[[], Any]
+    ) -> Any:
+        """
+        Return the cached response for ``payload``, calling ``fn`` on a
+        miss.
+
+        Iterators returned by ``fn`` are treated as streams: chunks are
+        passed through as they arrive and cached as a list once the
+        stream is exhausted. Hits on a stream return an iterator over
+        the cached chunks.
+
+        Args:
+            payload (Dict[str, Any]): What determines the response.
+            fn (Callable[[], Any]): Makes the actual call.
+
+        Returns:
+            Any: The response.
+
+        Raises:
+            CacheMissError: In replay mode, if the call was not recorded.
+        """
+        if self.mode == "off":
+            return fn()
+
+        key, cached = self._check(payload)
+        if cached is not _MISS:
+            if cached["stream"]:
+                return iter(cached["value"])
+            return cached["value"]
+
+        start = time.perf_counter()
+        response = fn()
+        if isinstance(response, (str, bytes, dict, list)) or not (
+            hasattr(response, "__iter__")
+            and hasattr(response, "__next__")
+        ):
+            return self._save(key, response, start)
+        return self._record_stream(key, response, start)
+
+    async def acall(
+        self, payload: Dict[str, Any], fn: Callable[[], Any]
+    ) -> Any:
+        """
+        Async counterpart of :meth:`call`.
+
+        ``fn`` returns an awaitable or an async iterator; async
+        iterators are cached as chunk lists like sync streams, and hits
+        on them return an async iterator over the cached chunks.
+        """
+        if self.mode == "off":
+            response = fn()
+            return (
+                await response
+                if inspect.isawaitable(response)
+                else response
+            )
+
+        key, cached = self._check(payload)
+        if cached is not _MISS:
+            if cached["stream"]:
+                return _aiter_chunks(cached["value"])
+            return cached["value"]
+
+        start = time.perf_counter()
+        response = fn()
+        if inspect.isawaitable(response):
+            response = await response
+        if hasattr(response, "__aiter__"):
+            return self._record_astream(key, response, start)
+        return self._save(key, response, start)
+
+    def _check(self, payload: Dict[str, Any]) -> Tuple[str, Any]:
+        """Key for ``payload`` and its cached entry, or ``_MISS``."""
+        key = self._key(payload)
+        if self.mode != "record":
+            entry = self._lookup(key)
+            if entry is not None:
+                encoded, latency = entry
+                with self._lock:
+                    self.hits += 1
+                    self.saved_latency += latency
+                return key, json.loads(encoded)
+            if self.mode == "replay":
+                raise CacheMissError(
+                    f"No recorded response for call {key}"
+                )
+
+        with self._lock:
+            self.misses += 1
+        return key, _MISS
+
+    def _save(self, key: str, response: Any, start: float) -> Any:
+        self._store(
+            key,
+            _encode(response, stream=False),
+            time.perf_counter() - start,
+        )
+        return response
+
+    def _record_stream(
+        self, key: str, stream: Iterator[Any], start: float
+    ) -> Iterator[Any]:
+        chunks = []
+        for chunk in stream:
+            chunks.append(_to_json(chunk))
+            yield chunk
+        self._store(
+            key,
+            _encode(chunks, stream=True),
+            time.perf_counter() - start,
+        )
+
+    async def _record_astream(
+        self, key: str, stream: AsyncIterator[Any], start: float
+    ) -> AsyncIterator[Any]:
+        chunks = []
+        async for chunk in stream:
+            chunks.append(_to_json(chunk))
+            yield chunk
+        self._store(
+            key,
+            _encode(chunks, stream=True),
+            time.perf_counter() - start,
+        )
+
+    def rewind(self) -> None:
+        """Restart record/replay numbering, e.g. before a new run."""
+        with self._lock:
+            self._occurrences.clear()
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._memory.clear()
+            self._occurrences.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate and the model latency the hits avoided."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "mode": self.mode,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (
+                    round(self.hits / lookups, 4) if lookups else 0.0
+                ),
+                "saved_latency_seconds": round(self.saved_latency, 3),
+                "memory_entries": len(self._memory),
+            }
+
+    def report(self) -> Dict[str, Any]:
+        """Log and return :meth:`stats`."""
+        stats = self.stats()
+        logger.info(
+            f"LLM cache: {stats['hits']} hits, {stats['misses']} misses"
+            f" ({stats['hit_rate']:.1%}),"
+            f" saved {stats['saved_latency_seconds']}s"
+        )
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+_default_cache: Optional[LLMCache] = None
+
+
+def set_default_llm_cache(cache: Optional[LLMCache]) -> None:
+    """
+    Use ``cache`` for every agent and LiteLLM created without one, so a
+    whole swarm run can be recorded or replayed in one place.
+    """
+    global _default_cache
+    _default_cache = cache
+
+
+def get_default_llm_cache() -> Optional[LLMCache]:
+    return _default_cache
+
+
+def sampling_params(llm: Any) -> Dict[str, Any]:
+    """Sampling settings of an llm object that affect its output."""
+    return {
+        name: getattr(llm, name)
+        for name in SAMPLING_ATTRIBUTES
+        if getattr(llm, name, None) is not None
+    }
+
+
+def llm_call_payload(
+    llm: Any, task: Any, args: tuple = (), kwargs: dict = None
+) -> Dict[str, Any]:
+    """Cache payload for calling ``llm`` with ``task``."""
+    return {
+        "llm": type(llm).__name__,
+        **sampling_params(llm),
+        "task": task,
+        "args": args,
+        "kwargs": kwargs or {},
+    }
+
+
+class CachedLLM:
+    """
+    Wrap any llm object so its ``run`` calls go through an
+    :class:`LLMCache`.
+
+    The key covers the wrapped model's class and sampling settings
+    (read at call time, so temperature changes are respected) plus the
+    call's arguments. Other attributes are forwarded to the wrapped
+    model.
+
+    Args:
+        llm (Any): Object with ``run`` or ``__call__``.
+        cache (Optional[LLMCache]): Defaults to the process-wide cache,
+            or a new in-memory one.
+    """
+
+    def __init__(self, llm: Any, cache: Optional[LLMCache] = None):
+        self.llm = llm
+        if cache is None:
+            cache = get_default_llm_cache()
+        self.cache = LLMCache() if cache is None else cache
+
+    def run(self, task: Any, *args, **kwargs) -> Any:
+        method = getattr(self.llm, "run", None) or self.llm
+        payload = llm_call_payload(self.llm, task, args, kwargs)
+        return self.cache.call(
+            payload, lambda: method(task, *args, **kwargs)
+        )
+
+    def __call__(self, task: Any, *args, **kwargs) -> Any:
+        return self.run(task, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        if "llm" not in self.__dict__:
+            raise AttributeError(name)
+        return getattr(self.__dict__["llm"], name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Settings such as temperature belong to the wrapped model
+        if name in ("llm", "cache") or "llm" not in self.__dict__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.llm, name, value)
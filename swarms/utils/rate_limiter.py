@@ -0,0 +1,501 @@
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Deque, Dict, Iterator, Optional
+
+from swarms.utils.loguru_logger import initialize_logger
+
+logger = initialize_logger(log_folder="rate_limiter")
+
+# Slots the current thread or task already holds, by limiter, so a
+# nested call (Agent -> LiteLLM) reuses its caller's slot
+_held: contextvars.ContextVar[Dict["RateLimiter", "RateSlot"]] = (
+    contextvars.ContextVar("held_rate_slots", default={})
+)
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    """
+    Whether ``error``, or an exception it was raised from, signals that
+    the provider is overloaded: HTTP 429, a rate-limit error or a
+    timeout.
+    """
+    seen = 0
+    while error is not None and seen < 8:
+        status = getattr(error, "status_code", None) or getattr(
+            getattr(error, "response", None), "status_code", None
+        )
+        name = type(error).__name__.lower()
+        message = str(error).lower()
+        if (
+            status == 429
+            or isinstance(error, (TimeoutError, asyncio.TimeoutError))
+            or "ratelimit" in name
+            or "timeout" in name
+            or "rate limit" in message
+            or "429" in message
+        ):
+            return True
+        error = error.__cause__ or error.__context__
+        seen += 1
+    return False
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    value = getattr(error, "retry_after", None)
+    if value is None:
+        headers = getattr(
+            getattr(error, "response", None), "headers", None
+        )
+        if headers is not None:
+            value = headers.get("retry-after")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at
+    ``per_minute / 60`` tokens a second.
+
+    :meth:`reserve` always succeeds and may leave the bucket in debt;
+    it returns how long the caller must wait for its share to be
+    refilled. Concurrent callers therefore queue in arrival order
+    instead of racing for each refill.
+
+    Args:
+        per_minute (float): Sustained rate.
+        burst (Optional[float]): Bucket size. Defaults to one minute's
+            worth.
+    """
+
+    def __init__(
+        self, per_minute: float, burst: Optional[float] = None
+    ):
+        self.rate = per_minute / 60.0
+        self.capacity = burst if burst is not None else per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate,
+        )
+        self._updated = now
+
+    def reserve(self, amount: float = 1) -> float:
+        """Take ``amount`` tokens; return the seconds to wait first."""
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def refund(self, amount: float) -> None:
+        """Return tokens (or take more, if ``amount`` is negative)."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class _Waiter:
+    __slots__ = ("event", "loop", "future", "granted")
+
+    def __init__(self, loop=None):
+        self.loop = loop
+        self.future = loop.create_future() if loop else None
+        self.event = None if loop else threading.Event()
+        self.granted = False
+
+    def wake(self) -> None:
+        self.granted = True
+        if self.event is not None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self) -> None:
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class AdaptiveConcurrency:
+    """
+    Concurrency limit that adapts with AIMD (additive increase,
+    multiplicative decrease).
+
+    Each success raises the limit by ``increase / limit``, about one
+    extra slot per round of requests. A throttle cuts it by
+    ``decrease``, at most once per ``decrease_interval`` so a burst of
+    429s from one overload counts once. Slots are handed to waiters in
+    arrival order, and threads and event loops can wait on the same
+    limiter.
+
+    Args:
+        initial (float): Starting limit.
+        minimum (float): Lowest limit.
+        maximum (float): Highest limit.
+        increase (float): Additive step per round of successes.
+        decrease (float): Multiplier applied on throttling.
+        decrease_interval (float): Seconds between decreases.
+    """
+
+    def __init__(
+        self,
+        initial: float = 64,
+        minimum: float = 1,
+        maximum: float = 256,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        decrease_interval: float = 1.0,
+    ):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.decrease_interval = decrease_interval
+        self.inflight = 0
+        self._last_decrease = 0.0
+        self._waiters: Deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+
+    def _has_room(self) -> bool:
+        return self.inflight < max(int(self.limit), 1)
+
+    def _grant(self) -> None:
+        while self._waiters and self._has_room():
+            waiter = self._waiters.popleft()
+            if (
+                waiter.future is not None
+                and waiter.future.cancelled()
+            ):
+                continue
+            self.inflight += 1
+            waiter.wake()
+
+    def acquire(self) -> None:
+        with self._lock:
+            if not self._waiters and self._has_room():
+                self.inflight += 1
+                return
+            waiter = _Waiter()
+            self._waiters.append(waiter)
+        waiter.event.wait()
+
+    async def aacquire(self) -> None:
+        with self._lock:
+            if not self._waiters and self._has_room():
+                self.inflight += 1
+                return
+            waiter = _Waiter(asyncio.get_running_loop())
+            self._waiters.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    self._release()
+                else:
+                    self._waiters.remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        self.inflight -= 1
+        self._grant()
+
+    def release(self, throttled: bool = False) -> None:
+        """Free a slot and adapt the limit to how the call went."""
+        with self._lock:
+            now = time.monotonic()
+            if throttled:
+                if (
+                    now - self._last_decrease
+                    >= self.decrease_interval
+                ):
+                    self.limit = max(
+                        self.minimum, self.limit * self.decrease
+                    )
+                    self._last_decrease = now
+            else:
+                self.limit = min(
+                    self.maximum,
+                    self.limit + self.increase / self.limit,
+                )
+            self._release()
+
+
+class RateSlot:
+    """A held rate-limiter slot; report actual usage with :meth:`used_tokens`."""
+
+    def __init__(self, limiter: "RateLimiter", tokens: float):
+        self.limiter = limiter
+        self.tokens = tokens
+        self.throttle: Optional[BaseException] = None
+
+    def used_tokens(self, actual: float) -> None:
+        """Settle the token budget against what the call really used."""
+        if self.limiter.token_bucket is not None:
+            self.limiter.token_bucket.refund(self.tokens - actual)
+        self.tokens = actual
+
+
+class RateLimiter:
+    """
+    Request, token and concurrency limits for one model or provider.
+
+    Before a call, :meth:`slot` / :meth:`aslot` wait for the
+    requests-per-minute and tokens-per-minute buckets, then for an
+    adaptive concurrency slot. A call that fails with a throttling
+    error (see :func:`is_throttle_error`) halves the concurrency limit
+    and pauses new calls for the provider's ``Retry-After`` or an
+    exponentially growing cooldown, so retries queue up instead of
+    hammering the provider. Successes grow the limit back.
+
+    Use :func:`get_rate_limiter` to share limiters across the process.
+
+    Args:
+        name (str): Model or provider the limiter covers.
+        requests_per_minute (Optional[float]): Request budget.
+        tokens_per_minute (Optional[float]): Token budget.
+        initial_concurrency (float): Starting concurrency limit.
+        max_concurrency (float): Upper bound on concurrency.
+        min_concurrency (float): Lower bound on concurrency.
+        cooldown (float): First pause after a throttle, in seconds;
+            doubles for consecutive throttles up to ``max_cooldown``.
+        max_cooldown (float): Longest pause.
+
+    Examples:
+    >>> configure_rate_limit("gpt-4o", requests_per_minute=500,
+    ...                      tokens_per_minute=30_000)
+    >>> with get_rate_limiter("gpt-4o").slot(tokens=1200) as slot:
+    ...     response = llm.run(task)
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        initial_concurrency: float = 64,
+        max_concurrency: float = 256,
+        min_concurrency: float = 1,
+        cooldown: float = 1.0,
+        max_cooldown: float = 30.0,
+    ):
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.request_bucket = (
+            TokenBucket(requests_per_minute)
+            if requests_per_minute
+            else None
+        )
+        self.token_bucket = (
+            TokenBucket(tokens_per_minute)
+            if tokens_per_minute
+            else None
+        )
+        self.concurrency = AdaptiveConcurrency(
+            initial=initial_concurrency,
+            minimum=min_concurrency,
+            maximum=max_concurrency,
+        )
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+        self._consecutive_throttles = 0
+        self.successes = 0
+        self.throttles = 0
+
+    def _delay(self, tokens: float) -> float:
+        delay = max(self._blocked_until - time.monotonic(), 0.0)
+        if self.request_bucket is not None:
+            delay = max(delay, self.request_bucket.reserve(1))
+        if self.token_bucket is not None and tokens:
+            delay = max(delay, self.token_bucket.reserve(tokens))
+        return delay
+
+    def _finish(self, error: Optional[BaseException]) -> None:
+        throttled = error is not None and is_throttle_error(error)
+        with self._lock:
+            if throttled:
+                self.throttles += 1
+                self._consecutive_throttles += 1
+                pause = _retry_after(error) or min(
+                    self.cooldown
+                    * 2 ** (self._consecutive_throttles - 1),
+                    self.max_cooldown,
+                )
+                self._blocked_until = max(
+                    self._blocked_until, time.monotonic() + pause
+                )
+                logger.warning(
+                    f"{self.name} throttled; pausing {pause:.1f}s,"
+                    f" concurrency limit {self.concurrency.limit:.1f}"
+                )
+            elif error is None:
+                self.successes += 1
+                self._consecutive_throttles = 0
+        self.concurrency.release(throttled=throttled)
+
+    @contextmanager
+    def slot(
+        self, tokens: float = 0, publish: bool = True
+    ) -> Iterator[RateSlot]:
+        """
+        Hold a slot for one call, blocking the thread until allowed.
+
+        Args:
+            tokens (float): Estimated tokens the call will use. Only
+                counted when ``tokens_per_minute`` is set.
+            publish (bool): Let calls nested in this one, in the same
+                thread or task, reuse the slot. Generators holding a
+                slot across ``yield`` should pass False, since their
+                caller keeps running in between.
+        """
+        outer = _held.get().get(self)
+        if outer is not None:
+            with self._nested(outer):
+                yield outer
+            return
+
+        time.sleep(self._delay(tokens))
+        self.concurrency.acquire()
+        slot = RateSlot(self, tokens)
+        reset = (
+            _held.set({**_held.get(), self: slot})
+            if publish
+            else None
+        )
+        try:
+            yield slot
+        except BaseException as error:
+            self._finish(error)
+            raise
+        else:
+            self._finish(slot.throttle)
+        finally:
+            if reset is not None:
+                _held.reset(reset)
+
+    @asynccontextmanager
+    async def aslot(self, tokens: float = 0, publish: bool = True):
+        """Async :meth:`slot`; waits without blocking the event loop."""
+        outer = _held.get().get(self)
+        if outer is not None:
+            with self._nested(outer):
+                yield outer
+            return
+
+        await asyncio.sleep(self._delay(tokens))
+        await self.concurrency.aacquire()
+        slot = RateSlot(self, tokens)
+        reset = (
+            _held.set({**_held.get(), self: slot})
+            if publish
+            else None
+        )
+        try:
+            yield slot
+        except BaseException as error:
+            self._finish(error)
+            raise
+        else:
+            self._finish(slot.throttle)
+        finally:
+            if reset is not None:
+                _held.reset(reset)
+
+    @staticmethod
+    @contextmanager
+    def _nested(outer: "RateSlot") -> Iterator[None]:
+        # The caller may swallow the error (LiteLLM.run prints it), so
+        # remember a throttle on the slot that will be released
+        try:
+            yield
+        except BaseException as error:
+            if is_throttle_error(error):
+                outer.throttle = error
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "concurrency_limit": round(self.concurrency.limit, 2),
+            "inflight": self.concurrency.inflight,
+            "successes": self.successes,
+            "throttles": self.throttles,
+            "requests_available": (
+                self.request_bucket.available
+                if self.request_bucket
+                else None
+            ),
+            "tokens_available": (
+                self.token_bucket.available
+                if self.token_bucket
+                else None
+            ),
+        }
+
+
+_registry: Dict[str, RateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def configure_rate_limit(key: str, **kwargs) -> RateLimiter:
+    """
+    Set the limits for a model (``"gpt-4o"``) or a provider
+    (``"anthropic"``, matching models named ``"anthropic/..."``).
+
+    Args:
+        key (str): Model or provider name.
+        **kwargs: :class:`RateLimiter` arguments.
+
+    Returns:
+        RateLimiter: The new limiter, which replaces any existing one.
+    """
+    limiter = RateLimiter(name=key, **kwargs)
+    with _registry_lock:
+        _registry[key] = limiter
+    return limiter
+
+
+def get_rate_limiter(model_name: Optional[str] = None) -> RateLimiter:
+    """
+    The process-wide limiter for ``model_name``.
+
+    Looks up the model, then its provider prefix, and otherwise creates
+    a limiter for the model with only adaptive concurrency.
+    """
+    key = model_name or "default"
+    with _registry_lock:
+        limiter = _registry.get(key)
+        if limiter is None and "/" in key:
+            limiter = _registry.get(key.split("/", 1)[0])
+        if limiter is None:
+            limiter = _registry[key] = RateLimiter(name=key)
+        return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Forget every configured limiter."""
+    with _registry_lock:
+        _registry.clear()
@@ -0,0 +1,108 @@
+"""
+Micro-benchmarks for MemoryManager at growing memory sizes.
+
+Run with ``python tests/profiling_memory_manager.py [sizes...]``.
+Defaults to 10k, 100k and 1M entries. A word tokenizer is used so the
+timings measure the manager rather than tiktoken.
+"""
+
+import random
+import sys
+import time
+
+from swarms.structs.agent_memory_manager import (
+    MemoryConfig,
+    MemoryManager,
+)
+
+WORDS = [f"word{i}" for i in range(5000)]
+
+
+class WordTokenizer:
+    def encode(self, text):
+        return text.split(" ")
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+    def count_tokens(self, text):
+        return text.count(" ") + 1
+
+
+class NullMemory:
+    def add(self, item):
+        pass
+
+    def query(self, query):
+        return []
+
+
+def timed(label, fn, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<28} {elapsed * 1e6:>12.1f} us")
+
+
+def benchmark(size: int):
+    print(f"{size:,} entries")
+    rng = random.Random(size)
+    manager = MemoryManager(
+        MemoryConfig(max_short_term_tokens=size * 12),
+        tokenizer=WordTokenizer(),
+        long_term_memory=NullMemory(),
+    )
+    messages = [
+        " ".join(rng.choices(WORDS, k=10)) for _ in range(size)
+    ]
+
+    start = time.perf_counter()
+    for message in messages:
+        manager.add_memory(message, "user", "agent", "session")
+    elapsed = time.perf_counter() - start
+    print(
+        f"  {'add_memory (per entry)':<28} {elapsed / size * 1e6:>12.1f} us"
+    )
+
+    timed(
+        "add_memory (full memory)",
+        lambda: manager.add_memory(
+            messages[0], "user", "agent", "session"
+        ),
+        repeat=1000,
+    )
+    timed(
+        "get_current_token_count",
+        manager.get_current_token_count,
+        1000,
+    )
+    timed(
+        "search_memories",
+        lambda: manager.search_memories("word1 word2", "short_term"),
+        repeat=10,
+    )
+    timed(
+        "search_memories (bm25)",
+        lambda: manager.search_memories(
+            "word1 word2", "short_term", ranked=True, limit=10
+        ),
+        repeat=10,
+    )
+    text = ". ".join(messages[:1000])
+    timed(
+        "truncate_to_token_limit",
+        lambda: manager.truncate_to_token_limit(text, 2000),
+        repeat=10,
+    )
+    print(f"  archived entries: {manager.archived_entries_count:,}")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [
+        10_000,
+        100_000,
+        1_000_000,
+    ]
+    for size in sizes:
+        benchmark(size)
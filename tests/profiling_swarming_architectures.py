@@ -0,0 +1,89 @@
+"""
+Benchmarks for the swarming topologies on sleeping mock agents.
+
+Run with ``python tests/profiling_swarming_architectures.py [agents]``.
+Defaults to 16 agents and 16 tasks. The serial baseline is one delay
+per agent call; concurrent runs should take roughly the longest chain
+of calls on any single agent instead.
+"""
+
+import sys
+import threading
+import time
+
+from swarms.structs.swarming_architectures import (
+    circular_swarm,
+    exponential_swarm,
+    fibonacci_swarm,
+    geometric_swarm,
+    grid_swarm,
+    harmonic_swarm,
+    linear_swarm,
+    log_swarm,
+    mesh_swarm,
+    power_swarm,
+    prime_swarm,
+    pyramid_swarm,
+    sigmoid_swarm,
+    sinusoidal_swarm,
+    staircase_swarm,
+    star_swarm,
+)
+
+DELAY = 0.05
+
+TOPOLOGIES = {
+    "circular": lambda a, t: circular_swarm(a, t),
+    "grid": lambda a, t: grid_swarm(a, t),
+    "linear": lambda a, t: linear_swarm(a, t),
+    "star": lambda a, t: star_swarm(a, t),
+    "mesh": lambda a, t: mesh_swarm(a, t),
+    "pyramid": lambda a, t: pyramid_swarm(a, t),
+    "fibonacci": lambda a, t: fibonacci_swarm(a, t),
+    "prime": lambda a, t: prime_swarm(a, t),
+    "power": lambda a, t: power_swarm(a, t),
+    "log": lambda a, t: log_swarm(a, t),
+    "exponential": lambda a, t: exponential_swarm(a, t),
+    "geometric": lambda a, t: geometric_swarm(a, t),
+    "harmonic": lambda a, t: harmonic_swarm(a, t),
+    "staircase": lambda a, t: staircase_swarm(a, t[0]),
+    "sigmoid": lambda a, t: sigmoid_swarm(a, t[0]),
+    "sinusoidal": lambda a, t: sinusoidal_swarm(a, t[0]),
+}
+
+
+class SleepingAgent:
+    def __init__(self, name):
+        self.agent_name = name
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def run(self, task):
+        with self._lock:
+            self.calls += 1
+        time.sleep(DELAY)
+        return f"{self.agent_name}:{task}"
+
+
+def benchmark(name: str, size: int):
+    agents = [SleepingAgent(f"agent-{i}") for i in range(size)]
+    tasks = [f"task-{i}" for i in range(size)]
+
+    start = time.perf_counter()
+    TOPOLOGIES[name](agents, tasks)
+    elapsed = time.perf_counter() - start
+
+    calls = sum(agent.calls for agent in agents)
+    busiest = max(agent.calls for agent in agents)
+    print(
+        f"  {name:<12} {calls:>5} calls {elapsed:>8.3f}s"
+        f"  (serial {calls * DELAY:.3f}s,"
+        f" busiest agent {busiest * DELAY:.3f}s)"
+    )
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    print(f"{size} agents, {size} tasks, {DELAY}s per call")
+    for name in sorted(TOPOLOGIES):
+        benchmark(name, size)
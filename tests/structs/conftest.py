@@ -0,0 +1,125 @@
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from swarms.structs.agent import Agent
+
+
+class CallTracker:
+    """
+    Records mock agent calls and how many overlap.
+
+    Concurrency is proven by counting, not by timing: ``peak`` is the
+    most calls in flight at once and ``peaks`` the same per agent.
+    With ``hold_until(n)`` every call blocks until ``n`` calls are in
+    flight together, so a serial implementation stalls until
+    ``timeout`` and leaves ``peak`` below ``n``.
+    """
+
+    def __init__(self, timeout: float = 5.0):
+        self.timeout = timeout
+        self.calls = []
+        self.finished = []
+        self.peak = 0
+        self.peaks = Counter()
+        self._active = Counter()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._released = threading.Event()
+        self._released.set()
+        self._release_at = 0
+
+    def hold_until(self, count: int) -> None:
+        self._release_at = count
+        self._released.clear()
+
+    @property
+    def active(self) -> int:
+        return sum(self._active.values())
+
+    @contextmanager
+    def running(self, name, task):
+        with self._lock:
+            self.calls.append((name, task))
+            self._active[name] += 1
+            self.peaks[name] = max(
+                self.peaks[name], self._active[name]
+            )
+            self.peak = max(self.peak, self.active)
+            if self.active >= self._release_at:
+                self._released.set()
+            self._changed.notify_all()
+        try:
+            self._released.wait(self.timeout)
+            yield
+        finally:
+            with self._lock:
+                self._active[name] -= 1
+                self.finished.append(name)
+                self._changed.notify_all()
+
+    def wait_for(self, count: int) -> bool:
+        """Waits until at least ``count`` calls have started."""
+        with self._changed:
+            return self._changed.wait_for(
+                lambda: len(self.calls) >= count, self.timeout
+            )
+
+    def wrap(self, name, fn, delay=0.0):
+        """Tracks a plain function, such as a pipeline stage."""
+
+        def run(value):
+            with self.running(name, value):
+                time.sleep(delay)
+                return fn(value)
+
+        return run
+
+
+@pytest.fixture
+def calls():
+    return CallTracker()
+
+
+@pytest.fixture
+def make_agent(calls):
+    """
+    Builds mock agents whose runs are recorded by ``calls``.
+
+    ``reply`` is a format string over ``name`` and ``task`` or a
+    callable taking the task. ``delay`` only widens the window in which
+    overlapping runs are counted. A run waits on ``gate`` when given,
+    and raises ``error`` when given.
+    """
+
+    def make(
+        name,
+        reply="{name}: {task}",
+        delay=0.0,
+        gate=None,
+        error=None,
+        spec=Agent,
+    ):
+        agent = MagicMock(spec=spec)
+        agent.agent_name = name
+        agent.name = name
+
+        def run(task, *args, **kwargs):
+            with calls.running(name, task):
+                if gate is not None:
+                    gate.wait(calls.timeout)
+                time.sleep(delay)
+                if error is not None:
+                    raise error
+                if callable(reply):
+                    return reply(task)
+                return reply.format(name=name, task=task)
+
+        agent.run.side_effect = run
+        return agent
+
+    return make
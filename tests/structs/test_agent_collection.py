@@ -0,0 +1,176 @@
+import threading
+
+import pytest
+
+from swarms.structs.agent_collection import AgentCollection
+from swarms.structs.agent_registry import AgentRegistry
+from swarms.structs.base_swarm import BaseSwarm
+from swarms.structs.swarm_registry import SwarmRegistry
+
+
+class StubAgent:
+    def __init__(self, name, model_name=None, status=None, tags=None):
+        self.agent_name = name
+        self.name = name
+        self.id = f"id-{name}"
+        self.model_name = model_name
+        self.status = status
+        self.tags = tags or []
+        self.description = name
+
+    def to_dict(self):
+        return {"agent_name": self.agent_name}
+
+
+class StubSwarm(BaseSwarm):
+    def run(self, task):
+        return task
+
+
+def test_lookups_by_name_id_tag_and_attributes():
+    a = StubAgent("a", "gpt-4o", "idle", ["finance"])
+    b = StubAgent("b", "gpt-4o", "busy", ["finance", "legal"])
+    c = StubAgent("c", "claude", "idle")
+    agents = AgentCollection([a, b, c])
+
+    assert agents.get("b") is b
+    assert agents.find("missing") is None
+    assert agents.find_by_id("id-c") is c
+    assert agents.find_by_tag("finance") == [a, b]
+    assert agents.where(model_name="gpt-4o", status="idle") == [a]
+    assert agents.where(description="c") == [c]
+    assert "a" in agents and a in agents
+
+
+def test_writes_publish_new_snapshots():
+    a, b = StubAgent("a", status="idle"), StubAgent("b")
+    agents = AgentCollection([a])
+    before = agents.snapshot()
+
+    agents.add(b)
+    a.status = "busy"
+    agents.reindex(a)
+    agents.replace("b", StubAgent("b2"))
+    agents.remove("a")
+
+    assert before == (a,)
+    assert agents.names() == ["b2"]
+    assert agents.where(status="busy") == []
+
+
+def test_unique_names_rejects_whole_batch():
+    agents = AgentCollection([StubAgent("a")], unique_names=True)
+
+    with pytest.raises(ValueError):
+        agents.add_many([StubAgent("b"), StubAgent("a")])
+    assert agents.names() == ["a"]
+
+
+def test_add_updates_indexes_in_place():
+    agents = AgentCollection(
+        [StubAgent(str(i), "gpt-4o") for i in range(100)]
+    )
+    by_name, by_model = agents._by_name, agents._indexes["model_name"]
+    shared = by_model["gpt-4o"]
+
+    agents.add(StubAgent("new", "gpt-4o"))
+
+    assert agents._by_name is by_name
+    assert agents._indexes["model_name"] is by_model
+    assert by_model["gpt-4o"] is shared and len(shared) == 101
+
+
+def test_concurrent_readers_see_consistent_snapshots():
+    agents = AgentCollection()
+    errors = []
+
+    def write():
+        for i in range(500):
+            agents.add(StubAgent(str(i)))
+
+    def read():
+        for _ in range(2000):
+            snapshot = agents.snapshot()
+            if any(
+                agents.find(a.agent_name) is None
+                for a in snapshot[-3:]
+            ):
+                errors.append(snapshot)
+
+    threads = [threading.Thread(target=write)] + [
+        threading.Thread(target=read) for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(agents) == 500
+
+
+def test_agent_registry_uses_indexes():
+    registry = AgentRegistry(
+        agents=[StubAgent("a", tags=["x"]), StubAgent("b")]
+    )
+
+    assert registry.find_agent_by_name("b").agent_name == "b"
+    assert registry.find_agent_by_name("missing") is None
+    assert registry.find_agent_by_id("id-a").agent_name == "a"
+    assert [
+        a.agent_name for a in registry.find_agents_by_tag("x")
+    ] == ["a"]
+    with pytest.raises(ValueError):
+        registry.add(StubAgent("a"))
+
+    registry.update_agent("a", StubAgent("a", status="new"))
+    registry.delete("b")
+    assert registry.list_agents() == ["a"]
+    assert registry.agents["a"].status == "new"
+    with pytest.raises(TypeError):
+        registry.agents["c"] = StubAgent("c")
+    with pytest.raises(KeyError):
+        registry.get("b")
+
+
+def test_base_swarm_lookups_follow_list_changes():
+    swarm = StubSwarm(agents=[StubAgent(str(i)) for i in range(1000)])
+
+    assert swarm.self_find_agent_by_name("999").agent_name == "999"
+    assert swarm.self_find_agent_by_id("id-5").agent_name == "5"
+    assert swarm.agent_exists("42")
+
+    swarm.add_agent(StubAgent("new"))
+    swarm.agents.append(StubAgent("direct"))
+    swarm.remove_agent(swarm.select_agent_by_name("0"))
+
+    assert swarm.get_agent_by_name("new") is not None
+    assert swarm.get_agent_by_name("direct") is not None
+    assert not swarm.agent_exists("0")
+
+
+def test_base_swarm_membership_is_by_identity():
+    agent = StubAgent("a")
+    swarm = StubSwarm(agents=[agent])
+
+    assert agent in swarm
+    assert StubAgent("a") not in swarm
+    assert "a" not in swarm
+
+
+def test_swarm_registry_queries_by_name():
+    def first():
+        """First swarm."""
+
+    def second():
+        return "ran"
+
+    registry = SwarmRegistry()
+    registry.add_list_of_swarms([first, second])
+
+    assert registry.query("second") is second
+    assert registry.run("second") == "ran"
+    registry.remove("first")
+    assert registry.list_swarms() == ["second"]
+    with pytest.raises(ValueError):
+        registry.query("first")
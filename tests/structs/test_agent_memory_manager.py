@@ -0,0 +1,141 @@
+from swarms.structs.agent_memory_manager import (
+    MemoryConfig,
+    MemoryManager,
+)
+
+
+class WordTokenizer:
+    """One token per space-separated word, so counts are predictable."""
+
+    def encode(self, text):
+        return text.split(" ")
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+    def count_tokens(self, text):
+        return len(self.encode(text))
+
+
+class ListMemory:
+    def __init__(self, fail=False):
+        self.items = []
+        self.fail = fail
+
+    def add(self, item):
+        if self.fail:
+            raise RuntimeError("unavailable")
+        self.items.append(item)
+
+    def query(self, query):
+        return []
+
+
+def make_manager(long_term_memory=None, **config):
+    return MemoryManager(
+        MemoryConfig(**config),
+        tokenizer=WordTokenizer(),
+        long_term_memory=long_term_memory,
+    )
+
+
+def add(manager, content, is_system=False):
+    manager.add_memory(content, "user", "agent", "session", is_system)
+
+
+def test_token_counts_are_maintained_incrementally():
+    manager = make_manager(auto_archive=False)
+    add(manager, "one two three")
+    add(manager, "four five")
+    add(manager, "system prompt", is_system=True)
+
+    assert manager.get_current_token_count() == 5
+    assert manager.get_system_messages_token_count() == 2
+
+    manager.clear_short_term_memory()
+    assert manager.get_current_token_count() == 0
+    assert manager.get_system_messages_token_count() == 2
+
+
+def test_archives_oldest_entries_in_one_batch():
+    long_term = ListMemory()
+    manager = make_manager(
+        long_term,
+        max_short_term_tokens=100,
+        archive_threshold=0.8,
+        archive_target=0.5,
+    )
+    for i in range(8):
+        add(manager, " ".join([f"w{i}"] * 10))
+
+    assert len(long_term.items) == 4
+    assert "w0" in long_term.items[0]
+    assert manager.get_current_token_count() == 40
+    assert manager.short_term_memory[0].content.startswith("w4")
+    assert manager.search_memories("w0", "short_term") == []
+
+
+def test_failed_archive_keeps_entries_in_order():
+    manager = make_manager(
+        ListMemory(fail=True), max_short_term_tokens=10
+    )
+    for i in range(5):
+        add(manager, f"entry{i} x")
+
+    assert [e.content for e in manager.short_term_memory] == [
+        f"entry{i} x" for i in range(5)
+    ]
+    assert manager.get_current_token_count() == 10
+    assert manager.archived_entries_count == 0
+
+
+def test_search_uses_whole_words_and_bm25_ranking():
+    manager = make_manager(auto_archive=False)
+    add(manager, "The cat sat on the mat")
+    add(manager, "A dog chased the CAT around the cat tree")
+    add(manager, "Nothing to see here")
+    add(manager, "You are a helpful cat expert", is_system=True)
+
+    matches = manager.search_memories("cat the", "short_term")
+    assert [m.content[:5] for m in matches] == ["The c", "A dog"]
+
+    ranked = manager.search_memories(
+        "cat tree", "short_term", ranked=True
+    )
+    assert ranked[0].content.startswith("A dog")
+    assert len(ranked) == 2
+
+    assert len(manager.search_memories("cat")) == 3
+    assert manager.search_memories("ca") == []
+
+
+def test_truncate_keeps_whole_sentences():
+    manager = make_manager()
+    text = "one two. three four. five six"
+
+    assert manager.truncate_to_token_limit(text, 10) == text
+    assert (
+        manager.truncate_to_token_limit(text, 4)
+        == "one two. three four"
+    )
+    assert manager.truncate_to_token_limit(text, 3) == "one two"
+    assert manager.truncate_to_token_limit(text, 1) == ""
+
+
+def test_snapshot_round_trip_restores_counters_and_index(tmp_path):
+    manager = make_manager(auto_archive=False)
+    add(manager, "alpha beta")
+    add(manager, "gamma", is_system=True)
+    path = str(tmp_path / "memory.json")
+    manager.save_memory_snapshot(path)
+
+    restored = make_manager()
+    restored.load_memory_snapshot(path)
+
+    assert restored.get_current_token_count() == 2
+    assert restored.get_system_messages_token_count() == 1
+    assert restored.search_memories("beta")[0].content == "alpha beta"
+    assert (
+        manager.short_term_memory[0].metadata.message_id
+        != manager.system_messages[0].metadata.message_id
+    )
@@ -0,0 +1,255 @@
+import asyncio
+import json
+import time
+
+from swarms.structs.async_workflow import (
+    AsyncWorkflow,
+    GroupChatConfig,
+    SharedMemory,
+    SpeakerConfig,
+    SpeakerRole,
+)
+
+
+def read_log(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_writes_are_coalesced_and_flushed_on_close(tmp_path):
+    path = str(tmp_path / "memory.jsonl")
+    memory = SharedMemory(path, flush_interval=60)
+
+    for i in range(1000):
+        memory.set("counter", i, "agent")
+    memory.set("other", "x", "agent")
+
+    assert memory.get("counter") == 999
+    memory.close()
+
+    records = read_log(path)
+    assert len(records) == 2
+    assert SharedMemory(path).get("counter") == 999
+
+
+def test_threshold_triggers_background_flush(tmp_path):
+    path = str(tmp_path / "memory.jsonl")
+    memory = SharedMemory(path, flush_interval=60, flush_threshold=5)
+
+    for i in range(5):
+        memory.set(f"k{i}", i, "agent")
+
+    deadline = time.time() + 2
+    while (
+        time.time() < deadline
+        and not (tmp_path / "memory.jsonl").exists()
+    ):
+        time.sleep(0.01)
+    memory.close()
+    assert len(read_log(path)) == 5
+
+
+def test_log_is_compacted(tmp_path):
+    path = str(tmp_path / "memory.jsonl")
+    memory = SharedMemory(path, flush_interval=60, compact_ratio=2)
+
+    for i in range(10):
+        memory.set("key", i, "agent")
+        memory.flush()
+    memory.close()
+
+    assert len(read_log(path)) <= 2
+    assert SharedMemory(path).get("key") == 9
+
+
+def test_loads_legacy_json_and_torn_log(tmp_path):
+    legacy = tmp_path / "legacy.json"
+    legacy.write_text(
+        json.dumps(
+            {
+                "a": {
+                    "key": "a",
+                    "value": 1,
+                    "timestamp": "2024-01-01T00:00:00",
+                    "author": "x",
+                    "metadata": {},
+                }
+            }
+        )
+    )
+    assert SharedMemory(str(legacy)).get("a") == 1
+
+    log = tmp_path / "torn.jsonl"
+    log.write_text(
+        json.dumps(
+            {
+                "key": "b",
+                "value": 2,
+                "timestamp": "2024-01-01T00:00:00",
+                "author": "x",
+                "metadata": {},
+            }
+        )
+        + '\n{"key": "c", "val'
+    )
+    memory = SharedMemory(str(log))
+    assert memory.get("b") == 2 and memory.get("c") is None
+
+
+def test_async_api_with_many_concurrent_writers(tmp_path):
+    path = str(tmp_path / "memory.jsonl")
+    memory = SharedMemory(path, flush_interval=0.05)
+
+    async def agent(n):
+        for i in range(100):
+            await memory.aset(f"agent-{n}", i, f"agent-{n}")
+            await asyncio.sleep(0)
+
+    async def main():
+        start = time.perf_counter()
+        await asyncio.gather(*(agent(n) for n in range(50)))
+        elapsed = time.perf_counter() - start
+        await memory.aclose()
+        return elapsed
+
+    elapsed = asyncio.run(main())
+
+    assert elapsed < 2
+    reloaded = SharedMemory(path)
+    assert all(reloaded.get(f"agent-{n}") == 99 for n in range(50))
+
+
+class ScriptedAgent:
+    def __init__(self, name, replies, delays=(0.0,)):
+        self.agent_name = name
+        self.replies = list(replies)
+        self.delays = list(delays)
+        self.calls = 0
+
+    async def arun(self, task):
+        call = self.calls
+        self.calls += 1
+        await asyncio.sleep(
+            self.delays[min(call, len(self.delays) - 1)]
+        )
+        return self.replies[min(call, len(self.replies) - 1)]
+
+
+def make_chat(tmp_path, agents, **config):
+    workflow = AsyncWorkflow(
+        log_path=str(tmp_path / "workflow.log"),
+        shared_memory_path=str(tmp_path / "memory.jsonl"),
+        enable_group_chat=True,
+        group_chat_config=GroupChatConfig(**config),
+    )
+    roles = [
+        SpeakerRole.COORDINATOR,
+        SpeakerRole.CRITIC,
+        SpeakerRole.VALIDATOR,
+    ]
+    for role, agent in zip(roles, agents):
+        workflow.speaker_system.add_speaker(
+            SpeakerConfig(role=role, agent=agent)
+        )
+    return workflow
+
+
+def test_group_chat_stops_on_consensus(tmp_path):
+    agents = [
+        ScriptedAgent("a", ["maybe 4", "The answer is 42."]),
+        ScriptedAgent("b", ["surely 7", "the answer is 42"]),
+    ]
+    workflow = make_chat(tmp_path, agents, max_turns=10)
+
+    messages = asyncio.run(workflow.run_group_chat("question"))
+
+    assert len(messages) == 4
+    assert agents[0].calls == 2
+
+
+def test_group_chat_stops_without_new_information(tmp_path):
+    agents = [
+        ScriptedAgent("a", ["alpha beta", "alpha beta gamma"]),
+        ScriptedAgent("b", ["gamma delta", "delta beta"]),
+    ]
+    workflow = make_chat(
+        tmp_path,
+        agents,
+        max_turns=10,
+        termination=["no_new_information"],
+    )
+
+    messages = asyncio.run(workflow.run_group_chat("question"))
+
+    assert {m.metadata["turn"] for m in messages} == {0, 1}
+
+
+def test_required_speakers_keep_chat_going(tmp_path):
+    agents = [
+        ScriptedAgent("a", ["same"]),
+        ScriptedAgent("b", [None]),
+    ]
+    workflow = make_chat(
+        tmp_path,
+        agents,
+        max_turns=3,
+        require_all_speakers=True,
+        termination=[lambda progress: True],
+    )
+    for speaker in workflow.speaker_system.speakers.values():
+        speaker.required = True
+
+    messages = asyncio.run(workflow.run_group_chat("question"))
+
+    assert len(messages) == 6
+
+
+def test_overlapped_turns_do_not_wait_for_slowest_speaker(tmp_path):
+    # Each turn has one slow speaker, so lock-step turns take 4 * 0.3s
+    delays = {"a": [0.3, 0, 0.3, 0], "b": [0, 0.3, 0, 0.3]}
+    agents = [
+        ScriptedAgent(
+            name,
+            [f"{name} {i}" for i in range(4)],
+            delays.get(name, [0]),
+        )
+        for name in ("a", "b", "c")
+    ]
+    workflow = make_chat(
+        tmp_path,
+        agents,
+        max_turns=4,
+        overlap_turns=True,
+        termination=[],
+    )
+
+    start = time.perf_counter()
+    messages = asyncio.run(workflow.run_group_chat("question"))
+    elapsed = time.perf_counter() - start
+
+    assert len(messages) == 12
+    assert [m.metadata["turn"] for m in messages] == [
+        turn for turn in range(4) for _ in range(3)
+    ]
+    assert elapsed < 0.9
+
+
+def test_turn_context_history_is_bounded(tmp_path):
+    agents = [
+        ScriptedAgent("a", [f"a{i}" for i in range(10)]),
+        ScriptedAgent("b", [f"b{i}" for i in range(10)]),
+    ]
+    workflow = make_chat(
+        tmp_path,
+        agents,
+        max_turns=5,
+        history_window=3,
+        termination=[],
+    )
+
+    messages = asyncio.run(workflow.run_group_chat("question"))
+
+    context = messages[-1].metadata["context"]
+    assert len(context["history"]) == 3
+    assert "metadata" not in context["history"][0]
+    assert "a0" in context["summary"]
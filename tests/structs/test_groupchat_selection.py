@@ -0,0 +1,143 @@
+import time
+
+import pytest
+
+from swarms.structs.groupchat import GroupChat
+
+
+class EchoAgent:
+    def __init__(self, agent_name, description="", bid=None):
+        self.agent_name = agent_name
+        self.description = description
+        self.prompts = []
+        if bid is not None:
+            self.bid = lambda context: bid
+
+    def run(self, task):
+        self.prompts.append(task)
+        return f"{self.agent_name} says hi"
+
+
+class SlowSummarizer:
+    def __init__(self):
+        self.calls = 0
+
+    def run(self, task):
+        time.sleep(0.05)
+        self.calls += 1
+        return f"summary {self.calls}"
+
+
+def make_chat(tmp_path, agents, **kwargs):
+    return GroupChat(
+        agents=agents,
+        group_objective="test",
+        state_path=str(tmp_path / "state.json"),
+        **kwargs,
+    )
+
+
+def test_round_robin_needs_no_selector_call(tmp_path):
+    agents = [EchoAgent("a"), EchoAgent("b"), EchoAgent("c")]
+    chat = make_chat(
+        tmp_path,
+        agents,
+        max_rounds=4,
+        speaker_selection="round_robin",
+    )
+
+    chat.run("start")
+
+    speakers = [i.agent_name for i in chat.state.interactions]
+    assert speakers == ["b", "c", "a", "b"]
+    # Every prompt an agent saw was a turn, never a selection request
+    assert all("select the next" not in p for p in agents[0].prompts)
+
+
+def test_affinity_picks_matching_agent(tmp_path):
+    agents = [
+        EchoAgent("writer", "drafts prose and essays"),
+        EchoAgent("coder", "writes python code and tests"),
+    ]
+    chat = make_chat(tmp_path, agents, speaker_selection="affinity")
+    chat._add_message("Admin", "please write python code")
+
+    assert (
+        chat.select_next_speaker(chat.wrapped_agents[0]).agent_name
+        == "coder"
+    )
+
+
+def test_bidding_picks_highest_bid(tmp_path):
+    agents = [EchoAgent("a", bid=0.1), EchoAgent("b", bid=0.9)]
+    chat = make_chat(tmp_path, agents, speaker_selection="bidding")
+
+    assert (
+        chat.select_next_speaker(chat.wrapped_agents[1]).agent_name
+        == "b"
+    )
+
+
+def test_unknown_strategy_raises(tmp_path):
+    with pytest.raises(ValueError):
+        make_chat(
+            tmp_path, [EchoAgent("a")], speaker_selection="nope"
+        )
+
+
+def test_context_is_bounded_and_summarized(tmp_path):
+    summarizer = SlowSummarizer()
+    chat = make_chat(
+        tmp_path,
+        [EchoAgent("a"), EchoAgent("b")],
+        context_window=3,
+        compact_every=2,
+        summary_agent=summarizer,
+    )
+    for i in range(10):
+        chat._add_message("Admin", f"message {i}")
+    chat.shutdown()
+
+    context = chat.get_context()
+
+    assert "message 9" in context
+    assert "message 6" not in context
+    assert context.startswith("Summary of the earlier conversation")
+    assert summarizer.calls >= 1
+    assert chat._summary_executor is None
+
+
+def test_replaced_state_drops_the_old_summary(tmp_path):
+    chat = make_chat(
+        tmp_path,
+        [EchoAgent("a"), EchoAgent("b")],
+        context_window=2,
+        compact_every=1,
+        summary_agent=SlowSummarizer(),
+    )
+    for i in range(4):
+        chat._add_message("Admin", f"message {i}")
+    chat.shutdown()
+    assert chat.get_context().startswith("Summary")
+
+    chat.state = chat.state.model_copy(update={"messages": []})
+    chat._add_message("Admin", "fresh")
+
+    assert chat.get_context() == "Admin: fresh"
+    assert chat._summarized_upto == 0
+
+
+def test_run_stops_the_summary_worker(tmp_path):
+    chat = make_chat(
+        tmp_path,
+        [EchoAgent("a"), EchoAgent("b")],
+        max_rounds=4,
+        context_window=1,
+        compact_every=1,
+        summary_agent=SlowSummarizer(),
+        speaker_selection="round_robin",
+    )
+
+    chat.run("start")
+
+    assert chat._summary_executor is None
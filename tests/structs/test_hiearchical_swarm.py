@@ -0,0 +1,137 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from swarms.structs.hiearchical_swarm import HierarchicalAgentSwarm
+
+
+@pytest.fixture
+def worker(make_agent):
+    def make(name, **kwargs):
+        agent = make_agent(
+            name, reply="{name} done", spec=None, **kwargs
+        )
+        agent.id = name
+        agent.description = f"{name} agent"
+        agent.to_dict.return_value = {}
+        return agent
+
+    return make
+
+
+def make_swarm(agents):
+    return HierarchicalAgentSwarm(director=MagicMock(), agents=agents)
+
+
+def test_orders_run_concurrently_in_original_order(worker, calls):
+    agents = [worker(f"worker-{i}") for i in range(4)]
+    swarm = make_swarm(agents)
+    orders = {
+        "orders": [
+            {"agent_name": agent.name, "task": "work"}
+            for agent in agents
+        ]
+    }
+
+    calls.hold_until(4)
+    log = swarm.distribute_orders_to_agents(orders)
+
+    assert calls.peak == 4
+    positions = [log.index(f"worker-{i} done") for i in range(4)]
+    assert positions == sorted(positions)
+    assert "latency" in log
+
+
+def test_orders_respect_dependencies(worker, calls):
+    research = worker("research", delay=0.05)
+    writer = worker("writer")
+    swarm = make_swarm([research, writer])
+
+    swarm.distribute_orders_to_agents(
+        {
+            "orders": [
+                {
+                    "agent_name": "writer",
+                    "task": "write",
+                    "depends_on": ["research"],
+                },
+                {
+                    "agent_name": "research",
+                    "task": "research",
+                    "order_id": "research",
+                },
+            ]
+        }
+    )
+
+    assert [name for name, _ in calls.calls] == ["research", "writer"]
+    assert "research done" in calls.calls[1][1]
+
+
+def test_cyclic_orders_are_rejected(worker):
+    swarm = make_swarm([worker("a")])
+    with pytest.raises(ValueError):
+        swarm.distribute_orders_to_agents(
+            {
+                "orders": [
+                    {
+                        "agent_name": "a",
+                        "task": "x",
+                        "order_id": "1",
+                        "depends_on": ["2"],
+                    },
+                    {
+                        "agent_name": "a",
+                        "task": "y",
+                        "order_id": "2",
+                        "depends_on": ["1"],
+                    },
+                ]
+            }
+        )
+
+
+def test_find_agent_by_name_uses_index(worker):
+    swarm = make_swarm([worker("a")])
+    late = worker("late")
+    swarm.agents.append(late)
+
+    assert swarm.find_agent_by_name("a").name == "a"
+    assert swarm.find_agent_by_name("late") is late
+    assert swarm.find_agent_by_name("missing") is None
+
+
+def test_orders_for_one_agent_do_not_overlap(worker, calls):
+    swarm = make_swarm([worker("busy"), worker("other")])
+
+    # Only proceeds once the other agent overlaps the busy one
+    calls.hold_until(2)
+    swarm.distribute_orders_to_agents(
+        {
+            "orders": [
+                {"agent_name": "busy", "task": "one"},
+                {"agent_name": "busy", "task": "two"},
+                {"agent_name": "other", "task": "three"},
+            ]
+        }
+    )
+
+    assert calls.peaks["busy"] == 1
+    assert calls.peak == 2
+
+
+def test_duplicate_names_keep_the_first_agent(monkeypatch, worker):
+    from swarms.structs import agent as agent_module
+
+    class WordTokenizer:
+        def count_tokens(self, text):
+            return len(text.split())
+
+    monkeypatch.setattr(agent_module, "TikTokenizer", WordTokenizer)
+    first = worker("dup")
+    swarm = make_swarm([first])
+    swarm.template_base_worker_llm = MagicMock()
+
+    swarm.create_single_agent("dup", "prompt", "second")
+
+    assert swarm.find_agent_by_name("dup") is first
@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -150,3 +151,58 @@ async def test_majority_voting_run_asynchronous(mocker):
 
     # Assert majority vote is correct
     assert majority_vote is not None
+
+
+def test_majority_voting_stops_at_quorum(make_agent, calls):
+    gate = threading.Event()
+    agents = [
+        make_agent("a", reply="Paris."),
+        make_agent("b", reply=" paris"),
+        make_agent("c", reply="Lyon", gate=gate),
+        make_agent("d", reply="Paris", gate=gate),
+    ]
+    mv = MajorityVoting(agents=agents, quorum=2)
+
+    try:
+        result = mv.run("What is the capital of France?")
+        # Returned while the stragglers were still held
+        assert sorted(calls.finished) == ["a", "b"]
+    finally:
+        gate.set()
+
+    assert result == "Paris."
+    assert mv.agents_consulted == 2
+
+
+def test_majority_voting_attributes_responses_to_agents(make_agent):
+    fast_done = threading.Event()
+    agents = [
+        make_agent("slow", reply="Paris", gate=fast_done),
+        make_agent(
+            "fast", reply=lambda task: fast_done.set() or "Lyon"
+        ),
+    ]
+    mv = MajorityVoting(agents=agents, early_stopping=False)
+    mv.conversation = MagicMock()
+
+    mv.run("What is the capital of France?")
+
+    mv.conversation.add.assert_any_call("slow", ["Paris"])
+    mv.conversation.add.assert_any_call("fast", ["Lyon"])
+    assert mv.agents_consulted == 2
+
+
+def test_majority_voting_similarity_hook_buckets_answers(make_agent):
+    agents = [
+        make_agent("a", reply="Paris, France"),
+        make_agent("b", reply="Lyon"),
+        make_agent("c", reply="paris"),
+    ]
+    mv = MajorityVoting(
+        agents=agents,
+        early_stopping=False,
+        similarity_fn=lambda new, existing: new.split(",")[0]
+        == existing.split(",")[0],
+    )
+
+    assert mv.run("capital?") == "Paris, France"
@@ -0,0 +1,152 @@
+import json
+import threading
+
+import pytest
+
+from swarms.schemas.agent_step_schemas import ManySteps
+from swarms.structs.mixture_of_agents import MixtureOfAgents
+
+
+@pytest.fixture
+def moa_agent(make_agent):
+    def make(name, **kwargs):
+        output = ManySteps(
+            agent_id=name,
+            agent_name=name,
+            task=None,
+            max_loops=1,
+            run_id=None,
+            steps=[],
+            full_history=None,
+            total_tokens=None,
+            stopping_token=None,
+            interactive=None,
+            dynamic_temperature_enabled=None,
+        )
+
+        def reply(task):
+            output.task = task
+            return f"{name}: {task.splitlines()[-1]}"
+
+        kwargs.setdefault("reply", reply)
+        agent = make_agent(name, spec=None, **kwargs)
+        agent.to_dict.return_value = {"agent_name": name}
+        agent.agent_output = output
+        return agent
+
+    return make
+
+
+@pytest.fixture
+def make_moa(moa_agent):
+    def make(agents, aggregator=None, **kwargs):
+        return MixtureOfAgents(
+            agents=agents,
+            aggregator_agent=aggregator or moa_agent("aggregator"),
+            aggregator_system_prompt="Combine:",
+            **kwargs,
+        )
+
+    return make
+
+
+def test_run_batched_pipelines_tasks(moa_agent, make_moa, calls):
+    moa = make_moa(
+        [moa_agent("a", delay=0.05), moa_agent("b", delay=0.05)],
+        aggregator=moa_agent("aggregator", delay=0.05),
+        layers=2,
+    )
+
+    outputs = moa.run_batched([f"task {i}" for i in range(4)])
+
+    # The aggregator overlaps the next task's reference agents
+    assert calls.peak == 3
+    summaries = [
+        json.loads(output)["aggregator_agent_summary"]
+        for output in outputs
+    ]
+    assert summaries == [f"aggregator: task {i}" for i in range(4)]
+
+
+def test_agent_runs_one_task_at_a_time(moa_agent, make_moa, calls):
+    moa = make_moa([moa_agent("a", delay=0.01)], layers=3)
+    tasks = [f"task {i}" for i in range(5)]
+
+    outputs = moa.run_batched(tasks)
+
+    assert calls.peaks["a"] == 1
+    for task, output in zip(tasks, outputs):
+        steps = json.loads(output)["normal_agent_outputs"]
+        # Snapshots, not the agent's live output of the last run
+        assert all(step["task"].endswith(task) for step in steps[:-1])
+
+
+def test_run_and_run_batched_send_the_same_prompts(
+    moa_agent, make_moa, calls
+):
+    moa = make_moa([moa_agent("a"), moa_agent("b")], layers=3)
+
+    moa.run("task")
+    from_run = sorted(calls.calls)
+    calls.calls.clear()
+    moa.run_batched(["task"])
+
+    assert sorted(calls.calls) == from_run
+
+
+def test_event_loop_stops_when_calls_return(moa_agent, make_moa):
+    moa = make_moa([moa_agent("a")], layers=2)
+
+    moa.run_batched(["task"])
+    assert moa._loop is None
+
+    with moa:
+        loop = moa._loop
+        moa.run_batched(["task"])
+        moa.run("task")
+        assert moa._loop is loop and loop.is_running()
+    assert loop.is_closed()
+
+
+def test_layer_concurrency_limits_in_flight_runs(
+    moa_agent, make_moa, calls
+):
+    moa = make_moa(
+        [moa_agent("a", delay=0.01), moa_agent("b", delay=0.01)],
+        layers=2,
+        layer_concurrency=1,
+    )
+
+    moa.run_batched([f"task {i}" for i in range(6)])
+
+    # One reference run in flight, plus at most the aggregator
+    assert calls.peak <= 2
+    assert calls.peaks["a"] == calls.peaks["b"] == 1
+
+
+def test_layer_quorum_skips_stragglers(moa_agent, make_moa, calls):
+    gate = threading.Event()
+    moa = make_moa(
+        [moa_agent("fast"), moa_agent("slow", gate=gate)],
+        layers=3,
+        layer_quorum=1,
+    )
+
+    try:
+        (output,) = moa.run_batched(["task"])
+        assert "slow" not in calls.finished
+    finally:
+        gate.set()
+
+    assert json.loads(output)["aggregator_agent_summary"].startswith(
+        "aggregator"
+    )
+
+
+def test_failed_layer_raises(moa_agent, make_moa):
+    moa = make_moa(
+        [moa_agent("a", error=ValueError("boom"))], layers=2
+    )
+
+    with pytest.raises(ValueError):
+        moa.run_batched(["task"])
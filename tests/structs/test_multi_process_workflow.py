@@ -0,0 +1,149 @@
+import os
+import time
+
+from swarms.structs.multi_process_workflow import (
+    AgentSpec,
+    MultiProcessWorkflow,
+)
+
+
+def word_count(task):
+    return len(task.split())
+
+
+def shout(task):
+    return task.upper()
+
+
+def report_pid(task):
+    return os.getpid()
+
+
+def sleep_forever(task):
+    time.sleep(30)
+
+
+def retry_forever(task):
+    # Agents retry on Exception; the timeout must still get through
+    while True:
+        try:
+            time.sleep(30)
+        except Exception:
+            pass
+
+
+def crash_once(marker):
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+    return "recovered"
+
+
+def crash_on(item):
+    if item == "crash":
+        os._exit(1)
+    time.sleep(0.05)
+    return f"ok:{item}"
+
+
+def cpu_heavy(n):
+    return sum(i * i for i in range(n))
+
+
+class CountingAgent:
+    builds = 0
+
+    def __init__(self, prefix):
+        CountingAgent.builds += 1
+        self.prefix = prefix
+        self.agent_name = prefix
+
+    def run(self, task):
+        return f"{self.prefix}:{task}:{CountingAgent.builds}"
+
+
+def test_run_returns_each_agent_result_in_order():
+    with MultiProcessWorkflow(
+        agents=[word_count, shout], max_workers=2
+    ) as workflow:
+        assert workflow.run("a b c") == [3, "A B C"]
+
+
+def test_batched_run_groups_results_per_task():
+    with MultiProcessWorkflow(
+        agents=[word_count], max_workers=2
+    ) as workflow:
+        results = workflow.batched_run(
+            ["a", "a b", "a b c"], batch_size=2
+        )
+
+    assert results == [[1], [2], [3]]
+
+
+def test_agent_specs_are_built_once_per_worker():
+    with MultiProcessWorkflow(
+        agents=[AgentSpec(CountingAgent, "spec")], max_workers=1
+    ) as workflow:
+        results = workflow.batched_run(["x", "y", "z"])
+
+    # Every job ran on the same cached agent instance
+    assert [r[0] for r in results] == [
+        "spec:x:1",
+        "spec:y:1",
+        "spec:z:1",
+    ]
+
+
+def test_work_runs_outside_the_calling_process():
+    with MultiProcessWorkflow(
+        agents=[report_pid], max_workers=2
+    ) as workflow:
+        (pid,) = workflow.run("task")
+
+    assert pid != os.getpid()
+
+
+def test_timeout_fails_job_without_blocking():
+    with MultiProcessWorkflow(
+        agents=[sleep_forever], timeout=0.2, max_retries=0
+    ) as workflow:
+        start = time.perf_counter()
+        assert workflow.run("task") == [None]
+
+    assert time.perf_counter() - start < 5
+
+
+def test_timeout_is_not_swallowed_by_retry_loops():
+    with MultiProcessWorkflow(
+        agents=[retry_forever], timeout=0.2, max_retries=0
+    ) as workflow:
+        start = time.perf_counter()
+        assert workflow.run("task") == [None]
+
+    assert time.perf_counter() - start < 5
+
+
+def test_crashed_worker_is_replaced_and_job_retried(tmp_path):
+    marker = str(tmp_path / "crashed")
+
+    with MultiProcessWorkflow(
+        agents=[crash_once], max_workers=1, max_retries=2
+    ) as workflow:
+        assert workflow.run(marker) == ["recovered"]
+
+
+def test_crash_only_charges_the_crashing_job():
+    with MultiProcessWorkflow(
+        max_workers=4, max_retries=1
+    ) as workflow:
+        results = workflow.map(crash_on, ["a", "crash", "b"])
+
+    assert results == ["ok:a", None, "ok:b"]
+
+
+def test_map_runs_cpu_work_in_pool():
+    with MultiProcessWorkflow(max_workers=2) as workflow:
+        assert workflow.map(cpu_heavy, [10, 100]) == [
+            cpu_heavy(10),
+            cpu_heavy(100),
+        ]
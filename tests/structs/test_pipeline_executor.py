@@ -0,0 +1,168 @@
+import pytest
+
+from swarms.structs.pipeline_executor import (
+    PipelineExecutor,
+    PipelineStage,
+)
+from swarms.structs.round_robin import RoundRobinSwarm
+from swarms.structs.sequential_workflow import SequentialWorkflow
+
+
+def nested(name):
+    """Replies ``name(input)`` to a bare or context-prefixed prompt."""
+    return lambda task: (
+        f"{name}({task.splitlines()[-1].split(': ')[-1]})"
+    )
+
+
+@pytest.fixture
+def stage_agent(make_agent):
+    def make(name, **kwargs):
+        agent = make_agent(name, reply=nested(name), **kwargs)
+        agent.agent_output = None
+        return agent
+
+    return make
+
+
+def test_pipeline_overlaps_stages_and_keeps_order(calls):
+    pipeline = PipelineExecutor(
+        [
+            PipelineStage(
+                "a", calls.wrap("a", lambda x: x + 1, 0.01)
+            ),
+            PipelineStage(
+                "b", calls.wrap("b", lambda x: x * 10, 0.01)
+            ),
+            PipelineStage(
+                "c", calls.wrap("c", lambda x: x - 1, 0.01)
+            ),
+        ]
+    )
+
+    results = pipeline.run(range(10))
+
+    assert results == [(i + 1) * 10 - 1 for i in range(10)]
+    assert calls.peak >= 2
+    report = pipeline.report()
+    assert [stats["processed"] for stats in report] == [10, 10, 10]
+    assert all(stats["throughput"] > 0 for stats in report)
+
+
+def test_pipeline_stage_workers_relieve_bottleneck(calls):
+    pipeline = PipelineExecutor(
+        [
+            PipelineStage("fast", lambda x: x),
+            PipelineStage(
+                "slow", calls.wrap("slow", lambda x: x), workers=5
+            ),
+        ]
+    )
+
+    calls.hold_until(5)
+    assert pipeline.run(range(10)) == list(range(10))
+    assert calls.peak == 5
+
+
+def test_pipeline_raises_first_failure_after_draining():
+    def fail_on_three(x):
+        if x == 3:
+            raise ValueError("three")
+        return x
+
+    pipeline = PipelineExecutor(
+        [
+            PipelineStage("check", fail_on_three),
+            PipelineStage("double", lambda x: x * 2),
+        ]
+    )
+
+    with pytest.raises(ValueError, match="three"):
+        pipeline.run(range(6))
+    report = pipeline.report()
+    assert report[0]["failed"] == 1
+    assert report[1]["processed"] == 5
+
+
+def test_round_robin_run_pipelined(stage_agent, calls):
+    swarm = RoundRobinSwarm(
+        agents=[
+            stage_agent("a", delay=0.02),
+            stage_agent("b", delay=0.02),
+        ]
+    )
+
+    results = swarm.run_pipelined(["x", "y", "z", "w"])
+
+    assert results == ["b(a(x))", "b(a(y))", "b(a(z))", "b(a(w))"]
+    assert calls.peak == 2
+    assert calls.peaks["a"] == calls.peaks["b"] == 1
+    assert [s["name"] for s in swarm.pipeline_stats] == [
+        "a-loop-1",
+        "b-loop-1",
+    ]
+
+
+def test_round_robin_run_pipelined_matches_run(stage_agent):
+    seen = []
+    swarm = RoundRobinSwarm(
+        agents=[stage_agent("a"), stage_agent("b")],
+        max_loops=2,
+        callback=lambda loop, result: seen.append((loop, result)),
+    )
+    swarm.index = 1
+
+    expected = swarm.run("x")
+    assert (
+        swarm.run_pipelined(["x"]) == [expected] == ["a(b(a(b(x))))"]
+    )
+    assert seen[2:] == seen[:2] == [(0, "a(b(x))"), (1, expected)]
+
+
+def test_sequential_workflow_run_pipelined(stage_agent):
+    workflow = SequentialWorkflow(
+        agents=[stage_agent("a"), stage_agent("b")],
+        output_type="final",
+    )
+
+    assert workflow.run_pipelined(["x", "y"]) == [
+        "b(a(x))",
+        "b(a(y))",
+    ]
+    assert len(workflow.pipeline_stats) == 2
+
+
+@pytest.mark.parametrize("output_type", ["all", "list", "dict"])
+def test_sequential_workflow_run_pipelined_matches_run(
+    stage_agent, calls, output_type
+):
+    workflow = SequentialWorkflow(
+        agents=[stage_agent("a"), stage_agent("b")],
+        max_loops=2,
+        output_type=output_type,
+    )
+
+    expected = workflow.run("x")
+    prompts = [task for _, task in calls.calls]
+    calls.calls.clear()
+
+    assert workflow.run_pipelined(["x"]) == [expected]
+    assert [task for _, task in calls.calls] == prompts
+
+
+def test_sequential_workflow_pipelined_loops_share_agents_safely(
+    stage_agent, calls
+):
+    workflow = SequentialWorkflow(
+        agents=[stage_agent("a", delay=0.01)],
+        max_loops=2,
+        output_type="final",
+    )
+
+    results = workflow.run_pipelined(
+        ["x", "y", "z"], workers_per_agent=2
+    )
+
+    assert results == ["a(a(x))", "a(a(y))", "a(a(z))"]
+    assert calls.peaks["a"] == 1
+    assert len(calls.calls) == 6
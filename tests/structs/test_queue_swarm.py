@@ -0,0 +1,136 @@
+import json
+import queue
+import threading
+import time
+
+import pytest
+
+from swarms.structs.queue_swarm import TaskQueueSwarm
+
+
+def make_swarm(agents, **kwargs):
+    return TaskQueueSwarm(agents=agents, autosave_on=False, **kwargs)
+
+
+def test_run_processes_all_tasks(make_agent):
+    swarm = make_swarm([make_agent("a"), make_agent("b")])
+    for i in range(6):
+        swarm.add_task(str(i))
+
+    metadata = json.loads(swarm.run())
+
+    assert metadata["tasks_completed"] == 6
+    assert sorted(o["task"] for o in metadata["outputs"]) == [
+        str(i) for i in range(6)
+    ]
+    assert not swarm.is_running
+
+
+def test_priority_and_deadline_order(make_agent, calls):
+    swarm = make_swarm([make_agent("a")])
+    now = time.time()
+    swarm.add_task("low", priority=5)
+    swarm.add_task("late", priority=1, deadline=now + 60)
+    swarm.add_task("soon", priority=1, deadline=now + 10)
+    swarm.add_task("expired", priority=0, deadline=now - 1)
+
+    swarm.run()
+
+    assert [task for _, task in calls.calls] == [
+        "soon",
+        "late",
+        "low",
+    ]
+    assert swarm.expired_tasks == 1
+
+
+def test_reject_backpressure(make_agent):
+    swarm = make_swarm(
+        [make_agent("a")], max_queue_size=1, overflow_policy="reject"
+    )
+    swarm.add_task("first")
+
+    with pytest.raises(queue.Full):
+        swarm.add_task("second")
+
+
+def test_persistent_pool_serves_producers(make_agent, calls):
+    swarm = make_swarm([make_agent("a")], max_concurrent_per_agent=3)
+    swarm.start()
+    assert swarm.is_running
+
+    calls.hold_until(3)
+    producers = [
+        threading.Thread(target=swarm.add_task, args=(str(i),))
+        for i in range(3)
+    ]
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+    swarm.stop()
+
+    assert calls.peak == 3
+    assert json.loads(swarm.export_metadata())["tasks_completed"] == 3
+
+
+def test_progress_is_counted_live_and_buffers_freed_on_stop(
+    make_agent,
+):
+    swarm = make_swarm([make_agent("a"), make_agent("b")])
+    for cycle in range(3):
+        swarm.start()
+        swarm.add_task(f"{cycle}-x")
+        swarm.add_task(f"{cycle}-y")
+        swarm.task_queue.join()
+        assert swarm.metadata.tasks_completed == 2 * (cycle + 1)
+
+        swarm.stop()
+        assert swarm._result_buffers == []
+
+    assert len(swarm.metadata.outputs) == 6
+    assert json.loads(swarm.export_metadata())["tasks_completed"] == 6
+
+
+def stop_while_running(swarm, gate):
+    """Stops without draining while the current task is held open."""
+    stopper = threading.Thread(
+        target=swarm.stop, kwargs={"drain": False}
+    )
+    stopper.start()
+    swarm._stopping.wait(timeout=2)
+    gate.set()
+    stopper.join(timeout=2)
+    return stopper
+
+
+def test_stop_without_drain_leaves_queued_tasks(make_agent, calls):
+    gate = threading.Event()
+    swarm = make_swarm([make_agent("a", gate=gate)])
+    for i in range(5):
+        swarm.add_task(str(i))
+    swarm.start()
+    assert calls.wait_for(1)
+
+    stop_while_running(swarm, gate)
+
+    completed = json.loads(swarm.export_metadata())["tasks_completed"]
+    assert completed == 1
+    assert swarm.task_queue.qsize() == 4
+
+
+def test_stop_without_drain_on_full_bounded_queue(make_agent, calls):
+    gate = threading.Event()
+    swarm = make_swarm([make_agent("a", gate=gate)], max_queue_size=2)
+    swarm.start()
+    swarm.add_task("0")
+    assert calls.wait_for(1)
+    swarm.add_task("1")
+    swarm.add_task("2")
+    assert swarm.task_queue.full()
+
+    stopper = stop_while_running(swarm, gate)
+
+    assert not stopper.is_alive()
+    assert not swarm.is_running
+    assert swarm.task_queue.qsize() == 2
@@ -0,0 +1,77 @@
+import csv
+import json
+import os
+from unittest.mock import MagicMock
+
+from swarms.structs.spreadsheet_swarm import (
+    AgentOutput,
+    ResultSink,
+    SpreadSheetSwarm,
+)
+
+
+def make_agent(name):
+    agent = MagicMock()
+    agent.name = name
+    agent.agent_name = name
+    agent.run.return_value = f"{name} result"
+    return agent
+
+
+def test_result_sink_streams_rows(tmp_path):
+    csv_path = tmp_path / "out.csv"
+    jsonl_path = tmp_path / "out" / "out.jsonl"
+    sink = ResultSink(
+        csv_path=str(csv_path),
+        jsonl_path=str(jsonl_path),
+        run_id="run",
+        flush_every=1,
+    )
+    sink.write(
+        AgentOutput(
+            agent_name="a", task="t", result="r", timestamp="now"
+        )
+    )
+
+    # Rows are on disk before the sink is closed
+    with open(csv_path) as file:
+        rows = list(csv.reader(file))
+    assert rows == [
+        ResultSink.CSV_HEADER,
+        ["run", "a", "t", "r", "now"],
+    ]
+    sink.close()
+
+    with open(jsonl_path) as file:
+        assert json.loads(file.readline())["agent_name"] == "a"
+
+
+def test_spreadsheet_swarm_streams_without_retaining(
+    tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    agents = [make_agent(f"agent-{i}") for i in range(5)]
+    swarm = SpreadSheetSwarm(
+        agents=agents,
+        workspace_dir=str(tmp_path),
+        retain_outputs=False,
+    )
+
+    swarm.run("task")
+
+    assert swarm.metadata.tasks_completed == 5
+    assert swarm.metadata.outputs == []
+    with open(swarm.save_file_path) as file:
+        rows = list(csv.reader(file))
+    assert len(rows) == 6
+    assert {row[1] for row in rows[1:]} == {
+        agent.agent_name for agent in agents
+    }
+    assert {row[0] for row in rows[1:]} == {swarm.metadata.run_id}
+
+    folder = swarm._output_folder()
+    jsonl_files = [
+        name for name in os.listdir(folder) if name.endswith(".jsonl")
+    ]
+    with open(os.path.join(folder, jsonl_files[0])) as file:
+        assert len(file.readlines()) == 5
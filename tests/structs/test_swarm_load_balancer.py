@@ -0,0 +1,54 @@
+from swarms.structs.swarm_load_balancer import AgentLoadBalancer
+
+
+def test_run_multiple_tasks_is_concurrent_and_ordered(
+    make_agent, calls
+):
+    agents = [make_agent(f"agent-{i}") for i in range(4)]
+    balancer = AgentLoadBalancer(agents)
+
+    calls.hold_until(4)
+    results = balancer.run_multiple_tasks([str(i) for i in range(8)])
+
+    assert calls.peak == 4
+    assert [r.split(": ")[1] for r in results] == [
+        str(i) for i in range(8)
+    ]
+    assert all(count == 0 for count in balancer.in_flight.values())
+
+
+def test_agents_never_exceed_concurrency_limit(make_agent, calls):
+    balancer = AgentLoadBalancer([make_agent("only", delay=0.01)])
+
+    balancer.run_multiple_tasks(["a", "b", "c", "d"])
+
+    assert calls.peaks["only"] == 1
+    assert len(calls.calls) == 4
+
+
+def test_ewma_policy_prefers_fast_agent(make_agent):
+    fast = make_agent("fast")
+    slow = make_agent("slow")
+    balancer = AgentLoadBalancer(
+        [fast, slow], selection_policy="ewma_latency"
+    )
+    balancer.ewma_latency.update({"fast": 0.1, "slow": 2.0})
+
+    assert balancer.get_available_agent() is fast
+
+
+def test_failing_agent_is_ejected(make_agent):
+    bad = make_agent("bad", error=ValueError("boom"))
+    good = make_agent("good")
+    balancer = AgentLoadBalancer(
+        [bad, good],
+        selection_policy="random",
+        eject_after_failures=1,
+        max_retries=5,
+    )
+
+    for _ in range(10):
+        balancer.run("task")
+
+    assert bad.run.call_count <= 1
+    assert "bad" in balancer.ejected_until
@@ -0,0 +1,179 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from swarms.structs.swarming_architectures import (
+    TopologyRuntime,
+    broadcast,
+    circular_swarm,
+    exponential_swarm,
+    fibonacci_swarm,
+    geometric_swarm,
+    grid_swarm,
+    harmonic_swarm,
+    linear_swarm,
+    log_swarm,
+    mesh_swarm,
+    power_swarm,
+    prime_swarm,
+    pyramid_swarm,
+    sigmoid_swarm,
+    sinusoidal_swarm,
+    staircase_swarm,
+    star_swarm,
+)
+
+DELAY = 0.05
+
+
+class MockAgent:
+    """Sleeps like a model call and records overlapping runs."""
+
+    def __init__(self, name, delay=DELAY):
+        self.agent_name = name
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def run(self, task):
+        with self._lock:
+            self.active += 1
+            self.calls += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return f"{self.agent_name}:{task}"
+
+
+def make_agents(count):
+    return [MockAgent(f"agent-{i}") for i in range(count)]
+
+
+def make_tasks(count):
+    return [f"task-{i}" for i in range(count)]
+
+
+def test_runtime_preserves_order_and_serializes_each_agent():
+    agents = make_agents(3)
+    calls = [(agents[i % 3], str(i)) for i in range(9)]
+
+    responses = TopologyRuntime().run(calls)
+
+    assert responses == [f"agent-{i % 3}:{i}" for i in range(9)]
+    assert all(agent.peak == 1 for agent in agents)
+
+
+def test_runtime_respects_concurrency_limit():
+    agents = make_agents(8)
+    running = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+    for agent in agents:
+        original = agent.run
+
+        def run(task, original=original):
+            with lock:
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+            try:
+                return original(task)
+            finally:
+                with lock:
+                    running["now"] -= 1
+
+        agent.run = run
+
+    TopologyRuntime(max_concurrency=2).run(
+        [(agent, "t") for agent in agents]
+    )
+
+    assert running["peak"] <= 2
+
+
+def test_runtime_raises_agent_errors():
+    agent = MagicMock()
+    agent.run.side_effect = ValueError("boom")
+
+    with pytest.raises(ValueError):
+        TopologyRuntime().run([(agent, "t")])
+
+
+def test_mesh_swarm_returns_results_in_task_order():
+    agents = make_agents(3)
+    tasks = make_tasks(7)
+
+    history = mesh_swarm(agents, tasks)["history"]
+
+    assert [entry["task"] for entry in history] == tasks
+    assert sum(agent.calls for agent in agents) == 7
+
+
+def test_task_lists_are_consumed_like_before():
+    agents = make_agents(4)
+    tasks = make_tasks(6)
+
+    linear_swarm(agents, tasks, return_full_history=False)
+
+    assert tasks == ["task-4", "task-5"]
+
+
+def test_star_swarm_runs_center_before_spokes():
+    order = []
+    agents = make_agents(3)
+    for agent in agents:
+        original = agent.run
+        agent.run = lambda task, a=agent, o=original: (
+            order.append(a.agent_name),
+            o(task),
+        )[1]
+
+    star_swarm(agents, ["t"])
+
+    assert order[0] == "agent-0"
+
+
+def test_broadcast_collects_every_response():
+    agents = make_agents(3)
+
+    history = asyncio.run(broadcast(agents[0], agents, "hello"))[
+        "history"
+    ]
+
+    assert [entry["response"] for entry in history] == [
+        f"agent-{i}:hello" for i in range(3)
+    ]
+
+
+TOPOLOGIES = {
+    "circular": lambda a, t: circular_swarm(a, t),
+    "grid": lambda a, t: grid_swarm(a, t),
+    "linear": lambda a, t: linear_swarm(a, t),
+    "star": lambda a, t: star_swarm(a, t),
+    "mesh": lambda a, t: mesh_swarm(a, t),
+    "pyramid": lambda a, t: pyramid_swarm(a, t),
+    "fibonacci": lambda a, t: fibonacci_swarm(a, t),
+    "prime": lambda a, t: prime_swarm(a, t),
+    "power": lambda a, t: power_swarm(a, t),
+    "log": lambda a, t: log_swarm(a, t),
+    "exponential": lambda a, t: exponential_swarm(a, t),
+    "geometric": lambda a, t: geometric_swarm(a, t),
+    "harmonic": lambda a, t: harmonic_swarm(a, t),
+    "staircase": lambda a, t: staircase_swarm(a, t[0]),
+    "sigmoid": lambda a, t: sigmoid_swarm(a, t[0]),
+    "sinusoidal": lambda a, t: sinusoidal_swarm(a, t[0]),
+}
+
+
+@pytest.mark.parametrize("name", sorted(TOPOLOGIES))
+def test_topology_never_overlaps_an_agent(name):
+    agents = [MockAgent(f"agent-{i}", delay=0.001) for i in range(16)]
+
+    TOPOLOGIES[name](agents, make_tasks(16))
+
+    assert sum(agent.calls for agent in agents) > 0
+    assert all(agent.peak <= 1 for agent in agents)
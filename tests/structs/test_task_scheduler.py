@@ -0,0 +1,159 @@
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
+from swarms.structs.task import Task
+from swarms.structs.task_scheduler import TaskScheduler
+
+
+class EchoAgent:
+    """Sleeps like a model call and records the order of runs."""
+
+    def __init__(self, name, delay=0.05, log=None):
+        self.agent_name = name
+        self.delay = delay
+        self.log = log if log is not None else []
+
+    def run(self, task):
+        time.sleep(self.delay)
+        self.log.append(task)
+        return f"{self.agent_name}:{task}"
+
+
+class FlakyAgent:
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    def run(self, task):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("flaky")
+        return "ok"
+
+
+def test_independent_tasks_run_in_parallel():
+    scheduler = TaskScheduler(max_workers=8)
+    for i in range(8):
+        scheduler.add_task(
+            Task(agent=EchoAgent(f"a{i}", 0.1)), task_id=str(i)
+        )
+
+    start = time.perf_counter()
+    results = scheduler.run()
+
+    assert time.perf_counter() - start < 0.5
+    assert len(results) == 8
+    assert all(value is not None for value in results.values())
+
+
+def test_dependencies_are_respected():
+    log = []
+    first = Task(agent=EchoAgent("first", log=log))
+    second = Task(agent=EchoAgent("second", log=log))
+    third = Task(agent=EchoAgent("third", 0.0, log=log))
+    third.add_dependency(second)
+
+    scheduler = TaskScheduler(max_workers=4)
+    scheduler.add_task(first, task_id="first", task_input="1")
+    scheduler.add_task(
+        second, task_id="second", task_input="2", depends_on=["first"]
+    )
+    scheduler.add_task(third, task_id="third", task_input="3")
+
+    results = scheduler.run()
+
+    assert log == ["1", "2", "3"]
+    assert results["third"] == "third:3"
+
+
+def test_schedule_time_delays_without_blocking_others():
+    later = Task(
+        agent=EchoAgent("later", 0.0),
+        schedule_time=datetime.now() + timedelta(seconds=0.3),
+    )
+    now = Task(agent=EchoAgent("now", 0.0))
+    scheduler = TaskScheduler()
+    scheduler.add_task(later, task_id="later")
+    scheduler.add_task(now, task_id="now")
+
+    future = scheduler.start()
+    time.sleep(0.15)
+    assert scheduler.status() == {
+        "later": "scheduled",
+        "now": "completed",
+    }
+    assert future.result(timeout=2)["later"] is not None
+
+
+def test_retries_with_backoff_then_blocks_dependents():
+    scheduler = TaskScheduler(max_retries=2, retry_backoff=0.05)
+    flaky = FlakyAgent(failures=2)
+    broken = FlakyAgent(failures=10)
+    scheduler.add_task(Task(agent=flaky), task_id="flaky")
+    scheduler.add_task(
+        Task(agent=broken), task_id="broken", max_retries=1
+    )
+    scheduler.add_task(
+        Task(agent=EchoAgent("after")),
+        task_id="after",
+        depends_on=["broken"],
+    )
+
+    results = scheduler.run()
+
+    assert results["flaky"] == "ok"
+    assert flaky.calls == 3
+    assert broken.calls == 2
+    assert scheduler.status()["broken"] == "failed"
+    assert scheduler.status()["after"] == "blocked"
+
+
+def test_max_concurrent_per_agent():
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def agent(task):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        return task
+
+    scheduler = TaskScheduler(
+        max_workers=4, max_concurrent_per_agent=1
+    )
+    for i in range(4):
+        scheduler.add_task(Task(agent=agent), task_input=str(i))
+
+    scheduler.run()
+
+    assert active["peak"] == 1
+
+
+def test_state_is_persisted_and_resumed(tmp_path):
+    path = str(tmp_path / "state.json")
+    flaky = FlakyAgent(failures=1)
+
+    scheduler = TaskScheduler(state_path=path)
+    scheduler.add_task(Task(agent=EchoAgent("done")), task_id="done")
+    scheduler.add_task(Task(agent=flaky), task_id="flaky")
+    scheduler.run()
+
+    with open(path) as file:
+        state = json.load(file)
+    assert state["done"]["status"] == "completed"
+    assert state["flaky"]["status"] == "failed"
+
+    agent = EchoAgent("done")
+    resumed = TaskScheduler(state_path=path)
+    resumed.add_task(Task(agent=agent), task_id="done")
+    resumed.add_task(Task(agent=flaky), task_id="flaky")
+    results = resumed.run()
+
+    assert agent.log == []
+    assert results["done"].startswith("done:")
+    assert results["flaky"] == "ok"
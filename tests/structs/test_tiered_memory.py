@@ -0,0 +1,198 @@
+from swarms.structs.conversation import Conversation
+from swarms.structs.tiered_memory import (
+    TieredMemory,
+    extractive_summary,
+)
+
+
+class WordTokenizer:
+    def encode(self, text):
+        return text.split()
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+    def count_tokens(self, text):
+        return len(text.split())
+
+
+def make_conversation():
+    return Conversation(system_prompt="You are a helpful agent.")
+
+
+def make_memory(tmp_path, **kwargs):
+    kwargs.setdefault("tokenizer", WordTokenizer())
+    return TieredMemory(str(tmp_path / "memory"), **kwargs)
+
+
+def test_compact_keeps_pinned_and_recent_messages(tmp_path):
+    memory = make_memory(tmp_path, hot_max_tokens=20)
+    conversation = make_conversation()
+    for i in range(10):
+        conversation.add("user", f"message number {i} about topic{i}")
+
+    evicted = memory.compact(conversation)
+    memory.flush()
+
+    history = conversation.conversation_history
+    # Six words per rendered message, so three fit
+    assert evicted == 7
+    assert history[0]["content"] == "You are a helpful agent."
+    assert [m["content"] for m in history[1:]] == [
+        f"message number {i} about topic{i}" for i in range(7, 10)
+    ]
+    assert "topic0" in memory.summary
+
+
+def test_archived_messages_are_retrieved_from_disk(tmp_path):
+    memory = make_memory(tmp_path, hot_max_tokens=10)
+    conversation = make_conversation()
+    conversation.add("user", "the launch code is pineapple")
+    for i in range(5):
+        conversation.add("agent", f"unrelated chatter {i}")
+    memory.compact(conversation)
+
+    hits = memory.search("what is the launch code", k=1)
+    assert hits[0]["content"] == "the launch code is pineapple"
+
+    prompt = memory.build_prompt(
+        conversation, "what is the launch code", max_tokens=200
+    )
+    assert "user (earlier): the launch code is pineapple" in prompt
+    assert prompt.index("helpful agent") < prompt.index("pineapple")
+    assert prompt.rstrip().endswith("unrelated chatter 4")
+
+
+def test_prompt_and_hot_window_stay_bounded(tmp_path):
+    memory = make_memory(
+        tmp_path, hot_max_tokens=40, warm_max_tokens=30
+    )
+    conversation = make_conversation()
+
+    sizes = []
+    for i in range(300):
+        conversation.add("user", f"question {i} " + "filler " * 5)
+        conversation.add("agent", f"answer {i} " + "detail " * 5)
+        memory.compact(conversation)
+        prompt = memory.build_prompt(
+            conversation, f"question {i}", 120
+        )
+        sizes.append(len(prompt.split()))
+
+    memory.flush()
+    assert len(conversation.conversation_history) <= 8
+    assert max(sizes) <= 120
+    assert len(memory.summary.split()) <= 30
+
+
+def test_state_is_reloaded_from_disk(tmp_path):
+    memory = make_memory(tmp_path, hot_max_tokens=5)
+    conversation = make_conversation()
+    conversation.add("user", "remember the blue door")
+    conversation.add("user", "and then something else entirely")
+    memory.compact(conversation)
+    memory.close()
+
+    reloaded = make_memory(tmp_path)
+    assert reloaded.summary == memory.summary
+    assert reloaded.search("blue door")[0]["content"] == (
+        "remember the blue door"
+    )
+
+
+def test_archive_is_indexed_without_save(tmp_path):
+    memory = make_memory(tmp_path, hot_max_tokens=5)
+    conversation = make_conversation()
+    conversation.add("user", "remember the blue door")
+    conversation.add("user", "and then something else entirely")
+    memory.compact(conversation)
+    memory.flush()
+
+    # Never saved, as when an agent process stops without close()
+    reloaded = make_memory(tmp_path)
+    assert reloaded.search("blue door")[0]["content"] == (
+        "remember the blue door"
+    )
+
+    # A saved index that is behind the archive is caught up
+    reloaded.save()
+    conversation.add("user", "the red window is open")
+    conversation.add("user", "yet another unrelated message here")
+    memory.compact(conversation)
+    again = make_memory(tmp_path)
+    assert again.search("red window")[0]["content"] == (
+        "the red window is open"
+    )
+    assert again.indexed_messages == 3
+
+
+def test_old_index_rows_are_sealed_to_disk(tmp_path):
+    memory = make_memory(
+        tmp_path, hot_max_tokens=1, cold_segment_rows=4
+    )
+    conversation = make_conversation()
+    conversation.add("user", "the launch code is pineapple")
+    for i in range(9):
+        conversation.add("agent", f"unrelated chatter {i}")
+    memory.compact(conversation)
+
+    # Only the newest rows stay in memory
+    assert len(memory.cold_index) == 1
+    assert memory.indexed_messages == 9
+    assert memory.search("launch code", k=1)[0]["content"] == (
+        "the launch code is pineapple"
+    )
+
+    memory.save()
+    conversation.add("agent", "more chatter to seal")
+    for i in range(4):
+        conversation.add("agent", f"closing remark {i}")
+    memory.compact(conversation)
+    assert len(memory.cold_index) == 2
+
+    # The saved rows were sealed since, so they are not loaded twice
+    reloaded = make_memory(tmp_path, cold_segment_rows=4)
+    assert reloaded.indexed_messages == 14
+    assert reloaded.search("seal", k=1)[0]["content"] == (
+        "more chatter to seal"
+    )
+
+
+def test_extractive_summary_keeps_frequent_sentences():
+    messages = [
+        {"role": "user", "content": "The budget is tight. Hello."},
+        {"role": "agent", "content": "The budget needs cuts."},
+    ]
+    summary = extractive_summary("", messages, max_sentences=2)
+    assert "Hello" not in summary
+    assert summary.count("budget") == 2
+
+
+def test_agent_prompts_come_from_tiered_memory(tmp_path, monkeypatch):
+    from swarms.structs import agent as agent_module
+
+    monkeypatch.setattr(agent_module, "TikTokenizer", WordTokenizer)
+
+    class EchoLLM:
+        def __init__(self):
+            self.prompts = []
+
+        def run(self, task, *args, **kwargs):
+            self.prompts.append(task)
+            return "noted " * 10
+
+    llm = EchoLLM()
+    agent = agent_module.Agent(
+        agent_name="tiered",
+        llm=llm,
+        max_loops=1,
+        context_length=150,
+        tiered_memory=make_memory(tmp_path, hot_max_tokens=60),
+        workspace_dir=str(tmp_path),
+    )
+    for i in range(30):
+        agent.run(f"fact {i}: the value of key{i} is {i * 7}")
+
+    assert len(agent.short_memory.conversation_history) < 10
+    assert max(len(p.split()) for p in llm.prompts) <= 150
+    assert "key29" in llm.prompts[-1]
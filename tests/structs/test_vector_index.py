@@ -0,0 +1,211 @@
+import numpy as np
+import pytest
+
+from swarms.structs.agent_router import AgentRouter
+from swarms.structs.conversation import Conversation
+from swarms.structs.graph_swarm import (
+    AgentOutput,
+    SwarmMemory,
+    SwarmOutput,
+)
+from swarms.structs.vector_index import (
+    HashingEmbedding,
+    NumpyVectorIndex,
+)
+
+
+class ProfileAgent:
+    def __init__(self, name, description):
+        self.name = name
+        self.description = description
+        self.system_prompt = ""
+
+
+def unit(*values):
+    return np.array(values, dtype=np.float32)
+
+
+def test_query_returns_top_k_by_cosine():
+    index = NumpyVectorIndex(initial_capacity=1)
+    index.upsert(
+        ["x", "y", "xy"],
+        [unit(1, 0), unit(0, 3), unit(1, 1)],
+    )
+
+    assert [id for id, _ in index.query(unit(2, 0.1), k=2)] == [
+        "x",
+        "xy",
+    ]
+    assert index.query(unit(0, 1))[0][1] == pytest.approx(1.0)
+    assert len(index.query(unit(1, 0), k=10)) == 3
+
+
+def test_update_and_delete_keep_rows_consistent():
+    index = NumpyVectorIndex()
+    index.upsert(
+        ["a", "b", "c"], [unit(1, 0), unit(0, 1), unit(1, 1)]
+    )
+
+    index.delete(["a", "missing"])
+    index.upsert(["b"], [unit(1, 0)], [{"tag": "moved"}])
+
+    assert len(index) == 2 and "a" not in index
+    assert index.query(unit(1, 0))[0][0] == "b"
+    assert index.get_metadata("b") == {"tag": "moved"}
+
+
+def test_dimension_mismatch_is_rejected():
+    index = NumpyVectorIndex()
+    index.upsert(["a"], [unit(1, 0)])
+
+    with pytest.raises(ValueError):
+        index.upsert(["b"], [unit(1, 0, 0)])
+
+
+def test_save_and_mmap_load(tmp_path):
+    index = NumpyVectorIndex()
+    index.upsert_texts(
+        ["cats", "stocks"],
+        ["cats and kittens", "stock market prices"],
+        [{"n": 1}, {"n": 2}],
+    )
+    index.save(str(tmp_path))
+
+    loaded = NumpyVectorIndex.load(str(tmp_path))
+    assert loaded.query_text("kittens")[0][0] == "cats"
+    assert loaded.get_metadata("stocks") == {"n": 2}
+
+    # Writes copy the read-only mapping
+    loaded.upsert_texts(["bonds"], ["bond yields"])
+    loaded.delete(["cats"])
+    assert loaded.query_text("bond")[0][0] == "bonds"
+
+
+def test_hashing_embedding_is_stable():
+    embed = HashingEmbedding(dim=64)
+
+    first, second = embed(["Hello world", "hello WORLD"])
+
+    assert first.shape == (64,)
+    assert np.array_equal(first, second)
+
+
+def test_agent_router_routes_with_injected_embedding():
+    calls = []
+
+    def embedding_fn(texts):
+        calls.append(len(texts))
+        return HashingEmbedding(128)(texts)
+
+    router = AgentRouter(embedding_fn=embedding_fn, n_agents=2)
+    finance = ProfileAgent("finance", "financial statements revenue")
+    legal = ProfileAgent("legal", "contracts and legal terms")
+    router.add_agents([finance, legal])
+
+    assert calls == [2]
+    assert (
+        router.find_best_agent("review the revenue numbers")
+        is finance
+    )
+    assert router.find_best_agents("legal contracts") == [
+        legal,
+        finance,
+    ]
+
+    router.remove_agent("legal")
+    assert router.find_best_agents("legal contracts") == [finance]
+
+
+def test_agent_router_loads_through_the_injected_index(tmp_path):
+    class CustomIndex(NumpyVectorIndex):
+        pass
+
+    router = AgentRouter(
+        persist_directory=str(tmp_path), index=CustomIndex()
+    )
+    agent = ProfileAgent("finance", "financial statements revenue")
+    router.add_agent(agent)
+    router.save()
+
+    router.load([agent])
+
+    assert type(router.index) is CustomIndex
+    assert router.find_best_agent("revenue") is agent
+
+
+def test_swarm_memory_recalls_similar_executions():
+    memory = SwarmMemory()
+    output = SwarmOutput(
+        outputs={
+            "writer": AgentOutput(
+                agent_name="writer", output="done", execution_time=1
+            )
+        },
+        execution_time=1,
+        success=True,
+    )
+    memory.store_execution("write a poem about the sea", output)
+
+    assert memory.get_optimal_sequence("a poem about the sea") == [
+        "writer"
+    ]
+    memory.clear_memory()
+    assert memory.get_similar_executions("poem") == []
+
+
+class HistoryAgent(ProfileAgent):
+    def __init__(self, name, description):
+        super().__init__(name, description)
+        self.short_memory = Conversation(time_enabled=False)
+
+
+def test_agent_history_shifts_routing_incrementally():
+    calls = []
+
+    def embedding_fn(texts):
+        calls.append(list(texts))
+        return HashingEmbedding(256)(texts)
+
+    router = AgentRouter(
+        embedding_fn=embedding_fn,
+        max_recent_interactions=2,
+        history_weight=2.0,
+    )
+    alpha = HistoryAgent("alpha", "general assistant")
+    beta = HistoryAgent("beta", "general helper")
+    router.add_agents([alpha, beta])
+
+    for i in range(5):
+        alpha.short_memory.add("user", f"astronomy telescope {i}")
+    router.update_agent_history("alpha").result()
+    router.update_agent_history("alpha").result()
+
+    # Each message was embedded exactly once, in one batch
+    assert calls[1:] == [
+        [f"user: astronomy telescope {i}" for i in range(5)]
+    ]
+    assert router.find_best_agent("telescope astronomy") is alpha
+
+    profile = router.profiles["alpha"]
+    assert profile.interactions == 5
+    assert len(profile.recent) == 2
+    assert profile.summary.any()
+    router.shutdown()
+
+
+def test_record_interactions_batches_by_size():
+    calls = []
+
+    def embedding_fn(texts):
+        calls.append(len(texts))
+        return HashingEmbedding(64)(texts)
+
+    router = AgentRouter(
+        embedding_fn=embedding_fn, embedding_batch_size=3
+    )
+    router.add_agent(ProfileAgent("solo", "anything"))
+    router.record_interactions("solo", [str(i) for i in range(7)])
+    router.flush()
+
+    assert calls == [1, 3, 3, 1]
+    assert router.profiles["solo"].interactions == 7
@@ -0,0 +1,145 @@
+import os
+import threading
+
+import pytest
+
+from swarms.tools.prebuilt import code_executor
+from swarms.tools.prebuilt.code_executor import CodeExecutor
+from swarms.tools.prebuilt.interpreter_pool import InterpreterPool
+
+
+@pytest.fixture
+def pool():
+    pool = InterpreterPool(size=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_pool_resets_namespace_between_runs(pool):
+    assert pool.execute("x = 1\nprint(x)").stdout == "1\n"
+    result = pool.execute("print(x)")
+    assert "NameError" in result.error
+
+
+def test_pool_restores_process_state_between_runs(pool, tmp_path):
+    pool.execute(
+        "import os, sys\n"
+        f"os.chdir({str(tmp_path)!r})\n"
+        "os.environ['SWARMS_LEAK'] = '1'\n"
+        "sys.path.insert(0, 'leak')"
+    )
+    result = pool.execute(
+        "import os, sys\n"
+        "print(os.getcwd())\n"
+        "print(os.environ.get('SWARMS_LEAK'))\n"
+        "print('leak' in sys.path)"
+    )
+    assert result.stdout == f"{os.getcwd()}\nNone\nFalse\n"
+
+
+def test_pool_replaces_worker_left_with_threads(pool):
+    pool.execute(
+        "import threading, time\n"
+        "threading.Thread(target=time.sleep, args=(60,), daemon=True)"
+        ".start()"
+    )
+    result = pool.execute(
+        "import threading\nprint(threading.active_count())"
+    )
+    assert result.stdout == "2\n"
+
+
+def test_pool_keeps_its_slot_when_a_restart_fails(pool, monkeypatch):
+    def fail():
+        raise RuntimeError("cannot start")
+
+    monkeypatch.setattr(pool, "_new_worker", fail)
+    assert pool.execute("import os\nos._exit(1)").error
+    assert pool.idle.qsize() == 1
+
+    monkeypatch.undo()
+    assert pool.execute("print('back')").stdout == "back\n"
+
+
+def test_pool_bounds_output(pool):
+    result = pool.execute("print('a' * 10000)", max_output_length=10)
+    assert result.stdout == "a" * 10
+    assert result.truncated
+
+
+def test_pool_replaces_timed_out_worker(pool):
+    result = pool.execute("while True: pass", timeout=0.5)
+    assert result.timed_out
+    assert pool.execute("print('ok')").stdout == "ok\n"
+
+
+def test_pool_streams_output(pool):
+    chunks = []
+    pool.execute(
+        "print('a')\nprint('b')",
+        on_output=lambda stream, data: chunks.append(data),
+    )
+    assert "".join(chunks) == "a\nb\n"
+
+
+def test_pool_keeps_raw_fd_output_off_the_protocol(pool):
+    result = pool.execute(
+        "import os\nos.system('echo 5')\nos.write(1, b'{}\\n')"
+    )
+    assert result.success
+    assert result.stdout == "5\n{}\n"
+    assert pool.execute("print('next')").stdout == "next\n"
+
+
+def test_code_executor_runs_on_pool(tmp_path):
+    executor = CodeExecutor(
+        artifacts_directory=str(tmp_path), max_output_length=5
+    )
+    try:
+        assert executor.execute("print('hello')") == "hello..."
+        with pytest.raises(RuntimeError):
+            executor.execute("raise ValueError('boom')")
+    finally:
+        executor.shutdown()
+
+
+def test_code_executor_starts_one_pool_under_contention(
+    tmp_path, monkeypatch
+):
+    started = []
+    barrier = threading.Barrier(4)
+
+    class SlowPool:
+        def __init__(self, **kwargs):
+            started.append(self)
+            threading.Event().wait(0.05)
+
+    monkeypatch.setattr(code_executor, "InterpreterPool", SlowPool)
+    executor = CodeExecutor(artifacts_directory=str(tmp_path))
+    pools = []
+
+    def get_pool():
+        barrier.wait()
+        pools.append(executor.pool)
+
+    threads = [threading.Thread(target=get_pool) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(started) == 1
+    assert all(pool is started[0] for pool in pools)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="needs RLIMIT_AS")
+def test_code_executor_limits_memory_without_pool(tmp_path):
+    executor = CodeExecutor(
+        artifacts_directory=str(tmp_path),
+        language="python3",
+        format_code=False,
+        use_pool=False,
+        memory_limit_mb=200,
+    )
+    with pytest.raises(RuntimeError, match="MemoryError"):
+        executor.execute("x = bytearray(500 * 1024 * 1024)")
@@ -0,0 +1,115 @@
+import torch
+
+from swarms.tools.logits_processor import (
+    NumberStoppingCriteria,
+    OutputNumbersTokens,
+    StringStoppingCriteria,
+    clear_tokenizer_vocabulary_cache,
+    get_tokenizer_vocabulary,
+)
+
+
+class FakeTokenizer:
+    vocab = ["<eos>", "1", "2", ".", '"', ",", "]", " ", "a"]
+    all_special_ids = [0]
+
+    def __init__(self):
+        self.decode_calls = 0
+
+    def __len__(self):
+        return len(self.vocab)
+
+    def __call__(self, text, return_tensors=None):
+        return {"input_ids": torch.tensor([[8]])}
+
+    def get_vocab(self):
+        return {token: i for i, token in enumerate(self.vocab)}
+
+    def decode(self, token_ids, skip_special_tokens=False):
+        self.decode_calls += 1
+        if isinstance(token_ids, int):
+            token_ids = [token_ids]
+        return "".join(self.vocab[int(i)] for i in token_ids)
+
+
+class SentencePieceTokenizer(FakeTokenizer):
+    # Word-initial pieces carry "▁", which decodes to a space except at
+    # the start of the decoded text
+    vocab = ["<eos>", "▁1", "2", ".", '"', ",", "]", "▁", "a"]
+
+    def decode(self, token_ids, skip_special_tokens=False):
+        if isinstance(token_ids, int):
+            token_ids = [token_ids]
+        text = "".join(self.vocab[int(i)] for i in token_ids)
+        return text.replace("▁", " ").lstrip(" ")
+
+
+def test_vocabulary_is_shared_per_tokenizer():
+    clear_tokenizer_vocabulary_cache()
+    tokenizer = FakeTokenizer()
+
+    first = OutputNumbersTokens(tokenizer, "prompt")
+    calls = tokenizer.decode_calls
+    second = OutputNumbersTokens(tokenizer, "prompt")
+
+    assert tokenizer.decode_calls == calls
+    assert first.allowed_mask is second.allowed_mask
+    assert first.allowed_mask.tolist() == [
+        False,
+        True,
+        True,
+        True,
+        False,
+        False,
+        False,
+        True,
+        False,
+    ]
+
+
+def test_vocabulary_token_sets():
+    vocabulary = get_tokenizer_vocabulary(FakeTokenizer())
+
+    assert vocabulary.digit_ids == {1, 2}
+    assert vocabulary.quote_ids == {4}
+    assert vocabulary.comma_ids == {5}
+    assert vocabulary.bracket_ids == {6}
+    assert vocabulary.token_strings[0] == ""
+
+
+def test_string_stopping_criteria_does_not_decode():
+    tokenizer = FakeTokenizer()
+    criteria = StringStoppingCriteria(tokenizer, prompt_length=1)
+    calls = tokenizer.decode_calls
+
+    assert not criteria(torch.tensor([[8]]), None)
+    assert not criteria(torch.tensor([[8, 8]]), None)
+    assert criteria(torch.tensor([[8, 8, 4]]), None)
+    assert tokenizer.decode_calls == calls
+
+
+def test_number_stopping_criteria_tracks_suffix():
+    tokenizer = FakeTokenizer()
+    criteria = NumberStoppingCriteria(
+        tokenizer, prompt_length=1, precision=2
+    )
+
+    assert not criteria(torch.tensor([[8, 1]]), None)
+    assert not criteria(torch.tensor([[8, 1, 3]]), None)
+    assert not criteria(torch.tensor([[8, 1, 3, 2, 2]]), None)
+    assert criteria(torch.tensor([[8, 1, 3, 2, 2, 1]]), None)
+
+    # A shorter sequence starts a new generation
+    assert not criteria(torch.tensor([[8, 2]]), None)
+    assert criteria(torch.tensor([[8, 2, 7]]), None)
+
+
+def test_number_stopping_criteria_keeps_sentencepiece_spaces():
+    criteria = NumberStoppingCriteria(
+        SentencePieceTokenizer(), prompt_length=1
+    )
+
+    assert not criteria(torch.tensor([[8, 1]]), None)
+    assert not criteria(torch.tensor([[8, 1, 2]]), None)
+    # "▁" decodes to nothing on its own but to a space after "12"
+    assert criteria(torch.tensor([[8, 1, 2, 7]]), None)
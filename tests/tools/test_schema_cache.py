@@ -0,0 +1,94 @@
+import copy
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from swarms.tools.py_func_to_openai_func_str import (
+    get_openai_function_schema_from_func,
+)
+from swarms.tools.pydantic_to_json import (
+    base_model_to_openai_function,
+)
+from swarms.tools.schema_cache import (
+    SchemaCache,
+    clear_schema_cache,
+    schema_cache,
+)
+
+
+def get_weather(city: str, days: int = 1) -> str:
+    """Get the weather forecast for a city."""
+    return city
+
+
+class WeatherQuery(BaseModel):
+    city: str
+
+
+def test_function_schema_is_cached():
+    clear_schema_cache()
+    first = get_openai_function_schema_from_func(
+        get_weather, description="weather"
+    )
+    misses = schema_cache.stats()["misses"]
+    second = get_openai_function_schema_from_func(
+        get_weather, description="weather"
+    )
+
+    assert first is second
+    assert schema_cache.stats()["misses"] == misses
+
+
+def test_cached_schema_is_read_only():
+    clear_schema_cache()
+    schema = get_openai_function_schema_from_func(
+        get_weather, description="weather"
+    )
+
+    with pytest.raises(TypeError):
+        schema["function"]["name"] = "mutated"
+    with pytest.raises(TypeError):
+        schema["function"]["parameters"]["required"].append("x")
+
+    editable = copy.deepcopy(schema)
+    editable["function"]["name"] = "mutated"
+    assert schema["function"]["name"] == "get_weather"
+    assert json.loads(json.dumps(schema)) == schema
+
+
+def test_get_json_and_get_or_create_share_entries():
+    cache = SchemaCache()
+    built = []
+
+    def factory():
+        built.append(1)
+        return {"a": [1]}
+
+    assert cache.get_json(("k",), factory) == '{"a": [1]}'
+    assert cache.get_or_create(("k",), factory) == {"a": [1]}
+    assert len(built) == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+
+def test_redefined_function_gets_new_entry():
+    cache = SchemaCache()
+
+    def tool(a: int) -> int:
+        return a
+
+    key = cache.function_key(tool)
+
+    def tool(a: str) -> int:  # noqa: F811
+        return 0
+
+    assert cache.function_key(tool) != key
+
+
+def test_model_schema_cache_and_invalidation():
+    clear_schema_cache()
+    base_model_to_openai_function(WeatherQuery)
+    assert schema_cache.stats()["entries"] == 1
+
+    clear_schema_cache(WeatherQuery)
+    assert schema_cache.stats()["entries"] == 0
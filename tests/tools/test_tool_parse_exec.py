@@ -0,0 +1,89 @@
+import asyncio
+import json
+import time
+
+from swarms.tools.tool_parse_exec import (
+    ToolDispatcher,
+    parse_and_execute_json,
+)
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+def slow(seconds: float) -> str:
+    time.sleep(seconds)
+    return "done"
+
+
+async def async_echo(text: str) -> str:
+    await asyncio.sleep(0)
+    return text
+
+
+def test_parse_and_execute_single_function():
+    out = parse_and_execute_json(
+        [add],
+        json.dumps({"name": "add", "parameters": {"a": 1, "b": 2}}),
+    )
+    assert json.loads(out) == {"result": "3"}
+
+
+def test_dispatcher_validates_arguments():
+    dispatcher = ToolDispatcher([add])
+    results = dispatcher.dispatch(
+        [{"name": "add", "parameters": {"a": "1", "b": 2}}]
+    )
+    assert results == {"add": "3"}
+
+    results = dispatcher.dispatch(
+        [{"name": "add", "parameters": {"a": 1, "c": 2}}]
+    )
+    assert results["add"].startswith("Error:")
+
+
+def test_dispatcher_runs_calls_concurrently():
+    def slow_a(seconds: float) -> str:
+        return slow(seconds)
+
+    def slow_b(seconds: float) -> str:
+        return slow(seconds)
+
+    dispatcher = ToolDispatcher([slow_a, slow_b])
+    start = time.monotonic()
+    results = dispatcher.dispatch(
+        [
+            {"name": "slow_a", "parameters": {"seconds": 0.5}},
+            {"name": "slow_b", "parameters": {"seconds": 0.5}},
+        ]
+    )
+    assert time.monotonic() - start < 0.9
+    assert list(results) == ["slow_a", "slow_b"]
+    dispatcher.shutdown()
+
+
+def test_dispatcher_per_tool_timeout():
+    dispatcher = ToolDispatcher([slow], tool_timeouts={"slow": 0.1})
+    results = dispatcher.dispatch(
+        [{"name": "slow", "parameters": {"seconds": 1}}]
+    )
+    assert "timed out" in results["slow"]
+    dispatcher.shutdown()
+
+
+def test_dispatcher_async_tools():
+    dispatcher = ToolDispatcher([async_echo, add])
+    calls = [
+        {"name": "async_echo", "parameters": {"text": "hi"}},
+        {"name": "add", "parameters": {"a": 1, "b": 1}},
+    ]
+    assert dispatcher.dispatch(calls) == {
+        "async_echo": "hi",
+        "add": "2",
+    }
+    assert asyncio.run(dispatcher.adispatch(calls)) == {
+        "async_echo": "hi",
+        "add": "2",
+    }
+    dispatcher.shutdown()
@@ -0,0 +1,154 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from swarms.utils import litellm_wrapper
+from swarms.utils.litellm_wrapper import LiteLLM
+
+
+class FakeAcompletion:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.threads = set()
+
+    async def __call__(self, model, messages, stream, **kwargs):
+        self.calls.append(messages[-1]["content"])
+        self.threads.add(threading.get_ident())
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if stream:
+            return self._stream(messages[-1]["content"])
+        message = SimpleNamespace(
+            content=f"re: {messages[-1]['content']}"
+        )
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=message)]
+        )
+
+    async def _stream(self, text):
+        for word in text.split():
+            delta = SimpleNamespace(content=word)
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=delta)]
+            )
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    fake = FakeAcompletion()
+    monkeypatch.setattr(litellm_wrapper, "acompletion", fake)
+    monkeypatch.setattr(
+        litellm_wrapper, "_SUPPORTS_SHARED_SESSION", False
+    )
+    monkeypatch.setattr(litellm_wrapper, "_model_concurrency", {})
+    return fake
+
+
+def test_many_concurrent_requests_respect_model_limit(fake):
+    llm = LiteLLM(
+        model_name="limited", max_concurrency=10, cache=None
+    )
+    results = llm.batched_run([f"task {i}" for i in range(200)])
+
+    assert results == [f"re: task {i}" for i in range(200)]
+    assert fake.peak == 10
+    # Every request ran on the calling thread's event loop
+    assert fake.threads == {threading.get_ident()}
+
+
+def test_identical_inflight_requests_are_coalesced(fake):
+    llm = LiteLLM(model_name="coalesced")
+
+    async def main():
+        return await asyncio.gather(
+            *[llm.arun("same prompt") for _ in range(50)],
+            llm.arun("other prompt"),
+        )
+
+    results = asyncio.run(main())
+
+    assert results[:50] == ["re: same prompt"] * 50
+    assert sorted(fake.calls) == ["other prompt", "same prompt"]
+
+
+def test_coalescing_can_be_disabled(fake):
+    llm = LiteLLM(model_name="plain", coalesce=False)
+    llm.batched_run(["same"] * 3)
+    assert fake.calls == ["same"] * 3
+
+
+def test_async_stream_yields_deltas(fake):
+    llm = LiteLLM(model_name="streamed", stream=True)
+
+    async def main():
+        stream = await llm.arun("one two three")
+        return [delta async for delta in stream]
+
+    assert asyncio.run(main()) == ["one", "two", "three"]
+
+
+def test_arun_reuses_one_http_session_and_cache(fake, monkeypatch):
+    from swarms.utils.llm_cache import LLMCache
+
+    monkeypatch.setattr(
+        litellm_wrapper, "_SUPPORTS_SHARED_SESSION", True
+    )
+    sessions = []
+    acompletion = fake.__call__
+
+    async def record_session(shared_session=None, **kwargs):
+        sessions.append(shared_session)
+        return await acompletion(**kwargs)
+
+    monkeypatch.setattr(
+        litellm_wrapper, "acompletion", record_session
+    )
+    cache = LLMCache()
+    llm = LiteLLM(model_name="pooled", cache=cache)
+
+    async def main():
+        first = await llm.abatched_run(["a", "b"])
+        second = await llm.arun("a")
+        await litellm_wrapper.close_shared_session()
+        return first, second
+
+    assert asyncio.run(main()) == (["re: a", "re: b"], "re: a")
+    assert len(sessions) == 2 and sessions[0] is sessions[1]
+    assert cache.stats()["hits"] == 1
+
+
+def test_failed_requests_raise_instead_of_returning_none(
+    fake, monkeypatch
+):
+    async def failing(model, messages, stream, **kwargs):
+        if "bad" in messages[-1]["content"]:
+            raise ValueError("bad request")
+        return await fake(model, messages, stream, **kwargs)
+
+    monkeypatch.setattr(litellm_wrapper, "acompletion", failing)
+    llm = LiteLLM(model_name="failing", cache=None)
+
+    with pytest.raises(ValueError):
+        llm.batched_run(["good", "bad"])
+
+    results = llm.batched_run(["good", "bad"], return_exceptions=True)
+    assert results[0] == "re: good"
+    assert isinstance(results[1], ValueError)
+
+
+def test_batched_run_works_inside_a_running_loop(fake):
+    llm = LiteLLM(model_name="nested", cache=None)
+
+    async def main():
+        return llm.batched_run(["a", "b"])
+
+    assert asyncio.run(main()) == ["re: a", "re: b"]
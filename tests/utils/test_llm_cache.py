@@ -0,0 +1,242 @@
+import time
+
+import pytest
+
+from swarms.utils.llm_cache import (
+    CachedLLM,
+    CacheMissError,
+    LLMCache,
+    cache_key,
+)
+
+
+class CountingLLM:
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.temperature = 0.5
+        self.delay = delay
+
+    def run(self, task, *args, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        return f"{task} #{self.calls}"
+
+
+class StreamingLLM:
+    def run(self, task):
+        return (word for word in task.split())
+
+
+def test_cache_key_is_order_independent():
+    assert cache_key({"a": 1, "b": [1, 2]}) == cache_key(
+        {"b": [1, 2], "a": 1}
+    )
+    assert cache_key({"a": 1}) != cache_key({"a": 2})
+
+
+def test_hits_skip_the_model_and_report_saved_latency():
+    llm = CountingLLM(delay=0.05)
+    cached = CachedLLM(llm, LLMCache())
+
+    assert cached.run("hello") == "hello #1"
+    assert cached.run("hello") == "hello #1"
+    assert cached.run("other") == "other #2"
+
+    cached.temperature = 0.9
+    assert llm.temperature == 0.9
+    assert cached.run("hello") == "hello #3"
+
+    stats = cached.cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 3)
+    assert stats["hit_rate"] == 0.25
+    assert stats["saved_latency_seconds"] >= 0.05
+
+
+def test_sqlite_tier_persists_and_lru_is_bounded(tmp_path):
+    path = str(tmp_path / "cache.db")
+    llm = CountingLLM()
+    cache = LLMCache(path, max_entries=2)
+    cached = CachedLLM(llm, cache)
+    for task in ["a", "b", "c"]:
+        cached.run(task)
+    assert cache.stats()["memory_entries"] == 2
+    assert cached.run("a") == "a #1"
+    cache.close()
+
+    reopened = CachedLLM(llm, LLMCache(path))
+    assert len(reopened.cache) == 3
+    assert reopened.run("b") == "b #2"
+    assert llm.calls == 3
+
+
+def test_record_then_replay_reproduces_repeated_calls(tmp_path):
+    path = str(tmp_path / "cache.db")
+    llm = CountingLLM()
+    recorder = CachedLLM(llm, LLMCache(path, mode="record"))
+    recorded = [recorder.run("roll the dice") for _ in range(3)]
+    assert recorded == [f"roll the dice #{i}" for i in (1, 2, 3)]
+    recorder.cache.close()
+
+    offline = CachedLLM(CountingLLM(), LLMCache(path, mode="replay"))
+    assert [
+        offline.run("roll the dice") for _ in range(3)
+    ] == recorded
+    with pytest.raises(CacheMissError):
+        offline.run("roll the dice")
+    with pytest.raises(CacheMissError):
+        offline.run("never recorded")
+
+    offline.cache.rewind()
+    assert offline.run("roll the dice") == recorded[0]
+
+
+def test_streams_are_cached_as_chunk_lists(tmp_path):
+    cache = LLMCache(str(tmp_path / "cache.db"))
+    cached = CachedLLM(StreamingLLM(), cache)
+
+    assert list(cached.run("one two three")) == [
+        "one",
+        "two",
+        "three",
+    ]
+    assert len(cache) == 1
+
+    replayed = cached.run("one two three")
+    assert not isinstance(replayed, list)
+    assert list(replayed) == ["one", "two", "three"]
+    assert cache.stats()["hits"] == 1
+
+
+def test_off_mode_always_calls_the_model():
+    llm = CountingLLM()
+    cached = CachedLLM(llm, LLMCache(mode="off"))
+    cached.run("x")
+    cached.run("x")
+    assert llm.calls == 2
+
+
+def test_litellm_uses_cache_for_plain_and_streamed_calls(monkeypatch):
+    from types import SimpleNamespace
+
+    from swarms.utils import litellm_wrapper
+
+    calls = []
+
+    def completion(model, messages, stream, **kwargs):
+        calls.append(messages[-1]["content"])
+        if stream:
+            return iter(
+                SimpleNamespace(
+                    choices=[
+                        SimpleNamespace(
+                            delta=SimpleNamespace(content=w)
+                        )
+                    ]
+                )
+                for w in ["a", "b"]
+            )
+        message = SimpleNamespace(content="answer")
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=message)]
+        )
+
+    monkeypatch.setattr(litellm_wrapper, "completion", completion)
+    cache = LLMCache()
+
+    llm = litellm_wrapper.LiteLLM(cache=cache)
+    assert llm.run("question") == "answer"
+    assert llm.run("question") == "answer"
+
+    streaming = litellm_wrapper.LiteLLM(stream=True, cache=cache)
+    assert list(streaming.run("question")) == ["a", "b"]
+    assert list(streaming.run("question")) == ["a", "b"]
+
+    assert len(calls) == 2
+    assert cache.stats()["hits"] == 2
+
+
+def test_agents_share_a_replayable_cache(tmp_path, monkeypatch):
+    from swarms.structs import agent as agent_module
+
+    class WordTokenizer:
+        def count_tokens(self, text):
+            return len(text.split())
+
+    monkeypatch.setattr(agent_module, "TikTokenizer", WordTokenizer)
+    path = str(tmp_path / "cache.db")
+
+    def run_agent(llm, cache):
+        agent = agent_module.Agent(
+            agent_name="cached",
+            llm=llm,
+            max_loops=1,
+            llm_cache=cache,
+            retry_attempts=1,
+        )
+        return agent.run("summarize the report")
+
+    live = CountingLLM()
+    recorded = run_agent(live, LLMCache(path, mode="record"))
+
+    offline = CountingLLM()
+    assert (
+        run_agent(offline, LLMCache(path, mode="replay")) == recorded
+    )
+    assert (live.calls, offline.calls) == (1, 0)
+
+
+def test_agent_raises_on_replay_miss(tmp_path, monkeypatch):
+    from swarms.structs import agent as agent_module
+
+    class WordTokenizer:
+        def count_tokens(self, text):
+            return len(text.split())
+
+    monkeypatch.setattr(agent_module, "TikTokenizer", WordTokenizer)
+    llm = CountingLLM()
+    agent = agent_module.Agent(
+        agent_name="replayed",
+        llm=llm,
+        max_loops=1,
+        llm_cache=LLMCache(str(tmp_path / "cache.db"), mode="replay"),
+    )
+
+    with pytest.raises(CacheMissError):
+        agent.run("hello")
+    assert llm.calls == 0
+
+
+def test_agent_defers_to_the_llms_own_cache(monkeypatch):
+    from swarms.structs import agent as agent_module
+
+    class WordTokenizer:
+        def count_tokens(self, text):
+            return len(text.split())
+
+    class SelfCachingLLM(CountingLLM):
+        def __init__(self):
+            super().__init__()
+            self.cache = LLMCache()
+
+        def run(self, task, *args, **kwargs):
+            return self.cache.call(
+                {"task": task},
+                lambda: super(SelfCachingLLM, self).run(task),
+            )
+
+    monkeypatch.setattr(agent_module, "TikTokenizer", WordTokenizer)
+    llm, agent_cache = SelfCachingLLM(), LLMCache()
+    agent = agent_module.Agent(
+        agent_name="layered",
+        llm=llm,
+        max_loops=1,
+        llm_cache=agent_cache,
+        retry_attempts=1,
+    )
+
+    agent.run("hello")
+
+    own = llm.cache.stats()
+    assert own["misses"] == 1 and own["memory_entries"] == 1
+    unused = agent_cache.stats()
+    assert (unused["misses"], unused["memory_entries"]) == (0, 0)
@@ -0,0 +1,236 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from swarms.utils import litellm_wrapper, rate_limiter
+from swarms.utils.litellm_wrapper import LiteLLM
+from swarms.utils.rate_limiter import (
+    AdaptiveConcurrency,
+    RateLimiter,
+    TokenBucket,
+    configure_rate_limit,
+    get_rate_limiter,
+    is_throttle_error,
+)
+
+
+class RateLimitError(Exception):
+    def __init__(self, retry_after=None):
+        super().__init__("Error code: 429 - rate limit exceeded")
+        self.status_code = 429
+        self.retry_after = retry_after
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    rate_limiter.reset_rate_limiters()
+    yield
+    rate_limiter.reset_rate_limiters()
+
+
+def test_token_bucket_spaces_requests_after_burst():
+    bucket = TokenBucket(per_minute=600, burst=2)
+
+    waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.1, abs=0.01)
+    assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+
+def test_aimd_halves_on_throttle_and_grows_on_success():
+    concurrency = AdaptiveConcurrency(initial=8, decrease_interval=0)
+
+    concurrency.acquire()
+    concurrency.release(throttled=True)
+    assert concurrency.limit == 4
+
+    for _ in range(8):
+        concurrency.acquire()
+        concurrency.release()
+    assert 5 < concurrency.limit < 6.5
+
+
+def test_concurrency_limit_holds_across_threads():
+    limiter = RateLimiter(
+        "model", initial_concurrency=3, max_concurrency=3
+    )
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def call():
+        with limiter.slot():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=call) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 3
+    assert limiter.successes == 12
+    assert limiter.concurrency.inflight == 0
+
+
+def test_throttle_pauses_new_calls_for_retry_after():
+    limiter = RateLimiter("model", initial_concurrency=4)
+
+    with pytest.raises(RateLimitError):
+        with limiter.slot():
+            raise RateLimitError(retry_after=0.2)
+
+    start = time.monotonic()
+    with limiter.slot():
+        pass
+
+    assert time.monotonic() - start >= 0.18
+    assert limiter.throttles == 1
+    # Halved by the throttle, then grown a little by the success
+    assert limiter.concurrency.limit == 2.5
+
+
+def test_nested_slot_reports_swallowed_throttle():
+    limiter = get_rate_limiter("model")
+
+    with limiter.slot() as outer:
+        try:
+            with limiter.slot() as inner:
+                assert inner is outer
+                raise RateLimitError(retry_after=0)
+        except RateLimitError:
+            pass
+        assert limiter.concurrency.inflight == 1
+
+    assert limiter.throttles == 1
+    assert limiter.successes == 0
+
+
+def test_token_budget_is_settled_with_actual_usage():
+    limiter = RateLimiter("model", tokens_per_minute=1000)
+
+    with limiter.slot(tokens=800) as slot:
+        slot.used_tokens(100)
+
+    assert limiter.token_bucket.available == pytest.approx(900, abs=1)
+
+
+def test_registry_falls_back_to_provider():
+    provider = configure_rate_limit(
+        "anthropic", requests_per_minute=50
+    )
+
+    assert get_rate_limiter("anthropic/claude-3") is provider
+    assert get_rate_limiter("gpt-4o") is get_rate_limiter("gpt-4o")
+    assert get_rate_limiter("gpt-4o").request_bucket is None
+
+
+def test_throttle_detection_follows_exception_chain():
+    try:
+        try:
+            raise RateLimitError()
+        except RateLimitError as error:
+            raise RuntimeError("Error calling run") from error
+    except RuntimeError as error:
+        wrapped = error
+
+    assert is_throttle_error(wrapped)
+    assert is_throttle_error(asyncio.TimeoutError())
+    assert not is_throttle_error(ValueError("bad input"))
+
+
+def test_async_slots_share_the_limit():
+    limiter = RateLimiter(
+        "model", initial_concurrency=2, max_concurrency=2
+    )
+    active, peak = [0], [0]
+
+    async def call():
+        async with limiter.aslot():
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+
+    async def main():
+        await asyncio.gather(*(call() for _ in range(10)))
+
+    asyncio.run(main())
+
+    assert peak[0] == 2
+    assert limiter.concurrency.inflight == 0
+
+
+def test_litellm_arun_throttle_shrinks_shared_limit(monkeypatch):
+    calls = []
+
+    async def fake_acompletion(model, messages, stream, **kwargs):
+        calls.append(model)
+        raise RateLimitError(retry_after=0)
+
+    monkeypatch.setattr(
+        litellm_wrapper, "acompletion", fake_acompletion
+    )
+    monkeypatch.setattr(
+        litellm_wrapper, "_SUPPORTS_SHARED_SESSION", False
+    )
+    limiter = configure_rate_limit(
+        "throttled", initial_concurrency=16
+    )
+    llm = LiteLLM(model_name="throttled", cache=None)
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(llm.arun("hello"))
+
+    assert calls == ["throttled"]
+    assert limiter.throttles == 1
+    assert limiter.concurrency.limit == 8
+
+
+def test_sync_stream_holds_slot_until_read(monkeypatch):
+    from types import SimpleNamespace
+
+    def chunk(content=None, usage=None):
+        choices = []
+        if content is not None:
+            delta = SimpleNamespace(content=content)
+            choices = [SimpleNamespace(delta=delta)]
+        return SimpleNamespace(choices=choices, usage=usage)
+
+    def fake_completion(model, messages, stream, **kwargs):
+        assert stream
+        yield chunk("a")
+        yield chunk("b")
+        yield chunk(usage=SimpleNamespace(total_tokens=50))
+
+    monkeypatch.setattr(
+        litellm_wrapper, "completion", fake_completion
+    )
+    limiter = configure_rate_limit(
+        "streamed", tokens_per_minute=10_000
+    )
+    llm = LiteLLM(
+        model_name="streamed", stream=True, cache=None, max_tokens=100
+    )
+
+    stream = llm.run("hi")
+    assert next(stream) == "a"
+    assert limiter.concurrency.inflight == 1
+    # Nothing published: other calls in this thread get their own slot
+    with limiter.slot() as other:
+        assert other.limiter is limiter
+        assert limiter.concurrency.inflight == 2
+
+    assert list(stream) == ["b"]
+    assert limiter.concurrency.inflight == 0
+    assert limiter.successes == 2
+    assert limiter.token_bucket.available == pytest.approx(
+        10_000 - 50, abs=5
+    )